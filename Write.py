@@ -13,6 +13,7 @@ import sys
 import shutil  # Untuk penulisan atomik
 import importlib # Tambahkan importlib
 from Writer.StateManager import StateManager  # For proper Pydantic deserialization
+from Writer.StateJournal import get_state_journal, has_journal, remove_journal  # STATE_BACKEND = "journal"
 
 import Writer.Config
 
@@ -20,6 +21,7 @@ import Writer.Config
 import Writer.Interface.Wrapper
 import Writer.PrintUtils
 import Writer.Translator # Still needed for TranslatePrompt in main
+import Writer.Estimator
 # import Writer.Statistics # No longer directly needed in main() functions after pipeline refactor. Pipeline handles its own stats.
 
 # Modules that are now primarily used by StoryPipeline and not directly in main:
@@ -250,18 +252,58 @@ Parser.add_argument(
     action="store_true",
     help="Generate PDF output with story content only (title and chapters)",
 )
+Parser.add_argument(
+    "-LLMCache",
+    default=None,
+    choices=["read-write", "read-only", "bypass"],
+    help="LLM response cache mode for this run (overrides LLM_CACHE_MODE, also on resume)",
+)
+Parser.add_argument(
+    "-AllModels",
+    default=None,
+    help="Use this model for every *_MODEL setting, e.g. mock://bench?latency=0.5 or replay://Logs/<run> for offline benchmarking",
+)
+Parser.add_argument(
+    "-Estimate",
+    action="store_true",
+    help="Print the expected LLM calls, tokens and time of this run (from previous runs' logs) and exit without calling any model",
+)
+Parser.add_argument(
+    "-EstimateChapters",
+    default=10,
+    type=int,
+    help="Number of chapters assumed by -Estimate",
+)
 # Args = Parser.parse_args() # Pindahkan parsing argumen ke dalam main()
 
 
+# Fungsi Helper untuk -AllModels
+def apply_all_models(model):
+    """Point every *_MODEL setting at model (-AllModels).
+
+    EMBEDDING_MODEL is only replaced by the offline mock:// and replay:// providers,
+    which also serve embeddings; a chat model cannot embed the lorebook.
+    """
+    offline = model.startswith(("mock://", "replay://"))
+    for model_var in [k for k in dir(Writer.Config) if k.endswith("_MODEL")]:
+        if model_var != "EMBEDDING_MODEL" or offline:
+            setattr(Writer.Config, model_var, model)
+
+
 # Fungsi Helper untuk Save/Load State
 def save_state(state_data, filepath):
     """Saves the current state to a JSON file atomically with proper Pydantic serialization."""
     temp_filepath = filepath + ".tmp"
     try:
+        if getattr(Writer.Config, "STATE_BACKEND", "json") == "journal":
+            # Append only the changed keys; the journal compacts itself into filepath
+            get_state_journal(filepath).save(state_data)
+            return
         # Use StateManager to properly handle Pydantic objects
         StateManager.save_state(state_data, temp_filepath)
         # Operasi atomik: ganti file lama dengan yang baru
         shutil.move(temp_filepath, filepath)
+        remove_journal(filepath)  # A full save supersedes any earlier journal
     except (IOError, OSError) as e:  # Catch specific file errors
         print(f"FATAL: Failed to save state to {filepath}: {e}", file=sys.stderr)
         # Hapus file temp jika ada
@@ -288,6 +330,9 @@ def load_state(filepath):
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"State file not found: {filepath}")
     try:
+        if has_journal(filepath):
+            # Journaled state: snapshot plus the changes appended since
+            return get_state_journal(filepath).load()
         # Use StateManager to properly reconstruct Pydantic objects
         state_data = StateManager.load_state(filepath)
         return state_data
@@ -349,6 +394,10 @@ def main():
         # Only override PDF config if flag is explicitly provided
         if Args.GeneratePDF:
             Writer.Config.ENABLE_PDF_GENERATION = True
+        if Args.LLMCache:
+            Writer.Config.LLM_CACHE_MODE = Args.LLMCache
+        if Args.AllModels:
+            apply_all_models(Args.AllModels)
 
         # Atur Writer.Config.DEBUG berdasarkan nilai dari Config.py dan flag Args.Debug
         # Jika Args.Debug adalah True (flag -Debug diberikan), maka Writer.Config.DEBUG akan True.
@@ -413,6 +462,11 @@ def main():
                     # print(f"  Restored Config.{key} = {value}") # Debugging
                 # else:
                 # print(f"  Skipping restore for {key}") # Debugging
+            # Cache mode and model overrides are chosen per run, so explicit flags win over the saved config
+            if Args.LLMCache:
+                Writer.Config.LLM_CACHE_MODE = Args.LLMCache
+            if Args.AllModels:
+                apply_all_models(Args.AllModels)
             
             # --- PEMUATAN PROMPT DINAMIS (BAGIAN INTI SETELAH CONFIG DARI STATE) ---
             native_lang_config_resume = getattr(Writer.Config, 'NATIVE_LANGUAGE', 'en') # No lower() here, load_active_prompts handles it
@@ -511,6 +565,17 @@ def main():
         _early_print(f"Dynamically set sys.modules['Writer.Prompts'] to '{ActivePrompts.__name__}'.")
         # --- AKHIR PEMUATAN PROMPT DINAMIS (BAGIAN INTI) ---
 
+        if Args.Estimate:
+            # Offline walk of the pipeline on mock models; nothing is logged or written
+            if Args.Prompt is None:
+                _early_error("FATAL: -Estimate requires -Prompt.")
+                sys.exit(1)
+            with open(Args.Prompt, "r", encoding="utf-8") as f:
+                EstimatePrompt = f.read()
+            Report = Writer.Estimator.EstimateRun(EstimatePrompt, ActivePrompts, Chapters=Args.EstimateChapters)
+            print(Writer.Estimator.FormatEstimate(Report))
+            sys.exit(0)
+
         SysLogger = Writer.PrintUtils.Logger()
         log_directory = SysLogger.LogDirPrefix
         SysLogger.Log(f"NATIVE_LANGUAGE set to '{native_lang_config_new}'. Active prompt module: '{ActivePrompts.__name__}'.", 5)
@@ -696,6 +761,11 @@ def main():
         else:
             SysLogger.Log(f"Main: Story generation pipeline ended at step: {final_step}. This may indicate an incomplete run if not 'complete'. Check logs.", 6)
 
+        if Interface.ResponseCache.mode != "bypass":
+            SysLogger.Log(f"Main: LLM response cache stats: {Interface.ResponseCache.stats()}", 5)
+        for model_name, tier_counts in Interface.JSONParseStats.snapshot().items():
+            SysLogger.Log(f"Main: JSON parse tiers for {model_name}: {tier_counts}", 5)
+
     except Exception as e:
         SysLogger.Log(f"FATAL error during main pipeline setup or invocation: {e}", 7)
         import traceback
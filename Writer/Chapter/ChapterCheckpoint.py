@@ -0,0 +1,42 @@
+"""
+ChapterCheckpoint - Sub-step results of one chapter, for fine-grained resume
+
+StoryPipeline keeps one plain dict per unfinished chapter in
+current_state["chapter_checkpoints"]. ChapterGenerator and ChapterByScene
+record each sub-step in it: the chapter outline, the previous-chapter
+summary, the scene outlines, each scene, each stage, and each revision
+iteration. The save callback persists the state after every step. On
+resume, recorded steps are returned instead of being generated again.
+
+Values must be JSON-serializable (Pydantic objects are stored as dicts).
+"""
+
+
+class ChapterCheckpoint:
+    """Memoizes a chapter's sub-steps in a state dict"""
+
+    def __init__(self, data: dict = None, save=None):  # type: ignore[assignment]
+        self.data = data if data is not None else {}
+        self._save = save
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+    def get(self, key: str, default=None):
+        return self.data.get(key, default)
+
+    def put(self, key: str, value) -> None:
+        """Records a finished sub-step and persists it"""
+        self.data[key] = value
+        if self._save is not None:
+            self._save()
+
+    def run(self, key: str, producer, _Logger=None):
+        """Returns the recorded value for key, or calls producer() and records its result"""
+        if key in self.data:
+            if _Logger is not None:
+                _Logger.Log(f"Resuming from checkpoint: reusing '{key}'", 4)
+            return self.data[key]
+        value = producer()
+        self.put(key, value)
+        return value
@@ -1,10 +1,9 @@
 from pydantic import BaseModel
 import Writer.Config
+from Writer.Chapter.SummaryCache import get_summary_cache
+from Writer.Parallel import map_ordered, resolve_workers
 # import Writer.Prompts # Dihapus untuk pemuatan dinamis
 
-# Cache untuk outline summaries - untuk menghindari summary ulang outline yang sama
-_outline_summary_cache = {}
-
 
 # Definisikan Skema Pydantic
 class SummaryComparisonSchema(BaseModel):
@@ -12,6 +11,28 @@ class SummaryComparisonSchema(BaseModel):
     DidFollowOutline: bool
 
 
+def _GenerateSummary(Interface, _Logger, _Intro: str, _Prompt: str, _What: str) -> str:
+    """Summary for one prompt, served from the shared SummaryCache when it was made before"""
+    Model = Writer.Config.CHAPTER_STAGE1_WRITER_MODEL
+    Cache = get_summary_cache()
+    Key = Cache.make_key(Model, _Intro, _Prompt)
+    Summary = Cache.get(Key)
+    if Summary is not None:
+        _Logger.Log(f"Using cached summary of {_What}.", 6)
+        return Summary
+
+    SummaryLangchain: list = []
+    SummaryLangchain.append(Interface.BuildSystemQuery(_Intro))
+    SummaryLangchain.append(Interface.BuildUserQuery(_Prompt))
+    _Logger.Log(f"Generating summary of {_What} for comparison.", 6)
+    SummaryLangchain, summary_json, _ = Interface.SafeGenerateJSON(_Logger, SummaryLangchain, Model)
+    Summary = summary_json.get('summary', '') or summary_json.get('text', '')
+    if Summary:
+        Cache.put(Key, Summary)
+    _Logger.Log(f"Finished generating summary of {_What}.", 6)
+    return Summary
+
+
 def LLMSummaryCheck(Interface, _Logger, _RefSummary: str, _Work: str):
     import Writer.Prompts as ActivePrompts  # Ditambahkan untuk pemuatan dinamis
     """
@@ -26,63 +47,17 @@ def LLMSummaryCheck(Interface, _Logger, _RefSummary: str, _Work: str):
         )
         return False, ""
 
-    # Build Summariziation Langchain
-    SummaryLangchain: list = []
-    SummaryLangchain.append(
-        Interface.BuildSystemQuery(ActivePrompts.SUMMARY_CHECK_INTRO)
-    )
-    SummaryLangchain.append(
-        Interface.BuildUserQuery(
-            ActivePrompts.SUMMARY_CHECK_PROMPT.format(_Work=_Work)
-        )
-    )
-    # Tambahkan log sebelum memanggil SafeGenerateJSON pertama
-    _Logger.Log(
-        "Generating summary of generated work for comparison.", 6
-    )  # Tambahkan log ini
-    SummaryLangchain, summary_json, _ = (
-        Interface.SafeGenerateJSON(
-            _Logger, SummaryLangchain, Writer.Config.CHAPTER_STAGE1_WRITER_MODEL
-        )
+    # The work and outline summaries are independent; cached ones cost nothing
+    Workers = resolve_workers(Writer.Config, 'SUMMARY_CHECK_WORKERS', 1)
+    WorkSummary, OutlineSummary = map_ordered(
+        lambda Request: _GenerateSummary(Interface, _Logger, *Request),
+        [
+            (ActivePrompts.SUMMARY_CHECK_INTRO, ActivePrompts.SUMMARY_CHECK_PROMPT.format(_Work=_Work), "generated work"),
+            (ActivePrompts.SUMMARY_OUTLINE_INTRO, ActivePrompts.SUMMARY_OUTLINE_PROMPT.format(_RefSummary=_RefSummary), "reference outline"),
+        ],
+        Workers,
+        thread_name_prefix="SummaryCheck",
     )
-    WorkSummary: str = summary_json.get('summary', '') or summary_json.get('text', '')
-    _Logger.Log(
-        "Finished generating summary of generated work.", 6
-    )  # Tambahkan log ini
-
-    # Check if we already have a cached summary for this outline
-    outline_hash = hash(_RefSummary)
-    if outline_hash in _outline_summary_cache:
-        OutlineSummary = _outline_summary_cache[outline_hash]
-        _Logger.Log(
-            "Using cached summary of reference outline.", 6
-        )
-    else:
-        # Now Summarize The Outline (first time only)
-        SummaryLangchain: list = []
-        SummaryLangchain.append(
-            Interface.BuildSystemQuery(ActivePrompts.SUMMARY_OUTLINE_INTRO)
-        )
-        SummaryLangchain.append(
-            Interface.BuildUserQuery(
-                ActivePrompts.SUMMARY_OUTLINE_PROMPT.format(_RefSummary=_RefSummary)
-            )
-        )
-        # Tambahkan log sebelum memanggil SafeGenerateJSON kedua
-        _Logger.Log(
-            "Generating summary of reference outline for comparison.", 6
-        )  # Tambahkan log ini
-        SummaryLangchain, summary_json, _ = (
-            Interface.SafeGenerateJSON(
-                _Logger, SummaryLangchain, Writer.Config.CHAPTER_STAGE1_WRITER_MODEL
-            )
-        )
-        OutlineSummary: str = summary_json.get('summary', '') or summary_json.get('text', '')
-        # Cache the summary for future use
-        _outline_summary_cache[outline_hash] = OutlineSummary
-        _Logger.Log(
-            "Finished generating and cached summary of reference outline.", 6
-        )  # Tambahkan log ini
 
     # Now, generate a comparison JSON value.
     ComparisonLangchain: list = []
@@ -5,6 +5,8 @@ from Writer.Models import ChapterOutput
 
 import Writer.Scene.ChapterByScene
 from Writer.Chapter.ParagraphValidator import validate_paragraph_breaks
+from Writer.Chapter.ChapterCheckpoint import ChapterCheckpoint
+from Writer.ReviewCycle import ReviewChapter
 
 # Helper method declarations (skeletons initially, will be filled)
 
@@ -13,7 +15,7 @@ def _get_pydantic_format_instructions_if_enabled(Interface, _Logger, Config_modu
     """
     Get Pydantic format instructions if enabled in config.
 
-    Uses language-aware format instructions from Interface._build_format_instruction().
+    Uses the language-aware format instruction cached by Interface._get_format_instruction().
 
     Returns:
         str: Format instructions or empty string
@@ -22,12 +24,8 @@ def _get_pydantic_format_instructions_if_enabled(Interface, _Logger, Config_modu
         return ""
 
     try:
-        # Import here to avoid circular imports
-        from Writer.Models import ChapterOutput
-
-        # Use language-aware format instruction builder from Interface
-        schema = ChapterOutput.model_json_schema()
-        return Interface._build_format_instruction(schema)
+        # Rendered once per language and reused for every chapter stage
+        return Interface._get_format_instruction(ChapterOutput)
     except Exception as e:
         _Logger.Log(f"Failed to generate Pydantic format instructions: {e}", 4)
         return ""
@@ -188,7 +186,42 @@ BASE CONTEXT:
     return reasoning
 
 
-def _prepare_initial_generation_context(Interface, _Logger, ActivePrompts, _Outline, _Chapters, _ChapterNum, _TotalChapters, Config_module):
+def _render_expanded_chapter_outline(_ExpandedChapterOutline, _ChapterNum):
+    """
+    ThisChapterOutline rendered from the structured per-chapter outline of the expansion stage.
+
+    Uses the stored outline text ({"text", "title"} as saved by the pipeline), or renders the
+    scenes / outline_summary of a ChapterOutlineOutput-shaped dict. Empty when there is nothing to render.
+    """
+    if not isinstance(_ExpandedChapterOutline, dict):
+        return ""
+
+    Body = str(_ExpandedChapterOutline.get("text") or "").strip()
+    if not Body:
+        SceneTexts = []
+        for Scene in _ExpandedChapterOutline.get("scenes") or []:
+            if isinstance(Scene, str):
+                SceneTexts.append(Scene.strip())
+                continue
+            SceneFields = Scene if isinstance(Scene, dict) else (Scene.model_dump() if hasattr(Scene, "model_dump") else {})
+            SceneParts = [
+                f"{Label}: {SceneFields[Field]}"
+                for Field, Label in (("title", "Scene"), ("characters_and_setting", "Characters & Setting"),
+                                     ("conflict_and_tone", "Conflict & Tone"), ("key_events", "Key Events"),
+                                     ("literary_devices", "Literary Devices"), ("resolution", "Resolution"),
+                                     ("setting", "Setting"), ("action", "Action"), ("purpose", "Purpose"))
+                if SceneFields.get(Field)
+            ]
+            SceneTexts.append("\n".join(SceneParts))
+        Body = "\n\n".join(Text for Text in SceneTexts if Text) or str(_ExpandedChapterOutline.get("outline_summary") or "").strip()
+    if not Body:
+        return ""
+
+    Title = _ExpandedChapterOutline.get("title") or _ExpandedChapterOutline.get("chapter_title")
+    return f"Chapter {_ChapterNum}: {Title}\n\n{Body}" if Title else f"Chapter {_ChapterNum}\n\n{Body}"
+
+
+def _prepare_initial_generation_context(Interface, _Logger, ActivePrompts, _Outline, _Chapters, _ChapterNum, _TotalChapters, Config_module, _Checkpoint=None, _ExpandedChapterOutline=None):
     """Prepares initial context, chapter-specific outline, and last chapter summary."""
     _Logger.Log(f"Stage 0: Preparing initial generation context for Chapter {_ChapterNum}/{_TotalChapters}", 3)
 
@@ -200,48 +233,97 @@ def _prepare_initial_generation_context(Interface, _Logger, ActivePrompts, _Outl
 
     # Extract ThisChapterOutline
     _Logger.Log(f"Extracting Chapter Specific Outline for Chapter {_ChapterNum}/{_TotalChapters}", 4)
-    ChapterSegmentMessages = [
-        Interface.BuildSystemQuery(ActivePrompts.CHAPTER_GENERATION_INTRO),
-        Interface.BuildUserQuery(
-            ActivePrompts.CHAPTER_GENERATION_PROMPT.format(_Outline=_Outline, _ChapterNum=_ChapterNum)
-        )
-    ]
-    ChapterSegmentMessages, chapter_obj, _ = Interface.SafeGeneratePydantic(
-        _Logger, ChapterSegmentMessages, Config_module.CHAPTER_STAGE1_WRITER_MODEL,
-        ChapterOutput
-    )
-    ThisChapterOutline = chapter_obj.text
-    _Logger.Log(f"Created Chapter Specific Outline for Chapter {_ChapterNum}/{_TotalChapters}", 4)
+    Checkpoint = _Checkpoint if _Checkpoint is not None else ChapterCheckpoint()
 
-    # Generate Summary of Last Chapter If Applicable
-    FormattedLastChapterSummary = ""
-    if _Chapters:  # Check if list is not empty
-        _Logger.Log(f"Creating Summary Of Last Chapter Info for Chapter {_ChapterNum}/{_TotalChapters}", 3)
-        ChapterSummaryMessages = [
-            Interface.BuildSystemQuery(ActivePrompts.CHAPTER_SUMMARY_INTRO),
+    def extract_chapter_outline():
+        ChapterSegmentMessages = [
+            Interface.BuildSystemQuery(ActivePrompts.CHAPTER_GENERATION_INTRO),
             Interface.BuildUserQuery(
-                ActivePrompts.CHAPTER_SUMMARY_PROMPT.format(
-                    _ChapterNum=_ChapterNum - 1, _TotalChapters=_TotalChapters,
-                    _Outline=_Outline, _LastChapter=_Chapters[-1].get("text", "")
-                )
+                ActivePrompts.CHAPTER_GENERATION_PROMPT.format(_Outline=_Outline, _ChapterNum=_ChapterNum)
             )
         ]
-        ChapterSummaryMessages, summary_json, _ = Interface.SafeGenerateJSON(
-            _Logger, ChapterSummaryMessages, Config_module.CHAPTER_STAGE1_WRITER_MODEL
+        ChapterSegmentMessages, chapter_obj, _ = Interface.SafeGeneratePydantic(
+            _Logger, ChapterSegmentMessages, Config_module.CHAPTER_STAGE1_WRITER_MODEL,
+            ChapterOutput
         )
-        FormattedLastChapterSummary = _extract_chapter_summary(summary_json)
-        _Logger.Log("Created Summary Of Last Chapter Info", 3)
+        return chapter_obj.text
+
+    # The expansion stage already wrote this chapter's outline; only extract it from the full context without one
+    ThisChapterOutline = _render_expanded_chapter_outline(_ExpandedChapterOutline, _ChapterNum)
+    MinOutlineWords = getattr(Config_module, "MIN_WORDS_PER_CHAPTER_OUTLINE", 0)
+    if ThisChapterOutline and isinstance(MinOutlineWords, int) and Writer.Statistics.GetWordCount(ThisChapterOutline) < MinOutlineWords:
+        _Logger.Log(f"Expanded outline for Chapter {_ChapterNum} is too short to use directly; extracting it instead", 5)
+        ThisChapterOutline = ""
+    if ThisChapterOutline:
+        _Logger.Log(f"Rendered Chapter Specific Outline for Chapter {_ChapterNum} from its expanded outline", 5)
+    else:
+        ThisChapterOutline = Checkpoint.run("chapter_outline", extract_chapter_outline, _Logger)
+    _Logger.Log(f"Created Chapter Specific Outline for Chapter {_ChapterNum}/{_TotalChapters}", 4)
 
-    # Construct DetailedChapterOutlineForCheck for validation
-    # Combine ThisChapterOutline with FormattedLastChapterSummary for temporal consistency
-    DetailedChapterOutlineForCheck = ThisChapterOutline
-    if FormattedLastChapterSummary:
-        DetailedChapterOutlineForCheck = f"{ThisChapterOutline}\n\n### Previous Chapter Context:\n{FormattedLastChapterSummary}"
+    # Generate Summary of Last Chapter If Applicable
+    FormattedLastChapterSummary = _summarize_last_chapter(
+        Interface, _Logger, ActivePrompts, _Outline, _Chapters, _ChapterNum, _TotalChapters, Config_module, Checkpoint
+    )
+    DetailedChapterOutlineForCheck = _build_outline_for_check(ThisChapterOutline, FormattedLastChapterSummary)
 
     _Logger.Log(f"Stage 0: Initial generation context prepared for Chapter {_ChapterNum}", 3)
     return MessageHistory, ContextHistoryInsert, ThisChapterOutline, FormattedLastChapterSummary, DetailedChapterOutlineForCheck
 
 
+def _summarize_last_chapter(Interface, _Logger, ActivePrompts, _Outline, _Chapters, _ChapterNum, _TotalChapters, Config_module, _Checkpoint=None):
+    """Summarizes the last entry of _Chapters for continuity; empty when there is no previous chapter."""
+    if not _Chapters:  # Check if list is not empty
+        return ""
+    if _Chapters[-1].get("summary"):
+        # Precomputed by the pipeline in the background once the previous chapter was finished
+        _Logger.Log(f"Reusing precomputed summary of Chapter {_ChapterNum - 1} for Chapter {_ChapterNum}/{_TotalChapters}", 4)
+        return _Chapters[-1]["summary"]
+    if _Checkpoint is not None:
+        return _Checkpoint.run(
+            "last_chapter_summary",
+            lambda: _summarize_last_chapter(Interface, _Logger, ActivePrompts, _Outline, _Chapters, _ChapterNum, _TotalChapters, Config_module),
+            _Logger,
+        )
+    return SummarizeChapter(Interface, _Logger, _Outline, _Chapters[-1].get("text", ""), _ChapterNum - 1, _TotalChapters, ActivePrompts, Config_module)
+
+
+def SummarizeChapter(Interface, _Logger, _Outline: str, _ChapterText: str, _ChapterNum: int, _TotalChapters: int, ActivePrompts=None, Config_module=None) -> str:
+    """
+    Continuity summary of a finished chapter, as used by the next chapter's Stage 0.
+
+    The pipeline calls this in the background as soon as a chapter is final and stores
+    the result as the chapter's "summary", so the next chapter does not wait for it.
+    """
+    if ActivePrompts is None:
+        from Writer.PromptsHelper import get_prompts
+        ActivePrompts = get_prompts()  # Use language-aware import
+    if Config_module is None:
+        Config_module = Writer.Config
+    _Logger.Log(f"Creating Summary Of Chapter {_ChapterNum}/{_TotalChapters}", 3)
+    ChapterSummaryMessages = [
+        Interface.BuildSystemQuery(ActivePrompts.CHAPTER_SUMMARY_INTRO),
+        Interface.BuildUserQuery(
+            ActivePrompts.CHAPTER_SUMMARY_PROMPT.format(
+                _ChapterNum=_ChapterNum, _TotalChapters=_TotalChapters,
+                _Outline=_Outline, _LastChapter=_ChapterText
+            )
+        )
+    ]
+    ChapterSummaryMessages, summary_json, _ = Interface.SafeGenerateJSON(
+        _Logger, ChapterSummaryMessages, Config_module.CHAPTER_STAGE1_WRITER_MODEL
+    )
+    FormattedLastChapterSummary = _extract_chapter_summary(summary_json)
+    _Logger.Log("Created Summary Of Last Chapter Info", 3)
+    return FormattedLastChapterSummary
+
+
+def _build_outline_for_check(ThisChapterOutline, FormattedLastChapterSummary):
+    # Combine ThisChapterOutline with FormattedLastChapterSummary for temporal consistency
+    if FormattedLastChapterSummary:
+        return f"{ThisChapterOutline}\n\n### Previous Chapter Context:\n{FormattedLastChapterSummary}"
+    return ThisChapterOutline
+
+
 def _generate_stage1_plot(Interface, _Logger, ActivePrompts, _ChapterNum, _TotalChapters, MessageHistory, ContextHistoryInsert, ThisChapterOutline, FormattedLastChapterSummary, _BaseContext, DetailedChapterOutlineForCheck, Config_module, ChapterGenSummaryCheck_module):
     """Generates Stage 1: Initial Plot, including feedback loop."""
     _Logger.Log(f"Stage 1: Generating Initial Plot for Chapter {_ChapterNum}/{_TotalChapters}", 3)
@@ -458,7 +540,7 @@ def _generate_stage3_dialogue(Interface, _Logger, ActivePrompts, _ChapterNum, _T
     return Stage3Chapter
 
 
-def _run_final_chapter_revision_loop(Interface, _Logger, ActivePrompts, _ChapterNum, _TotalChapters, ChapterToRevise, OverallOutline, MessageHistoryForRevision, Config_module, LLMEditor_module, ReviseChapter_func_local):
+def _run_final_chapter_revision_loop(Interface, _Logger, ActivePrompts, _ChapterNum, _TotalChapters, ChapterToRevise, OverallOutline, MessageHistoryForRevision, Config_module, LLMEditor_module, ReviseChapter_func_local, _Checkpoint=None):
     """Runs the final chapter revision loop (Stage 5)."""
     _Logger.Log(f"Stage 5: Entering Feedback/Revision Loop For Chapter {_ChapterNum}/{_TotalChapters}", 4)
 
@@ -468,14 +550,26 @@ def _run_final_chapter_revision_loop(Interface, _Logger, ActivePrompts, _Chapter
     Iterations = 0
     RevisionLoopExitReason = "Unknown"
 
+    # Resume after the last revision that was checkpointed
+    LastRevision = _Checkpoint.get("revision") if _Checkpoint is not None else None
+    if LastRevision:
+        Iterations = LastRevision["iteration"]
+        CurrentChapterContent = LastRevision["text"]
+        CurrentWritingHistory = LastRevision["history"]
+        _Logger.Log(f"Resuming from checkpoint: Stage 5 revision {Iterations} of Chapter {_ChapterNum}", 4)
+
     while True:
         Iterations += 1
-        Feedback = LLMEditor_module.GetFeedbackOnChapter(
-            Interface, _Logger, CurrentChapterContent, OverallOutline  # OverallOutline is _Outline from GenerateChapter
+        AtRevisionCap = Iterations > Config_module.CHAPTER_MAX_REVISIONS
+        # Feedback only feeds another revision; the rating only matters once the minimum revisions are done
+        Feedback, Rating = ReviewChapter(
+            LLMEditor_module, Interface, _Logger, CurrentChapterContent, OverallOutline,  # OverallOutline is _Outline from GenerateChapter
+            _NeedFeedback=not AtRevisionCap,
+            _NeedRating=AtRevisionCap or Iterations > Config_module.CHAPTER_MIN_REVISIONS,
+            _Config=Config_module,
         )
-        Rating = LLMEditor_module.GetChapterRating(Interface, _Logger, CurrentChapterContent)
 
-        if Iterations > Config_module.CHAPTER_MAX_REVISIONS:
+        if AtRevisionCap:
             RevisionLoopExitReason = "Max Revisions Reached"
             break
         # Original code used Rating as boolean for this check
@@ -494,12 +588,14 @@ def _run_final_chapter_revision_loop(Interface, _Logger, ActivePrompts, _Chapter
             _Iteration=Iterations,
             # ActivePrompts is implicitly handled by ReviseChapter_func_local as it imports it.
         )
+        if _Checkpoint is not None:
+            _Checkpoint.put("revision", {"iteration": Iterations, "text": CurrentChapterContent, "history": CurrentWritingHistory})
 
     _Logger.Log(f"{RevisionLoopExitReason}, Exiting Feedback/Revision Loop (Stage 5) For Chapter {_ChapterNum}/{_TotalChapters} after {Iterations}/{Config_module.CHAPTER_MAX_REVISIONS} iteration(s). Final Rating: {Rating}", 4)
     return CurrentChapterContent
 
 
-def _run_scene_generation_pipeline_for_initial_plot(Interface, _Logger, ActivePrompts, _ChapterNum, _TotalChapters, ThisChapterOutline, _FullOutlineForSceneGen, _BaseContext, Config_module, _ExpandedChapterOutline=None):
+def _run_scene_generation_pipeline_for_initial_plot(Interface, _Logger, ActivePrompts, _ChapterNum, _TotalChapters, ThisChapterOutline, _FullOutlineForSceneGen, _BaseContext, Config_module, _ExpandedChapterOutline=None, _Checkpoint=None):
     """Generates initial plot using scene-by-scene pipeline."""
     _Logger.Log(f"Stage 1 (Alternative): Running Scene Generation Pipeline for Chapter {_ChapterNum}/{_TotalChapters}", 3)
     # Note: Writer.Scene.ChapterByScene is imported in the main GenerateChapter or at file top.
@@ -514,6 +610,7 @@ def _run_scene_generation_pipeline_for_initial_plot(Interface, _Logger, ActivePr
         _BaseContext,
         _ExpandedChapterOutline,  # type: ignore # Pass expanded chapter outline with scenes
         # Config_module is implicitly used by ChapterByScene if it imports Writer.Config directly
+        _Checkpoint=_Checkpoint,
     )
     _Logger.Log(f"Stage 1 (Alternative): Scene Generation Pipeline COMPLETE for Chapter {_ChapterNum}/{_TotalChapters}", 3)
     return Stage1Chapter
@@ -529,14 +626,43 @@ def GenerateChapter(
     # _QualityThreshold: int = 85, # Removed as it's unused
     _BaseContext: str = "",
     _FullOutlineForSceneGen: str = "",  # Added to pass the full outline if needed by scene gen
-    _ExpandedChapterOutline: dict = None  # type: ignore[assignment]  # Added to pass expanded chapter outline with scenes
+    _ExpandedChapterOutline: dict = None,  # type: ignore[assignment]  # Added to pass expanded chapter outline with scenes
+    _Checkpoint: ChapterCheckpoint = None  # type: ignore[assignment]  # Sub-step checkpoints for resume
 ):
+    Draft = DraftChapter(
+        Interface, _Logger, _ChapterNum, _TotalChapters, _Outline, _Chapters,
+        _BaseContext, _FullOutlineForSceneGen, _ExpandedChapterOutline, _Checkpoint=_Checkpoint
+    )
+    return FinishChapter(Interface, _Logger, Draft, _Outline, _Chapters, _BaseContext, _Checkpoint=_Checkpoint)
+
+
+def DraftChapter(
+    Interface,
+    _Logger,
+    _ChapterNum: int,
+    _TotalChapters: int,
+    _Outline: str,
+    _Chapters: list = [],
+    _BaseContext: str = "",
+    _FullOutlineForSceneGen: str = "",
+    _ExpandedChapterOutline: dict = None,  # type: ignore[assignment]
+    _PreviousChapterPending: bool = False,
+    _Checkpoint: ChapterCheckpoint = None  # type: ignore[assignment]
+):
+    """
+    Outline-driven half of GenerateChapter: Stage 0 and Stage 1.
+
+    With _PreviousChapterPending the previous chapter is still being written, so
+    the draft is made from the outline alone and FinishChapter adds the
+    previous-chapter summary once that text exists. Returns a draft dict for
+    FinishChapter. Sub-steps already in _Checkpoint are reused.
+    """
     from Writer.PromptsHelper import get_prompts
     ActivePrompts = get_prompts()  # Use language-aware import
     import Writer.Config as Config  # Import Config
     import Writer.Chapter.ChapterGenSummaryCheck as ChapterGenSummaryCheck  # Import for helpers
-    import Writer.LLMEditor as LLMEditor  # Import for helpers
     # Scene.ChapterByScene is imported where _run_scene_generation_pipeline_for_initial_plot is defined/called
+    Checkpoint = _Checkpoint if _Checkpoint is not None else ChapterCheckpoint()
 
     # Stage 0: Prepare initial context, chapter-specific outline, and last chapter summary
     (
@@ -546,39 +672,80 @@ def GenerateChapter(
         FormattedLastChapterSummary,
         DetailedChapterOutlineForCheck
     ) = _prepare_initial_generation_context(
-        Interface, _Logger, ActivePrompts, _Outline, _Chapters,
-        _ChapterNum, _TotalChapters, Config
+        Interface, _Logger, ActivePrompts, _Outline, [] if _PreviousChapterPending else _Chapters,
+        _ChapterNum, _TotalChapters, Config, Checkpoint, _ExpandedChapterOutline
     )
     _Logger.Log(f"Done with base langchain setup for Chapter {_ChapterNum}/{_TotalChapters}", 2)
 
     # Stage 1: Create Initial Plot (either via scene pipeline or direct generation)
-    Stage1Chapter = ""
-    if Config.SCENE_GENERATION_PIPELINE:  # Use Config from import
-        Stage1Chapter = _run_scene_generation_pipeline_for_initial_plot(
-            Interface, _Logger, ActivePrompts, _ChapterNum, _TotalChapters,
-            ThisChapterOutline, _FullOutlineForSceneGen, _BaseContext, Config,  # Pass Config module
-            _ExpandedChapterOutline  # Pass expanded chapter outline with scenes
-        )
-    else:
-        Stage1Chapter = _generate_stage1_plot(
+    def generate_stage1():
+        if Config.SCENE_GENERATION_PIPELINE:  # Use Config from import
+            return _run_scene_generation_pipeline_for_initial_plot(
+                Interface, _Logger, ActivePrompts, _ChapterNum, _TotalChapters,
+                ThisChapterOutline, _FullOutlineForSceneGen, _BaseContext, Config,  # Pass Config module
+                _ExpandedChapterOutline,  # Pass expanded chapter outline with scenes
+                Checkpoint
+            )
+        return _generate_stage1_plot(
             Interface, _Logger, ActivePrompts, _ChapterNum, _TotalChapters, MessageHistory,  # Pass MessageHistory
             ContextHistoryInsert, ThisChapterOutline, FormattedLastChapterSummary,
             _BaseContext, DetailedChapterOutlineForCheck, Config, ChapterGenSummaryCheck  # Pass Config and ChapterGenSummaryCheck modules
         )
 
+    Stage1Chapter = Checkpoint.run("stage1", generate_stage1, _Logger)
+
+    return {
+        "chapter_num": _ChapterNum,
+        "total_chapters": _TotalChapters,
+        "message_history": MessageHistory,
+        "context_history_insert": ContextHistoryInsert,
+        "chapter_outline": ThisChapterOutline,
+        "last_chapter_summary": FormattedLastChapterSummary,
+        "outline_for_check": DetailedChapterOutlineForCheck,
+        "previous_chapter_pending": _PreviousChapterPending,
+        "stage1": Stage1Chapter,
+    }
+
+
+def FinishChapter(Interface, _Logger, _Draft: dict, _Outline: str, _Chapters: list = [], _BaseContext: str = "", _Checkpoint: ChapterCheckpoint = None):  # type: ignore[assignment]
+    """Continuity-dependent half of GenerateChapter: Stages 2, 3 and 5 on a DraftChapter result."""
+    from Writer.PromptsHelper import get_prompts
+    ActivePrompts = get_prompts()  # Use language-aware import
+    import Writer.Config as Config  # Import Config
+    import Writer.Chapter.ChapterGenSummaryCheck as ChapterGenSummaryCheck  # Import for helpers
+    import Writer.LLMEditor as LLMEditor  # Import for helpers
+    Checkpoint = _Checkpoint if _Checkpoint is not None else ChapterCheckpoint()
+
+    _ChapterNum = _Draft["chapter_num"]
+    _TotalChapters = _Draft["total_chapters"]
+    MessageHistory = _Draft["message_history"]
+    ContextHistoryInsert = _Draft["context_history_insert"]
+    ThisChapterOutline = _Draft["chapter_outline"]
+    FormattedLastChapterSummary = _Draft["last_chapter_summary"]
+    DetailedChapterOutlineForCheck = _Draft["outline_for_check"]
+
+    if _Draft.get("previous_chapter_pending") and _Chapters:
+        # The draft was made ahead of the previous chapter; bring its continuity in now
+        _Logger.Log(f"Adding previous chapter continuity to prefetched draft of Chapter {_ChapterNum}/{_TotalChapters}", 4)
+        ContextHistoryInsert = ActivePrompts.CHAPTER_HISTORY_INSERT.format(_Outline=_Outline)
+        FormattedLastChapterSummary = _summarize_last_chapter(
+            Interface, _Logger, ActivePrompts, _Outline, _Chapters, _ChapterNum, _TotalChapters, Config, Checkpoint
+        )
+        DetailedChapterOutlineForCheck = _build_outline_for_check(ThisChapterOutline, FormattedLastChapterSummary)
+
     # Stage 2: Add Character Development
-    Stage2Chapter = _generate_stage2_character_dev(
+    Stage2Chapter = Checkpoint.run("stage2", lambda: _generate_stage2_character_dev(
         Interface, _Logger, ActivePrompts, _ChapterNum, _TotalChapters, MessageHistory,
         ContextHistoryInsert, ThisChapterOutline, FormattedLastChapterSummary,
-        Stage1Chapter, _BaseContext, DetailedChapterOutlineForCheck, Config, ChapterGenSummaryCheck
-    )
+        _Draft["stage1"], _BaseContext, DetailedChapterOutlineForCheck, Config, ChapterGenSummaryCheck
+    ), _Logger)
 
     # Stage 3: Add Dialogue
-    Stage3Chapter = _generate_stage3_dialogue(
+    Stage3Chapter = Checkpoint.run("stage3", lambda: _generate_stage3_dialogue(
         Interface, _Logger, ActivePrompts, _ChapterNum, _TotalChapters, MessageHistory,
         ContextHistoryInsert, ThisChapterOutline, FormattedLastChapterSummary,
         Stage2Chapter, _BaseContext, DetailedChapterOutlineForCheck, Config, ChapterGenSummaryCheck
-    )
+    ), _Logger)
 
     Chapter = Stage3Chapter
 
@@ -588,7 +755,8 @@ def GenerateChapter(
     else:
         Chapter = _run_final_chapter_revision_loop(
             Interface, _Logger, ActivePrompts, _ChapterNum, _TotalChapters,
-            Chapter, _Outline, MessageHistory, Config, LLMEditor, ReviseChapter  # Pass imported modules and local ReviseChapter
+            Chapter, _Outline, MessageHistory, Config, LLMEditor, ReviseChapter,  # Pass imported modules and local ReviseChapter
+            Checkpoint
         )
 
     return Chapter
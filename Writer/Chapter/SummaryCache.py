@@ -0,0 +1,78 @@
+"""
+SummaryCache - Summaries for LLMSummaryCheck keyed by a stable digest
+
+A summary is keyed by a SHA-256 digest of the model and the summary prompt,
+which includes the text being summarized. The key is the same in every
+process, so a cache file next to the run state still hits after a resume.
+Outline summaries are shared by all stage checks of a chapter, and a work
+summary is reused whenever the same text is checked again.
+
+StoryPipeline points the shared cache at <state dir>/summary_cache.json.
+Until then (e.g. in tests or one-off calls) the cache lives in memory only.
+"""
+import hashlib
+import json
+import os
+import threading
+
+SUMMARY_CACHE_FILENAME = "summary_cache.json"
+
+
+class SummaryCache:
+    """Digest -> summary text, optionally persisted to a JSON file"""
+
+    def __init__(self, filepath: str = None):  # type: ignore[assignment]
+        self.filepath = filepath
+        self._lock = threading.Lock()
+        self._entries = {}
+        if filepath and os.path.exists(filepath):
+            try:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}  # Unreadable cache: summaries are generated again
+
+    @staticmethod
+    def make_key(model: str, *prompts: str) -> str:
+        """Stable digest of the model and the prompts of a summary request"""
+        payload = json.dumps([str(model), [str(prompt) for prompt in prompts]], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, summary: str) -> None:
+        with self._lock:
+            self._entries[key] = summary
+            if not self.filepath:
+                return
+            os.makedirs(os.path.dirname(os.path.abspath(self.filepath)), exist_ok=True)
+            temp_filepath = f"{self.filepath}.{threading.get_ident()}.tmp"
+            with open(temp_filepath, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(temp_filepath, self.filepath)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_summary_cache = SummaryCache()
+_summary_cache_lock = threading.Lock()
+
+
+def get_summary_cache() -> SummaryCache:
+    """Returns the shared SummaryCache"""
+    return _summary_cache
+
+
+def use_summary_cache_file(filepath: str) -> SummaryCache:
+    """Makes the shared cache persist to filepath (loading what it holds) and returns it"""
+    global _summary_cache
+    with _summary_cache_lock:
+        if _summary_cache.filepath != filepath:
+            _summary_cache = SummaryCache(filepath)
+        return _summary_cache
+
+
+__all__ = ['SummaryCache', 'get_summary_cache', 'use_summary_cache_file', 'SUMMARY_CACHE_FILENAME']
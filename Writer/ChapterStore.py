@@ -0,0 +1,131 @@
+"""
+ChapterStore - Content-addressed chapter text blobs referenced from state
+
+With CHAPTER_BLOB_STORE enabled, every chapter version (raw, edited, scrubbed,
+translated) is written once to <state dir>/chapters/<sha[:2]>/<sha>.txt and
+the chapter dicts in state hold its hash under "text_ref" instead of the text.
+Identical versions (e.g. a pass that left a chapter unchanged) share one blob.
+
+StoredChapter keeps the existing chapter-dict interface: chapter["text"] and
+chapter.get("text") read the blob on demand, and assigning "text" stores a new
+blob. Serialized state therefore stays small and is independent of how many
+versions exist, and resuming only reads the texts that are actually used.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+TEXT_KEY = "text"
+REF_KEY = "text_ref"
+
+
+class ChapterStore:
+    """Content-addressed text blobs on disk with a small in-memory LRU cache"""
+
+    def __init__(self, root: str, cache_size: int = 8):
+        self.root = root
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, ref: str) -> str:
+        return os.path.join(self.root, ref[:2], f"{ref}.txt")
+
+    def put(self, text: str) -> str:
+        """Stores text (once per distinct content) and returns its reference"""
+        ref = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        path = self._path(ref)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(temp_path, path)
+        self._remember(ref, text)
+        return ref
+
+    def get(self, ref: str) -> str:
+        """Returns the text stored under ref"""
+        with self._lock:
+            if ref in self._cache:
+                self._cache.move_to_end(ref)
+                return self._cache[ref]
+        with open(self._path(ref), "r", encoding="utf-8") as f:
+            text = f.read()
+        self._remember(ref, text)
+        return text
+
+    def _remember(self, ref: str, text: str) -> None:
+        with self._lock:
+            self._cache[ref] = text
+            self._cache.move_to_end(ref)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def wrap(self, chapter: dict) -> "StoredChapter":
+        """StoredChapter for a chapter dict, moving an inline "text" into the store"""
+        if isinstance(chapter, StoredChapter) and chapter.store is self:
+            return chapter
+        return StoredChapter(self, chapter)
+
+    def attach(self, chapters: list) -> list:
+        """Wraps every chapter dict of a list in place (e.g. after loading state) and returns the list"""
+        for index, chapter in enumerate(chapters):
+            if isinstance(chapter, dict):
+                chapters[index] = self.wrap(chapter)
+        return chapters
+
+    def inline(self, obj):
+        """Copy of a JSON-ready structure with every text_ref replaced by its text (for final output files)"""
+        if isinstance(obj, dict):
+            if REF_KEY in obj and TEXT_KEY not in obj:
+                inlined = {key: self.inline(value) for key, value in obj.items() if key != REF_KEY}
+                inlined[TEXT_KEY] = self.get(obj[REF_KEY])
+                return inlined
+            return {key: self.inline(value) for key, value in obj.items()}
+        if isinstance(obj, list):
+            return [self.inline(item) for item in obj]
+        return obj
+
+
+class StoredChapter(dict):
+    """
+    Chapter dict whose "text" lives in a ChapterStore.
+
+    The underlying dict holds "text_ref" instead of "text", so serialize_for_json
+    and json.dump write only the reference.
+    """
+
+    def __init__(self, store: ChapterStore, data: dict):
+        super().__init__()
+        self.store = store
+        for key, value in data.items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        if key == TEXT_KEY:
+            if not super().__contains__(REF_KEY):
+                raise KeyError(key)
+            return self.store.get(super().__getitem__(REF_KEY))
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        if key == TEXT_KEY:
+            super().__setitem__(REF_KEY, self.store.put(value))
+            return
+        super().__setitem__(key, value)
+
+    def __contains__(self, key):
+        if key == TEXT_KEY:
+            return super().__contains__(REF_KEY)
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def copy(self):
+        return StoredChapter(self.store, dict(super().items()))
+
+
+__all__ = ['ChapterStore', 'StoredChapter']
@@ -95,6 +95,16 @@ FAST_MODEL = (
 # OLLAMA_CTX = 8192
 OLLAMA_CTX = 16384
 
+# Token counting and context packing
+CHARS_PER_TOKEN_ESTIMATE = 4.5  # Starting chars/token ratio when no local tokenizer exists (calibrated per model at runtime)
+TOKEN_WARNING_THRESHOLD = 20000  # Warn when a prompt is larger than this many tokens
+TOKENIZER_FILES = {}  # Optional map of model name -> local tokenizer.json for exact counts
+TOKENIZER_DIR = ""  # Optional directory with <model_name>/tokenizer.json files
+CONTEXT_RESPONSE_RESERVE_TOKENS = 4096  # Tokens kept free for the response when packing prompts
+PACK_CHAT_HISTORY = False  # Drop/truncate older chat turns that would overflow the model context (the task prompt is always kept)
+MODEL_CONTEXT_TOKENS = {}  # Context windows for non-Ollama providers, e.g. {"google": 1000000}
+CHAPTER_CONTEXT_TOKEN_BUDGET = 0  # Budget for the per-chapter generation context, 0 = off (lore is dropped first, then memory)
+
 # OLLAMA_HOST = "https://xxxx-11434.proxy.runpod.net"
 # OLLAMA_HOST = "http://10.23.82.116:11434"
 # OLLAMA_HOST = "10.23.147.239:11434"
@@ -117,6 +127,9 @@ CHAPTER_NO_REVISIONS = False  # Note this value is overridden by the argparser #
 CHAPTER_QUALITY = 90  # Note this value is overridden by the argparser
 CHAPTER_MIN_REVISIONS = 1  # Note this value is overridden by the argparser
 CHAPTER_MAX_REVISIONS = 3  # Note this value is overridden by the argparser
+COMBINED_REVIEW_MODE = False  # One structured review call returns both the critique and the IsComplete decision in revision loops
+REVIEW_WORKERS = 1  # Separate feedback and IsComplete calls of a revision loop run concurrently (1 = sequential)
+SUMMARY_CHECK_WORKERS = 1  # Work and outline summaries of a summary check generated concurrently (1 = sequential)
 
 # Minimum Word Counts for chapter generation calls
 MIN_WORDS_TRANSLATE_PROMPT = 10  # Minimum words for prompt translation
@@ -139,8 +152,12 @@ MIN_WORDS_EDIT_NOVEL = 150  # Minimum words for final novel edit pass per chapte
 SCRUB_NO_SCRUB = False  # Note this value is overridden by the argparser
 EXPAND_OUTLINE = True  # Note this value is overridden by the argparser
 ENABLE_FINAL_EDIT_PASS = True  # Note this value is overridden by the argparser
+POST_PROCESSING_WORKERS = 1  # Chapters edited, scrubbed or translated concurrently (1 = sequential; with STREAMING_POST_PROCESSING this pool runs alongside chapter writing)
+STREAMING_POST_PROCESSING = False  # Edit/scrub/translate each chapter while later chapters are still being written
 
 SCENE_GENERATION_PIPELINE = True
+SCENE_WRITING_WORKERS = 1  # Scenes of a chapter written concurrently (1 = sequential; raise for providers that serve parallel requests)
+SCENE_BOUNDARY_SMOOTHING = False  # Rewrite each scene's opening paragraph to follow on from the previous scene
 
 OPTIONAL_OUTPUT_NAME = ""
 
@@ -152,7 +169,7 @@ NATIVE_LANGUAGE = "id"
 
 # Maximum retries for Pydantic validation
 MAX_PYDANTIC_RETRIES = 5  # Jumlah percobaan ulang maksimum untuk Pydantic validation
-PYDANTIC_RETRY_DELAY = 3  # Delay in seconds before retry (helps Ollama model unload)
+STREAMING_JSON_VALIDATION = False  # Stream structured Ollama calls and abort as soon as the JSON goes off-schema
 
 # LLM Native Reasoning Mode Control
 #
@@ -170,12 +187,48 @@ MAX_OPENROUTER_RETRIES = 2  # Maximum retries for OpenRouter API calls
 # Maximum retries for Google API calls
 MAX_GOOGLE_RETRIES = 2
 
+# Retry policy shared by all providers (see Writer/Interface/RetryPolicy.py)
+# Per error class: delay = min(max, base * factor ** attempt), jittered; Retry-After headers take precedence
+RETRY_BACKOFF = {
+    "validation": {"base": 0.0, "factor": 1.0, "max": 0.0},  # Bad JSON / schema errors re-prompt immediately
+    "transport": {"base": 1.0, "factor": 2.0, "max": 30.0},  # Timeouts, connection resets
+    "rate_limit": {"base": 5.0, "factor": 2.0, "max": 120.0},  # HTTP 429 / RESOURCE_EXHAUSTED
+    "overload": {"base": 3.0, "factor": 2.0, "max": 60.0},  # 5xx, overloaded or busy hosts
+}
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # Consecutive host failures before calls to that host are paused (0 = off)
+CIRCUIT_BREAKER_RESET_SECONDS = 60  # Seconds a tripped host is paused before a single probe request
+RATE_LIMIT_REQUESTS_PER_MINUTE = {}  # Token-bucket limit per provider or "provider@host", e.g. {"google": 60}
+
+# LLM response cache (content-addressed, keyed by model/messages/seed/schema/options)
+LLM_CACHE_MODE = "bypass"  # "read-write", "read-only" or "bypass" (overridden by -LLMCache)
+LLM_CACHE_DIR = ".llm_cache"  # Directory holding the SQLite response cache
+LLM_CACHE_MAX_MB = 512  # Size limit before least-recently-used entries are evicted
+
+# Request concurrency limits (enforced by Interface for threads and AsyncInterface coroutines)
+MAX_CONCURRENT_REQUESTS_PER_PROVIDER = {"ollama": 2, "google": 8, "openrouter": 8}  # In-flight calls per provider
+MAX_CONCURRENT_REQUESTS_PER_HOST = 2  # In-flight calls per explicit host (e.g. each Ollama server)
+ASYNC_INTERFACE_WORKERS = 16  # Worker threads backing AsyncInterface coroutines
+
+# Shared keep-alive HTTP pool for OpenRouter chat and embeddings
+HTTP_POOL_CONNECTIONS = 4  # Number of per-host connection pools to keep
+HTTP_POOL_MAXSIZE = 16  # Maximum keep-alive connections per host
+HTTP_CONNECT_TIMEOUT = 10  # Seconds to establish a connection
+HTTP_READ_TIMEOUT = 600  # Default seconds to wait for a response
+HTTP_ENABLE_HTTP2 = True  # Use HTTP/2 via httpx when httpx[http2] is installed
+
 # Configuration comment removed - SafeGenerateText is no longer used
 # MAX_TEXT_RETRIES = 5  # This is deprecated as SafeGenerateText is replaced
 
 # Added based on test_pipeline.py AttributeErrors
 CHAPTER_HEADER_FORMAT = "## Chapter {chapter_num}: {chapter_title}"
 CHAPTER_MEMORY_WORDS = 250  # Adaptive: Short stories (≤3 chapters) use min(100, this value), longer stories use full value
+USE_HIERARCHICAL_MEMORY = False  # Chapter context gets rolling chapter/arc/story-so-far summaries instead of the previous chapter's last words
+STORY_MEMORY_TOKEN_BUDGET = 1024  # Tokens of story memory injected into each chapter's context
+STORY_MEMORY_ARC_SIZE = 4  # Chapter summaries per arc summary (and arcs kept before folding into the story so far)
+STORY_MEMORY_SUMMARY_WORDS = 150  # Target length of arc and story-so-far summaries
+PRECOMPUTE_CHAPTER_SUMMARIES = True  # Summary of a finished chapter generated in the background for the next chapter's continuity
+CHAPTER_PREFETCH_DEPTH = 0  # Later chapters drafted (outline + Stage 1) in the background while the current one is finished (0 = sequential)
+OUTLINE_EXPANSION_WORKERS = 1  # Per-chapter outlines expanded concurrently (1 = sequential; raise for providers that serve parallel requests)
 GENERATE_CHAPTER_TITLES = True
 TITLE_MAX_TOKENS = 50
 MAX_WORDS_FOR_CHAPTER_TITLE_PROMPT = 500  # Maximum words of chapter content to use for title generation
@@ -184,10 +237,14 @@ MAX_LENGTH_CHAPTER_TITLE = 100  # Maximum character length for chapter title
 MAX_RETRIES_CHAPTER_TITLE = 3  # Maximum retries for chapter title generation
 ENABLE_GLOBAL_OUTLINE_REFINEMENT = True  # Flag to enable global outline refinement
 AUTO_CHAPTER_TITLES = True  # Flag to enable automatic chapter title generation
+BACKGROUND_CHAPTER_TITLES = True  # Chapter titles generated in the background and merged before post-processing
 DEFAULT_CHAPTER_TITLE_PREFIX = "Chapter"  # Default prefix for chapter titles
 ADD_CHAPTER_TITLES_TO_NOVEL_BODY_TEXT = True  # Add chapter titles to final novel text
 STORIES_DIR = "Stories"  # Directory for generated stories
 LOG_DIRECTORY = "Logs"  # Directory for log files
+STATE_BACKEND = "json"  # "json" rewrites run.state.json on every save; "journal" appends only changed keys to run.state.json.journal
+STATE_JOURNAL_COMPACT_EVERY = 50  # Journal records folded back into run.state.json (and the journal emptied) after this many saves
+CHAPTER_BLOB_STORE = False  # Store chapter texts once per version under <log dir>/chapters; state keeps only their hashes
 
 # Markdown output configuration
 INCLUDE_OUTLINE_IN_MD = True  # Include outline in final markdown output
@@ -233,6 +290,8 @@ EMBEDDING_MODEL = "ollama://qwen3-embedding:latest"  # Embedding model string. W
 EMBEDDING_DIMENSIONS = 768  # Default embedding dimensions (for nomic-embed-text)
 EMBEDDING_CTX = 8192  # Context window for embeddings (match nomic-embed-text-v2-moe capabilities)
 EMBEDDING_FALLBACK_ENABLED = False  # Fail fast, no automatic fallback
+EMBEDDING_BATCH_SIZE = 64  # Maximum texts sent in one embedding request
+EMBEDDING_BATCH_MAX_TOKENS = 8192  # Estimated token budget per embedding request
 
 
 # Example model URLs for reference (not actively used)
@@ -0,0 +1,345 @@
+"""
+Estimator - Pre-run estimate of LLM calls, tokens and time (-Estimate)
+
+Write.py -Estimate runs the real StoryPipeline stage graph offline, before
+any model is contacted. Every configured *_MODEL is replaced by its own
+mock:// stand-in (see Writer/Interface/MockProviders.py), so the current
+flags decide the calls exactly as in a real run: outline revisions,
+CHAPTER_MAX_REVISIONS, the scene pipeline, reasoning chain, summary checks,
+and the edit/scrub/translate passes. Each call is recorded with its stage,
+its step (the Writer function that made it), the real model it stands in
+for, and its prompt and completion tokens.
+
+The graph is walked twice. The "expected" scenario approves every quality
+check, so loops stop at their minimum. The "worst case" scenario fails every
+check, so loops run to their maximum.
+
+Times come from CostModel. CostModel is calibrated from the "Response for
+<model> in <s>s ... Tokens: {...}" lines that previous runs wrote to
+<LOG_DIRECTORY>/*/Main.log. Per model it fits
+seconds = overhead + prompt_tokens / prefill_tps + completion_tokens / decode_tps
+and keeps that model's mean completion length, which also sizes the mock
+prose. Calls run sequentially in this model, so concurrency settings
+(*_WORKERS, CHAPTER_PREFETCH_DEPTH) bring the real wall-clock below the
+estimate.
+"""
+import ast
+import contextlib
+import glob
+import io
+import os
+import re
+import shutil
+import sys
+import tempfile
+from types import SimpleNamespace
+
+import Writer.Config
+import Writer.Interface.Wrapper
+import Writer.PrintUtils
+from Writer.Chapter.SummaryCache import use_summary_cache_file
+
+# Fallbacks when no previous run of a model was logged
+DEFAULT_DECODE_TPS = 20.0
+DEFAULT_PREFILL_TPS = 400.0
+DEFAULT_OVERHEAD_SECONDS = 1.0
+DEFAULT_CHAPTERS = 10
+
+_RESPONSE_LINE = re.compile(r"Response for (?P<model>\S+) in (?P<seconds>[\d.]+)s \(.*?\)\. Tokens: (?P<usage>\{.*\})")
+_PIPELINE_STAGES = {
+    "_generate_outline_stage": "outline",
+    "_detect_chapters_stage": "detect_chapters",
+    "_expand_chapter_outlines_stage": "expand_chapter_outlines",
+    "_write_chapters_stage": "write_chapters",
+    "_perform_post_processing_stage": "post_processing",
+}
+
+
+class CostModel:
+    """Per-model latency fit and completion length from previous runs' logs"""
+
+    def __init__(self, samples: dict = None):  # type: ignore[assignment]
+        # {model: [(prompt_tokens, completion_tokens, seconds), ...]}
+        self.samples = samples or {}
+        self._fits = {}
+
+    @classmethod
+    def from_logs(cls, log_root: str) -> "CostModel":
+        """Collects real (non mock/replay) calls from every <log_root>/*/Main.log"""
+        samples = {}
+        for log_path in glob.glob(os.path.join(log_root, "*", "Main.log")):
+            try:
+                with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+                    for line in f:
+                        sample = cls.parse_line(line)
+                        if sample:
+                            samples.setdefault(sample[0], []).append(sample[1:])
+            except OSError:
+                continue
+        return cls(samples)
+
+    @staticmethod
+    def parse_line(line: str):
+        """(model, prompt_tokens, completion_tokens, seconds) from a Wrapper response log line, else None"""
+        match = _RESPONSE_LINE.search(line)
+        if not match or match.group("model").startswith(("mock://", "replay://")):
+            return None
+        try:
+            usage = ast.literal_eval(match.group("usage"))
+            seconds = float(match.group("seconds"))
+        except (ValueError, SyntaxError):
+            return None
+        if not isinstance(usage, dict) or seconds <= 0:
+            return None  # Cache hits and failed calls carry no timing information
+        return match.group("model"), int(usage.get("prompt_tokens", 0)), int(usage.get("completion_tokens", 0)), seconds
+
+    def _samples_for(self, model: str) -> list:
+        if model in self.samples:
+            return self.samples[model]
+        return [sample for model_samples in self.samples.values() for sample in model_samples]
+
+    def is_calibrated(self, model: str) -> bool:
+        return model in self.samples
+
+    def mean_completion_tokens(self, model: str = None):  # type: ignore[assignment]
+        """Mean completion tokens per call for model (all models if None or unseen); None without history"""
+        samples = self._samples_for(model) if model else self._samples_for("")
+        if not samples:
+            return None
+        return sum(sample[1] for sample in samples) / len(samples)
+
+    def seconds(self, model: str, prompt_tokens: float, completion_tokens: float) -> float:
+        overhead, per_prompt, per_completion = self._fit(model)
+        return overhead + prompt_tokens * per_prompt + completion_tokens * per_completion
+
+    def _fit(self, model: str):
+        if model not in self._fits:
+            self._fits[model] = _fit_latency(self._samples_for(model))
+        return self._fits[model]
+
+
+def _fit_latency(samples: list):
+    """(overhead, seconds per prompt token, seconds per completion token) by least squares, with fallbacks"""
+    defaults = (DEFAULT_OVERHEAD_SECONDS, 1 / DEFAULT_PREFILL_TPS, 1 / DEFAULT_DECODE_TPS)
+    if not samples:
+        return defaults
+    if len(samples) >= 5:
+        coefficients = _least_squares([(1.0, p, c) for p, c, _ in samples], [s for _, _, s in samples])
+        if coefficients and all(value >= 0 for value in coefficients):
+            return tuple(coefficients)
+    # Too few or inconsistent samples: attribute all time to completion tokens
+    completion = sum(c for _, c, _ in samples)
+    seconds = sum(s for _, _, s in samples)
+    return (0.0, 0.0, seconds / completion) if completion else (seconds / len(samples), 0.0, 0.0)
+
+
+def _least_squares(rows: list, targets: list):
+    """Solves the normal equations for a small design matrix; None if singular"""
+    size = len(rows[0])
+    matrix = [[sum(row[i] * row[j] for row in rows) for j in range(size)] for i in range(size)]
+    vector = [sum(row[i] * target for row, target in zip(rows, targets)) for i in range(size)]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda r: abs(matrix[r][column]))
+        if abs(matrix[pivot][column]) < 1e-12:
+            return None
+        matrix[column], matrix[pivot] = matrix[pivot], matrix[column]
+        vector[column], vector[pivot] = vector[pivot], vector[column]
+        for row in range(size):
+            if row != column:
+                factor = matrix[row][column] / matrix[column][column]
+                matrix[row] = [a - factor * b for a, b in zip(matrix[row], matrix[column])]
+                vector[row] -= factor * vector[column]
+    return [vector[i] / matrix[i][i] for i in range(size)]
+
+
+class _QuietLogger:
+    """Logger stand-in: the estimate run's own log lines are not shown"""
+
+    def __init__(self, log_dir: str):
+        self.LogDirPrefix = log_dir
+        self.LogItems = []
+
+    def Log(self, _Item, _Level: int):
+        if _Level >= 7:
+            self.LogItems.append(str(_Item))
+
+    def SaveLangchain(self, _LangChainID: str, _LangChain: list):
+        pass
+
+
+class _RecordingInterface(Writer.Interface.Wrapper.Interface):
+    """Interface that records every chat call of the estimate run"""
+
+    def __init__(self, Models: list, RealModels: dict):
+        super().__init__(Models)
+        self.RealModels = RealModels  # mock URI -> configured model
+        self.Stage = "setup"
+        self.Calls = []
+
+    def ChatResponse(self, _Logger, _Messages, _Model: str, _SeedOverride: int, _FormatSchema: dict = None):  # type: ignore[assignment]
+        Result = super().ChatResponse(_Logger, _Messages, _Model, _SeedOverride, _FormatSchema)
+        FullResponseMessages, TokenUsage, _, EstInputTokens = Result
+        self.Calls.append({
+            "stage": self.Stage,
+            "step": _calling_step(),
+            "model": self.RealModels.get(_Model, _Model),
+            "prompt_tokens": EstInputTokens or (TokenUsage or {}).get("prompt_tokens", 0),
+            "completion_tokens": (TokenUsage or {}).get("completion_tokens", 0),
+        })
+        return Result
+
+
+def _calling_step() -> str:
+    """'Module.function' of the innermost Writer frame outside Writer/Interface and this module"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename.replace("\\", "/")
+        if "/Writer/" in filename and "/Writer/Interface/" not in filename and not filename.endswith("/Estimator.py"):
+            return f"{os.path.splitext(os.path.basename(filename))[0]}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def _tag_stages(pipeline, interface):
+    """Records which StoryPipeline stage is running (per instance, sequential stages)"""
+    for method_name, stage in _PIPELINE_STAGES.items():
+        method = getattr(pipeline, method_name)
+
+        def tagged(*args, _method=method, _stage=stage, **kwargs):
+            previous, interface.Stage = interface.Stage, _stage
+            try:
+                return _method(*args, **kwargs)
+            finally:
+                interface.Stage = previous
+        setattr(pipeline, method_name, tagged)
+
+
+def _walk_pipeline(Prompt: str, ActivePrompts, Chapters: int, Words: int, Approve: bool, WorkDir: str) -> list:
+    """Runs StoryPipeline on mock models and returns the recorded calls"""
+    from Writer.Pipeline import StoryPipeline
+    import Writer.Translator
+
+    ModelVars = [name for name in dir(Writer.Config) if name.endswith("_MODEL") and isinstance(getattr(Writer.Config, name), str)]
+    RealModels, MockFor = {}, {}
+    MockOptions = f"words={Words}&chapters={Chapters}&rating={90 if Approve else 0}&approve={1 if Approve else 0}"
+    for name in ModelVars:
+        real = getattr(Writer.Config, name)
+        if real not in MockFor:
+            MockFor[real] = f"mock://estimate{len(MockFor)}?{MockOptions}"
+            RealModels[MockFor[real]] = real
+        setattr(Writer.Config, name, MockFor[real])
+
+    os.makedirs(WorkDir, exist_ok=True)
+    Writer.Config.LOG_DIRECTORY = WorkDir
+    Writer.Config.STORIES_DIR = os.path.join(WorkDir, "Stories")
+    Writer.Config.LOREBOOK_PERSIST_DIR = os.path.join(WorkDir, "lorebook_db")
+    Writer.Config.LLM_CACHE_MODE = "bypass"
+    Writer.Config.ENABLE_PDF_GENERATION = False
+    Writer.Config.STREAMING_POST_PROCESSING = False  # Same calls; keeps post-processing attributed to its own stage
+    Writer.Config.DEBUG = False
+
+    Interface = _RecordingInterface(list(RealModels), RealModels)
+    Logger = _QuietLogger(WorkDir)
+
+    if Writer.Config.TRANSLATE_PROMPT_LANGUAGE and \
+            Writer.Config.TRANSLATE_PROMPT_LANGUAGE.lower() != Writer.Config.NATIVE_LANGUAGE.lower():
+        Interface.Stage = "prompt_translation"
+        Prompt = Writer.Translator.TranslatePrompt(
+            Interface, Logger, Prompt,
+            _SourceLanguage=Writer.Config.TRANSLATE_PROMPT_LANGUAGE, TargetLang=Writer.Config.NATIVE_LANGUAGE
+        )
+
+    pipeline = StoryPipeline(Interface, Logger, Writer.Config, ActivePrompts, is_fresh_run=True)
+    _tag_stages(pipeline, Interface)
+    state = {
+        "status": "in_progress", "log_directory": WorkDir, "config": {}, "last_completed_step": "init",
+        "expanded_chapter_outlines": [], "completed_chapters_data": [], "next_chapter_index": 1,
+    }
+    Args = SimpleNamespace(Output=os.path.join(WorkDir, "estimate"), GeneratePDF=False)
+    pipeline.run_pipeline(state, os.path.join(WorkDir, "run.state.json"), Prompt, Args=Args, StartTime=0)
+    return Interface.Calls
+
+
+def _summarize(calls: list, cost_model: CostModel) -> dict:
+    """Totals per stage, per model and per step, with completion lengths and times from the cost model"""
+    summary = {"total": {}, "stages": {}, "models": {}, "steps": {}}
+    for call in calls:
+        completion = cost_model.mean_completion_tokens(call["model"]) if cost_model.is_calibrated(call["model"]) else None
+        completion = completion if completion is not None else call["completion_tokens"]
+        seconds = cost_model.seconds(call["model"], call["prompt_tokens"], completion)
+        for table, key in (("total", None), ("stages", call["stage"]), ("models", call["model"]), ("steps", call["step"])):
+            row = summary[table] if key is None else summary[table].setdefault(key, {})
+            row["calls"] = row.get("calls", 0) + 1
+            row["prompt_tokens"] = row.get("prompt_tokens", 0) + call["prompt_tokens"]
+            row["completion_tokens"] = row.get("completion_tokens", 0) + int(completion)
+            row["seconds"] = row.get("seconds", 0.0) + seconds
+    return summary
+
+
+def EstimateRun(Prompt: str, ActivePrompts, Chapters: int = DEFAULT_CHAPTERS, LogRoot: str = None):  # type: ignore[assignment]
+    """
+    Estimates calls, tokens and time of a new run with the current Writer.Config.
+
+    Returns {"expected": summary, "worst_case": summary, "calibrated_models": [...],
+    "uncalibrated_models": [...], "chapters": n}. Writer.Config is restored afterwards.
+    """
+    cost_model = CostModel.from_logs(LogRoot or getattr(Writer.Config, "LOG_DIRECTORY", "Logs"))
+    mean_completion = cost_model.mean_completion_tokens()
+    # Mock prose as long as real responses were (about 0.75 words per token)
+    words = max(50, int(mean_completion * 0.75)) if mean_completion else 300
+
+    saved_config = {name: getattr(Writer.Config, name) for name in dir(Writer.Config) if name.isupper()}
+    work_root = tempfile.mkdtemp(prefix="estimate_")
+    report = {"chapters": Chapters}
+    # Components that open their own Logger (e.g. the lorebook) must not create log directories either
+    real_logger = Writer.PrintUtils.Logger
+    Writer.PrintUtils.Logger = lambda *args, **kwargs: _QuietLogger(work_root)
+    try:
+        for scenario, approve in (("expected", True), ("worst_case", False)):
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):  # Progress lines of the mock run
+                    calls = _walk_pipeline(Prompt, ActivePrompts, Chapters, words, approve, os.path.join(work_root, scenario))
+            finally:
+                for name, value in saved_config.items():
+                    setattr(Writer.Config, name, value)
+            report[scenario] = _summarize(calls, cost_model)
+    finally:
+        Writer.PrintUtils.Logger = real_logger
+        use_summary_cache_file(None)  # The pipeline pointed it into work_root
+        shutil.rmtree(work_root, ignore_errors=True)
+
+    models = sorted(set(report["expected"]["models"]) | set(report["worst_case"]["models"]))
+    report["calibrated_models"] = [model for model in models if cost_model.is_calibrated(model)]
+    report["uncalibrated_models"] = [model for model in models if not cost_model.is_calibrated(model)]
+    return report
+
+
+def _format_table(title: str, rows: dict) -> list:
+    lines = [title, f"  {'':<48} {'calls':>6} {'prompt tok':>11} {'compl tok':>10} {'hours':>7}"]
+    for key, row in sorted(rows.items(), key=lambda item: -item[1]["seconds"]):
+        lines.append(f"  {str(key)[:48]:<48} {row['calls']:>6} {row['prompt_tokens']:>11} {row['completion_tokens']:>10} {row['seconds'] / 3600:>7.2f}")
+    return lines
+
+
+def FormatEstimate(report: dict, TopSteps: int = 10) -> str:
+    """Human-readable report of EstimateRun"""
+    lines = [f"Run estimate for {report['chapters']} chapters (sequential model time; *_WORKERS and prefetch reduce wall-clock)"]
+    for scenario, label in (("expected", "Expected (checks pass at their minimum)"), ("worst_case", "Worst case (every loop runs to its maximum)")):
+        summary = report[scenario]
+        total = summary["total"]
+        lines.append("")
+        lines.append(f"== {label}: {total.get('calls', 0)} calls, {total.get('prompt_tokens', 0)} prompt + "
+                     f"{total.get('completion_tokens', 0)} completion tokens, {total.get('seconds', 0.0) / 3600:.2f} h ==")
+        lines += _format_table("Per stage:", summary["stages"])
+        lines += _format_table("Per model:", summary["models"])
+        top_steps = dict(sorted(summary["steps"].items(), key=lambda item: -item[1]["seconds"])[:TopSteps])
+        lines += _format_table(f"Top {len(top_steps)} steps:", top_steps)
+    lines.append("")
+    if report["calibrated_models"]:
+        lines.append(f"Calibrated from previous runs: {', '.join(report['calibrated_models'])}")
+    if report["uncalibrated_models"]:
+        lines.append(f"No logged runs (pooled or default rates used): {', '.join(report['uncalibrated_models'])}")
+    return "\n".join(lines)
+
+
+__all__ = ['CostModel', 'EstimateRun', 'FormatEstimate']
@@ -0,0 +1,59 @@
+"""
+AsyncInterface - asyncio front-end for Writer.Interface.Wrapper.Interface
+
+The provider clients (ollama, google-genai, requests) are blocking, so each
+coroutine runs the matching sync Interface method on a worker thread. The
+per-provider and per-host request slots live in the wrapped Interface, which
+means coroutines and plain threads share the same concurrency limits.
+
+Example:
+    AsyncInt = AsyncInterface(Interface)
+    Results = await asyncio.gather(
+        AsyncInt.SafeGeneratePydantic(Logger, MessagesA, Model, TitleOutput),
+        AsyncInt.SafeGeneratePydantic(Logger, MessagesB, Model, TitleOutput),
+    )
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import Writer.Config
+from Writer.Interface.Wrapper import Interface
+
+
+class AsyncInterface:
+    """Coroutine versions of ChatResponse, SafeGenerateJSON, SafeGeneratePydantic and GenerateEmbedding"""
+
+    def __init__(self, _Interface: Interface = None, Models: list = [], max_workers: int = None):  # type: ignore[assignment]
+        self.Interface = _Interface if _Interface is not None else Interface(Models)
+        workers = max_workers or getattr(Writer.Config, 'ASYNC_INTERFACE_WORKERS', 16)
+        self._Executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="AsyncInterface")
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._Executor, functools.partial(func, *args, **kwargs))
+
+    async def ChatResponse(self, _Logger, _Messages, _Model: str, _SeedOverride: int, _FormatSchema: dict = None):  # type: ignore[assignment]
+        return await self._run(self.Interface.ChatResponse, _Logger, _Messages, _Model, _SeedOverride, _FormatSchema=_FormatSchema)
+
+    async def SafeGenerateJSON(self, _Logger, _Messages, _Model: str, _SeedOverride: int = -1, _FormatSchema: dict = None, _max_retries_override: int = None):  # type: ignore[assignment]
+        return await self._run(
+            self.Interface.SafeGenerateJSON, _Logger, _Messages, _Model,
+            _SeedOverride=_SeedOverride, _FormatSchema=_FormatSchema, _max_retries_override=_max_retries_override,
+        )
+
+    async def SafeGeneratePydantic(self, _Logger, _Messages, _Model: str, _PydanticModel: type, _SeedOverride: int = -1, _max_retries_override: int = None):  # type: ignore[assignment]
+        return await self._run(
+            self.Interface.SafeGeneratePydantic, _Logger, _Messages, _Model, _PydanticModel,
+            _SeedOverride=_SeedOverride, _max_retries_override=_max_retries_override,
+        )
+
+    async def GenerateEmbedding(self, _Logger, _Texts: list, _Model: str, _SeedOverride: int = -1):
+        return await self._run(self.Interface.GenerateEmbedding, _Logger, _Texts, _Model, _SeedOverride)
+
+    def __getattr__(self, name):
+        # Message builders and other cheap helpers stay synchronous
+        return getattr(self.Interface, name)
+
+    def close(self):
+        self._Executor.shutdown(wait=True)
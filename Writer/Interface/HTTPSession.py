@@ -0,0 +1,92 @@
+"""
+HTTPSession - Shared keep-alive HTTP connection pool for remote providers
+
+Interface owns one pool and hands it to every OpenRouter client and to the
+OpenRouter embedding calls, so TCP+TLS handshakes are paid once per host
+instead of once per request.
+
+When HTTP_ENABLE_HTTP2 is set and httpx with the h2 extra is installed the pool
+uses an HTTP/2 httpx.Client; otherwise it falls back to a requests.Session with
+a sized HTTPAdapter (requests itself only speaks HTTP/1.1).
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def _http2_available() -> bool:
+    try:
+        import httpx  # noqa: F401
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class HTTPSessionPool:
+    """Thin pooled client exposing post() and stream_lines() over requests or httpx"""
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 16,
+                 connect_timeout: float = 10, read_timeout: float = 600, enable_http2: bool = True):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.http2 = bool(enable_http2) and _http2_available()
+
+        if self.http2:
+            import httpx
+            self._client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            )
+        else:
+            self._client = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            self._client.mount("https://", adapter)
+            self._client.mount("http://", adapter)
+
+    @classmethod
+    def from_config(cls):
+        """Build a pool from the HTTP_* settings in Writer.Config"""
+        import Writer.Config
+        return cls(
+            pool_connections=getattr(Writer.Config, 'HTTP_POOL_CONNECTIONS', 4),
+            pool_maxsize=getattr(Writer.Config, 'HTTP_POOL_MAXSIZE', 16),
+            connect_timeout=getattr(Writer.Config, 'HTTP_CONNECT_TIMEOUT', 10),
+            read_timeout=getattr(Writer.Config, 'HTTP_READ_TIMEOUT', 600),
+            enable_http2=getattr(Writer.Config, 'HTTP_ENABLE_HTTP2', True),
+        )
+
+    def _timeout(self, timeout=None):
+        read_timeout = timeout if timeout is not None else self.read_timeout
+        if self.http2:
+            import httpx
+            return httpx.Timeout(read_timeout, connect=self.connect_timeout)
+        return (self.connect_timeout, read_timeout)
+
+    def post(self, url: str, headers: dict = None, json=None, data=None, timeout=None):  # type: ignore[assignment]
+        """POST over a pooled connection; the response supports raise_for_status() and json()"""
+        if self.http2:
+            # httpx takes raw request bodies as content=; data= is for form fields only
+            return self._client.post(url, headers=headers, json=json, content=data, timeout=self._timeout(timeout))
+        return self._client.post(url, headers=headers, json=json, data=data, timeout=self._timeout(timeout))
+
+    def get(self, url: str, headers: dict = None, timeout=None):  # type: ignore[assignment]
+        return self._client.get(url, headers=headers, timeout=self._timeout(timeout))
+
+    def stream_lines(self, url: str, headers: dict = None, data=None, timeout=None):  # type: ignore[assignment]
+        """POST and yield decoded response lines as they arrive"""
+        if self.http2:
+            with self._client.stream("POST", url, headers=headers, content=data, timeout=self._timeout(timeout)) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if line:
+                        yield line
+        else:
+            with self._client.post(url, headers=headers, data=data, timeout=self._timeout(timeout), stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if line:
+                        yield line.decode("utf-8")
+
+    def close(self):
+        self._client.close()
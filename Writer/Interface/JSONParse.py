@@ -0,0 +1,142 @@
+"""
+JSONParse - Tiered JSON parsing for LLM responses
+
+SafeGenerateJSON parses every structured response. Most responses are valid
+JSON, so json_repair (slow on chapter-sized responses) is only the last resort:
+
+    strict   - orjson (when installed) or the stdlib json parser
+    extract  - string-aware brace matching that cuts the first complete JSON
+               value out of surrounding prose, then a strict parse
+    repair   - json_repair on the narrowed text, as before
+
+JSONParseStats counts which tier succeeded for each model so the run log shows
+which models actually need repair.
+"""
+import json
+import threading
+
+import json_repair
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+PARSE_TIERS = ("strict", "extract", "repair")
+MAX_EXTRACT_SCAN_CHARS = 2_000_000  # Brace matcher gives up (falls through to repair) beyond this
+
+
+def strip_code_fences(text: str) -> str:
+    """Remove a surrounding ```json ... ``` fence and whitespace"""
+    cleaned = text.strip()
+    if cleaned.startswith("```json"):
+        cleaned = cleaned[7:]
+    if cleaned.startswith("```"):
+        cleaned = cleaned[3:]
+    if cleaned.endswith("```"):
+        cleaned = cleaned[:-3]
+    return cleaned.strip()
+
+
+def strict_loads(text: str):
+    """Strict parse with orjson when available, stdlib json otherwise"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_start(text: str) -> int:
+    first_brace = text.find("{")
+    first_bracket = text.find("[")
+    if first_brace == -1:
+        return first_bracket
+    if first_bracket == -1:
+        return first_brace
+    return min(first_brace, first_bracket)
+
+
+def extract_balanced(text: str, start: int, max_scan: int = MAX_EXTRACT_SCAN_CHARS):
+    """Return (start, end) of the complete JSON value opening at text[start], or None.
+
+    Brackets inside string literals (including escaped quotes) are ignored.
+    """
+    stack = []
+    in_string = False
+    escape = False
+    limit = min(len(text), start + max_scan)
+    for i in range(start, limit):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            if not stack or stack.pop() != ch:
+                return None
+            if not stack:
+                return start, i + 1
+    return None
+
+
+def parse_json_tiered(text: str):
+    """Parse an LLM response into JSON.
+
+    Returns:
+        Tuple of (parsed value, tier name)
+
+    Raises:
+        ValueError: if the response is empty or contains no JSON start character
+    """
+    cleaned = strip_code_fences(text)
+    if not cleaned:
+        raise ValueError("Cleaned response is empty.")
+
+    try:
+        return strict_loads(cleaned), "strict"
+    except ValueError:
+        pass
+
+    start = _json_start(cleaned)
+    if start == -1:  # No JSON start characters
+        raise ValueError("No JSON object or array start found in response.")
+
+    span = extract_balanced(cleaned, start)
+    # A second value after the first means multiple JSON objects; leave that to json_repair
+    if span is not None and _json_start(cleaned[span[1]:]) == -1:
+        try:
+            return strict_loads(cleaned[span[0]:span[1]]), "extract"
+        except ValueError:
+            pass
+
+    # Narrow to the most likely JSON part and let json_repair fix structural issues
+    expected_end_char = "}" if cleaned[start] == "{" else "]"
+    last_end_char_idx = cleaned.rfind(expected_end_char)
+    if last_end_char_idx > start:
+        cleaned = cleaned[start: last_end_char_idx + 1]
+    return json_repair.loads(cleaned), "repair"
+
+
+class JSONParseStats:
+    """Thread-safe per-model counters of the tier that parsed each response"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict = {}
+
+    def record(self, model: str, tier: str) -> None:
+        with self._lock:
+            model_counts = self._counts.setdefault(model, {name: 0 for name in PARSE_TIERS})
+            model_counts[tier] = model_counts.get(tier, 0) + 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {model: dict(counts) for model, counts in self._counts.items()}
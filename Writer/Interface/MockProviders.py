@@ -0,0 +1,330 @@
+"""
+MockProviders - Offline providers for deterministic end-to-end runs
+
+mock://<name>?latency=0.2&jitter=0.1&dist=lognormal&tps=0&words=300&chapters=3&rating=90&approve=1
+    Synthesizes a response that satisfies the requested JSON schema (the
+    schema SafeGeneratePydantic derives from the Pydantic model). Output is
+    deterministic for a given request and seed. Optional latency is sampled
+    from a fixed/uniform/normal/lognormal/exponential distribution, plus
+    completion_tokens / tps seconds when tps is set.
+
+replay://<path to a run directory or its LangchainDebug folder>?strict=1
+    Serves the assistant responses recorded by Logger.SaveLangchain. Requests
+    are matched by a digest of their messages, then by their last user
+    message. Lorebook metadata is normalized before hashing because its
+    key order and added_at timestamp differ between runs. With strict=0 an
+    unmatched request gets the next unused transcript in recording order
+    instead of an error.
+
+Both providers are CPU-only. They let Write.py and StoryPipeline.run_pipeline
+be benchmarked for pipeline overhead, concurrency and resume behaviour
+without a live model.
+"""
+import glob
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+
+from Writer.Interface.RetryPolicy import ERROR_FATAL, ProviderError
+
+_LOREM = (
+    "angin malam berbisik di antara pepohonan ketika cahaya bulan jatuh di atas "
+    "jalan setapak yang basah dan langkah kaki terdengar pelan mendekati rumah tua "
+    "di ujung desa tempat semua rahasia lama tersimpan rapi menunggu seseorang "
+    "yang cukup berani untuk membuka pintu kayu itu dan menatap masa lalu"
+).split()
+
+_PROSE_FIELDS = ("text", "content", "prose", "chapter", "scene")
+_RATING_FIELDS = ("score", "rating")
+_COUNT_FIELDS = ("totalchapters", "total_chapters", "target_chapter_count")
+
+DEFAULT_MOCK_OPTIONS = {
+    "latency": 0.0,  # Mean seconds per call
+    "jitter": 0.0,  # Spread (seconds) for uniform/normal, sigma for lognormal
+    "dist": "fixed",  # fixed | uniform | normal | lognormal | exponential
+    "tps": 0.0,  # Simulated generation speed (completion tokens per second, 0 = instant)
+    "words": 300,  # Length of synthesized prose fields
+    "chapters": 3,  # Value for chapter-count fields
+    "rating": 90,  # Value for score/rating fields (clamped to the schema bounds)
+    "approve": 1,  # Value for boolean fields (0 fails every yes/no check, e.g. to force maximum revisions)
+}
+
+
+class ReplayMissError(ProviderError):
+    """Raised when a replay:// provider has no recorded response for a request (never retried)"""
+
+    def __init__(self, message: str):
+        super().__init__(message, error_class=ERROR_FATAL)
+
+
+def messages_digest(messages: list) -> str:
+    """Stable digest of the role/content pairs of a chat request"""
+    payload = json.dumps(
+        [[m.get("role", ""), _normalize_content(str(m.get("content", "")))] for m in messages],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _last_user_digest(messages: list):
+    content = _last_user_content(messages)
+    return hashlib.sha256(_normalize_content(content).encode("utf-8")).hexdigest() if content else None
+
+
+# "(source: story_elements | type: theme | added_at: 2024-01-01 ...)" as rendered by Lorebook.retrieve
+_LORE_METADATA = re.compile(r"\(((?:[a-z_]+: [^|()\n]*)(?: \| [a-z_]+: [^|()\n]*)+)\)")
+
+
+def _normalize_content(content: str) -> str:
+    """Drop run-specific lorebook metadata details so recorded prompts match replayed ones"""
+    def _canonical(match):
+        items = [item for item in match.group(1).split(" | ") if not item.startswith("added_at: ")]
+        return "(" + " | ".join(sorted(items)) + ")"
+    return _LORE_METADATA.sub(_canonical, content)
+
+
+def _last_user_content(messages: list) -> str:
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            return str(message.get("content", ""))
+    return ""
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def deterministic_embedding(text: str, dimensions: int = 64) -> list:
+    """Unit-length pseudo-embedding derived from the text digest"""
+    rng = random.Random(hashlib.sha256(text.encode("utf-8")).hexdigest())
+    vector = [rng.uniform(-1, 1) for _ in range(dimensions)]
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+class SchemaSynthesizer:
+    """Builds a JSON value that satisfies a (Pydantic-generated) JSON schema"""
+
+    def __init__(self, schema: dict, rng: random.Random, options: dict):
+        self.root = schema or {}
+        self.defs = self.root.get("$defs", {}) or self.root.get("definitions", {})
+        self.rng = rng
+        self.options = options
+
+    def _resolve(self, schema):
+        if isinstance(schema, dict) and "$ref" in schema:
+            return self._resolve(self.defs.get(schema["$ref"].split("/")[-1], {}))
+        return schema or {}
+
+    def _words(self, count: int) -> str:
+        words = [self.rng.choice(_LOREM) for _ in range(max(1, count))]
+        return " ".join(words)
+
+    def prose(self, words: int) -> str:
+        """Paragraphed prose of roughly the requested word count"""
+        paragraphs = []
+        remaining = max(1, int(words))
+        while remaining > 0:
+            size = min(remaining, 60)
+            paragraphs.append(self._words(size).capitalize() + ".")
+            remaining -= size
+        return "\n\n".join(paragraphs)
+
+    def build(self, schema=None, name: str = ""):
+        schema = self._resolve(self.root if schema is None else schema)
+        for union_key in ("anyOf", "oneOf"):
+            if union_key in schema:
+                options = [self._resolve(o) for o in schema[union_key]]
+                non_null = [o for o in options if o.get("type") != "null"]
+                return self.build((non_null or options)[0], name)
+        if "enum" in schema:
+            return schema["enum"][0]
+        if "const" in schema:
+            return schema["const"]
+
+        schema_type = schema.get("type")
+        if isinstance(schema_type, list):
+            schema_type = next((t for t in schema_type if t != "null"), "string")
+        if schema_type is None:
+            schema_type = "object" if "properties" in schema else "string"
+
+        if schema_type == "object":
+            return self._object(schema)
+        if schema_type == "array":
+            count = max(schema.get("minItems", 1), 1)
+            if "maxItems" in schema:
+                count = min(count, schema["maxItems"])
+            return [self.build(schema.get("items", {}), name) for _ in range(count)]
+        if schema_type in ("integer", "number"):
+            return self._number(schema, name, schema_type == "integer")
+        if schema_type == "boolean":
+            return bool(float(self.options.get("approve", 1)))
+        if schema_type == "null":
+            return None
+        return self._string(schema, name)
+
+    def _object(self, schema):
+        properties = schema.get("properties")
+        if properties is None:
+            value_schema = schema.get("additionalProperties")
+            if isinstance(value_schema, dict):
+                return {"mock_entry": self.build(value_schema, "mock_entry")}
+            return {}
+        # Optional fields are left to their model defaults
+        return {field: self.build(properties[field], field) for field in schema.get("required", list(properties))}
+
+    def _number(self, schema, name: str, integer: bool):
+        lowered = name.lower()
+        low = schema.get("minimum", schema.get("exclusiveMinimum", 0) + (1 if "exclusiveMinimum" in schema else 0))
+        high = schema.get("maximum", schema.get("exclusiveMaximum", math.inf) - (1 if "exclusiveMaximum" in schema else 0))
+        if lowered in _COUNT_FIELDS or ("chapter" in lowered and "count" in lowered):
+            value = self.options["chapters"]
+        elif any(key in lowered for key in _RATING_FIELDS):
+            value = self.options["rating"]
+        elif "word" in lowered:
+            value = self.options["words"]
+        else:
+            value = max(low, 1)
+        value = min(max(value, low), high)
+        return int(value) if integer else float(value)
+
+    def _string(self, schema, name: str):
+        lowered = name.lower()
+        min_length = schema.get("minLength", 0)
+        max_length = schema.get("maxLength")
+        if schema.get("format") == "date-time":
+            return "2024-01-01T00:00:00"
+        if "title" in lowered:
+            value = f"Mock {self._words(3).title()}"
+        elif any(key in lowered for key in _PROSE_FIELDS):
+            value = self.prose(self.options["words"])
+        else:
+            value = self._words(12).capitalize() + "."
+        while len(value) < min_length:
+            value += " " + self._words(12)
+        if max_length is not None:
+            value = value[:max_length].rstrip() or value[:max_length]
+        return value
+
+
+class MockProvider:
+    """Schema-driven synthetic responses with configurable latency"""
+
+    def __init__(self, name: str, options: dict = None, sleep=time.sleep):  # type: ignore[assignment]
+        self.name = name
+        self.options = dict(DEFAULT_MOCK_OPTIONS)
+        self.options.update(options or {})
+        self._sleep = sleep
+
+    def _latency(self, rng: random.Random, completion_tokens: int) -> float:
+        mean = float(self.options["latency"])
+        jitter = float(self.options["jitter"])
+        dist = str(self.options["dist"]).lower()
+        if dist == "uniform":
+            delay = rng.uniform(mean - jitter, mean + jitter)
+        elif dist == "normal":
+            delay = rng.gauss(mean, jitter)
+        elif dist == "lognormal" and mean > 0:
+            sigma = jitter or 0.5
+            delay = rng.lognormvariate(math.log(mean) - sigma * sigma / 2, sigma)  # Mean stays at `latency`
+        elif dist == "exponential" and mean > 0:
+            delay = rng.expovariate(1 / mean)
+        else:
+            delay = mean
+        tps = float(self.options["tps"])
+        if tps > 0:
+            delay += completion_tokens / tps
+        return max(0.0, delay)
+
+    def chat(self, messages: list, seed=None, format_schema: dict = None):  # type: ignore[assignment]
+        """Return (content, token_usage) for a chat request"""
+        rng = random.Random(f"{messages_digest(messages)}:{seed}")
+        synthesizer = SchemaSynthesizer(format_schema or {}, rng, self.options)
+        if format_schema:
+            content = json.dumps(synthesizer.build(), ensure_ascii=False)
+        else:
+            # Every call goes through SafeGenerateJSON; without a schema answer with the
+            # common keys read by the summary/context extractors
+            prose = synthesizer.prose(60)
+            content = json.dumps({"context": prose, "summary": prose, "text": prose}, ensure_ascii=False)
+
+        usage = {
+            "prompt_tokens": sum(_estimate_tokens(str(m.get("content", ""))) for m in messages),
+            "completion_tokens": _estimate_tokens(content),
+        }
+        delay = self._latency(rng, usage["completion_tokens"])
+        if delay:
+            self._sleep(delay)
+        return content, usage
+
+
+class ReplayProvider:
+    """Serves responses recorded in LangchainDebug transcripts"""
+
+    def __init__(self, source: str, strict: bool = True):
+        self.source = source
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._by_digest: dict = {}
+        self._by_last_user: dict = {}
+        self._sequence: list = []
+        self._next_sequential = 0
+        self._load()
+
+    def _transcript_dir(self) -> str:
+        nested = os.path.join(self.source, "LangchainDebug")
+        return nested if os.path.isdir(nested) else self.source
+
+    @staticmethod
+    def _sort_key(path: str):
+        match = re.match(r"(\d+)_", os.path.basename(path))
+        return (int(match.group(1)) if match else math.inf, path)
+
+    def _load(self):
+        directory = self._transcript_dir()
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"Replay source not found: {self.source}")
+        for path in sorted(glob.glob(os.path.join(directory, "*.json")), key=self._sort_key):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    transcript = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not isinstance(transcript, list) or not transcript or transcript[-1].get("role") != "assistant":
+                continue
+            request, response = transcript[:-1], str(transcript[-1].get("content", ""))
+            self._by_digest.setdefault(messages_digest(request), []).append(response)
+            last_user = _last_user_digest(request)
+            if last_user:
+                self._by_last_user.setdefault(last_user, []).append(response)
+            self._sequence.append(response)
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    @staticmethod
+    def _take(queue: list) -> str:
+        # Identical requests are served in recording order; the last answer repeats
+        return queue.pop(0) if len(queue) > 1 else queue[0]
+
+    def chat(self, messages: list):
+        """Return (content, token_usage) for a recorded request"""
+        with self._lock:
+            queue = self._by_digest.get(messages_digest(messages)) or self._by_last_user.get(_last_user_digest(messages))
+            if queue:
+                content = self._take(queue)
+            elif not self.strict and self._sequence:
+                content = self._sequence[self._next_sequential % len(self._sequence)]
+                self._next_sequential += 1
+            else:
+                raise ReplayMissError(f"Replay transcript not found for request in {self.source}")
+        usage = {
+            "prompt_tokens": sum(_estimate_tokens(str(m.get("content", ""))) for m in messages),
+            "completion_tokens": _estimate_tokens(content),
+        }
+        return content, usage
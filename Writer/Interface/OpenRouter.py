@@ -1,8 +1,10 @@
 import json
-import requests
 import time
 import sys  # Add sys for stderr
+from types import SimpleNamespace
 from typing import List, Mapping, Optional, Literal, Union, TypedDict
+from Writer.Interface.HTTPSession import HTTPSessionPool
+from Writer.Interface.RetryPolicy import ProviderError, RetryPolicy, classify_error, retry_after_seconds, ERROR_FATAL, ERROR_TRANSPORT
 
 
 class OpenRouter:
@@ -11,6 +13,18 @@ class OpenRouter:
     https://openrouter.ai/docs#llm-parameters
     """
 
+    # Explanations appended to OpenRouter error codes
+    _ERROR_HINTS = {
+        400: " (Bad Request: invalid or missing params, CORS)",
+        401: " (Invalid credentials: OAuth session expired, disabled/invalid API key)",
+        402: " (Your account or API key has insufficient credits. Add more credits and retry the request.)",
+        403: " (Your chosen model requires moderation and your input was flagged)",
+        408: " (Your request timed out)",
+        429: " (You are being rate limited)",
+        502: " (Your chosen model is down or we received an invalid response from it)",
+        503: " (There is no available model provider that meets your routing requirements)",
+    }
+
     Message_Type = TypedDict(  # type: ignore[misc]
         "Message",
         {"role": Literal["user", "assistant", "system", "tool"], "content": str},
@@ -80,6 +94,7 @@ class OpenRouter:
         set_p90: bool = False,
         api_url: str = "https://openrouter.ai/api/v1/chat/completions",
         timeout: int = 3600,
+        session: Optional[HTTPSessionPool] = None,
     ):
 
         self.api_url = api_url
@@ -94,6 +109,8 @@ class OpenRouter:
         )
         self.stop = stop
         self.timeout = timeout
+        # Keep-alive connection pool, normally shared with the owning Interface
+        self.session = session if session is not None else HTTPSessionPool.from_config()
 
         # Get the top LLM sampling parameter configurations used by users on OpenRouter.
         # https://openrouter.ai/docs/parameters-api
@@ -103,7 +120,7 @@ class OpenRouter:
                 "accept": "application/json",
                 "Authorization": f"Bearer {self.api_key}",
             }
-            params = requests.get(parameters_url, headers=headers).json()["data"]
+            params = self.session.get(parameters_url, headers=headers).json()["data"]
             # I am so sorry
             self.temperature = (
                 params["temperature_p50"] if set_p50 else params["temperature_p90"]
@@ -190,10 +207,19 @@ class OpenRouter:
         max_retries: int = 10,
         seed: int = None,  # type: ignore[assignment]
         stream: bool = False,
+        **overrides,
     ):  # Tambahkan stream
+        """Send a chat completion request over the pooled session.
+
+        Keyword overrides (temperature, max_tokens, response_format, ...) take
+        precedence over the client defaults. Non-streaming calls return an
+        OpenAI-style object (``.choices[0].message.content`` and ``.usage``);
+        streaming calls return a generator of parsed SSE chunks.
+        """
         messages = self.ensure_array(messages)  # type: ignore
         headers = {
             "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/datacrystals/AIStoryWriter",  # Opsional, bisa dipertimbangkan untuk dihapus jika tidak diperlukan
             "X-Title": "StoryForgeAI",  # Opsional
         }
@@ -219,120 +245,84 @@ class OpenRouter:
             "stream": stream,  # Atur stream secara dinamis
             "usage": {"include": True}  # <-- TAMBAHKAN BARIS INI
         }
+        body.update(overrides)
 
         # Hapus kunci dengan nilai None dari body untuk menghindari error dari beberapa model/provider
         body = {k: v for k, v in body.items() if v is not None}
 
         if stream:
-            try:
-                response = requests.post(
-                    url=self.api_url,
-                    headers=headers,
-                    data=json.dumps(body),
-                    timeout=self.timeout,  # Timeout untuk keseluruhan stream
-                    stream=True,  # Penting untuk library requests
-                )
-                response.raise_for_status()
-                for line in response.iter_lines():
-                    if line:
-                        decoded_line = line.decode("utf-8")
-                        if decoded_line.startswith("data: "):
-                            json_data_string = decoded_line[len("data: "):].strip()
-                            if json_data_string == "[DONE]":
-                                break
-                            try:
-                                data = json.loads(json_data_string)
-                                yield data  # Yield dictionary yang diparsing
-                            except json.JSONDecodeError:
-                                print(
-                                    f"OpenRouter Stream: JSONDecodeError for '{json_data_string}'",
-                                    file=sys.stderr,
-                                )
-                                continue
-                return  # Akhir dari generator
-            except requests.exceptions.RequestException as e:
-                print(f"OpenRouter Stream: RequestException: {e}", file=sys.stderr)
-                raise  # Naikkan kembali exception agar bisa ditangani di level atas
-            except Exception as e:
-                print(f"OpenRouter Stream: Unexpected error: {e}", file=sys.stderr)
-                raise
-        else:
-            # Logika non-streaming yang sudah ada
-            retries = 0
-            while retries < max_retries:
-                try:
-                    response = requests.post(
-                        url=self.api_url,
-                        headers=headers,
-                        data=json.dumps(body),  # body sudah memiliki stream: False
-                        timeout=self.timeout,
-                        stream=False,  # Eksplisit False untuk non-streaming
-                    )
-                    response.raise_for_status()
-                    response_json = response.json()
-                    if "choices" in response_json:
-                        content = response_json["choices"][0]["message"]["content"]
-                        usage_info = response_json.get("usage")
-                        return content, usage_info
-                    elif "error" in response_json:
-                        print(
-                            f"Openrouter returns error '{response_json['error']['code']}' with message '{response_json['error']['message']}', retry attempt {retries + 1}."
-                        )
-                        if response_json["error"]["code"] == 400:
-                            print("Bad Request (invalid or missing params, CORS)")
-                        if response_json["error"]["code"] == 401:
-                            raise Exception(
-                                "Invalid credentials (OAuth session expired, disabled/invalid API key)"
-                            )
-                        if response_json["error"]["code"] == 402:
-                            raise Exception(
-                                "Your account or API key has insufficient credits. Add more credits and retry the request."
-                            )
-                        if response_json["error"]["code"] == 403:
-                            print(
-                                "Your chosen model requires moderation and your input was flagged"
-                            )
-                        if response_json["error"]["code"] == 408:
-                            print("Your request timed out")
-                        if (
-                            response_json["error"]["code"] == 429
-                        ):  # Pastikan ini response_json
-                            print("You are being rate limited")
-                            print("Waiting 10 seconds")
-                            time.sleep(10)
-                        if response_json["error"]["code"] == 502:
-                            print(
-                                "Your chosen model is down or we received an invalid response from it"
-                            )
-                        if response_json["error"]["code"] == 503:
-                            print(
-                                "There is no available model provider that meets your routing requirements"
-                            )
-                    else:
-                        from pprint import pprint  # Pastikan import ada jika digunakan
+            return self._chat_stream(headers, body)
+        return self._chat_once(headers, body, max_retries)
 
+    def _chat_stream(self, headers, body):
+        try:
+            for decoded_line in self.session.stream_lines(
+                self.api_url, headers=headers, data=json.dumps(body), timeout=self.timeout
+            ):
+                if decoded_line.startswith("data: "):
+                    json_data_string = decoded_line[len("data: "):].strip()
+                    if json_data_string == "[DONE]":
+                        break
+                    try:
+                        data = json.loads(json_data_string)
+                        yield data  # Yield dictionary yang diparsing
+                    except json.JSONDecodeError:
                         print(
-                            f"Response without error but missing choices, retry attempt {retries + 1}."
+                            f"OpenRouter Stream: JSONDecodeError for '{json_data_string}'",
+                            file=sys.stderr,
                         )
-                        pprint(response.json())
-                except requests.exceptions.HTTPError as http_err:
-                    print(
-                        f"HTTP error occurred: '{http_err}' - Status Code: '{http_err.response.status_code}', retry attempt {retries + 1}."
-                    )
-                    if http_err.response.status_code == 524:
-                        time.sleep(10)
-                except (
-                    requests.exceptions.Timeout,
-                    requests.exceptions.TooManyRedirects,
-                ) as err:
-                    print(f"Retry attempt {retries + 1} after error: '{err}'")
-                except requests.exceptions.RequestException as req_err:
-                    print(
-                        f"An error occurred while making the request: '{req_err}', retry attempt {retries + 1}."
-                    )
-                except Exception as e:
-                    print(
-                        f"An unexpected error occurred: '{e}', retry attempt {retries + 1}."
-                    )
-                retries += 1
-            return None, None  # Jika semua retry gagal untuk non-streaming
+                        continue
+        except Exception as e:
+            print(f"OpenRouter Stream: Unexpected error: {e}", file=sys.stderr)
+            raise  # Naikkan kembali exception agar bisa ditangani di level atas
+
+    def _chat_once(self, headers, body, max_retries):
+        """Non-streaming request; transient errors are retried with the RetryPolicy backoff.
+
+        Interface calls this with max_retries=1 and lets its RetryEngine drive
+        retries, circuit breaking and rate limiting.
+        """
+        policy = RetryPolicy.from_config()
+        for attempt in range(max(1, max_retries)):
+            try:
+                return self._post_chat(headers, body)
+            except Exception as e:
+                error_class = classify_error(e)
+                if error_class == ERROR_FATAL or attempt + 1 >= max_retries:
+                    raise
+                delay = policy.delay(error_class, attempt, retry_after_seconds(e))
+                print(
+                    f"OpenRouter {error_class} error: '{e}', retry attempt {attempt + 1} in {delay:.1f}s.",
+                    file=sys.stderr,
+                )
+                time.sleep(delay)
+        raise Exception(f"OpenRouter chat failed after {max_retries} attempts")
+
+    def _post_chat(self, headers, body):
+        """Single chat completion request; raises ProviderError/HTTPError with the status code"""
+        response = self.session.post(
+            self.api_url,
+            headers=headers,
+            data=json.dumps(body),  # body sudah memiliki stream: False
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        response_json = response.json()
+        if "choices" in response_json:
+            content = response_json["choices"][0]["message"]["content"]
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+                usage=response_json.get("usage") or {},
+            )
+        if "error" in response_json:
+            code = response_json["error"].get("code")
+            message = response_json["error"].get("message", "")
+            retry_after = (response_json["error"].get("metadata") or {}).get("retry_after")
+            raise ProviderError(
+                f"Openrouter returns error '{code}' with message '{message}'"
+                f"{self._ERROR_HINTS.get(code, '')}",
+                status_code=code if isinstance(code, int) else None,
+                retry_after=retry_after if isinstance(retry_after, (int, float)) else None,
+            )
+        # A transient provider glitch: retried with transport backoff
+        raise ProviderError(f"Response without error but missing choices: {str(response_json)[:200]}", error_class=ERROR_TRANSPORT)
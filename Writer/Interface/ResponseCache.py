@@ -0,0 +1,166 @@
+"""
+ResponseCache - Content-addressed on-disk cache for LLM completions
+
+Every request that goes through Interface.ChatResponse is normalized into a
+(model, messages, seed, format schema, options) tuple and hashed with SHA-256.
+The completion text and token usage for that hash are stored in a small SQLite
+database so resumed or re-run pipelines can replay identical calls instantly.
+A completion is only stored once SafeGenerateJSON has parsed it, and it is
+evicted again when SafeGeneratePydantic rejects it, so bad outputs never replay.
+
+Modes:
+    "read-write": serve hits and store new completions
+    "read-only":  serve hits, never write (useful for replaying a frozen cache)
+    "bypass":     cache disabled, every call goes to the provider
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+CACHE_MODES = ("read-write", "read-only", "bypass")
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of LLM responses keyed by a stable request hash"""
+
+    DB_FILENAME = "responses.sqlite3"
+
+    def __init__(self, cache_dir: str = ".llm_cache", mode: str = "bypass", max_mb: float = 512):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Invalid LLM cache mode '{mode}'. Expected one of {CACHE_MODES}")
+
+        self.cache_dir = cache_dir
+        self.mode = mode
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @classmethod
+    def from_config(cls):
+        """Build a cache from the LLM_CACHE_* settings in Writer.Config"""
+        import Writer.Config
+        return cls(
+            cache_dir=getattr(Writer.Config, 'LLM_CACHE_DIR', '.llm_cache'),
+            mode=getattr(Writer.Config, 'LLM_CACHE_MODE', 'bypass'),
+            max_mb=getattr(Writer.Config, 'LLM_CACHE_MAX_MB', 512),
+        )
+
+    @property
+    def can_read(self) -> bool:
+        return self.mode in ("read-write", "read-only")
+
+    @property
+    def can_write(self) -> bool:
+        return self.mode == "read-write"
+
+    @staticmethod
+    def make_key(model: str, messages: list, seed, format_schema=None, options=None) -> str:
+        """Stable SHA-256 digest of the normalized request"""
+        normalized = {
+            "model": model,
+            "messages": [
+                {"role": m.get("role"), "content": str(m.get("content", ""))}
+                for m in messages
+            ],
+            "seed": seed,
+            "format_schema": format_schema,
+            "options": options or {},
+        }
+        payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._conn = sqlite3.connect(
+                os.path.join(self.cache_dir, self.DB_FILENAME), check_same_thread=False
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, model TEXT, content TEXT, token_usage TEXT, "
+                "size INTEGER, created REAL, last_access REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON responses(last_access)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str):
+        """Return (content, token_usage) for a cached request, or None on a miss"""
+        if not self.can_read:
+            return None
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT content, token_usage FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if self.can_write:
+                conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+        content, token_usage = row
+        return content, (json.loads(token_usage) if token_usage else None)
+
+    def put(self, key: str, model: str, content: str, token_usage=None) -> None:
+        """Store a completion and evict least-recently-used entries beyond the size limit"""
+        if not self.can_write:
+            return
+        usage_json = json.dumps(token_usage) if token_usage else None
+        size = len(content.encode("utf-8")) + len(usage_json or "")
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, content, token_usage, size, created, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, model, content, usage_json, size, now, now),
+            )
+            self.stores += 1
+            self._evict(conn)
+            conn.commit()
+
+    def delete(self, key: str) -> None:
+        """Remove a stored completion, e.g. one whose response later failed validation"""
+        if not self.can_write:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            conn.commit()
+
+    def _evict(self, conn) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,341 @@
+"""
+RetryPolicy - Error classification, backoff, circuit breaking and rate limiting for LLM calls
+
+Every provider call made by Interface goes through RetryEngine.call(). Errors
+are sorted into classes that each get their own backoff (RETRY_BACKOFF):
+
+    validation  - the host answered but the output was unusable (bad JSON,
+                  ResponseParseError, stream aborted, Pydantic errors); retried by the caller with
+                  feedback, never worth sleeping for
+    transport   - connection resets, timeouts, unexpected exceptions
+    rate_limit  - HTTP 429 / RESOURCE_EXHAUSTED; Retry-After is honoured
+    overload    - 5xx, "overloaded", "server busy", open circuit breaker
+    fatal       - bad credentials, no credits, unknown model; never retried
+
+A per-host CircuitBreaker opens after CIRCUIT_BREAKER_FAILURE_THRESHOLD
+consecutive transport/rate-limit/overload failures and rejects calls until
+CIRCUIT_BREAKER_RESET_SECONDS have passed, then lets a single probe through.
+A per-host TokenBucket enforces RATE_LIMIT_REQUESTS_PER_MINUTE.
+"""
+import json
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+ERROR_VALIDATION = "validation"
+ERROR_TRANSPORT = "transport"
+ERROR_RATE_LIMIT = "rate_limit"
+ERROR_OVERLOAD = "overload"
+ERROR_FATAL = "fatal"
+
+# Seconds: delay = min(max, base * factor ** attempt), then jittered into [delay/2, delay]
+DEFAULT_BACKOFF = {
+    ERROR_VALIDATION: {"base": 0.0, "factor": 1.0, "max": 0.0},
+    ERROR_TRANSPORT: {"base": 1.0, "factor": 2.0, "max": 30.0},
+    ERROR_RATE_LIMIT: {"base": 5.0, "factor": 2.0, "max": 120.0},
+    ERROR_OVERLOAD: {"base": 3.0, "factor": 2.0, "max": 60.0},
+}
+
+# Errors that say something about the health of the host (feed the circuit breaker)
+_HOST_ERRORS = {ERROR_TRANSPORT, ERROR_RATE_LIMIT, ERROR_OVERLOAD}
+
+_FATAL_STATUS = {400, 401, 402, 403, 404}
+_OVERLOAD_STATUS = {500, 502, 503, 504, 520, 524, 529}
+_RATE_LIMIT_MARKERS = ("rate limit", "rate-limit", "ratelimit", "too many requests", "resource_exhausted", "quota")
+_OVERLOAD_MARKERS = ("overloaded", "server busy", "unavailable", "try again later", "model is loading", "bad gateway")
+# Fallback for errors without a status code; only markers that cannot come from a transient proxy or upstream page
+_FATAL_MARKERS = ("invalid credentials", "insufficient credits", "api key not valid", "permission_denied")
+
+
+class ProviderError(Exception):
+    """Provider-reported failure carrying the HTTP-style status, Retry-After hint and optionally its ERROR_* class"""
+
+    def __init__(self, message: str, status_code: int = None, retry_after: float = None, error_class: str = None):  # type: ignore[assignment]
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.error_class = error_class
+
+
+class ResponseParseError(Exception):
+    """The model answered, but no usable structured output could be parsed from it"""
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit breaker is open"""
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"Circuit breaker open for {host}; next probe in {retry_after:.1f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+def _status_code(error):
+    for attr in ("status_code", "code", "status"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int) and 100 <= value < 600:
+            return value
+    response = getattr(error, "response", None)
+    value = getattr(response, "status_code", None)
+    if isinstance(value, int):
+        return value
+    return None
+
+
+def classify_error(error) -> str:
+    """Map an exception to one of the ERROR_* classes"""
+    if isinstance(error, CircuitOpenError):
+        return ERROR_OVERLOAD
+    if isinstance(error, (json.JSONDecodeError, TypeError, ResponseParseError)):
+        return ERROR_VALIDATION
+    if isinstance(error, ProviderError) and error.error_class:
+        return error.error_class
+    error_type = type(error).__name__
+    if error_type in ("ValidationError", "StreamAbortedError"):
+        return ERROR_VALIDATION
+
+    status = _status_code(error)
+    if status == 429:
+        return ERROR_RATE_LIMIT
+    if status in _OVERLOAD_STATUS:
+        return ERROR_OVERLOAD
+    if status in _FATAL_STATUS:
+        return ERROR_FATAL
+
+    message = str(error).lower()
+    if any(marker in message for marker in _RATE_LIMIT_MARKERS):
+        return ERROR_RATE_LIMIT
+    if any(marker in message for marker in _OVERLOAD_MARKERS):
+        return ERROR_OVERLOAD
+    if any(marker in message for marker in _FATAL_MARKERS):
+        return ERROR_FATAL
+    return ERROR_TRANSPORT
+
+
+def retry_after_seconds(error):
+    """Server-requested wait in seconds (Retry-After header, retry_after attribute or retryDelay), else None"""
+    value = getattr(error, "retry_after", None)
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    header = headers.get("Retry-After") if headers is not None else None
+    if header:
+        header = str(header).strip()
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(header).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    # Google reports e.g. 'retryDelay': '12s' inside the error details
+    match = re.search(r"retryDelay['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)s", str(error))
+    if match:
+        return float(match.group(1))
+    return None
+
+
+class RetryPolicy:
+    """Per-error-class exponential backoff with jitter"""
+
+    def __init__(self, backoff: dict = None):  # type: ignore[assignment]
+        self.backoff = {cls: dict(cfg) for cls, cfg in DEFAULT_BACKOFF.items()}
+        for error_class, cfg in (backoff or {}).items():
+            self.backoff.setdefault(error_class, {}).update(cfg)
+
+    @classmethod
+    def from_config(cls):
+        import Writer.Config
+        backoff = getattr(Writer.Config, 'RETRY_BACKOFF', None)
+        return cls(backoff if isinstance(backoff, dict) else None)
+
+    def delay(self, error_class: str, attempt: int, retry_after: float = None) -> float:  # type: ignore[assignment]
+        """Seconds to wait before retry number attempt+1 (attempt is 0-based)"""
+        if error_class == ERROR_FATAL:
+            return 0.0
+        if retry_after is not None:
+            return retry_after
+        cfg = self.backoff.get(error_class, self.backoff[ERROR_TRANSPORT])
+        delay = min(cfg.get("max", 0.0), cfg.get("base", 0.0) * cfg.get("factor", 1.0) ** attempt)
+        if delay <= 0:
+            return 0.0
+        return random.uniform(delay / 2, delay)
+
+
+class CircuitBreaker:
+    """Closed -> open after N consecutive host failures -> half-open single probe -> closed"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed" or self.failure_threshold <= 0:
+                return True
+            if self.state == "open" and self._clock() - self.opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                self._probe_in_flight = False
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def remaining(self) -> float:
+        with self._lock:
+            if self.state != "open":
+                return 0.0
+            return max(0.0, self.reset_timeout - (self._clock() - self.opened_at))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == "half_open" or (self.failure_threshold > 0 and self.failures >= self.failure_threshold):
+                self.state = "open"
+                self.opened_at = self._clock()
+
+
+class TokenBucket:
+    """Blocking token-bucket limiter refilled at rate_per_minute"""
+
+    def __init__(self, rate_per_minute: float, burst: int = None, clock=time.monotonic, sleep=time.sleep):  # type: ignore[assignment]
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(burst if burst else max(1, int(rate_per_minute // 60) or 1))
+        self.tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available; returns seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+class RetryEngine:
+    """Runs provider operations under the retry policy, per-host breakers and rate limits"""
+
+    def __init__(self, policy: RetryPolicy = None, failure_threshold: int = 5, reset_timeout: float = 60.0,  # type: ignore[assignment]
+                 requests_per_minute: dict = None, sleep=time.sleep):  # type: ignore[assignment]
+        self.policy = policy or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.requests_per_minute = requests_per_minute or {}
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._breakers: dict = {}
+        self._buckets: dict = {}
+
+    @classmethod
+    def from_config(cls):
+        import Writer.Config
+        rpm = getattr(Writer.Config, 'RATE_LIMIT_REQUESTS_PER_MINUTE', {})
+        return cls(
+            policy=RetryPolicy.from_config(),
+            failure_threshold=getattr(Writer.Config, 'CIRCUIT_BREAKER_FAILURE_THRESHOLD', 5),
+            reset_timeout=getattr(Writer.Config, 'CIRCUIT_BREAKER_RESET_SECONDS', 60),
+            requests_per_minute=rpm if isinstance(rpm, dict) else {},
+        )
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[host]
+
+    def bucket(self, host: str, provider: str = None):  # type: ignore[assignment]
+        """Rate limiter for host (falls back to the provider entry), or None when unlimited"""
+        with self._lock:
+            if host not in self._buckets:
+                rpm = self.requests_per_minute.get(host, self.requests_per_minute.get(provider, 0))
+                self._buckets[host] = TokenBucket(rpm, sleep=self._sleep) if rpm and rpm > 0 else None
+            return self._buckets[host]
+
+    def call(self, operation, host: str, provider: str = None, label: str = "API call",  # type: ignore[assignment]
+             max_attempts: int = 2, log=None):
+        """Run operation() with classification-driven retries.
+
+        Validation and fatal errors are raised immediately; transport,
+        rate-limit and overload errors are retried with their backoff until
+        max_attempts is reached. log(message, level) receives retry notices.
+        """
+        max_attempts = max(1, int(max_attempts))
+        breaker = self.breaker(host)
+        for attempt in range(max_attempts):
+            if not breaker.allow():
+                error = CircuitOpenError(host, breaker.remaining())
+                if attempt + 1 >= max_attempts:
+                    raise error
+                self._wait(log, label, host, error, ERROR_OVERLOAD, attempt, max_attempts, error.retry_after)
+                continue
+
+            bucket = self.bucket(host, provider)
+            if bucket is not None:
+                waited = bucket.acquire()
+                if waited and log:
+                    log(f"Rate limiter delayed {label} to {host} by {waited:.1f}s", 6)
+
+            try:
+                result = operation()
+            except Exception as e:
+                error_class = classify_error(e)
+                if error_class in _HOST_ERRORS:
+                    breaker.record_failure()
+                elif error_class == ERROR_VALIDATION:
+                    breaker.record_success()  # The host answered; the content was the problem
+                if error_class in (ERROR_VALIDATION, ERROR_FATAL) or attempt + 1 >= max_attempts:
+                    if log:
+                        log(f"{label} {error_class} error ({host}, Attempt {attempt + 1}/{max_attempts}): {e}", 7)
+                    raise
+                self._wait(log, label, host, e, error_class, attempt, max_attempts, retry_after_seconds(e))
+                continue
+
+            breaker.record_success()
+            return result
+        raise Exception(f"{label} failed for {host} after {max_attempts} attempts.")
+
+    def _wait(self, log, label, host, error, error_class, attempt, max_attempts, retry_after):
+        delay = self.policy.delay(error_class, attempt, retry_after)
+        if log:
+            log(f"{label} {error_class} error ({host}, Attempt {attempt + 1}/{max_attempts}): {error}. Retrying in {delay:.1f}s", 7)
+        if delay > 0:
+            self._sleep(delay)
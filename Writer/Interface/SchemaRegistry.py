@@ -0,0 +1,59 @@
+"""
+SchemaRegistry - Precomputed JSON schemas for the structured-output models
+
+SafeGeneratePydantic used to call model_json_schema() for every request.
+The registry computes each schema once, starting from
+Writer.Models.MODEL_REGISTRY (ad-hoc models are added on first use). The
+cached schemas are shared and must be treated as read-only.
+
+Rendered format instructions depend on the Interface language strings, so
+Interface caches those itself per (model, language) on top of this registry.
+"""
+import threading
+
+
+class SchemaRegistry:
+    """Process-wide cache of model name -> JSON schema"""
+
+    def __init__(self, models: dict = None):  # type: ignore[assignment]
+        self._lock = threading.Lock()
+        self._schemas: dict = {}
+        if models is None:
+            from Writer.Models import MODEL_REGISTRY
+            models = MODEL_REGISTRY
+        for model in models.values():
+            self.schema(model)
+
+    @staticmethod
+    def _compute_schema(model) -> dict:
+        if hasattr(model, 'model_json_schema'):
+            return model.model_json_schema()
+        # Fallback for older Pydantic versions
+        return model.schema()
+
+    def schema(self, model) -> dict:
+        """JSON schema of model, computed on first request"""
+        with self._lock:
+            cached = self._schemas.get(model)
+        if cached is not None:
+            return cached
+        schema = self._compute_schema(model)
+        with self._lock:
+            return self._schemas.setdefault(model, schema)
+
+    def __contains__(self, model) -> bool:
+        with self._lock:
+            return model in self._schemas
+
+
+_SHARED_REGISTRY = None
+_SHARED_LOCK = threading.Lock()
+
+
+def get_schema_registry() -> SchemaRegistry:
+    """Shared registry, built from MODEL_REGISTRY on first use"""
+    global _SHARED_REGISTRY
+    with _SHARED_LOCK:
+        if _SHARED_REGISTRY is None:
+            _SHARED_REGISTRY = SchemaRegistry()
+        return _SHARED_REGISTRY
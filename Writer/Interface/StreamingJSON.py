@@ -0,0 +1,318 @@
+"""
+StreamingJSON - Incremental JSON validation for streamed structured output
+
+IncrementalJSONValidator is fed the response text chunk by chunk while the
+model is still generating. It tracks the JSON structure with a small state
+machine and checks every value against the JSON schema that
+SafeGeneratePydantic passes down. It raises StreamAbortedError as soon as the
+output can no longer become a valid response, so the caller can stop the
+stream and retry instead of waiting for a chapter-length completion.
+
+Detected failures:
+    - output that does not start with a JSON object/array (after an optional ``` fence)
+    - a top-level array when the schema expects an object (multiple JSON objects)
+    - schema echoing (keys such as "properties" or "$defs" that are not fields)
+    - unknown keys when the schema forbids additional properties
+    - values whose type cannot match the field schema
+    - strings longer than maxLength and arrays longer than maxItems
+    - extra content after the top-level value is complete
+"""
+
+_SCHEMA_ECHO_KEYS = {"properties", "$defs", "definitions", "required", "additionalProperties"}
+_NUMBER_START = set("-0123456789")
+_DELIMITERS = set(",}] \t\r\n")
+
+
+class StreamAbortedError(Exception):
+    """Raised when a streamed structured response is structurally invalid"""
+
+
+class IncrementalJSONValidator:
+    """Character-level JSON state machine validated against a JSON schema"""
+
+    def __init__(self, schema: dict = None):  # type: ignore[assignment]
+        self.root_schema = schema or {}
+        self.defs = self.root_schema.get("$defs", {}) or self.root_schema.get("definitions", {})
+        self.stack: list = []
+        self.started = False
+        self.finished = False
+        self.prefix = ""
+        self.chars_seen = 0
+
+        # Scalar parsing state
+        self.in_string = False
+        self.string_is_key = False
+        self.string_len = 0
+        self.string_buf: list = []
+        self.escape = False
+        self.unicode_skip = 0
+        self.string_schema: dict = {}
+        self.in_literal = False
+
+    # ------------------------------------------------------------------
+    # Schema helpers
+    # ------------------------------------------------------------------
+    def _resolve(self, schema):
+        if not isinstance(schema, dict):
+            return {}
+        ref = schema.get("$ref")
+        if ref:
+            name = ref.split("/")[-1]
+            return self._resolve(self.defs.get(name, {}))
+        return schema
+
+    def _allowed_types(self, schema) -> set:
+        """JSON types a value may take, or an empty set when unconstrained"""
+        schema = self._resolve(schema)
+        if not schema:
+            return set()
+        for union_key in ("anyOf", "oneOf"):
+            if union_key in schema:
+                types = set()
+                for option in schema[union_key]:
+                    option_types = self._allowed_types(option)
+                    if not option_types:
+                        return set()
+                    types |= option_types
+                return types
+        schema_type = schema.get("type")
+        if isinstance(schema_type, list):
+            types = set(schema_type)
+        elif isinstance(schema_type, str):
+            types = {schema_type}
+        elif "enum" in schema:
+            types = {self._json_type(v) for v in schema["enum"]}
+        elif "properties" in schema:
+            types = {"object"}
+        else:
+            return set()
+        if "integer" in types:
+            types.add("number")
+        return types
+
+    @staticmethod
+    def _json_type(value) -> str:
+        if isinstance(value, bool):
+            return "boolean"
+        if isinstance(value, (int, float)):
+            return "number"
+        if value is None:
+            return "null"
+        if isinstance(value, list):
+            return "array"
+        if isinstance(value, dict):
+            return "object"
+        return "string"
+
+    def _pick(self, schema, json_type):
+        """Select the union branch of schema that matches json_type"""
+        schema = self._resolve(schema)
+        for union_key in ("anyOf", "oneOf"):
+            if union_key in schema:
+                for option in schema[union_key]:
+                    if json_type in self._allowed_types(option):
+                        return self._resolve(option)
+        return schema
+
+    def _abort(self, reason: str):
+        raise StreamAbortedError(f"{reason} (after {self.chars_seen} chars)")
+
+    # ------------------------------------------------------------------
+    # Value handling
+    # ------------------------------------------------------------------
+    def _expected_value_schema(self):
+        if not self.stack:
+            return self.root_schema
+        frame = self.stack[-1]
+        if frame["kind"] == "object":
+            properties = frame["schema"].get("properties", {})
+            return properties.get(frame["key"], {})
+        return frame["schema"].get("items", {})
+
+    def _begin_value(self, ch):
+        if ch == '"':
+            json_type = "string"
+        elif ch == "{":
+            json_type = "object"
+        elif ch == "[":
+            json_type = "array"
+        elif ch in _NUMBER_START:
+            json_type = "number"
+        elif ch in "tf":
+            json_type = "boolean"
+        elif ch == "n":
+            json_type = "null"
+        else:
+            self._abort(f"Unexpected character {ch!r} where a value should start")
+
+        value_schema = self._expected_value_schema()
+        allowed = self._allowed_types(value_schema)
+        if allowed and json_type not in allowed:
+            where = f"field '{self.stack[-1]['key']}'" if self.stack and self.stack[-1]["kind"] == "object" else "value"
+            self._abort(f"{where} started as {json_type}, schema expects {sorted(allowed)}")
+        value_schema = self._pick(value_schema, json_type)
+
+        if self.stack and self.stack[-1]["kind"] == "array":
+            frame = self.stack[-1]
+            frame["count"] += 1
+            max_items = frame["schema"].get("maxItems")
+            if max_items is not None and frame["count"] > max_items:
+                self._abort(f"Array exceeds maxItems={max_items}")
+
+        if json_type in ("object", "array"):
+            # The parent moves on once this container closes
+            self.stack.append({"kind": json_type, "schema": value_schema, "state": "start", "key": None, "count": 0})
+            return
+
+        if self.stack:
+            self.stack[-1]["state"] = "after_value"
+        if json_type == "string":
+            self._start_string(is_key=False, schema=value_schema)
+        else:
+            self.in_literal = True
+
+    def _start_string(self, is_key: bool, schema=None):
+        self.in_string = True
+        self.string_is_key = is_key
+        self.string_len = 0
+        self.string_buf = []
+        self.escape = False
+        self.unicode_skip = 0
+        self.string_schema = schema or {}
+
+    def _end_string(self):
+        self.in_string = False
+        if self.string_is_key:
+            frame = self.stack[-1]
+            key = "".join(self.string_buf)
+            frame["key"] = key
+            frame["state"] = "colon"
+            properties = frame["schema"].get("properties")
+            if properties is not None and key not in properties:
+                if key in _SCHEMA_ECHO_KEYS:
+                    self._abort(f"Schema echo detected (key '{key}')")
+                if frame["schema"].get("additionalProperties") is False:
+                    self._abort(f"Unknown key '{key}'")
+        elif not self.stack:
+            self.finished = True
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def feed(self, chunk: str) -> None:
+        """Consume the next piece of streamed text; raises StreamAbortedError on failure"""
+        for ch in chunk:
+            self.chars_seen += 1
+            self._feed_char(ch)
+
+    def _feed_char(self, ch):
+        if self.in_string:
+            self._feed_string_char(ch)
+            return
+
+        if self.in_literal:
+            if ch not in _DELIMITERS:
+                return
+            self.in_literal = False
+            if not self.stack:
+                self.finished = True
+
+        if self.finished:
+            if not ch.isspace() and ch != "`":
+                self._abort("Extra content after the complete JSON value")
+            return
+
+        if not self.started:
+            if ch.isspace():
+                return
+            if ch in "`" or (self.prefix.startswith("```") and ch.isalpha() and len(self.prefix) < 8):
+                self.prefix += ch
+                return
+            if ch not in "{[":
+                self._abort(f"Response does not start with JSON (got {ch!r})")
+            if ch == "[" and "object" in self._allowed_types(self.root_schema) and "array" not in self._allowed_types(self.root_schema):
+                self._abort("Expected a single JSON object, got an array")
+            self.started = True
+            self._begin_value(ch)
+            return
+
+        if ch.isspace():
+            return
+
+        frame = self.stack[-1]
+        state = frame["state"]
+
+        if frame["kind"] == "object":
+            if state in ("start", "key"):
+                if ch == '"':
+                    self._start_string(is_key=True)
+                elif ch == "}" and state == "start":
+                    self.stack.pop()
+                    self._after_container_closed()
+                else:
+                    self._abort(f"Expected an object key, got {ch!r}")
+            elif state == "colon":
+                if ch != ":":
+                    self._abort(f"Expected ':' after key '{frame['key']}', got {ch!r}")
+                frame["state"] = "value"
+            elif state == "value":
+                self._begin_value(ch)
+            elif state == "after_value":
+                if ch == ",":
+                    frame["state"] = "key"
+                elif ch == "}":
+                    self.stack.pop()
+                    self._after_container_closed()
+                else:
+                    self._abort(f"Expected ',' or '}}' after value of '{frame['key']}', got {ch!r}")
+        else:
+            if state == "start":
+                if ch == "]":
+                    self.stack.pop()
+                    self._after_container_closed()
+                else:
+                    self._begin_value(ch)
+            elif state == "value":
+                self._begin_value(ch)
+            elif state == "after_value":
+                if ch == ",":
+                    frame["state"] = "value"
+                elif ch == "]":
+                    self.stack.pop()
+                    self._after_container_closed()
+                else:
+                    self._abort(f"Expected ',' or ']' in array, got {ch!r}")
+
+    def _after_container_closed(self):
+        if self.stack:
+            self.stack[-1]["state"] = "after_value"
+        else:
+            self.finished = True
+
+    def _feed_string_char(self, ch):
+        if self.unicode_skip:
+            self.unicode_skip -= 1
+            return
+        if self.escape:
+            self.escape = False
+            if ch == "u":
+                self.unicode_skip = 4
+            self._count_string_char(ch)
+            return
+        if ch == "\\":
+            self.escape = True
+            return
+        if ch == '"':
+            self._end_string()
+            return
+        self._count_string_char(ch)
+
+    def _count_string_char(self, ch):
+        self.string_len += 1
+        if self.string_is_key:
+            self.string_buf.append(ch)
+            return
+        max_length = self.string_schema.get("maxLength")
+        if max_length is not None and self.string_len > max_length:
+            key = self.stack[-1]["key"] if self.stack and self.stack[-1]["kind"] == "object" else "value"
+            self._abort(f"Field '{key}' exceeds maxLength={max_length}")
@@ -0,0 +1,197 @@
+"""
+TokenCounter - Per-model token counting and priority-based context packing
+
+Token counts come from a local HuggingFace ``tokenizer.json`` when one is
+configured for the model (TOKENIZER_FILES or TOKENIZER_DIR). Without a local
+tokenizer the counter falls back to a chars-per-token ratio that starts at
+CHARS_PER_TOKEN_ESTIMATE and is calibrated from the prompt token counts the
+providers report after each call.
+
+ContextPacker uses those counts to drop the lowest-priority context blocks (or
+the oldest conversation turns) before a request is sent, instead of letting
+Ollama silently cut the front of an over-long prompt.
+"""
+import os
+import threading
+
+try:
+    from tokenizers import Tokenizer
+    TOKENIZERS_AVAILABLE = True
+except ImportError:
+    TOKENIZERS_AVAILABLE = False
+
+MESSAGE_OVERHEAD_TOKENS = 4  # Role markers and separators added by chat templates
+
+
+class TokenCounter:
+    """Counts tokens with cached per-model tokenizers and a calibrated fallback"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tokenizers: dict = {}
+        self._chars_per_token: dict = {}
+
+    @staticmethod
+    def _default_ratio() -> float:
+        import Writer.Config
+        return getattr(Writer.Config, 'CHARS_PER_TOKEN_ESTIMATE', 4.5)
+
+    def _tokenizer_path(self, model: str):
+        import Writer.Config
+        files = getattr(Writer.Config, 'TOKENIZER_FILES', {}) or {}
+        bare_name = model.split("://", 1)[-1].split("@", 1)[0].split("?", 1)[0]
+        for key in (model, bare_name):
+            if key in files:
+                return files[key]
+        tokenizer_dir = getattr(Writer.Config, 'TOKENIZER_DIR', '')
+        if tokenizer_dir:
+            candidate = os.path.join(tokenizer_dir, bare_name.replace("/", "_").replace(":", "_"), "tokenizer.json")
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+    def _get_tokenizer(self, model: str):
+        with self._lock:
+            if model in self._tokenizers:
+                return self._tokenizers[model]
+        tokenizer = None
+        path = self._tokenizer_path(model)
+        if path and TOKENIZERS_AVAILABLE:
+            try:
+                tokenizer = Tokenizer.from_file(path)
+            except Exception as e:
+                print(f"TokenCounter: could not load tokenizer '{path}' for {model}: {e}")
+        with self._lock:
+            self._tokenizers[model] = tokenizer
+        return tokenizer
+
+    def is_exact(self, model: str) -> bool:
+        return self._get_tokenizer(model) is not None
+
+    def chars_per_token(self, model: str) -> float:
+        with self._lock:
+            return self._chars_per_token.get(model, self._default_ratio())
+
+    def count(self, model: str, text: str) -> int:
+        """Token count of a single text for the given model"""
+        if not text:
+            return 0
+        tokenizer = self._get_tokenizer(model)
+        if tokenizer is not None:
+            return len(tokenizer.encode(text, add_special_tokens=False).ids)
+        return int(round(len(text) / self.chars_per_token(model)))
+
+    def count_messages(self, model: str, messages: list) -> int:
+        """Token count of a chat request including per-message template overhead"""
+        return sum(
+            self.count(model, str(m.get("content", ""))) + MESSAGE_OVERHEAD_TOKENS
+            for m in messages
+        )
+
+    def calibrate(self, model: str, input_chars: int, reported_prompt_tokens: int) -> None:
+        """Update the fallback chars-per-token ratio from a provider-reported prompt size"""
+        if not input_chars or not reported_prompt_tokens or self.is_exact(model):
+            return
+        observed = input_chars / reported_prompt_tokens
+        if not 0.5 <= observed <= 20:
+            return  # Ignore nonsense (e.g. cached prompt prefixes reporting tiny counts)
+        with self._lock:
+            previous = self._chars_per_token.get(model)
+            # Exponential moving average keeps one odd call from swinging the estimate
+            self._chars_per_token[model] = observed if previous is None else previous * 0.8 + observed * 0.2
+
+
+class ContextPacker:
+    """Fits context into a token budget by dropping the lowest-priority pieces first"""
+
+    def __init__(self, counter: TokenCounter, model: str):
+        self.counter = counter
+        self.model = model
+
+    def pack_blocks(self, blocks: list, budget: int, separator: str = "\n\n---\n\n"):
+        """Keep as many blocks as fit in budget.
+
+        Args:
+            blocks: list of (priority, text) tuples in output order; higher priority survives longer
+            budget: maximum tokens for the joined result
+
+        Returns:
+            Tuple of (packed text, list of dropped (priority, text) blocks)
+        """
+        kept = [(i, priority, text) for i, (priority, text) in enumerate(blocks) if text]
+        dropped = []
+        separator_tokens = self.counter.count(self.model, separator)
+
+        def _total(items):
+            return sum(self.counter.count(self.model, text) for _, _, text in items) + separator_tokens * max(0, len(items) - 1)
+
+        top_priority = max((priority for _, priority, _ in kept), default=0)
+        while _total(kept) > budget:
+            # Top-priority blocks are never dropped
+            candidates = [item for item in kept if item[1] < top_priority]
+            if not candidates:
+                break
+            # Lowest priority first; among equals drop the earliest block
+            victim = min(candidates, key=lambda item: (item[1], item[0]))
+            kept.remove(victim)
+            dropped.append((victim[1], victim[2]))
+
+        return separator.join(text for _, _, text in kept), dropped
+
+    def pack_messages(self, messages: list, budget: int):
+        """Shorten the chat history until the request fits in budget.
+
+        System messages, the first user message (the task) and the final message
+        are always kept. Older assistant/user turn pairs - e.g. failed JSON and its
+        retry feedback - are dropped first, oldest first; then the oldest remaining
+        intermediate message is truncated.
+
+        Returns:
+            Tuple of (packed messages, number of dropped or truncated messages)
+        """
+        packed = [dict(m) for m in messages]
+        changed = 0
+
+        def _over():
+            return self.counter.count_messages(self.model, packed) - budget
+
+        def _intermediate():
+            task = next((i for i, m in enumerate(packed) if m.get("role") == "user"), None)
+            return [
+                i for i in range(len(packed) - 1)
+                if i != task and packed[i].get("role") != "system"
+            ]
+
+        while _over() > 0:
+            candidates = _intermediate()
+            pair = next((i for i in candidates if i + 1 in candidates
+                         and packed[i].get("role") == "assistant" and packed[i + 1].get("role") == "user"), None)
+            if pair is None:
+                break
+            del packed[pair:pair + 2]
+            changed += 2
+
+        while _over() > 0:
+            candidates = _intermediate()
+            if not candidates:
+                break
+            victim = packed[candidates[0]]
+            content = str(victim.get("content", "")).removesuffix(" [...]")
+            tokens = self.counter.count(self.model, content)
+            keep_tokens = tokens - _over() - self.counter.count(self.model, " [...]")
+            if keep_tokens <= 0:
+                del packed[candidates[0]]
+            else:
+                victim["content"] = content[:int(len(content) * keep_tokens / tokens)].rstrip() + " [...]"
+                if self.counter.count(self.model, victim["content"]) >= tokens:
+                    del packed[candidates[0]]  # Too short to truncate further
+            changed += 1
+        return packed, changed
+
+
+_SHARED_COUNTER = TokenCounter()
+
+
+def get_token_counter() -> TokenCounter:
+    """Process-wide counter so tokenizers and calibration are shared by every caller"""
+    return _SHARED_COUNTER
@@ -8,8 +8,16 @@ import importlib
 import importlib.metadata
 import subprocess
 import sys
+import threading
+from contextlib import contextmanager
 from urllib.parse import parse_qs, urlparse, unquote
-import json_repair
+from Writer.Interface.ResponseCache import ResponseCache
+from Writer.Interface.HTTPSession import HTTPSessionPool
+from Writer.Interface.StreamingJSON import IncrementalJSONValidator, StreamAbortedError
+from Writer.Interface.TokenCounter import ContextPacker, get_token_counter
+from Writer.Interface.SchemaRegistry import get_schema_registry
+from Writer.Interface.JSONParse import JSONParseStats, parse_json_tiered, strip_code_fences
+from Writer.Interface.RetryPolicy import ResponseParseError, RetryEngine, classify_error, retry_after_seconds, ERROR_FATAL
 
 try:
     from pydantic import ValidationError
@@ -383,8 +391,52 @@ class Interface:
 
     def __init__(self, Models: list = []):
         self.Clients: dict = {}
+        self.ResponseCache = ResponseCache.from_config()
+        self._CacheLocal = threading.local()  # Per-thread response awaiting acceptance before it is cached
+        self._SlotLock = threading.Lock()
+        self._ProviderSlots: dict = {}
+        self._HostSlots: dict = {}
+        self._HTTPSession = None
+        self.TokenCounter = get_token_counter()
+        self.RetryEngine = RetryEngine.from_config()
+        self._FormatInstructionCache: dict = {}
+        self.JSONParseStats = JSONParseStats()
         self.LoadModels(Models)
 
+    def _get_http_session(self) -> HTTPSessionPool:
+        """Shared keep-alive connection pool for HTTP-based providers (created on first use)"""
+        with self._SlotLock:
+            if self._HTTPSession is None:
+                self._HTTPSession = HTTPSessionPool.from_config()
+            return self._HTTPSession
+
+    @contextmanager
+    def _request_slot(self, Provider: str, Host: str = None):  # type: ignore[assignment]
+        """Bound the number of in-flight requests per provider and per host.
+
+        Limits come from MAX_CONCURRENT_REQUESTS_PER_PROVIDER and
+        MAX_CONCURRENT_REQUESTS_PER_HOST, so callers that fan out over threads
+        (or AsyncInterface coroutines) never oversubscribe a backend.
+        """
+        with self._SlotLock:
+            if Provider not in self._ProviderSlots:
+                limits = getattr(Writer.Config, 'MAX_CONCURRENT_REQUESTS_PER_PROVIDER', {}) or {}
+                self._ProviderSlots[Provider] = threading.BoundedSemaphore(max(1, int(limits.get(Provider, 4))))
+            ProviderSlot = self._ProviderSlots[Provider]
+            HostSlot = None
+            if Host:
+                if Host not in self._HostSlots:
+                    host_limit = getattr(Writer.Config, 'MAX_CONCURRENT_REQUESTS_PER_HOST', 2)
+                    self._HostSlots[Host] = threading.BoundedSemaphore(max(1, int(host_limit)))
+                HostSlot = self._HostSlots[Host]
+
+        with ProviderSlot:
+            if HostSlot is None:
+                yield
+            else:
+                with HostSlot:
+                    yield
+
     def _get_retry_limit(self, override: int = None) -> int:  # type: ignore[assignment]
         """DRY helper: Get retry limit with safe fallback to MAX_PYDANTIC_RETRIES.
 
@@ -524,7 +576,16 @@ class Interface:
                 if not os.environ.get("OPENROUTER_API_KEY"):
                     raise Exception("OPENROUTER_API_KEY missing")
                 from Writer.Interface.OpenRouter import OpenRouter
-                self.Clients[Model] = OpenRouter(api_key=os.environ["OPENROUTER_API_KEY"], model=ProviderModelName)  # type: ignore
+                self.Clients[Model] = OpenRouter(api_key=os.environ["OPENROUTER_API_KEY"], model=ProviderModelName, session=self._get_http_session())  # type: ignore
+            elif Provider == "mock":
+                from Writer.Interface.MockProviders import MockProvider
+                _, _, _, MockOptions = self.GetModelAndProvider(Model)
+                self.Clients[Model] = MockProvider(ProviderModelName, MockOptions)
+            elif Provider == "replay":
+                from Writer.Interface.MockProviders import ReplayProvider
+                _, _, _, ReplayOptions = self.GetModelAndProvider(Model)
+                Strict = str((ReplayOptions or {}).get("strict", 1)) not in ("0", "0.0", "false", "False")
+                self.Clients[Model] = ReplayProvider(ProviderModelName, strict=Strict)
             else:
                 raise NotImplementedError(f"Provider {Provider} not supported")
 
@@ -560,7 +621,43 @@ class Interface:
         if not handler:
             raise Exception(f"Embeddings not supported for provider: {Provider}")
 
-        return handler(_Logger, _Model, ProviderModelName, _Texts)
+        # One request per batch, batches bounded by count and estimated tokens
+        AllEmbeddings = []
+        TotalTokens = 0
+        Batches = self._batch_texts_for_embedding(_Texts)
+        for BatchIdx, Batch in enumerate(Batches):
+            with self._request_slot(Provider, ModelHost):
+                BatchEmbeddings, BatchUsage = handler(_Logger, _Model, ProviderModelName, Batch)
+            if len(BatchEmbeddings) != len(Batch):
+                raise Exception(f"Embedding batch {BatchIdx + 1} returned {len(BatchEmbeddings)} vectors for {len(Batch)} texts")
+            AllEmbeddings.extend(BatchEmbeddings)
+            TotalTokens += (BatchUsage or {}).get("prompt_tokens", 0)
+
+        if len(Batches) > 1:
+            _Logger.Log(f"Embedded {len(_Texts)} texts in {len(Batches)} batched requests ({_Model})", 6)
+        return AllEmbeddings, {"prompt_tokens": TotalTokens, "completion_tokens": 0}
+
+    def _batch_texts_for_embedding(self, _Texts: list) -> list:
+        """Split texts into batches bounded by EMBEDDING_BATCH_SIZE and EMBEDDING_BATCH_MAX_TOKENS.
+
+        A single text larger than the token budget still gets its own batch;
+        the provider decides how to truncate it.
+        """
+        MaxItems = max(1, int(getattr(Writer.Config, 'EMBEDDING_BATCH_SIZE', 64)))
+        MaxTokens = getattr(Writer.Config, 'EMBEDDING_BATCH_MAX_TOKENS', 8192)
+        CharsPerToken = getattr(Writer.Config, 'CHARS_PER_TOKEN_ESTIMATE', 4.5)
+
+        Batches, Current, CurrentTokens = [], [], 0
+        for Text in _Texts:
+            TextTokens = len(str(Text)) / CharsPerToken
+            if Current and (len(Current) >= MaxItems or CurrentTokens + TextTokens > MaxTokens):
+                Batches.append(Current)
+                Current, CurrentTokens = [], 0
+            Current.append(Text)
+            CurrentTokens += TextTokens
+        if Current:
+            Batches.append(Current)
+        return Batches
 
     # SafeGenerateText method removed - replaced with SafeGeneratePydantic
     def SafeGenerateText_DEPRECATED(self, _Logger, _Messages, _Model: str, _SeedOverride: int = -1, _FormatSchema: dict = None, _MinWordCount: int = 1, _max_retries_override: int = None):  # type: ignore[assignment]
@@ -575,58 +672,30 @@ class Interface:
         while Retries < max_r:
             CurrentSeed = _SeedOverride if Retries == 0 else random.randint(0, 99999)
             # ResponseMessagesList is the full history *after* the LLM call in this iteration
-            ResponseMessagesList, TokenUsage, InputChars, EstInputTokens = self.ChatResponse(
-                _Logger, CurrentMessages, _Model, CurrentSeed, _FormatSchema=_FormatSchema,
-            )
+            try:
+                ResponseMessagesList, TokenUsage, InputChars, EstInputTokens = self.ChatResponse(
+                    _Logger, CurrentMessages, _Model, CurrentSeed, _FormatSchema=_FormatSchema,
+                )
+            except StreamAbortedError as e:
+                Retries += 1
+                _Logger.Log(f"SafeGenerateJSON: Stream aborted early ({e}). Retry {Retries}/{max_r}", 6)
+                continue
 
             RawResponseText = self.GetLastMessageText(ResponseMessagesList)
-            CleanedResponseText = RawResponseText.strip()
-            # Standard cleaning for markdown-like code blocks
-            if CleanedResponseText.startswith("```json"):
-                CleanedResponseText = CleanedResponseText[7:]
-            if CleanedResponseText.startswith("```"):
-                CleanedResponseText = CleanedResponseText[3:]
-            if CleanedResponseText.endswith("```"):
-                CleanedResponseText = CleanedResponseText[:-3]
-            CleanedResponseText = CleanedResponseText.strip()
+            # Standard cleaning for markdown-like code blocks (kept for the error log below)
+            CleanedResponseText = strip_code_fences(RawResponseText)
 
             try:
-                if not CleanedResponseText:
-                    raise ValueError("Cleaned response is empty.")
-
-                # More robust JSON extraction
-                first_brace = CleanedResponseText.find("{")
-                first_bracket = CleanedResponseText.find("[")
-
-                if first_brace == -1 and first_bracket == -1:  # No JSON start characters
-                    raise ValueError("No JSON object or array start found in response.")
-
-                start_index = -1
-                if first_brace != -1 and first_bracket != -1:
-                    start_index = min(first_brace, first_bracket)
-                elif first_brace != -1:
-                    start_index = first_brace
-                else:
-                    start_index = first_bracket  # Must be first_bracket != -1
-
-                # If a start char is found, try to find its corresponding end char
-                if start_index != -1:
-                    is_object = CleanedResponseText[start_index] == '{'
-                    expected_end_char = '}' if is_object else ']'
-                    # Attempt to find the matching end character. This is simplified; robust parsing is hard.
-                    # For now, json_repair will handle most structural issues.
-                    # We just try to narrow down the string to the most likely JSON part.
-                    last_end_char_idx = CleanedResponseText.rfind(expected_end_char)
-                    if last_end_char_idx > start_index:
-                        CleanedResponseText = CleanedResponseText[start_index: last_end_char_idx + 1]
-                    # else, we might have a truncated JSON or other issues, let json_repair try
-
-                JSONResponse = json_repair.loads(CleanedResponseText)
+                # Strict parse first; brace extraction and json_repair only when needed
+                JSONResponse, ParseTier = parse_json_tiered(RawResponseText)
+                self.JSONParseStats.record(_Model, ParseTier)
                 token_info = TokenUsage if TokenUsage else "N/A (streaming incomplete)"
-                _Logger.Log(f"JSON Call Stats: ... Tokens: {token_info}", 6)
+                _Logger.Log(f"JSON Call Stats: ... Parsed via {ParseTier}. Tokens: {token_info}", 6)
+                self._accept_cached_response()
                 return ResponseMessagesList, JSONResponse, TokenUsage  # Success
 
             except Exception as e:
+                self._reject_cached_response()
                 _Logger.Log(f"SafeGenerateJSON: Parse Error: '{e}'. Raw: '{RawResponseText[:100]}...'. Cleaned: '{CleanedResponseText[:100]}...'. Retry {Retries + 1}/{max_r}", 7)
                 Retries += 1
                 CurrentMessages = ResponseMessagesList  # Use history from the failed attempt
@@ -636,7 +705,7 @@ class Interface:
                     CurrentMessages = [m.copy() for m in _Messages]  # Reset
 
         _Logger.Log(f"SafeGenerateJSON: All {max_r} retries failed. RAISING EXCEPTION.", 7)
-        raise Exception(f"Failed to generate valid JSON after {max_r} retries")
+        raise ResponseParseError(f"Failed to generate valid JSON after {max_r} retries")
 
     def SafeGeneratePydantic(self, _Logger, _Messages, _Model: str, _PydanticModel: type, _SeedOverride: int = -1, _max_retries_override: int = None):  # type: ignore[assignment]
         """
@@ -676,15 +745,11 @@ class Interface:
         # Get max retries from config
         max_attempts = self._get_retry_limit(_max_retries_override)
 
-        # Get format instructions for the model
-        if hasattr(_PydanticModel, 'model_json_schema'):
-            schema = _PydanticModel.model_json_schema()
-        else:
-            # Fallback for older Pydantic versions
-            schema = _PydanticModel.schema()
+        # Schema and format instruction are computed once per model (and language)
+        schema = get_schema_registry().schema(_PydanticModel)
 
         # Prepare format instruction - use simplified format to prevent schema echoing
-        format_instruction = self._build_format_instruction(schema)
+        format_instruction = self._get_format_instruction(_PydanticModel)
 
         # Add format instruction to the last user message
         messages_for_parsing = [m.copy() for m in _Messages]
@@ -715,11 +780,12 @@ class Interface:
                     raise TypeError(f"Expected JSON object/dict, got {type(JSONResponse).__name__}")
 
                 # Validate and convert to Pydantic model
-                validated_model = _PydanticModel(**JSONResponse)
+                validated_model = _PydanticModel.model_validate(JSONResponse)
                 _Logger.Log(f"SafeGeneratePydantic: Successfully validated {_PydanticModel.__name__} on attempt {attempt + 1}", 5)
                 return ResponseMessagesList, validated_model, TokenUsage
 
             except ValidationError as ve:
+                self._reject_cached_response()
                 # Handle Pydantic validation errors with targeted error feedback
                 if attempt < max_attempts - 1:
                     _Logger.Log(f"Attempt {attempt + 1} failed: Pydantic validation error. Retrying with error feedback...", 5)
@@ -734,10 +800,8 @@ class Interface:
                         "content": error_message
                     })
 
-                    # Add delay before retry to allow model unload (prevents Ollama "Stopping..." stuck)
-                    retry_delay = getattr(Writer.Config, 'PYDANTIC_RETRY_DELAY', 3)
-                    _Logger.Log(f"Waiting {retry_delay}s before retry to allow model unload...", 6)
-                    time.sleep(retry_delay)
+                    # Validation retries re-prompt immediately (RETRY_BACKOFF["validation"])
+                    self._wait_before_retry(_Logger, ve, attempt)
 
                     continue
                 else:
@@ -752,6 +816,7 @@ class Interface:
                         raise Exception(f"Pydantic validation failed: {str(ve)}")
 
             except Exception as e:
+                self._reject_cached_response()
                 # Handle non-ValidationError exceptions (TypeError, etc.)
                 if attempt < max_attempts - 1:
                     _Logger.Log(f"Attempt {attempt + 1} failed: {e}. Retrying...", 5)
@@ -762,10 +827,9 @@ class Interface:
                     elif _is_validation_or_missing_error(e):
                         _Logger.Log(self._get_text('hint_required_fields'), 5)
 
-                    # Add delay before retry to allow model unload (prevents Ollama "Stopping..." stuck)
-                    retry_delay = getattr(Writer.Config, 'PYDANTIC_RETRY_DELAY', 3)
-                    _Logger.Log(f"Waiting {retry_delay}s before retry to allow model unload...", 6)
-                    time.sleep(retry_delay)
+                    if classify_error(e) == ERROR_FATAL:
+                        raise
+                    self._wait_before_retry(_Logger, e, attempt)
 
                     continue
                 else:
@@ -800,6 +864,15 @@ class Interface:
             return header + "\n" + "\n".join(f"- {exp}" for exp in explanations) + "\n\n"
         return ""
 
+    def _get_format_instruction(self, _PydanticModel) -> str:
+        """Format instruction for _PydanticModel in the current language, rendered once per Interface"""
+        CacheKey = (_PydanticModel, getattr(self, 'language', 'en'))
+        Instruction = self._FormatInstructionCache.get(CacheKey)
+        if Instruction is None:
+            Instruction = self._build_format_instruction(get_schema_registry().schema(_PydanticModel))
+            self._FormatInstructionCache[CacheKey] = Instruction
+        return Instruction
+
     def _build_format_instruction(self, schema):
         """Build clear format instruction without showing full schema to prevent echoing"""
         properties = schema.get('properties', {})
@@ -959,12 +1032,17 @@ class Interface:
             chat_params["think"] = False
             _Logger.Log(f"LLM reasoning mode DISABLED for {ProviderModel_name} (ENABLE_LLM_REASONING_MODE=False)", 6)
 
-        MaxRetries = getattr(Writer.Config, "MAX_OLLAMA_RETRIES", 2)
-        for attempt in range(MaxRetries):
-            try:
-                client = self.Clients[_Model_key]
+        # Optional streaming with incremental schema validation (structured calls only)
+        StreamValidate = bool(_FormatSchema_dict) and getattr(Writer.Config, 'STREAMING_JSON_VALIDATION', False)
+        if StreamValidate:
+            chat_params["stream"] = True
 
-                # Always use non-streaming mode (streaming removed)
+        def operation():
+            client = self.Clients[_Model_key]
+
+            if StreamValidate:
+                AssistantMessage, LastChunk = self._ollama_stream_validated(_Logger, client, chat_params, _FormatSchema_dict)
+            else:
                 response = client.chat(**chat_params)
                 AssistantMessage = {"role": "assistant", "content": response["message"]["content"]}
                 LastChunk = {"done": True}
@@ -974,44 +1052,91 @@ class Interface:
                         "eval_count": response["eval_count"]
                     })
 
-                FullResponseMessages = _Messages_list + [AssistantMessage]
-                TokenUsage = None
-                if LastChunk:
-                    if Writer.Config.DEBUG:
-                        _Logger.Log(f"LastChunk keys: {list(LastChunk.keys()) if isinstance(LastChunk, dict) else 'Not a dict'}", 6)
-                        _Logger.Log(f"LastChunk 'done' status: {LastChunk.get('done', 'missing')}", 6)
+            FullResponseMessages = _Messages_list + [AssistantMessage]
+            TokenUsage = None
+            if LastChunk:
+                if Writer.Config.DEBUG:
+                    _Logger.Log(f"LastChunk keys: {list(LastChunk.keys()) if isinstance(LastChunk, dict) else 'Not a dict'}", 6)
+                    _Logger.Log(f"LastChunk 'done' status: {LastChunk.get('done', 'missing')}", 6)
 
-                    if LastChunk.get("done"):
-                        prompt_tokens = LastChunk.get("prompt_eval_count", 0)
-                        completion_tokens = LastChunk.get("eval_count", 0)
-                        TokenUsage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens}
+                if LastChunk.get("done"):
+                    prompt_tokens = LastChunk.get("prompt_eval_count", 0)
+                    completion_tokens = LastChunk.get("eval_count", 0)
+                    TokenUsage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens}
 
-                        if Writer.Config.DEBUG:
-                            _Logger.Log(f"Token usage extracted: prompt={prompt_tokens}, completion={completion_tokens}", 6)
-                    else:
-                        _Logger.Log(f"Warning: LastChunk exists but 'done' is not True. Keys: {list(LastChunk.keys()) if isinstance(LastChunk, dict) else 'Not a dict'}", 6)
+                    if Writer.Config.DEBUG:
+                        _Logger.Log(f"Token usage extracted: prompt={prompt_tokens}, completion={completion_tokens}", 6)
                 else:
-                    _Logger.Log("Warning: LastChunk is None - streaming may have been interrupted", 6)
-                return FullResponseMessages, TokenUsage
-            except Exception as e:
-                _Logger.Log(f"Ollama API Error ({_Model_key}, Attempt {attempt+1}/{MaxRetries}): {e}", 7)
-                if attempt + 1 >= MaxRetries:
-                    raise
-                time.sleep(random.uniform(0.5, 1.5) * (attempt + 1))
-        raise Exception(f"Ollama chat failed for {_Model_key} after {MaxRetries} attempts.")
-
-    def _execute_with_retry(self, _Logger, operation, _Model_key, operation_name="API call"):
-        """DRY helper: Execute operation with retry logic"""
-        MaxRetries = Writer.Config.MAX_GOOGLE_RETRIES
-        for attempt in range(MaxRetries):
-            try:
-                return operation()
-            except Exception as e:
-                _Logger.Log(f"Google {operation_name} error ({_Model_key}, Attempt {attempt+1}/{MaxRetries}): {e}", 7)
-                if attempt + 1 >= MaxRetries:
-                    raise
-                time.sleep(random.uniform(0.5, 1.5) * (attempt + 1))
-        raise Exception(f"Google {operation_name} failed for {_Model_key} after {MaxRetries} attempts.")
+                    _Logger.Log(f"Warning: LastChunk exists but 'done' is not True. Keys: {list(LastChunk.keys()) if isinstance(LastChunk, dict) else 'Not a dict'}", 6)
+            else:
+                _Logger.Log("Warning: LastChunk is None - streaming may have been interrupted", 6)
+            return FullResponseMessages, TokenUsage
+
+        # StreamAbortedError is a validation error: raised at once so SafeGenerateJSON retries with a new seed
+        return self._execute_with_retry(_Logger, operation, _Model_key, "chat", "ollama", getattr(Writer.Config, "MAX_OLLAMA_RETRIES", 2))
+
+    def _ollama_stream_validated(self, _Logger, client, chat_params, _FormatSchema_dict):
+        """Stream an Ollama chat, validating the partial JSON against the schema as it arrives.
+
+        Returns (AssistantMessage, LastChunk) like the non-streaming path. Raises
+        StreamAbortedError and closes the stream as soon as the output is
+        structurally wrong, so Ollama stops generating the rest of the response.
+        """
+        Validator = IncrementalJSONValidator(_FormatSchema_dict)
+        Stream = client.chat(**chat_params)
+        ContentParts = []
+        LastChunk = {}
+        try:
+            for Chunk in Stream:
+                Piece = Chunk["message"]["content"] if Chunk.get("message") else ""
+                if Piece:
+                    ContentParts.append(Piece)
+                    Validator.feed(Piece)
+                if Chunk.get("done"):
+                    LastChunk = {
+                        "done": True,
+                        "prompt_eval_count": Chunk.get("prompt_eval_count", 0),
+                        "eval_count": Chunk.get("eval_count", 0),
+                    }
+        except StreamAbortedError as e:
+            _Logger.Log(f"Streaming validation aborted {chat_params['model']}: {e}", 6)
+            if hasattr(Stream, "close"):
+                Stream.close()
+            raise
+        return {"role": "assistant", "content": "".join(ContentParts)}, LastChunk
+
+    def _execute_with_retry(self, _Logger, operation, _Model_key, operation_name="API call", Provider="google", MaxRetries=None):
+        """DRY helper: Execute operation under the shared retry policy, circuit breaker and rate limiter"""
+        if MaxRetries is None:
+            MaxRetries = Writer.Config.MAX_GOOGLE_RETRIES
+        _, _, ModelHost, _ = self.GetModelAndProvider(_Model_key)
+        Host = f"{Provider}@{ModelHost}" if ModelHost else Provider
+        return self.RetryEngine.call(
+            operation, Host, Provider, f"{Provider.capitalize()} {operation_name}", MaxRetries,
+            log=lambda Message, Level: _Logger.Log(Message, Level),
+        )
+
+    def _accept_cached_response(self):
+        """Stores the calling thread's last ChatResponse in the response cache once the caller accepted it"""
+        Entry = getattr(self._CacheLocal, "entry", None)
+        if Entry is not None and Entry[1] is not None:
+            self.ResponseCache.put(Entry[0], *Entry[1])
+            self._CacheLocal.entry = (Entry[0], None)
+
+    def _reject_cached_response(self):
+        """Forgets the calling thread's last ChatResponse and evicts it if it was already cached"""
+        Entry = getattr(self._CacheLocal, "entry", None)
+        self._CacheLocal.entry = None
+        if Entry is not None and Entry[1] is None:
+            self.ResponseCache.delete(Entry[0])
+
+    def _wait_before_retry(self, _Logger, Error, Attempt: int):
+        """Back off before a SafeGeneratePydantic retry according to the error class"""
+        ErrorClass = classify_error(Error)
+        Delay = self.RetryEngine.policy.delay(ErrorClass, Attempt, retry_after_seconds(Error))
+        if Delay > 0:
+            _Logger.Log(f"Waiting {Delay:.1f}s before retry ({ErrorClass} error)...", 6)
+            time.sleep(Delay)
 
     def _transform_messages_for_google(self, _Messages_list):
         """Transform messages for Google Gemini API compatibility using types.Content"""
@@ -1113,36 +1238,53 @@ class Interface:
                 if response_format.get("type") == "json_object":
                     ReqOptions.update({"temperature": ReqOptions.get("temperature", 0.0)})
 
-        MaxRetries = Writer.Config.MAX_OPENROUTER_RETRIES
-        for attempt in range(MaxRetries):
-            try:
-                # Always use non-streaming mode (streaming removed)
-                response = Client.chat(messages=_Messages_list, stream=False, **ReqOptions)
-                AssistantMessage = response.choices[0].message.content
-                AssistantMessage = {"role": "assistant", "content": AssistantMessage}
-                LastChunk = {"usage": response.usage} if hasattr(response, 'usage') else {}
-
-                FullResponseMessages = _Messages_list + [AssistantMessage]
-                TokenUsage = None
-                if LastChunk and isinstance(LastChunk, dict) and "usage" in LastChunk:
-                    usage = LastChunk["usage"]
-                    TokenUsage = {"prompt_tokens": usage.get("prompt_tokens", 0), "completion_tokens": usage.get("completion_tokens", 0)}
-                return FullResponseMessages, TokenUsage
-            except Exception as e:
-                _Logger.Log(f"OpenRouter API Error ({_Model_key}, Attempt {attempt+1}/{MaxRetries}): {e}", 7)
-                if attempt + 1 >= MaxRetries:
-                    raise
-                time.sleep(random.uniform(0.5, 1.5) * (attempt + 1))
-        raise Exception(f"OpenRouter chat failed for {_Model_key} after {MaxRetries} attempts.")
+        def operation():
+            # Single attempt per call: retries are driven by the shared RetryEngine
+            response = Client.chat(messages=_Messages_list, stream=False, max_retries=1, **ReqOptions)
+            AssistantMessage = response.choices[0].message.content
+            AssistantMessage = {"role": "assistant", "content": AssistantMessage}
+            LastChunk = {"usage": response.usage} if hasattr(response, 'usage') else {}
+
+            FullResponseMessages = _Messages_list + [AssistantMessage]
+            TokenUsage = None
+            if LastChunk and isinstance(LastChunk, dict) and "usage" in LastChunk:
+                usage = LastChunk["usage"]
+                TokenUsage = {"prompt_tokens": usage.get("prompt_tokens", 0), "completion_tokens": usage.get("completion_tokens", 0)}
+            return FullResponseMessages, TokenUsage
+
+        return self._execute_with_retry(_Logger, operation, _Model_key, "chat", "openrouter", Writer.Config.MAX_OPENROUTER_RETRIES)
+
+    def _mock_chat(self, _Logger, _Model_key, ProviderModel_name, _Messages_list, ModelOptions_dict, Seed_int, _FormatSchema_dict):
+        """Offline mock:// provider: schema-valid synthetic responses (see MockProviders)"""
+        Content, TokenUsage = self.Clients[_Model_key].chat(_Messages_list, Seed_int, _FormatSchema_dict)
+        return _Messages_list + [{"role": "assistant", "content": Content}], TokenUsage
+
+    def _replay_chat(self, _Logger, _Model_key, ProviderModel_name, _Messages_list, ModelOptions_dict, Seed_int, _FormatSchema_dict):
+        """Offline replay:// provider: responses recorded in LangchainDebug transcripts"""
+        Content, TokenUsage = self.Clients[_Model_key].chat(_Messages_list)
+        return _Messages_list + [{"role": "assistant", "content": Content}], TokenUsage
 
     def ChatResponse(self, _Logger, _Messages, _Model: str, _SeedOverride: int, _FormatSchema: dict = None):  # type: ignore[assignment]
         """Non-streaming response for Pydantic generation with user-friendly display"""
+        self._CacheLocal.entry = None
+        Provider, ProviderModelName, ModelHost, ModelOptions = self.GetModelAndProvider(_Model)
+
+        # Fit the request into the model's context window before sending it
+        ContextLimit = self._get_context_limit(Provider, ModelOptions) \
+            if getattr(Writer.Config, "PACK_CHAT_HISTORY", False) is True else 0
+        if ContextLimit:
+            Budget = ContextLimit - getattr(Writer.Config, "CONTEXT_RESPONSE_RESERVE_TOKENS", 4096)
+            if self.TokenCounter.count_messages(_Model, _Messages) > Budget:
+                _Messages, Changed = ContextPacker(self.TokenCounter, _Model).pack_messages(_Messages, Budget)
+                if Changed:
+                    _Logger.Log(f"Context packer dropped or truncated {Changed} older message(s) to fit {Budget} tokens for {_Model}", 7)
+
         TotalInputChars, EstInputTokens = 0, 0
         try:
             for msg in _Messages:
                 content = msg.get("content", "")
                 TotalInputChars += len(str(content))
-            EstInputTokens = round(TotalInputChars / getattr(Writer.Config, "CHARS_PER_TOKEN_ESTIMATE", 4.5))
+            EstInputTokens = self.TokenCounter.count_messages(_Model, _Messages)
         except Exception as e:
             _Logger.Log(f"Token calculation error: {e}", 6)
 
@@ -1152,22 +1294,40 @@ class Interface:
                 _Logger.Log(f"  Msg{i} {m.get('role')}: {str(m.get('content',''))[:100]}...", 6)
             _Logger.Log(f"--- End Req for {_Model} ---", 6)
 
-        Provider, ProviderModelName, ModelHost, ModelOptions = self.GetModelAndProvider(_Model)
         SeedToUse = _SeedOverride if _SeedOverride != -1 else getattr(Writer.Config, "SEED", random.randint(0, 999999))
 
-        _Logger.Log(f"Model: '{ProviderModelName}' ({Provider}@{ModelHost or 'Default'}) | InChars: {TotalInputChars} (Est~{EstInputTokens}tok)", 4)
-        if EstInputTokens > getattr(Writer.Config, "TOKEN_WARNING_THRESHOLD", 20000):
-            _Logger.Log(f"WARN: High Token Context: est~{EstInputTokens}tok for {_Model}", 6)
+        TokenLabel = "" if self.TokenCounter.is_exact(_Model) else "~"
+        _Logger.Log(f"Model: '{ProviderModelName}' ({Provider}@{ModelHost or 'Default'}) | InChars: {TotalInputChars} ({TokenLabel}{EstInputTokens}tok)", 4)
+        if ContextLimit and EstInputTokens > ContextLimit:
+            _Logger.Log(f"WARN: Prompt ({TokenLabel}{EstInputTokens}tok) still exceeds the {ContextLimit}-token context of {_Model}; the provider will truncate it", 7)
+        elif EstInputTokens > getattr(Writer.Config, "TOKEN_WARNING_THRESHOLD", 20000):
+            _Logger.Log(f"WARN: High Token Context: {TokenLabel}{EstInputTokens}tok for {_Model}", 6)
 
         start_time = time.time()
         ResponseHandler = getattr(self, f"_{Provider}_chat", None)
         if not ResponseHandler:
             raise Exception(f"Unsupported provider: {Provider}")
 
-        # _Messages passed to ResponseHandler is the current state of history for this attempt
-        FullResponseMessages, TokenUsage = ResponseHandler(
-            _Logger, _Model, ProviderModelName, _Messages, ModelOptions, SeedToUse, _FormatSchema
-        )
+        # Content-addressed response cache (see LLM_CACHE_MODE)
+        CacheKey, CachedResponse = None, None
+        if self.ResponseCache.can_read or self.ResponseCache.can_write:
+            CacheKey = ResponseCache.make_key(_Model, _Messages, SeedToUse, _FormatSchema, ModelOptions)
+            CachedResponse = self.ResponseCache.get(CacheKey)
+
+        if CachedResponse is not None:
+            CachedContent, TokenUsage = CachedResponse
+            FullResponseMessages = list(_Messages) + [{"role": "assistant", "content": CachedContent}]
+            _Logger.Log(f"Response cache HIT for {_Model} (key {CacheKey[:12]})", 6)
+            self._CacheLocal.entry = (CacheKey, None)
+        else:
+            # _Messages passed to ResponseHandler is the current state of history for this attempt
+            with self._request_slot(Provider, ModelHost):
+                FullResponseMessages, TokenUsage = ResponseHandler(
+                    _Logger, _Model, ProviderModelName, _Messages, ModelOptions, SeedToUse, _FormatSchema
+                )
+            # Stored only once the caller accepts the response (see _accept_cached_response)
+            if CacheKey is not None and FullResponseMessages:
+                self._CacheLocal.entry = (CacheKey, (_Model, self.GetLastMessageText(FullResponseMessages), TokenUsage))
 
         # Display user-friendly content for Pydantic responses
         if _FormatSchema and FullResponseMessages:
@@ -1196,6 +1356,9 @@ class Interface:
                 if getattr(Writer.Config, 'DEBUG', False):
                     print(f"[DEBUG] No content extracted. FullResponseMessages: {FullResponseMessages}")
 
+        if TokenUsage and CachedResponse is None:
+            self.TokenCounter.calibrate(_Model, TotalInputChars, TokenUsage.get("prompt_tokens", 0))
+
         gen_time = round(time.time() - start_time, 2)
         comp_tokens = TokenUsage.get("completion_tokens", 0) if TokenUsage else 0
         tps = f"~{round(comp_tokens/gen_time,1)}tok/s" if comp_tokens and gen_time > 0.1 else "N/A"
@@ -1210,6 +1373,17 @@ class Interface:
 
         return FullResponseMessages, TokenUsage, TotalInputChars, EstInputTokens
 
+    def _get_context_limit(self, Provider: str, ModelOptions: dict = None) -> int:  # type: ignore[assignment]
+        """Context window (tokens) to pack requests into, or 0 when unknown.
+
+        Ollama uses num_ctx from the model URL or OLLAMA_CTX; other providers
+        use MODEL_CONTEXT_TOKENS[provider] when configured.
+        """
+        if Provider == "ollama":
+            NumCtx = (ModelOptions or {}).get("num_ctx") or getattr(Writer.Config, "OLLAMA_CTX", 4096)
+            return int(NumCtx)
+        return int((getattr(Writer.Config, "MODEL_CONTEXT_TOKENS", {}) or {}).get(Provider, 0))
+
     def _DisplayPydanticResponse(self, full_content: str, schema: dict, _Logger):
         """Display user-friendly extracted content from Pydantic response"""
 
@@ -1326,103 +1500,102 @@ class Interface:
         return str(_Messages[-1].get("content", "")) if isinstance(_Messages[-1], dict) else ""
 
     def _ollama_embedding(self, _Logger, _Model_key, ProviderModel_name, _Texts: list):
-        """Generate embeddings using Ollama"""
+        """Generate embeddings for one batch using Ollama's embed endpoint (list input)"""
         client = self.Clients[_Model_key]
-        embeddings = []
-        total_tokens = 0
 
-        for text in _Texts:
-            try:
-                # Use Ollama's embeddings endpoint
-                response = client.embeddings(
-                    model=ProviderModel_name,
-                    prompt=text
-                )
-                embeddings.append(response['embedding'])
-                # Ollama doesn't provide token usage for embeddings
-                total_tokens += len(text.split())  # Rough estimate
-            except Exception as e:
-                _Logger.Log(f"Ollama embedding error: {e}", 7)
-                raise
+        try:
+            response = client.embed(
+                model=ProviderModel_name,
+                input=list(_Texts)
+            )
+        except Exception as e:
+            _Logger.Log(f"Ollama embedding error: {e}", 7)
+            raise
+
+        embeddings = [list(vector) for vector in response['embeddings']]
+        # Ollama reports prompt_eval_count for embed; fall back to a rough word estimate
+        total_tokens = response.get('prompt_eval_count') if hasattr(response, 'get') else None
+        if not total_tokens:
+            total_tokens = sum(len(text.split()) for text in _Texts)
 
         return embeddings, {"prompt_tokens": total_tokens, "completion_tokens": 0}
 
     def _google_embedding(self, _Logger, _Model_key, ProviderModel_name, _Texts: list):
-        """Generate embeddings using Gemini with retry logic and client pattern"""
+        """Generate embeddings for one batch using Gemini batch embed_content with retry logic"""
         from google.genai import types
 
         client = self.Clients[_Model_key]
-        embeddings = []
-        total_tokens = 0
-
-        MaxRetries = Writer.Config.MAX_GOOGLE_RETRIES
-        for attempt in range(MaxRetries):
-            try:
-                for text in _Texts:
-                    # Use client pattern (latest SDK)
-                    result = client.models.embed_content(
-                        model=f'models/{ProviderModel_name}',
-                        content=text,
-                        config=types.EmbedContentConfig(task_type="retrieval_document")
-                    )
-                    # Use object attribute access (not dictionary)
-                    embeddings.append(result.embedding)
-                    total_tokens += len(text.split())
-
-                return embeddings, {"prompt_tokens": total_tokens, "completion_tokens": 0}
 
-            except Exception as e:
-                _Logger.Log(f"Gemini embedding error ({_Model_key}, Attempt {attempt+1}/{MaxRetries}): {e}", 7)
-                if attempt + 1 >= MaxRetries:
-                    raise
-                time.sleep(random.uniform(0.5, 1.5) * (attempt + 1))
+        def operation():
+            # A list of contents is embedded in a single request
+            result = client.models.embed_content(
+                model=f'models/{ProviderModel_name}',
+                contents=list(_Texts),
+                config=types.EmbedContentConfig(task_type="retrieval_document")
+            )
+            # Use object attribute access (not dictionary)
+            embeddings = [list(item.values) for item in result.embeddings]
+            total_tokens = sum(len(text.split()) for text in _Texts)
+            return embeddings, {"prompt_tokens": total_tokens, "completion_tokens": 0}
 
-        raise Exception(f"Google embedding failed for {_Model_key} after {MaxRetries} attempts.")
+        return self._execute_with_retry(_Logger, operation, _Model_key, "embedding")
 
     def _openrouter_embedding(self, _Logger, _Model_key, ProviderModel_name, _Texts: list):
-        """Generate embeddings using OpenRouter (OpenAI-compatible)"""
-        import requests
-
+        """Generate embeddings for one batch using OpenRouter (OpenAI-compatible list input)"""
         client = self.Clients[_Model_key]
+        session = self._get_http_session()
 
         # Prepare request for embeddings (OpenAI-compatible format)
         headers = {
             "Authorization": f"Bearer {client.api_key}",
             "Content-Type": "application/json"
         }
+        data = {
+            "model": ProviderModel_name,
+            "input": list(_Texts)
+        }
 
-        all_embeddings = []
-        total_tokens = 0
-
-        for text in _Texts:
-            data = {
-                "model": ProviderModel_name,
-                "input": text
-            }
+        try:
+            response = session.post(
+                "https://openrouter.ai/api/v1/embeddings",
+                headers=headers,
+                json=data
+            )
+            response.raise_for_status()
+            result = response.json()
+        except Exception as e:
+            _Logger.Log(f"OpenRouter embedding error: {e}", 7)
+            raise
 
-            try:
-                response = requests.post(
-                    "https://openrouter.ai/api/v1/embeddings",
-                    headers=headers,
-                    json=data
-                )
-                response.raise_for_status()
-                result = response.json()
-                all_embeddings.append(result['data'][0]['embedding'])
-                # OpenRouter typically returns token usage
-                total_tokens += result.get('usage', {}).get('prompt_tokens', len(text.split()))
-            except Exception as e:
-                _Logger.Log(f"OpenRouter embedding error: {e}", 7)
-                raise
+        # Results carry an index; sort so vectors line up with the input order
+        items = sorted(result['data'], key=lambda item: item.get('index', 0))
+        all_embeddings = [item['embedding'] for item in items]
+        # OpenRouter typically returns token usage
+        total_tokens = result.get('usage', {}).get('prompt_tokens', sum(len(text.split()) for text in _Texts))
 
         return all_embeddings, {"prompt_tokens": total_tokens, "completion_tokens": 0}
 
+    def _mock_embedding(self, _Logger, _Model_key, ProviderModel_name, _Texts: list):
+        from Writer.Interface.MockProviders import deterministic_embedding
+        Usage = {"prompt_tokens": sum(max(1, len(t) // 4) for t in _Texts), "completion_tokens": 0}
+        return [deterministic_embedding(t) for t in _Texts], Usage
+
+    def _replay_embedding(self, _Logger, _Model_key, ProviderModel_name, _Texts: list):
+        # Embeddings are not recorded in transcripts; use the same deterministic vectors as mock://
+        return self._mock_embedding(_Logger, _Model_key, ProviderModel_name, _Texts)
+
     def GetModelAndProvider(self, _Model: str):
         if "://" not in _Model:
             return "ollama", _Model, getattr(Writer.Config, 'OLLAMA_HOST', None), None
 
         parsed = urlparse(_Model)
         Provider, Netloc, Path, Query = parsed.scheme, parsed.netloc, parsed.path.strip('/'), parsed.query
+
+        if Provider in ("mock", "replay"):
+            # Offline providers: the name (or replay:///absolute/path) keeps its slashes, no host
+            Name = unquote(Netloc + parsed.path) if Netloc else unquote(parsed.path)
+            Options = {k: (float(v[0]) if v[0].replace('.', '', 1).isdigit() else v[0]) for k, v in parse_qs(Query).items()}
+            return Provider, Name, None, Options if Options else None
         Host, ModelName = None, Netloc
 
         if "@" in Netloc:
@@ -2,7 +2,7 @@ from pydantic import BaseModel  # Ditambahkan
 # import Writer.Prompts # Dihapus untuk pemuatan dinamis
 import Writer.Config as Config
 
-from Writer.Models import ReviewOutput
+from Writer.Models import CombinedReviewOutput, ReviewOutput
 
 
 # Definisikan Skema Pydantic
@@ -68,6 +68,27 @@ def GetOutlineRating(
     return Rating
 
 
+def GetCombinedReviewOnOutline(Interface, _Logger, _Outline: str):
+    import Writer.Prompts as ActivePrompts
+
+    # Critique and IsComplete decision in one call
+    History = []
+    History.append(Interface.BuildSystemQuery(ActivePrompts.CRITIC_OUTLINE_INTRO))
+
+    StartingPrompt: str = ActivePrompts.CRITIC_OUTLINE_PROMPT.format(_Outline=_Outline) + ActivePrompts.OUTLINE_REVIEW_DECISION
+
+    _Logger.Log("Prompting LLM To Critique Outline And Decide IsComplete", 5)
+    History.append(Interface.BuildUserQuery(StartingPrompt))
+    _, Review_obj, _ = Interface.SafeGeneratePydantic(
+        _Logger,
+        History,
+        Config.REVISION_MODEL,
+        CombinedReviewOutput
+    )
+    _Logger.Log(f"Editor Determined IsComplete: {Review_obj.is_complete}", 5)
+    return Review_obj.feedback, Review_obj.is_complete
+
+
 def GetFeedbackOnChapter(Interface, _Logger, _Chapter: str, _Outline: str):
     import Writer.Prompts as ActivePrompts  # Ditambahkan untuk pemuatan dinamis
 
@@ -116,3 +137,23 @@ def GetChapterRating(Interface, _Logger, _Chapter: str):
     Rating = review_obj.IsComplete
     _Logger.Log(f"Editor Determined IsComplete: {Rating}", 5)
     return Rating
+
+
+def GetCombinedReviewOnChapter(Interface, _Logger, _Chapter: str, _Outline: str):
+    import Writer.Prompts as ActivePrompts
+
+    # Critique and IsComplete decision in one call
+    History = []
+    History.append(Interface.BuildSystemQuery(ActivePrompts.CRITIC_CHAPTER_INTRO))
+
+    StartingPrompt: str = ActivePrompts.CRITIC_CHAPTER_PROMPT.format(
+        _Chapter=_Chapter, _Outline=_Outline
+    ) + ActivePrompts.CHAPTER_REVIEW_DECISION
+
+    _Logger.Log("Prompting LLM To Critique Chapter And Decide IsComplete", 5)
+    History.append(Interface.BuildUserQuery(StartingPrompt))
+    _, Review_obj, _ = Interface.SafeGeneratePydantic(
+        _Logger, History, Config.REVISION_MODEL, CombinedReviewOutput
+    )
+    _Logger.Log(f"Editor Determined IsComplete: {Review_obj.is_complete}", 5)
+    return Review_obj.feedback, Review_obj.is_complete
@@ -811,6 +811,11 @@ class ReviewOutput(BaseModel):
         return v
 
 
+class CombinedReviewOutput(ReviewOutput):
+    """ReviewOutput that also carries the IsComplete decision (COMBINED_REVIEW_MODE)"""
+    is_complete: bool = Field(description="Whether the work meets all completion criteria")
+
+
 # Registry of all available models for dynamic loading
 MODEL_REGISTRY = {
     'BaseContext': BaseContext,
@@ -834,6 +839,7 @@ MODEL_REGISTRY = {
     'StoryInfoOutput': StoryInfoOutput,
     'SceneValidationOutput': SceneValidationOutput,
     'ReviewOutput': ReviewOutput,
+    'CombinedReviewOutput': CombinedReviewOutput,
 }
 
 
@@ -4,6 +4,7 @@ import Writer.Statistics  # Add this import
 import copy
 import re
 from Writer.Models import ChapterOutput
+from Writer.Parallel import map_ordered, resolve_workers
 try:
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.metrics.pairwise import cosine_similarity
@@ -133,83 +134,95 @@ def validate_chapter_editing(original_chapter, edited_chapter, logger):
 
 
 def EditNovel(Interface, _Logger, _Chapters: list, _Outline: str, _TotalChapters: int):
-    import Writer.Prompts as ActivePrompts  # Ditambahkan untuk pemuatan dinamis
-
     # Create deep copy to prevent contamination and preserve original for context
-    EditedChapters = copy.deepcopy(_Chapters)
     OriginalChapters = copy.deepcopy(_Chapters)  # Keep original for context isolation
 
-    for i in range(1, _TotalChapters + 1):
-
-        current_chapter_index = i - 1
-
-        # Build explicit chapter markup context to prevent confusion
-        context_sections = []
-        # Previous Chapter (if it exists) - use ORIGINAL to prevent contamination
-        if i > 1:
-            prev_chapter_text = OriginalChapters[current_chapter_index - 1]
-            context_sections.append(f"<PREVIOUS_CHAPTER>\n{prev_chapter_text}\n</PREVIOUS_CHAPTER>")
-        # Current Chapter (target for editing) - use ORIGINAL
-        current_chapter_text = OriginalChapters[current_chapter_index]
-        context_sections.append(f"<CHAPTER_TO_EDIT number=\"{i}\">\n{current_chapter_text}\n</CHAPTER_TO_EDIT>")
-        # Next Chapter (if it exists) - use ORIGINAL
-        if i < _TotalChapters:
-            next_chapter_text = OriginalChapters[current_chapter_index + 1]
-            context_sections.append(f"<NEXT_CHAPTER>\n{next_chapter_text}\n</NEXT_CHAPTER>")
-
-        # Join with clear section breaks
-        NovelText = "\n\n".join(context_sections)
-
-        # Get original word count before editing
-        OriginalWordCount = Writer.Statistics.GetWordCount(
-            OriginalChapters[current_chapter_index]
-        )
+    # Every edit reads only OriginalChapters, so chapters are edited concurrently
+    def edit(i):
+        try:
+            return EditChapter(Interface, _Logger, OriginalChapters, _Outline, _TotalChapters, i)
+        except Exception as e:
+            _Logger.Log(f"Chapter {i} edit failed ({e}); keeping the unedited chapter", 7)
+            return OriginalChapters[i - 1]
 
-        Prompt: str = ActivePrompts.CHAPTER_EDIT_PROMPT.format(
-            _Outline=_Outline, NovelText=NovelText, i=i
-        )
+    Workers = resolve_workers(Writer.Config, "POST_PROCESSING_WORKERS")
+    return map_ordered(edit, range(1, _TotalChapters + 1), Workers, thread_name_prefix="EditNovel")
 
-        _Logger.Log(
-            f"Prompting LLM To Perform Chapter {i}/{_TotalChapters} Second Pass In-Place Edit (Limited Context)",
-            5,
-        )
-        Messages = []
-        Messages.append(Interface.BuildUserQuery(Prompt))
-        Messages, Chapter_obj, _ = Interface.SafeGeneratePydantic(  # Use Pydantic model
-            _Logger,
-            Messages,
-            Writer.Config.FINAL_NOVEL_EDITOR_MODEL,
-            ChapterOutput
-        )
-        _Logger.Log(f"Finished Chapter {i} Second Pass In-Place Edit", 5)
-
-        # Extract text from validated ChapterOutput model
-        NewChapter = Chapter_obj.text
-
-        # Validate the editing result
-        original_chapter = OriginalChapters[current_chapter_index]
-        is_valid, validation_report = validate_chapter_editing(original_chapter, NewChapter, _Logger)
-
-        if is_valid:
-            # Validation passed - use edited chapter
-            EditedChapters[current_chapter_index] = NewChapter
-            NewWordCount = Writer.Statistics.GetWordCount(NewChapter)
-            _Logger.Log(f"Chapter {i} editing validation PASSED", 4)
-            _Logger.Log(f"Validation details: Similarity={validation_report.get('content_similarity', 'N/A')}, Key preservation={validation_report.get('key_preservation', 'N/A')}", 5)
-        else:
-            # Validation failed - revert to original
-            EditedChapters[current_chapter_index] = original_chapter  # Keep original
-            NewWordCount = OriginalWordCount
-            _Logger.Log(f"Chapter {i} editing validation FAILED - reverted to original", 2)
-            _Logger.Log(f"Validation failures: {', '.join(validation_report.get('failure_reasons', ['Unknown']))}", 3)
-            if validation_report.get('original_key_elements'):
-                _Logger.Log(f"Original key elements: {validation_report['original_key_elements']}", 5)
-            if validation_report.get('preserved_elements'):
-                _Logger.Log(f"Preserved key elements: {validation_report['preserved_elements']}", 5)
-
-        _Logger.Log(
-            f"Word Count Change (Edit): Chapter {i} {OriginalWordCount} -> {NewWordCount}",
-            3,
-        )
 
-    return EditedChapters
+def EditChapter(Interface, _Logger, OriginalChapters: list, _Outline: str, _TotalChapters: int, i: int):
+    """Edits chapter i (1-based) using its original neighbours as context"""
+    import Writer.Prompts as ActivePrompts  # Ditambahkan untuk pemuatan dinamis
+
+    current_chapter_index = i - 1
+
+    # Build explicit chapter markup context to prevent confusion
+    context_sections = []
+    # Previous Chapter (if it exists) - use ORIGINAL to prevent contamination
+    if i > 1:
+        prev_chapter_text = OriginalChapters[current_chapter_index - 1]
+        context_sections.append(f"<PREVIOUS_CHAPTER>\n{prev_chapter_text}\n</PREVIOUS_CHAPTER>")
+    # Current Chapter (target for editing) - use ORIGINAL
+    current_chapter_text = OriginalChapters[current_chapter_index]
+    context_sections.append(f"<CHAPTER_TO_EDIT number=\"{i}\">\n{current_chapter_text}\n</CHAPTER_TO_EDIT>")
+    # Next Chapter (if it exists) - use ORIGINAL
+    if i < _TotalChapters:
+        next_chapter_text = OriginalChapters[current_chapter_index + 1]
+        context_sections.append(f"<NEXT_CHAPTER>\n{next_chapter_text}\n</NEXT_CHAPTER>")
+
+    # Join with clear section breaks
+    NovelText = "\n\n".join(context_sections)
+
+    # Get original word count before editing
+    OriginalWordCount = Writer.Statistics.GetWordCount(
+        OriginalChapters[current_chapter_index]
+    )
+
+    Prompt: str = ActivePrompts.CHAPTER_EDIT_PROMPT.format(
+        _Outline=_Outline, NovelText=NovelText, i=i
+    )
+
+    _Logger.Log(
+        f"Prompting LLM To Perform Chapter {i}/{_TotalChapters} Second Pass In-Place Edit (Limited Context)",
+        5,
+    )
+    Messages = []
+    Messages.append(Interface.BuildUserQuery(Prompt))
+    Messages, Chapter_obj, _ = Interface.SafeGeneratePydantic(  # Use Pydantic model
+        _Logger,
+        Messages,
+        Writer.Config.FINAL_NOVEL_EDITOR_MODEL,
+        ChapterOutput,
+        _SeedOverride=Writer.Config.SEED + i  # Per-chapter seed: same result whatever the scheduling
+    )
+    _Logger.Log(f"Finished Chapter {i} Second Pass In-Place Edit", 5)
+
+    # Extract text from validated ChapterOutput model
+    NewChapter = Chapter_obj.text
+
+    # Validate the editing result
+    original_chapter = OriginalChapters[current_chapter_index]
+    is_valid, validation_report = validate_chapter_editing(original_chapter, NewChapter, _Logger)
+
+    if is_valid:
+        # Validation passed - use edited chapter
+        EditedChapter = NewChapter
+        NewWordCount = Writer.Statistics.GetWordCount(NewChapter)
+        _Logger.Log(f"Chapter {i} editing validation PASSED", 4)
+        _Logger.Log(f"Validation details: Similarity={validation_report.get('content_similarity', 'N/A')}, Key preservation={validation_report.get('key_preservation', 'N/A')}", 5)
+    else:
+        # Validation failed - revert to original
+        EditedChapter = original_chapter  # Keep original
+        NewWordCount = OriginalWordCount
+        _Logger.Log(f"Chapter {i} editing validation FAILED - reverted to original", 2)
+        _Logger.Log(f"Validation failures: {', '.join(validation_report.get('failure_reasons', ['Unknown']))}", 3)
+        if validation_report.get('original_key_elements'):
+            _Logger.Log(f"Original key elements: {validation_report['original_key_elements']}", 5)
+        if validation_report.get('preserved_elements'):
+            _Logger.Log(f"Preserved key elements: {validation_report['preserved_elements']}", 5)
+
+    _Logger.Log(
+        f"Word Count Change (Edit): Chapter {i} {OriginalWordCount} -> {NewWordCount}",
+        3,
+    )
+
+    return EditedChapter
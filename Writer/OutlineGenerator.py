@@ -1,4 +1,5 @@
 import Writer.LLMEditor
+import Writer.ReviewCycle
 import Writer.Config
 from Writer.Models import OutlineOutput, StoryElements, ChapterOutlineOutput
 # import Writer.Prompts # Dihapus untuk pemuatan dinamis
@@ -103,12 +104,17 @@ def GenerateOutline(Interface, _Logger, _OutlinePrompt, _QualityThreshold: int =
     OutlineRevisionLoopExitReason = "Unknown"  # Tambahkan variabel ini
     while True:
         Iterations += 1
-        Feedback = Writer.LLMEditor.GetFeedbackOnOutline(Interface, _Logger, Outline)
-        Rating = Writer.LLMEditor.GetOutlineRating(Interface, _Logger, Outline)
+        AtRevisionCap = Iterations > Writer.Config.OUTLINE_MAX_REVISIONS
+        # Feedback only feeds another revision; the rating only matters once the minimum revisions are done
+        Feedback, Rating = Writer.ReviewCycle.ReviewOutline(
+            Writer.LLMEditor, Interface, _Logger, Outline,
+            _NeedFeedback=not AtRevisionCap,
+            _NeedRating=AtRevisionCap or Iterations > Writer.Config.OUTLINE_MIN_REVISIONS,
+        )
         # Rating has been changed from a 0-100 int, to does it meet the standards (yes/no)?
         # Yes it has - the 0-100 int isn't actually good at all, LLM just returned a bunch of junk ratings
 
-        if Iterations > Writer.Config.OUTLINE_MAX_REVISIONS:
+        if AtRevisionCap:
             OutlineRevisionLoopExitReason = "Max Revisions Reached"  # Set alasan
             break
         if (Iterations > Writer.Config.OUTLINE_MIN_REVISIONS) and (Rating is True):
@@ -0,0 +1,61 @@
+"""
+Parallel - Bounded fan-out for independent per-chapter LLM calls
+
+Interface enforces the per-provider and per-host request limits, so stages
+only decide how many chapters may be in flight. map_ordered returns results
+in input order no matter which call finishes first. The on_result callback
+runs on the calling thread as each item completes, which keeps state
+mutation and checkpointing single-threaded.
+
+With max_workers <= 1 items are processed inline, in order, exactly like a
+plain loop.
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+def resolve_workers(Config, name: str, default: int = 1) -> int:
+    """Positive worker count from a config attribute, falling back to default"""
+    value = getattr(Config, name, default)
+    return value if isinstance(value, int) and not isinstance(value, bool) and value > 0 else default
+
+
+def map_ordered(func, items, max_workers: int, on_result=None, thread_name_prefix: str = "Parallel"):
+    """
+    Call func(item) for every item on up to max_workers threads.
+
+    Args:
+        func: Callable taking one item
+        items: Iterable of inputs
+        max_workers: Maximum concurrent calls
+        on_result: Optional callback(index, result), called on this thread as items finish
+        thread_name_prefix: Name prefix for the worker threads
+
+    Returns:
+        List of results in the order of items
+
+    Raises:
+        The first exception raised by func; items not yet started are cancelled
+    """
+    items = list(items)
+    results = [None] * len(items)
+
+    if max_workers <= 1 or len(items) <= 1:
+        for index, item in enumerate(items):
+            results[index] = func(item)
+            if on_result is not None:
+                on_result(index, results[index])
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix=thread_name_prefix) as executor:
+        futures = {executor.submit(func, item): index for index, item in enumerate(items)}
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                if on_result is not None:
+                    on_result(index, results[index])
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return results
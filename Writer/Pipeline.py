@@ -1,27 +1,49 @@
 import os
 import json
 import shutil
+import copy
 import time
 import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
 import Writer
 
 # Import Pydantic model for title generation
 from Writer.Models import TitleOutput
 # Import StateManager for proper Pydantic serialization
 from Writer.StateManager import StateManager, serialize_for_json
+from Writer.StateJournal import get_state_journal, remove_journal
+# Token-aware packing of the per-chapter generation context
+from Writer.Interface.TokenCounter import ContextPacker, get_token_counter
+# Bounded fan-out for independent per-chapter calls
+from Writer.Parallel import map_ordered, resolve_workers
+# Sub-step checkpoints of the chapter being written
+from Writer.Chapter.ChapterCheckpoint import ChapterCheckpoint
+# Content-addressed chapter texts referenced from state (CHAPTER_BLOB_STORE)
+from Writer.ChapterStore import ChapterStore
+# Summary-check summaries persisted next to the run state
+from Writer.Chapter.SummaryCache import SUMMARY_CACHE_FILENAME, use_summary_cache_file
+# Rolling chapter/arc summaries for the chapter context
+from Writer.StoryMemory import StoryMemory
 
 
 # Assuming Writer.Config, Writer.Statistics, and other Writer modules will be imported
 # by the consuming code or passed appropriately.
 
 
-def save_state_pipeline(state_data, filepath, logger):
+def save_state_pipeline(state_data, filepath, logger, backend="json"):
     """Saves the current state to a JSON file with proper Pydantic serialization."""
     temp_filepath = filepath + ".tmp"
     try:
+        if backend == "journal":
+            # Append only the changed keys (see Writer/StateJournal.py)
+            written = get_state_journal(filepath).save(state_data)
+            if logger:
+                logger.Log(f"Pipeline: State journal wrote {written} bytes for {filepath}", 6)
+            return
         # Use StateManager to properly handle Pydantic objects
         StateManager.save_state(state_data, temp_filepath)
         shutil.move(temp_filepath, filepath)
+        remove_journal(filepath)  # A full save supersedes any earlier journal
     except Exception as e:
         if logger:
             logger.Log(f"PIPELINE SAVE_STATE FATAL: Failed to save state to {filepath}: {e}", 7)
@@ -166,11 +188,17 @@ def _get_outline_for_chapter_pipeline_version(SysLogger, Config, Statistics, Act
 
 
 # Helper: Builds the context for chapter generation (base story elements, previous text, current chapter outline).
+_CONTEXT_PRIORITY_LORE = 1
+_CONTEXT_PRIORITY_MEMORY = 2
+_CONTEXT_PRIORITY_REQUIRED = 3
+
+
 def _get_current_context_for_chapter_gen_pipeline_version(SysLogger, Config, Statistics, ActivePrompts, current_state, chapter_num, base_context_text, lorebook=None):
     SysLogger.Log(f"Pipeline: Building generation context for Chapter {chapter_num}.", 6)
 
     # 1. Base Context (Story Elements, etc., from initial outline generation)
-    context_components = [base_context_text]
+    # Components carry a packing priority: lore is dropped first, then chapter memory
+    context_components = [(_CONTEXT_PRIORITY_REQUIRED, base_context_text)]
 
     # 2. Relevant Lore (if lorebook is enabled)
     if lorebook and Config.USE_LOREBOOK:
@@ -183,11 +211,23 @@ def _get_current_context_for_chapter_gen_pipeline_version(SysLogger, Config, Sta
         lore = lorebook.retrieve(lore_retrieval_query, k=Config.LOREBOOK_K_RETRIEVAL)
         if lore:
             formatted_lore = f"### Relevant Lore:\n{lore}"
-            context_components.append(formatted_lore)
+            context_components.append((_CONTEXT_PRIORITY_LORE, formatted_lore))
             SysLogger.Log(f"Pipeline: Added lorebook context ({len(lore)} chars) for Chapter {chapter_num}", 6)
 
-    # 3. Previous Chapter Text (if enabled and available)
-    if Config.CHAPTER_MEMORY_WORDS > 0 and chapter_num > 1:
+    # 3. Story memory: rolling summaries of everything written so far (USE_HIERARCHICAL_MEMORY)
+    story_memory_text = ""
+    if getattr(Config, "USE_HIERARCHICAL_MEMORY", False) is True and chapter_num > 1 and current_state.get("story_memory"):
+        memory_model = getattr(Config, "CHAPTER_STAGE1_WRITER_MODEL", "")
+        story_memory_text = StoryMemory(current_state["story_memory"]).render(
+            ActivePrompts, getattr(Config, "STORY_MEMORY_TOKEN_BUDGET", 1024),
+            lambda text: get_token_counter().count(memory_model, text), _BeforeChapter=chapter_num
+        )
+    if story_memory_text:
+        context_components.append((_CONTEXT_PRIORITY_MEMORY, story_memory_text))
+        SysLogger.Log(f"Pipeline: Added story memory ({Statistics.GetWordCount(story_memory_text)} words) to context for Chapter {chapter_num}.", 6)
+
+    # Previous Chapter Text (if enabled and available) when there is no story memory
+    elif Config.CHAPTER_MEMORY_WORDS > 0 and chapter_num > 1:
         completed_chapters_data = current_state.get("completed_chapters_data", [])  # Expects list of dicts
         if len(completed_chapters_data) >= (chapter_num - 1) and chapter_num - 2 < len(completed_chapters_data):  # Ensure index is valid
             # completed_chapters_data stores dicts: {"number": N, "title": "T", "text": "actual chapter text"}
@@ -217,7 +257,7 @@ def _get_current_context_for_chapter_gen_pipeline_version(SysLogger, Config, Sta
                     previous_chapter_title=previous_chapter_info.get("title", f"Chapter {chapter_num-1}"),
                     previous_chapter_text=previous_chapter_segment
                 )
-                context_components.append(formatted_prev_chapter_text)
+                context_components.append((_CONTEXT_PRIORITY_MEMORY, formatted_prev_chapter_text))
                 SysLogger.Log(f"Pipeline: Added last {Statistics.GetWordCount(previous_chapter_segment)} words from Chapter {chapter_num - 1} to context.", 6)
             else:
                 SysLogger.Log(f"Pipeline: Previous Chapter {chapter_num - 1} text was empty. Not added to context.", 6)
@@ -234,9 +274,17 @@ def _get_current_context_for_chapter_gen_pipeline_version(SysLogger, Config, Sta
         chapter_num=chapter_num,
         chapter_outline_text=current_chapter_specific_outline
     )
-    context_components.append(formatted_chapter_outline)
-
-    final_context = "\n\n---\n\n".join(filter(None, context_components))  # Join non-empty components with a separator
+    context_components.append((_CONTEXT_PRIORITY_REQUIRED, formatted_chapter_outline))
+
+    # Join non-empty components with a separator, dropping low-priority ones that exceed the token budget
+    token_budget = getattr(Config, "CHAPTER_CONTEXT_TOKEN_BUDGET", 0)
+    if isinstance(token_budget, int) and token_budget > 0:
+        packer = ContextPacker(get_token_counter(), getattr(Config, "CHAPTER_STAGE1_WRITER_MODEL", ""))
+        final_context, dropped = packer.pack_blocks(context_components, token_budget)
+        if dropped:
+            SysLogger.Log(f"Pipeline: Dropped {len(dropped)} low-priority context block(s) to fit {token_budget} tokens for Chapter {chapter_num}.", 7)
+    else:
+        final_context = "\n\n---\n\n".join(filter(None, (text for _, text in context_components)))
     SysLogger.Log(f"Pipeline: Final context for Chapter {chapter_num} length: {len(final_context)} chars, Word Count: {Statistics.GetWordCount(final_context)}.", 6)
     return final_context.strip()
 
@@ -310,6 +358,7 @@ class StoryPipeline:
         self.Config = config
         self.ActivePrompts = active_prompts
         self.is_fresh_run = is_fresh_run
+        self.StreamingPost = None  # StreamingPostProcessor while STREAMING_POST_PROCESSING runs alongside chapter writing
 
         try:
             import Writer.OutlineGenerator
@@ -392,12 +441,17 @@ class StoryPipeline:
                     self.SysLogger.Log(f"Failed to get lorebook entries for state: {e}", 3)
 
             # Use existing save function
-            save_state_pipeline(current_state, state_filepath, self.SysLogger)
+            save_state_pipeline(current_state, state_filepath, self.SysLogger, self._state_backend())
 
         except Exception as e:
             self.SysLogger.Log(f"Failed to save state with lorebook entries: {e}", 3)
             # Fallback to original save without lorebook
-            save_state_pipeline(current_state, state_filepath, self.SysLogger)
+            save_state_pipeline(current_state, state_filepath, self.SysLogger, self._state_backend())
+
+    def _state_backend(self):
+        """STATE_BACKEND from config: "journal" appends changes, anything else rewrites the JSON file"""
+        backend = getattr(self.Config, 'STATE_BACKEND', 'json')
+        return backend if backend == "journal" else "json"
 
     def _generate_outline_stage(self, current_state, prompt_content, state_filepath):
         self.SysLogger.Log("Pipeline: Starting Outline Generation Stage...", 3)
@@ -442,7 +496,15 @@ class StoryPipeline:
         # Sub-step: High-Level Chapter Outline Refinement (Global Refinement)
         # This refined outline becomes the basis for per-chapter expansion if enabled.
         refined_global_outline = base_outline_for_expansion  # Start with the current best outline
-        if self.Config.ENABLE_GLOBAL_OUTLINE_REFINEMENT:  # New config flag
+        resuming_expansion = (
+            current_state.get("last_completed_step") == "refine_global_outline"
+            and bool(current_state.get("refined_global_outline"))
+        )
+        if resuming_expansion:
+            # Refinement finished before the interruption; its outline is what the checkpointed chapters used
+            self.SysLogger.Log("Pipeline: Resuming per-chapter expansion with the saved refined global outline.", 4)
+            refined_global_outline = current_state["refined_global_outline"]
+        elif self.Config.ENABLE_GLOBAL_OUTLINE_REFINEMENT:  # New config flag
             self.SysLogger.Log("Pipeline: Starting High-Level Global Outline Refinement sub-step...", 3)
             if not base_outline_for_expansion:
                 self.SysLogger.Log("PIPELINE _expand_chapter_outlines_stage FATAL: Base outline for expansion is missing.", 7)
@@ -538,14 +600,33 @@ class StoryPipeline:
             current_state["refined_global_outline"] = base_outline_for_expansion  # Store original as "refined" to simplify downstream logic
 
         # Per-Chapter Expansion using the (potentially) refined global outline
+        # Each call only reads the refined outline, so chapters fan out across a bounded pool.
+        # Finished chapters are checkpointed in place (None = pending) so a resume skips them.
         GeneratedChapterOutlines = []
         if num_chapters > 0:  # Only proceed if there are chapters to outline
-            for ChapterIdx in range(1, num_chapters + 1):
+            checkpointed = current_state.get("expanded_chapter_outlines") if resuming_expansion else None
+            if not isinstance(checkpointed, list) or len(checkpointed) != num_chapters:
+                checkpointed = [None] * num_chapters
+            GeneratedChapterOutlines = list(checkpointed)
+            pending_chapters = [idx for idx in range(1, num_chapters + 1) if not GeneratedChapterOutlines[idx - 1]]
+            if len(pending_chapters) < num_chapters:
+                self.SysLogger.Log(f"Pipeline: Reusing {num_chapters - len(pending_chapters)} checkpointed chapter outline(s).", 4)
+
+            def expand_chapter(ChapterIdx):
                 self.SysLogger.Log(f"Pipeline: Generating outline for chapter {ChapterIdx}/{num_chapters}...", 6)
                 ChapterOutlineText, ChapterTitle = self.OutlineGenerator.GeneratePerChapterOutline(
                     self.Interface, self.SysLogger, ChapterIdx, num_chapters, refined_global_outline
                 )
-                GeneratedChapterOutlines.append({"text": ChapterOutlineText, "title": ChapterTitle})
+                return {"text": ChapterOutlineText, "title": ChapterTitle}
+
+            def checkpoint_chapter(index, chapter_outline):
+                GeneratedChapterOutlines[pending_chapters[index] - 1] = chapter_outline
+                current_state["expanded_chapter_outlines"] = GeneratedChapterOutlines
+                current_state["last_completed_step"] = "refine_global_outline"  # Expansion still in progress
+                self._save_state_wrapper(current_state, state_filepath)
+
+            workers = resolve_workers(self.Config, "OUTLINE_EXPANSION_WORKERS")
+            map_ordered(expand_chapter, pending_chapters, workers, on_result=checkpoint_chapter, thread_name_prefix="OutlineExpansion")
             self.SysLogger.Log(f"Pipeline: Generated {len(GeneratedChapterOutlines)} per-chapter outlines.", 4)
         else:
             self.SysLogger.Log(f"Pipeline: Skipping per-chapter outline generation as num_chapters is {num_chapters}.", 4)
@@ -561,96 +642,364 @@ class StoryPipeline:
 
         # completed_chapters_data stores: [{"number": 1, "title": "T", "text": "C1"}, {"number": 2, ...}]
         completed_chapters_data = current_state.get("completed_chapters_data", [])
+        chapter_store = self._chapter_store(state_filepath)
+        if chapter_store:
+            current_state["completed_chapters_data"] = completed_chapters_data = chapter_store.attach(completed_chapters_data)
         next_chapter_to_generate_num = current_state.get("next_chapter_index", 1)  # 1-based index
 
         self.SysLogger.Log(f"Pipeline: Chapter writing from number {next_chapter_to_generate_num} up to {total_num_chapters_overall}.", 4)
 
         if total_num_chapters_overall is None or total_num_chapters_overall < next_chapter_to_generate_num:
             self.SysLogger.Log(f"Pipeline: No chapters to generate (total_num_chapters_overall: {total_num_chapters_overall}, next_chapter_to_generate_num: {next_chapter_to_generate_num}). Skipping chapter writing.", 4)
+            if any(chapter.get("title_pending") for chapter in completed_chapters_data):
+                with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ChapterTitle") as title_executor:
+                    self._merge_chapter_titles(
+                        self._submit_pending_chapter_titles(title_executor, current_state, completed_chapters_data, base_context_text),
+                        completed_chapters_data
+                    )
             current_state["last_completed_step"] = "chapter_generation_complete"
             self._save_state_wrapper(current_state, state_filepath)
             return completed_chapters_data  # Return existing data
 
-        for current_chap_num in range(next_chapter_to_generate_num, total_num_chapters_overall + 1):
-            self.SysLogger.Log(f"--- Pipeline: Generating Chapter {current_chap_num}/{total_num_chapters_overall} ---", 3)
-
-            # Get combined context (base, previous chapters, current chapter outline) for generation
-            # This uses _get_current_context_for_chapter_gen_pipeline_version
-            current_gen_context = _get_current_context_for_chapter_gen_pipeline_version(
-                self.SysLogger, self.Config, self.Statistics, self.ActivePrompts, current_state, current_chap_num, base_context_text, lorebook=self.lorebook
-            )
-            if not current_gen_context:
-                self.SysLogger.Log(f"PIPELINE _write_chapters_stage FATAL: Generation context for Chapter {current_chap_num} is empty.", 7)
-                raise ValueError(f"Empty generation context for Chapter {current_chap_num}.")
-
-            # Get expanded chapter outline for scene pipeline (if available)
-            expanded_chapter_outline_dict = None
-            expanded_chapter_outlines = current_state.get("expanded_chapter_outlines", [])
-            if self.Config.EXPAND_OUTLINE and self.Config.SCENE_GENERATION_PIPELINE and expanded_chapter_outlines:
-                if current_chap_num > 0 and len(expanded_chapter_outlines) >= current_chap_num:
-                    potential_expanded = expanded_chapter_outlines[current_chap_num - 1]
-                    if isinstance(potential_expanded, dict):
-                        expanded_chapter_outline_dict = potential_expanded
-                        self.SysLogger.Log(f"Passing expanded outline dict for Chapter {current_chap_num} to scene pipeline", 5)
-
-            # Generate chapter content using ChapterGenerator.GenerateChapter
-            raw_chapter_content = self.ChapterGenerator.GenerateChapter(
-                self.Interface,              # Interface
-                self.SysLogger,             # _Logger
-                current_chap_num,           # _ChapterNum
-                total_num_chapters_overall,  # _TotalChapters
-                current_gen_context,        # _Outline (full context string)
-                completed_chapters_data,    # _Chapters (list of prior chapters)
-                "",                         # _BaseContext (empty for now)
-                current_gen_context,        # _FullOutlineForSceneGen (same as outline)
-                expanded_chapter_outline_dict  # type: ignore # _ExpandedChapterOutline (dict with scenes)
-            )
-
-            # Get specific outline for title generation (can be different from full gen context)
-            current_chapter_specific_outline_for_title = _get_outline_for_chapter_pipeline_version(
-                self.SysLogger, self.Config, self.Statistics, self.ActivePrompts, current_state, current_chap_num
-            )
+        # Chapters ahead of the one being finished are drafted from their outlines in the background;
+        # only the continuity stages wait for the previous chapter's text
+        prefetch_depth = getattr(self.Config, "CHAPTER_PREFETCH_DEPTH", 0)
+        prefetch_depth = prefetch_depth if isinstance(prefetch_depth, int) and prefetch_depth > 0 else 0
+        draft_executor = ThreadPoolExecutor(max_workers=prefetch_depth, thread_name_prefix="ChapterDraft") if prefetch_depth else None
+        pending_drafts = {}
+        use_story_memory = getattr(self.Config, "USE_HIERARCHICAL_MEMORY", False) is True
+        # A finished chapter is summarized in the background for the next chapter's continuity
+        summary_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ChapterSummary") \
+            if use_story_memory or getattr(self.Config, "PRECOMPUTE_CHAPTER_SUMMARIES", False) is True else None
+        pending_summary = None
+        # The story memory is updated and rolled up on the summary thread after each summary; chapter N's
+        # context waits for the memory through chapter N-2 only, so chapter N-1's roll-up overlaps chapter N
+        story_memory = StoryMemory(copy.deepcopy(current_state.setdefault("story_memory", {}))) if use_story_memory else None
+        pending_memory = self._submit_story_memory_catch_up(
+            summary_executor, story_memory, current_state, next_chapter_to_generate_num, total_num_chapters_overall
+        ) if story_memory is not None else []
+        # Titles are only needed for final assembly, so they are generated in the background and merged at the end
+        title_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ChapterTitle") \
+            if getattr(self.Config, "BACKGROUND_CHAPTER_TITLES", False) is True else None
+        pending_titles = self._submit_pending_chapter_titles(title_executor, current_state, completed_chapters_data, base_context_text) \
+            if title_executor else {}
+        streaming_post = self._start_streaming_post_processing(current_state, completed_chapters_data, total_num_chapters_overall)
+        try:
+            for current_chap_num in range(next_chapter_to_generate_num, total_num_chapters_overall + 1):
+                self.SysLogger.Log(f"--- Pipeline: Generating Chapter {current_chap_num}/{total_num_chapters_overall} ---", 3)
+
+                if draft_executor:
+                    last_prefetch = min(current_chap_num + prefetch_depth, total_num_chapters_overall)
+                    for ahead_chap_num in range(current_chap_num + 1, last_prefetch + 1):
+                        if ahead_chap_num not in pending_drafts:
+                            pending_drafts[ahead_chap_num] = self._submit_chapter_draft(
+                                draft_executor, current_state, ahead_chap_num, total_num_chapters_overall, base_context_text
+                            )
+
+                self._collect_story_memory(pending_memory, current_state, state_filepath, current_chap_num - 2)
+
+                # Get combined context (base, previous chapters, current chapter outline) for generation
+                # This uses _get_current_context_for_chapter_gen_pipeline_version
+                current_gen_context = _get_current_context_for_chapter_gen_pipeline_version(
+                    self.SysLogger, self.Config, self.Statistics, self.ActivePrompts, current_state, current_chap_num, base_context_text, lorebook=self.lorebook
+                )
+                if not current_gen_context:
+                    self.SysLogger.Log(f"PIPELINE _write_chapters_stage FATAL: Generation context for Chapter {current_chap_num} is empty.", 7)
+                    raise ValueError(f"Empty generation context for Chapter {current_chap_num}.")
+
+                chapter_draft = self._collect_chapter_draft(pending_drafts.pop(current_chap_num, None), current_chap_num)
+                if chapter_draft is not None:
+                    # A prefetched draft's sub-steps become this chapter's checkpoint
+                    chapter_draft, draft_checkpoint_data = chapter_draft
+                    current_state.setdefault("chapter_checkpoints", {})[str(current_chap_num)] = draft_checkpoint_data
+                chapter_checkpoint = self._chapter_checkpoint(current_state, state_filepath, current_chap_num)
+                self._collect_chapter_summary(pending_summary, current_state, state_filepath)
+                pending_summary = None
+
+                if chapter_draft is not None:
+                    # Prefetched draft: finish it with the previous chapter's text now available
+                    raw_chapter_content = chapter_checkpoint.run("chapter_text", lambda: self.ChapterGenerator.FinishChapter(
+                        self.Interface, self.SysLogger, chapter_draft,
+                        current_gen_context, completed_chapters_data, "", _Checkpoint=chapter_checkpoint
+                    ), self.SysLogger)
+                else:
+                    # Generate chapter content using ChapterGenerator.GenerateChapter
+                    raw_chapter_content = chapter_checkpoint.run("chapter_text", lambda: self.ChapterGenerator.GenerateChapter(
+                        self.Interface,              # Interface
+                        self.SysLogger,             # _Logger
+                        current_chap_num,           # _ChapterNum
+                        total_num_chapters_overall,  # _TotalChapters
+                        current_gen_context,        # _Outline (full context string)
+                        completed_chapters_data,    # _Chapters (list of prior chapters)
+                        "",                         # _BaseContext (empty for now)
+                        current_gen_context,        # _FullOutlineForSceneGen (same as outline)
+                        self._get_expanded_outline_for_scene_pipeline(current_state, current_chap_num),  # type: ignore # _ExpandedChapterOutline (dict with scenes)
+                        _Checkpoint=chapter_checkpoint  # Scene/stage/revision checkpoints for resume
+                    ), self.SysLogger)
+
+                summary_future = summary_executor.submit(
+                    self.ChapterGenerator.SummarizeChapter, self.Interface, self.SysLogger,
+                    current_gen_context, raw_chapter_content, current_chap_num, total_num_chapters_overall
+                ) if summary_executor else None
+
+                if title_executor:
+                    # Placeholder until the background title is merged (title_pending survives a crash)
+                    chapter_title = f"{self.Config.DEFAULT_CHAPTER_TITLE_PREFIX}{current_chap_num}"
+                else:
+                    # Get specific outline for title generation (can be different from full gen context)
+                    current_chapter_specific_outline_for_title = _get_outline_for_chapter_pipeline_version(
+                        self.SysLogger, self.Config, self.Statistics, self.ActivePrompts, current_state, current_chap_num
+                    )
 
-            # Generate chapter title using helper
-            chapter_title = _handle_chapter_title_generation_pipeline_version(
-                self.SysLogger, self.Interface, self.Config, self.ActivePrompts,
-                raw_chapter_content, current_chap_num,
-                base_context_text,  # Base outline/elements for broader context
-                current_chapter_specific_outline_for_title,  # Specific outline for this chapter
-                self.Statistics
-            )
+                    # Generate chapter title using helper
+                    chapter_title = _handle_chapter_title_generation_pipeline_version(
+                        self.SysLogger, self.Interface, self.Config, self.ActivePrompts,
+                        raw_chapter_content, current_chap_num,
+                        base_context_text,  # Base outline/elements for broader context
+                        current_chapter_specific_outline_for_title,  # Specific outline for this chapter
+                        self.Statistics
+                    )
 
-            chapter_data_entry = {
-                "number": current_chap_num,
-                "title": chapter_title,
-                "text": raw_chapter_content,  # Store raw text, formatting applied at higher levels if needed
-                "word_count": self.Statistics.GetWordCount(raw_chapter_content)
-            }
-
-            # Add or update chapter in list
-            # Ensure list is long enough if overwriting (shouldn't happen with next_chapter_index logic)
-            if len(completed_chapters_data) >= current_chap_num:
-                completed_chapters_data[current_chap_num - 1] = chapter_data_entry
-                self.SysLogger.Log(f"Pipeline: Overwriting existing Chapter {current_chap_num} data.", 6)
-            else:
-                completed_chapters_data.append(chapter_data_entry)
+                chapter_data_entry = {
+                    "number": current_chap_num,
+                    "title": chapter_title,
+                    "text": raw_chapter_content,  # Store raw text, formatting applied at higher levels if needed
+                    "word_count": self.Statistics.GetWordCount(raw_chapter_content)
+                }
+                if title_executor:
+                    chapter_data_entry["title_pending"] = True
+                if chapter_store:
+                    chapter_data_entry = chapter_store.wrap(chapter_data_entry)  # State keeps only the text's hash
+
+                # Add or update chapter in list
+                # Ensure list is long enough if overwriting (shouldn't happen with next_chapter_index logic)
+                if len(completed_chapters_data) >= current_chap_num:
+                    completed_chapters_data[current_chap_num - 1] = chapter_data_entry
+                    self.SysLogger.Log(f"Pipeline: Overwriting existing Chapter {current_chap_num} data.", 6)
+                else:
+                    completed_chapters_data.append(chapter_data_entry)
 
-            current_state["completed_chapters_data"] = completed_chapters_data
-            current_state["next_chapter_index"] = current_chap_num + 1
-            current_state["last_completed_step"] = "chapter_generation"  # Mark as in-progress
-            self._save_state_wrapper(current_state, state_filepath)
-            self.SysLogger.Log(f"--- Pipeline: Chapter {current_chap_num} (Title: '{chapter_title}') Generation Complete. Word Count: {chapter_data_entry['word_count']}. State Saved. ---", 4)
+                current_state["completed_chapters_data"] = completed_chapters_data
+                current_state.get("chapter_checkpoints", {}).pop(str(current_chap_num), None)  # Sub-steps no longer needed
+                current_state["next_chapter_index"] = current_chap_num + 1
+                current_state["last_completed_step"] = "chapter_generation"  # Mark as in-progress
+                self._save_state_wrapper(current_state, state_filepath)
+                self.SysLogger.Log(f"--- Pipeline: Chapter {current_chap_num} (Title: '{chapter_title}') Generation Complete. Word Count: {chapter_data_entry['word_count']}. State Saved. ---", 4)
+                if streaming_post:
+                    streaming_post.chapter_written(current_chap_num, raw_chapter_content)
+                if summary_future:
+                    pending_summary = (summary_future, chapter_data_entry)
+                    if story_memory is not None:
+                        pending_memory.append((current_chap_num, summary_executor.submit(
+                            self._add_to_story_memory, story_memory, current_chap_num, summary_future
+                        )))
+                if title_executor:
+                    pending_titles[current_chap_num] = self._submit_chapter_title(
+                        title_executor, current_state, chapter_data_entry, base_context_text
+                    )
+            self._collect_chapter_summary(pending_summary, current_state, state_filepath)
+            self._collect_story_memory(pending_memory, current_state, state_filepath, total_num_chapters_overall)
+            self._merge_chapter_titles(pending_titles, completed_chapters_data)
+        except BaseException:
+            if streaming_post:
+                streaming_post.close()
+                self.StreamingPost = None
+            raise
+        finally:
+            if draft_executor:
+                draft_executor.shutdown(wait=True, cancel_futures=True)
+            if summary_executor:
+                summary_executor.shutdown(wait=True, cancel_futures=True)
+            if title_executor:
+                title_executor.shutdown(wait=True, cancel_futures=True)
 
         current_state["last_completed_step"] = "chapter_generation_complete"  # All chapters for this run done
         self._save_state_wrapper(current_state, state_filepath)
         self.SysLogger.Log("Pipeline: All Chapters Generated for this run. State Saved.", 5)
         return completed_chapters_data
 
+    def _submit_story_memory_catch_up(self, executor, story_memory, current_state, next_chapter_num, total_chapters):
+        """Queues memory updates for written chapters the story memory does not hold yet (e.g. after a resume); returns [(chapter number, future)]"""
+        pending_memory = []
+        for chapter in current_state.get("completed_chapters_data", [])[:next_chapter_num - 1]:
+            number = chapter.get("number")
+            if not isinstance(number, int) or number <= story_memory.last_chapter():
+                continue
+            if chapter.get("summary"):
+                summary_future = Future()
+                summary_future.set_result(chapter["summary"])
+            else:
+                chapter_outline = _get_outline_for_chapter_pipeline_version(
+                    self.SysLogger, self.Config, self.Statistics, self.ActivePrompts, current_state, number
+                )
+                summary_future = executor.submit(
+                    self.ChapterGenerator.SummarizeChapter, self.Interface, self.SysLogger,
+                    chapter_outline, chapter.get("text", ""), number, total_chapters
+                )
+            pending_memory.append((number, executor.submit(self._add_to_story_memory, story_memory, number, summary_future)))
+        return pending_memory
+
+    def _add_to_story_memory(self, story_memory, chapter_num, summary_future):
+        """Summary-thread job: adds a chapter summary to the story memory and returns a snapshot of it (None when skipped)"""
+        try:
+            summary = summary_future.result()
+        except Exception:
+            summary = ""  # _collect_chapter_summary already logs the failure
+        if not summary:
+            self.SysLogger.Log(f"Pipeline: Chapter {chapter_num} has no summary; it is left out of the story memory.", 6)
+            return None
+        story_memory.add_chapter(self.Interface, self.SysLogger, self.ActivePrompts, chapter_num, summary)
+        return copy.deepcopy(story_memory.data)
+
+    def _collect_story_memory(self, pending_memory, current_state, state_filepath, through_chapter):
+        """Waits for the story memory updates up to through_chapter and stores the newest snapshot in current_state.
+
+        Later updates are left pending even when they have finished, so a chapter's context never
+        depends on thread timing.
+        """
+        snapshot = None
+        while pending_memory and pending_memory[0][0] <= through_chapter:
+            try:
+                snapshot = pending_memory.pop(0)[1].result() or snapshot
+            except Exception as e:
+                self.SysLogger.Log(f"Pipeline: Story memory update failed ({e}).", 6)
+        if snapshot is not None:
+            current_state["story_memory"] = snapshot
+            self._save_state_wrapper(current_state, state_filepath)
+
+    def _submit_chapter_title(self, executor, current_state, chapter_data_entry, base_context_text):
+        """Starts the title generation of a written chapter on the title executor"""
+        chapter_num = chapter_data_entry.get("number")
+        chapter_outline = _get_outline_for_chapter_pipeline_version(
+            self.SysLogger, self.Config, self.Statistics, self.ActivePrompts, current_state, chapter_num
+        )
+        return executor.submit(
+            _handle_chapter_title_generation_pipeline_version,
+            self.SysLogger, self.Interface, self.Config, self.ActivePrompts,
+            chapter_data_entry.get("text", ""), chapter_num, base_context_text, chapter_outline, self.Statistics
+        )
+
+    def _submit_pending_chapter_titles(self, executor, current_state, completed_chapters_data, base_context_text):
+        """Restarts titles that were still pending when a previous run stopped; returns {chapter number: future}"""
+        pending_titles = {}
+        for chapter in completed_chapters_data:
+            if chapter.get("title_pending"):
+                self.SysLogger.Log(f"Pipeline: Resuming pending title generation for Chapter {chapter.get('number')}.", 5)
+                pending_titles[chapter.get("number")] = self._submit_chapter_title(executor, current_state, chapter, base_context_text)
+        return pending_titles
+
+    def _merge_chapter_titles(self, pending_titles, completed_chapters_data):
+        """Waits for background titles and writes them into completed_chapters_data"""
+        if pending_titles:
+            self.SysLogger.Log(f"Pipeline: Waiting for {len(pending_titles)} background chapter title(s)...", 5)
+        for chapter_num, title_future in pending_titles.items():
+            chapter = completed_chapters_data[chapter_num - 1]
+            try:
+                chapter["title"] = title_future.result()
+            except Exception as e:  # Title generation falls back to the default title itself; this is a last resort
+                self.SysLogger.Log(f"Pipeline: Background title of Chapter {chapter_num} failed ({e}); keeping '{chapter.get('title')}'.", 6)
+            chapter.pop("title_pending", None)
+
+    def _collect_chapter_summary(self, pending_summary, current_state, state_filepath):
+        """Stores a background chapter summary as the chapter's "summary"; on failure the next chapter summarizes it itself"""
+        if pending_summary is None:
+            return
+        summary_future, chapter_data_entry = pending_summary
+        try:
+            summary = summary_future.result()
+        except Exception as e:
+            self.SysLogger.Log(f"Pipeline: Background summary of Chapter {chapter_data_entry.get('number')} failed ({e}); it will be summarized when needed.", 6)
+            return
+        if summary:
+            chapter_data_entry["summary"] = summary
+            self._save_state_wrapper(current_state, state_filepath)
+
+    def _chapter_store(self, state_filepath):
+        """ChapterStore in a "chapters" directory next to the state file, or None when CHAPTER_BLOB_STORE is off"""
+        if getattr(self.Config, "CHAPTER_BLOB_STORE", False) is not True or not state_filepath:
+            return None
+        root = os.path.join(os.path.dirname(os.path.abspath(state_filepath)), "chapters")
+        store = getattr(self, "ChapterBlobStore", None)
+        if store is None or store.root != root:
+            store = self.ChapterBlobStore = ChapterStore(root)
+        return store
+
+    def _start_streaming_post_processing(self, current_state, completed_chapters_data, total_chapters):
+        """StreamingPostProcessor fed with the chapters written so far, or None when streaming is off"""
+        self.StreamingPost = None
+        if getattr(self.Config, "STREAMING_POST_PROCESSING", False) is not True:
+            return None
+        from Writer.StreamingPostProcessor import StreamingPostProcessor
+        streaming_post = StreamingPostProcessor(
+            self.Interface, self.SysLogger, self.Config, self.NovelEditor, self.Scrubber, self.Translator,
+            current_state.get("full_outline", ""), total_chapters
+        )
+        if not streaming_post.Passes:
+            return None
+        self.SysLogger.Log(f"Pipeline: Streaming post-processing enabled ({', '.join(streaming_post.Passes)}).", 5)
+        for chapter in completed_chapters_data:  # Chapters already written before a resume
+            streaming_post.chapter_written(chapter.get("number"), chapter.get("text", ""))
+        self.StreamingPost = streaming_post
+        return streaming_post
+
+    def _get_expanded_outline_for_scene_pipeline(self, current_state, chapter_num):
+        """Expanded outline dict of a chapter (its outline is rendered from it; scenes feed the scene pipeline), or None"""
+        expanded_chapter_outlines = current_state.get("expanded_chapter_outlines", [])
+        if self.Config.EXPAND_OUTLINE and expanded_chapter_outlines:
+            if chapter_num > 0 and len(expanded_chapter_outlines) >= chapter_num:
+                potential_expanded = expanded_chapter_outlines[chapter_num - 1]
+                if isinstance(potential_expanded, dict):
+                    self.SysLogger.Log(f"Passing expanded outline dict for Chapter {chapter_num} to chapter generation", 5)
+                    return potential_expanded
+        return None
+
+    def _chapter_checkpoint(self, current_state, state_filepath, chapter_num):
+        """ChapterCheckpoint over current_state["chapter_checkpoints"][chapter], saving the state on every sub-step"""
+        checkpoint_data = current_state.setdefault("chapter_checkpoints", {}).setdefault(str(chapter_num), {})
+        if checkpoint_data:
+            self.SysLogger.Log(f"Pipeline: Resuming Chapter {chapter_num} from checkpointed sub-steps: {', '.join(checkpoint_data)}.", 4)
+        return ChapterCheckpoint(checkpoint_data, save=lambda: self._save_state_wrapper(current_state, state_filepath))
+
+    def _submit_chapter_draft(self, executor, current_state, chapter_num, total_chapters, base_context_text):
+        """Starts the outline-driven stages of a later chapter on the draft executor"""
+        # Built now, on this thread: the previous chapter is not written yet, so the context holds no chapter memory
+        draft_context = _get_current_context_for_chapter_gen_pipeline_version(
+            self.SysLogger, self.Config, self.Statistics, self.ActivePrompts, current_state, chapter_num, base_context_text, lorebook=self.lorebook
+        )
+        expanded_outline = self._get_expanded_outline_for_scene_pipeline(current_state, chapter_num)
+        self.SysLogger.Log(f"Pipeline: Prefetching draft of Chapter {chapter_num}/{total_chapters}.", 5)
+        # Draft sub-steps are kept in memory (the worker must not save the shared state) and
+        # become the chapter's checkpoint once the draft is collected on this thread
+        draft_checkpoint = ChapterCheckpoint(dict(current_state.get("chapter_checkpoints", {}).get(str(chapter_num), {})))
+
+        def draft():
+            chapter_draft = self.ChapterGenerator.DraftChapter(
+                self.Interface, self.SysLogger, chapter_num, total_chapters, draft_context,
+                [], "", draft_context, expanded_outline, True, _Checkpoint=draft_checkpoint
+            )
+            return chapter_draft, draft_checkpoint.data
+
+        return executor.submit(draft)
+
+    def _collect_chapter_draft(self, draft_future, chapter_num):
+        """Waits for a prefetched (draft, checkpoint data) pair; None (generate normally) if there was none or it failed"""
+        if draft_future is None:
+            return None
+        try:
+            return draft_future.result()
+        except Exception as e:
+            self.SysLogger.Log(f"Pipeline: Prefetched draft of Chapter {chapter_num} failed ({e}); generating it sequentially.", 6)
+            return None
+
     def _perform_post_processing_stage(self, current_state, state_filepath, Args, StartTime):
         self.SysLogger.Log("Pipeline: Starting Post-Processing Stage...", 3)
 
         # Retrieve necessary data from current_state
         FinalChaptersData = current_state.get("completed_chapters_data", [])  # This is list of dicts
+        chapter_store = self._chapter_store(state_filepath)
+        if chapter_store:
+            # Chapter versions copied below share the stored blobs; only changed texts add new ones
+            current_state["completed_chapters_data"] = FinalChaptersData = chapter_store.attach(FinalChaptersData)
         FullOutlineForInfo = current_state.get("full_outline", "")
         StoryElementsForInfo = current_state.get("story_elements", "")
         RoughChapterOutlineForInfo = current_state.get("rough_chapter_outline", "")  # Potentially less used if full_outline is primary
@@ -668,6 +1017,16 @@ class StoryPipeline:
 
         current_working_chapters_data = [ch.copy() for ch in FinalChaptersData]  # Work on a copy
 
+        # Per-pass results already produced while chapters were being written (STREAMING_POST_PROCESSING)
+        StreamedPasses = {}
+        streaming_post = getattr(self, "StreamingPost", None)
+        if streaming_post is not None:
+            self.StreamingPost = None
+            self.SysLogger.Log("Pipeline: Waiting for streamed post-processing to finish...", 5)
+            StreamedPasses = streaming_post.results([ch.get("text", "") for ch in current_working_chapters_data]) or {}
+            if not StreamedPasses:
+                self.SysLogger.Log("Pipeline: Streamed post-processing does not match the final chapters; running batch passes.", 6)
+
         # --- Sub-step: Mark start of post-processing ---
         if current_state.get("last_completed_step") == "chapter_generation_complete":
             current_state["last_completed_step"] = "post_processing_started"
@@ -684,7 +1043,7 @@ class StoryPipeline:
                     # NovelEditor.EditNovel now expects list of chapter data dicts
                     # Extract text content from chapter data dicts
                     chapter_texts = [ch.get("text", "") for ch in current_working_chapters_data]
-                    edited_chapter_texts = self.NovelEditor.EditNovel(
+                    edited_chapter_texts = StreamedPasses.get("edited") or self.NovelEditor.EditNovel(
                         self.Interface, self.SysLogger,
                         chapter_texts,
                         FullOutlineForInfo,
@@ -715,7 +1074,7 @@ class StoryPipeline:
                     # Scrubber.ScrubNovel now expects list of chapter data dicts
                     # Extract text content from chapter data dicts
                     chapter_texts = [ch.get("text", "") for ch in current_working_chapters_data]
-                    scrubbed_chapter_texts = self.Scrubber.ScrubNovel(
+                    scrubbed_chapter_texts = StreamedPasses.get("scrubbed") or self.Scrubber.ScrubNovel(
                         self.Interface, self.SysLogger,
                         chapter_texts,
                         NumChaptersActual
@@ -747,7 +1106,7 @@ class StoryPipeline:
                     # Translator.TranslateNovel now expects list of chapter data dicts
                     # Extract text content from chapter data dicts
                     chapter_texts = [ch.get("text", "") for ch in current_working_chapters_data]
-                    translated_chapter_texts = self.Translator.TranslateNovel(
+                    translated_chapter_texts = StreamedPasses.get("translated") or self.Translator.TranslateNovel(
                         self.Interface, self.SysLogger,
                         chapter_texts,
                         NumChaptersActual,
@@ -778,6 +1137,14 @@ class StoryPipeline:
         # Use the final processed chapter data to build a body of text for summary, if appropriate, or use outline
         # For now, using outline as per original logic
         info_query_text = FullOutlineForInfo if FullOutlineForInfo else StoryElementsForInfo
+        # The chapter summaries precomputed while writing (PRECOMPUTE_CHAPTER_SUMMARIES) describe what was actually written
+        chapter_summaries = [
+            f"Chapter {ch.get('number', index + 1)}: {ch['summary']}"
+            for index, ch in enumerate(FinalChaptersData) if ch.get("summary")
+        ]
+        if chapter_summaries:
+            summaries_text = "### Chapter Summaries:\n" + "\n\n".join(chapter_summaries)
+            info_query_text = f"{info_query_text}\n\n{summaries_text}" if info_query_text else summaries_text
         if not info_query_text and current_working_chapters_data:  # Fallback to using first chapter text
             info_query_text = current_working_chapters_data[0].get("text", "No content available for story info generation.")
 
@@ -886,6 +1253,8 @@ class StoryPipeline:
             with open(FinalJSONPath, "w", encoding="utf-8") as F:
                 # Serialize Pydantic objects to JSON-compatible dicts before dumping
                 serializable_story_info = serialize_for_json(StoryInfoJSON)
+                if chapter_store:
+                    serializable_story_info = chapter_store.inline(serializable_story_info)  # Output file carries the texts
                 json.dump(serializable_story_info, F, indent=4, ensure_ascii=False)
             self.SysLogger.Log(f"Pipeline: Story info JSON saved to {FinalJSONPath}", 5)
         except Exception as e:
@@ -923,6 +1292,9 @@ class StoryPipeline:
     def run_pipeline(self, current_state, state_filepath, initial_prompt_for_outline, Args, StartTime):  # Added Args, StartTime
         self.SysLogger.Log("Pipeline: Starting run_pipeline method.", 3)
         last_completed_step = current_state.get("last_completed_step", "init")
+        if state_filepath:
+            # Summary-check summaries persist next to the state, so a resumed run reuses them
+            use_summary_cache_file(os.path.join(os.path.dirname(os.path.abspath(state_filepath)), SUMMARY_CACHE_FILENAME))
 
         Outline = current_state.get("full_outline")
         BaseContext = current_state.get("base_context")  # Elements, Rough Outline, etc.
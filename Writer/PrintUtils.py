@@ -2,6 +2,7 @@ import termcolor
 import datetime
 import os
 import json
+import threading
 
 
 def PrintMessageHistory(_Messages):
@@ -38,6 +39,7 @@ class Logger:
         self.File = open(self.LogPath, log_mode, encoding="utf-8")
         self.LangchainID = 0
         self.LogItems = []  # Initialize LogItems here
+        self._Lock = threading.RLock()  # Concurrent LLM calls share this logger
 
         # Hitung LangchainID awal jika melanjutkan
         if _ExistingLogDir:
@@ -77,16 +79,20 @@ class Logger:
     # Helper function that saves the entire language chain object as both json and markdown for debugging later
     def SaveLangchain(self, _LangChainID: str, _LangChain: list):
 
+        # Reserve an ID atomically so concurrent calls never share a debug file
+        with self._Lock:
+            ThisID = self.LangchainID
+            self.LangchainID += 1
+
         # Calculate Filepath For This Langchain
         ThisLogPathJSON: str = (
             self.LogDirPrefix
-            + f"/LangchainDebug/{self.LangchainID}_{_LangChainID}.json"
+            + f"/LangchainDebug/{ThisID}_{_LangChainID}.json"
         )
         ThisLogPathMD: str = (
-            self.LogDirPrefix + f"/LangchainDebug/{self.LangchainID}_{_LangChainID}.md"
+            self.LogDirPrefix + f"/LangchainDebug/{ThisID}_{_LangChainID}.md"
         )
-        LangChainDebugTitle: str = f"{self.LangchainID}_{_LangChainID}"
-        self.LangchainID += 1
+        LangChainDebugTitle: str = f"{ThisID}_{_LangChainID}"
 
         # Generate and Save JSON Version
         with open(
@@ -128,8 +134,9 @@ class Logger:
         LogEntry = f"[{str(_Level).ljust(2)}] [{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}] {_Item}"
 
         # Write it to file
-        self.File.write(LogEntry + "\n")
-        self.LogItems.append(LogEntry)
+        with self._Lock:
+            self.File.write(LogEntry + "\n")
+            self.LogItems.append(LogEntry)
 
         # Now color and print it
         if _Level == 0:
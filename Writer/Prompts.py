@@ -234,6 +234,17 @@ Give a JSON formatted response with the following structure:
 Please do not include any other text, just the JSON object as your response will be parsed by a computer. Your entire response must be only the JSON object.
 """
 
+OUTLINE_REVIEW_DECISION = """
+
+In the same JSON response, also decide whether this outline meets all of the following criteria (true or false):
+    - Pacing: Is the story rushing over certain plot points and excessively focusing on others?
+    - Details: How are things described? Is it repetitive? Is the word choice appropriate for the scene? Are we describing things too much or too little?
+    - Flow: Does each chapter flow into the next? Does the plot make logical sense to the reader? Does it have a specific narrative structure at play? Is the narrative structure consistent throughout the story?
+    - Genre: What is the genre? What language is appropriate for that genre? Do the scenes support the genre?
+
+Add the decision as the boolean field "is_complete" (true/false), next to "feedback", "rating" and "suggestions".
+"""
+
 CHAPTER_COUNT_PROMPT = """
 <OUTLINE>
 {_Summary}
@@ -680,6 +691,55 @@ When scene metadata is provided (setting, characters, purpose, word count), use
 ###############
 """
 
+SCENE_BOUNDARY_INTRO = "You are a helpful AI Assistant. Answer the user's prompts to the best of your abilities."
+
+SCENE_BOUNDARY_PROMPT = """
+The two scenes below were written separately and are joined in the chapter. This is the end of the earlier scene:
+
+<PREVIOUS_SCENE_ENDING>
+{_PreviousEnding}
+</PREVIOUS_SCENE_ENDING>
+
+This is the opening paragraph of the next scene:
+
+<NEXT_SCENE_OPENING>
+{_NextOpening}
+</NEXT_SCENE_OPENING>
+
+Rewrite only the opening paragraph so that it follows naturally from the previous ending:
+- Keep its events, characters, setting and point of view
+- Bridge any jump in time or place with a brief transition
+- Do not repeat what the previous ending already says
+- Keep about the same length and the same style
+
+IMPORTANT: Your response must be a valid JSON object with this exact format:
+{{
+    "text": "The rewritten opening paragraph"
+}}
+
+Return ONLY the JSON object, no other text."""
+
+STORY_MEMORY_ROLLUP_INTRO = "You are a helpful AI Assistant. Answer the user's prompts to the best of your abilities."
+
+STORY_MEMORY_ROLLUP_PROMPT = """
+Below are summaries of consecutive parts of my novel, in story order:
+
+<SUMMARIES>
+{_Summaries}
+</SUMMARIES>
+
+Combine them into one summary of at most {_Words} words that I can use as memory while writing later chapters:
+- Keep the main plot events in order and how they are connected
+- Keep where each main character stands at the end and any unresolved threads
+- Leave out minor details that later chapters do not depend on
+
+IMPORTANT: Your response must be a valid JSON object with this exact format:
+{{
+    "summary": "The combined summary"
+}}
+
+Return ONLY the JSON object, no other text."""
+
 SUMMARY_CHECK_INTRO = "You are a helpful AI Assistant. Answer the user's prompts to the best of your abilities."
 
 SUMMARY_CHECK_PROMPT = """
@@ -846,6 +906,17 @@ Give a JSON formatted response with the following structure:
 Please do not include any other text, just the JSON object as your response will be parsed by a computer. Your entire response must be only the JSON object.
 """
 
+CHAPTER_REVIEW_DECISION = """
+
+In the same JSON response, also decide whether this chapter meets all of the following criteria (true or false):
+    - Pacing: Is the story rushing over certain plot points and excessively focusing on others?
+    - Details: How are things described? Is it repetitive? Is the word choice appropriate for the scene? Are we describing things too much or too little?
+    - Flow: Does each chapter flow into the next? Does the plot make logical sense to the reader? Does it have a specific narrative structure at play? Is the narrative structure consistent throughout the story?
+    - Genre: What is the genre? What language is appropriate for that genre? Do the scenes support the genre?
+
+Add the decision as the boolean field "is_complete" (true/false), next to "feedback", "rating" and "suggestions".
+"""
+
 CHAPTER_EDIT_PROMPT = """
 <OUTLINE>
 {_Outline}
@@ -1043,6 +1114,12 @@ MEGA_OUTLINE_CURRENT_CHAPTER_PREFIX = ">>> CURRENT CHAPTER: "
 # Format templates for chapter context generation
 PREVIOUS_CHAPTER_CONTEXT_FORMAT = "### Previous Chapter {chapter_num}:\n{previous_chapter_text}"
 
+STORY_MEMORY_STORY_SO_FAR_FORMAT = "### Story So Far:\n{summary}"
+
+STORY_MEMORY_ARC_FORMAT = "### Chapters {first_chapter}-{last_chapter}:\n{summary}"
+
+STORY_MEMORY_CHAPTER_FORMAT = "### Chapter {chapter_num} Summary:\n{summary}"
+
 CURRENT_CHAPTER_OUTLINE_FORMAT = "### Current Chapter {chapter_num} Outline:\n{chapter_outline_text}"
 
 GET_CHAPTER_TITLE_PROMPT = """Please generate a concise, engaging title for chapter {chapter_num} based on the following content:
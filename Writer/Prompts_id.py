@@ -261,6 +261,17 @@ Berikan respons berformat JSON dengan struktur berikut:
 Harap jangan sertakan teks lain, hanya objek JSON karena respons Anda akan diparsing oleh komputer. Seluruh respons Anda harus hanya objek JSON.
 """
 
+OUTLINE_REVIEW_DECISION = """
+
+Dalam respons JSON yang sama, putuskan juga apakah outline ini memenuhi semua kriteria berikut (benar atau salah):
+    - Laju: Apakah cerita terlalu cepat melewati poin plot tertentu dan terlalu fokus pada yang lain?
+    - Detail: Bagaimana hal-hal dijelaskan? Apakah berulang? Apakah pilihan kata sesuai untuk adegan tersebut? Apakah kita menjelaskan hal-hal terlalu banyak atau terlalu sedikit?
+    - Alur: Apakah setiap bab mengalir ke bab berikutnya? Apakah plot masuk akal secara logis bagi pembaca? Apakah memiliki struktur naratif tertentu yang dimainkan? Apakah struktur naratif konsisten di seluruh cerita?
+    - Genre: Apa genrenya? Bahasa apa yang sesuai untuk genre itu? Apakah adegan mendukung genre tersebut?
+
+Tambahkan keputusan tersebut sebagai field boolean "is_complete" (true/false), di samping "feedback", "rating" dan "suggestions".
+"""
+
 CHAPTER_COUNT_PROMPT = """
 <OUTLINE>
 {_Summary}
@@ -712,6 +723,57 @@ Pastikan seluruh respons Anda ditulis dalam Bahasa Indonesia.
 ###############
 """
 
+SCENE_BOUNDARY_INTRO = "Anda adalah Asisten AI yang membantu. Jawab prompt pengguna sebaik mungkin. Pastikan seluruh respons Anda ditulis dalam Bahasa Indonesia."
+
+SCENE_BOUNDARY_PROMPT = """
+Dua adegan di bawah ini ditulis secara terpisah dan digabungkan dalam bab. Ini adalah akhir dari adegan sebelumnya:
+
+<PREVIOUS_SCENE_ENDING>
+{_PreviousEnding}
+</PREVIOUS_SCENE_ENDING>
+
+Ini adalah paragraf pembuka adegan berikutnya:
+
+<NEXT_SCENE_OPENING>
+{_NextOpening}
+</NEXT_SCENE_OPENING>
+
+Tulis ulang hanya paragraf pembuka agar mengalir secara alami dari akhir adegan sebelumnya:
+- Pertahankan peristiwa, karakter, latar, dan sudut pandangnya
+- Jembatani lompatan waktu atau tempat dengan transisi singkat
+- Jangan mengulang apa yang sudah dikatakan di akhir adegan sebelumnya
+- Pertahankan panjang dan gaya yang kurang lebih sama
+
+Pastikan seluruh respons Anda ditulis dalam Bahasa Indonesia.
+PENTING: Respons Anda harus berupa objek JSON yang valid dengan format persis seperti ini:
+{{
+    "text": "Paragraf pembuka yang telah ditulis ulang"
+}}
+
+Kembalikan HANYA objek JSON, tanpa teks lain."""
+
+STORY_MEMORY_ROLLUP_INTRO = "Anda adalah Asisten AI yang membantu. Jawab prompt pengguna sebaik mungkin. Pastikan seluruh respons Anda ditulis dalam Bahasa Indonesia."
+
+STORY_MEMORY_ROLLUP_PROMPT = """
+Berikut adalah ringkasan bagian-bagian berurutan dari novel saya, sesuai urutan cerita:
+
+<SUMMARIES>
+{_Summaries}
+</SUMMARIES>
+
+Gabungkan menjadi satu ringkasan paling banyak {_Words} kata yang dapat saya gunakan sebagai ingatan saat menulis bab-bab berikutnya:
+- Pertahankan peristiwa plot utama sesuai urutan dan keterkaitannya
+- Pertahankan posisi akhir setiap karakter utama dan alur yang belum terselesaikan
+- Hilangkan detail kecil yang tidak dibutuhkan bab-bab berikutnya
+
+Pastikan seluruh respons Anda ditulis dalam Bahasa Indonesia.
+PENTING: Respons Anda harus berupa objek JSON yang valid dengan format persis seperti ini:
+{{
+    "summary": "Ringkasan gabungan"
+}}
+
+Kembalikan HANYA objek JSON, tanpa teks lain."""
+
 SUMMARY_CHECK_INTRO = "Anda adalah Asisten AI yang membantu. Jawab prompt pengguna sebaik mungkin. Pastikan seluruh respons Anda ditulis dalam Bahasa Indonesia."
 
 SUMMARY_CHECK_PROMPT = """
@@ -887,6 +949,17 @@ Berikan respons berformat JSON dengan struktur berikut:
 Harap jangan sertakan teks lain, hanya objek JSON karena respons Anda akan diparsing oleh komputer. Seluruh respons Anda harus hanya objek JSON.
 """
 
+CHAPTER_REVIEW_DECISION = """
+
+Dalam respons JSON yang sama, putuskan juga apakah bab ini memenuhi semua kriteria berikut (benar atau salah):
+    - Laju: Apakah cerita terlalu cepat melewati poin plot tertentu dan terlalu fokus pada yang lain?
+    - Detail: Bagaimana hal-hal dijelaskan? Apakah berulang? Apakah pilihan kata sesuai untuk adegan tersebut? Apakah kita menjelaskan hal-hal terlalu banyak atau terlalu sedikit?
+    - Alur: Apakah setiap bab mengalir ke bab berikutnya? Apakah plot masuk akal secara logis bagi pembaca? Apakah memiliki struktur naratif tertentu yang dimainkan? Apakah struktur naratif konsisten di seluruh cerita?
+    - Genre: Apa genrenya? Bahasa apa yang sesuai untuk genre itu? Apakah adegan mendukung genre tersebut?
+
+Tambahkan keputusan tersebut sebagai field boolean "is_complete" (true/false), di samping "feedback", "rating" dan "suggestions".
+"""
+
 CHAPTER_EDIT_PROMPT = """
 <OUTLINE>
 {_Outline}
@@ -1113,6 +1186,12 @@ MEGA_OUTLINE_CURRENT_CHAPTER_PREFIX = ">>> BAB SAAT INI: "
 # Template format untuk generasi konteks bab
 PREVIOUS_CHAPTER_CONTEXT_FORMAT = "### Bab Sebelumnya {chapter_num}:\n{previous_chapter_text}"
 
+STORY_MEMORY_STORY_SO_FAR_FORMAT = "### Cerita Sejauh Ini:\n{summary}"
+
+STORY_MEMORY_ARC_FORMAT = "### Bab {first_chapter}-{last_chapter}:\n{summary}"
+
+STORY_MEMORY_CHAPTER_FORMAT = "### Ringkasan Bab {chapter_num}:\n{summary}"
+
 CURRENT_CHAPTER_OUTLINE_FORMAT = "### Outline Bab {chapter_num} Saat Ini:\n{chapter_outline_text}"
 
 GET_CHAPTER_TITLE_PROMPT = """Silakan buat judul yang ringkas dan menarik untuk bab {chapter_num} berdasarkan konten berikut:
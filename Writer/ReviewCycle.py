@@ -0,0 +1,54 @@
+"""
+ReviewCycle - Evaluator calls for one iteration of a revision loop
+
+Each iteration of the outline and chapter revision loops may need critique
+feedback (to revise with) and an IsComplete decision (to stop). It does not
+always need both:
+- On the iteration that hits the revision cap, the feedback is never used.
+- Before the minimum number of revisions is done, the decision cannot end
+  the loop.
+
+The functions here make only the calls that are needed. When both are needed
+and COMBINED_REVIEW_MODE is on, one CombinedReviewOutput call returns both.
+Otherwise the feedback and rating calls run concurrently on up to
+REVIEW_WORKERS threads.
+
+The editor module is passed in, so the loops keep going through LLMEditor's
+functions.
+"""
+import Writer.Config
+from Writer.Parallel import map_ordered, resolve_workers
+
+
+def _Review(FeedbackCall, RatingCall, CombinedCall, _NeedFeedback: bool, _NeedRating: bool, _Config):
+    """(Feedback, Rating); an element that was not needed is None"""
+    if _NeedFeedback and _NeedRating:
+        if getattr(_Config, 'COMBINED_REVIEW_MODE', False) is True:
+            return CombinedCall()
+        Workers = resolve_workers(_Config, 'REVIEW_WORKERS', 1)
+        Feedback, Rating = map_ordered(lambda Call: Call(), [FeedbackCall, RatingCall], Workers, thread_name_prefix="Review")
+        return Feedback, Rating
+    return (FeedbackCall() if _NeedFeedback else None), (RatingCall() if _NeedRating else None)
+
+
+def ReviewOutline(Editor, Interface, _Logger, _Outline: str, _NeedFeedback: bool = True, _NeedRating: bool = True, _Config=None):
+    """Feedback and IsComplete rating for an outline"""
+    return _Review(
+        lambda: Editor.GetFeedbackOnOutline(Interface, _Logger, _Outline),
+        lambda: Editor.GetOutlineRating(Interface, _Logger, _Outline),
+        lambda: Editor.GetCombinedReviewOnOutline(Interface, _Logger, _Outline),
+        _NeedFeedback, _NeedRating, _Config if _Config is not None else Writer.Config
+    )
+
+
+def ReviewChapter(Editor, Interface, _Logger, _Chapter: str, _Outline: str, _NeedFeedback: bool = True, _NeedRating: bool = True, _Config=None):
+    """Feedback and IsComplete rating for a chapter"""
+    return _Review(
+        lambda: Editor.GetFeedbackOnChapter(Interface, _Logger, _Chapter, _Outline),
+        lambda: Editor.GetChapterRating(Interface, _Logger, _Chapter),
+        lambda: Editor.GetCombinedReviewOnChapter(Interface, _Logger, _Chapter, _Outline),
+        _NeedFeedback, _NeedRating, _Config if _Config is not None else Writer.Config
+    )
+
+
+__all__ = ['ReviewOutline', 'ReviewChapter']
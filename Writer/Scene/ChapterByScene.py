@@ -1,5 +1,8 @@
+import Writer.Config
 import Writer.Scene.ChapterOutlineToScenes
 import Writer.Scene.SceneOutlineToScene
+import Writer.Scene.SmoothSceneBoundaries
+from Writer.Parallel import map_ordered, resolve_workers
 from Writer.Scene.ScenesToJSON import deduplicate_scene_objects
 from Writer.Models import SceneOutline
 
@@ -85,6 +88,7 @@ def ChapterByScene(
     _Outline: str,
     _BaseContext: str = "",
     _ExpandedChapterOutline: dict = None,  # type: ignore[assignment]
+    _Checkpoint=None,  # ChapterCheckpoint: scene outlines and finished scenes survive a crash
 ):  # Added _ExpandedChapterOutline parameter
 
     # This function calls all other scene-by-scene generation functions and creates a full chapter based on the new scene pipeline.
@@ -103,6 +107,11 @@ def ChapterByScene(
             _ExpandedChapterOutline, _Logger
         )
 
+    # Scene outlines generated before a crash are reused
+    if not SceneOutlineObjects and _Checkpoint is not None and "scene_outlines" in _Checkpoint:
+        _Logger.Log("Resuming from checkpoint: reusing scene outlines", 4)
+        SceneOutlineObjects = [SceneOutline.model_validate(scene) for scene in _Checkpoint.get("scene_outlines")]
+
     # FALLBACK: Generate scenes if not available from expanded outline
     if not SceneOutlineObjects:
         _Logger.Log("Generating scenes via ChapterOutlineToScenes", 4)
@@ -115,16 +124,23 @@ def ChapterByScene(
             _Outline,
             _BaseContext=_BaseContext,
         )
+        if _Checkpoint is not None:
+            _Checkpoint.put("scene_outlines", [scene.model_dump() for scene in SceneOutlineObjects])
 
     # Deduplicate WITHOUT LLM call using utility function
     SceneOutlineList = deduplicate_scene_objects(SceneOutlineObjects)
 
-    # Now we iterate through each scene one at a time and write it, then add it to this rough chapter, which is then returned for further editing
-    RoughChapter: str = ""
+    # Scenes only depend on their own outline and the chapter outline, so they are written
+    # concurrently (SCENE_WRITING_WORKERS) and reassembled in order
     TotalScenes = len(SceneOutlineList)  # Get total scenes after deduplication
-    for idx, SceneOutlineObj in enumerate(SceneOutlineList):  # SceneOutlineObj is SceneOutline object
-        SceneNum = idx + 1  # 1-based index for logging
-        scene_text = Writer.Scene.SceneOutlineToScene.SceneOutlineToScene(
+    Workers = resolve_workers(Writer.Config, 'SCENE_WRITING_WORKERS', 1)
+
+    def write_scene(Item):
+        SceneNum, SceneOutlineObj = Item  # SceneNum is 1-based, SceneOutlineObj is a SceneOutline object
+        if _Checkpoint is not None and f"scene_{SceneNum}" in _Checkpoint:
+            _Logger.Log(f"Resuming from checkpoint: reusing 'scene_{SceneNum}'", 4)
+            return _Checkpoint.get(f"scene_{SceneNum}")
+        return Writer.Scene.SceneOutlineToScene.SceneOutlineToScene(
             Interface,
             _Logger,
             SceneNum,
@@ -133,8 +149,22 @@ def ChapterByScene(
             _Outline,
             _BaseContext,
         )
-        # Strip trailing whitespace and add consistent paragraph break to prevent wall-of-text
-        RoughChapter += scene_text.rstrip() + "\n\n"
+
+    def record_scene(Index, SceneText):
+        # Runs on this thread, so checkpoint saves are never concurrent
+        if _Checkpoint is not None and f"scene_{Index + 1}" not in _Checkpoint:
+            _Checkpoint.put(f"scene_{Index + 1}", SceneText)
+
+    SceneTexts = map_ordered(write_scene, enumerate(SceneOutlineList, start=1), Workers,
+                             on_result=record_scene, thread_name_prefix="Scene")
+
+    if getattr(Writer.Config, 'SCENE_BOUNDARY_SMOOTHING', False) is True and len(SceneTexts) > 1:
+        def smooth_boundaries():
+            return Writer.Scene.SmoothSceneBoundaries.SmoothSceneBoundaries(Interface, _Logger, SceneTexts, Workers)
+        SceneTexts = _Checkpoint.run("scene_boundaries", smooth_boundaries, _Logger) if _Checkpoint is not None else smooth_boundaries()
+
+    # Strip trailing whitespace and add consistent paragraph break to prevent wall-of-text
+    RoughChapter: str = "".join(scene_text.rstrip() + "\n\n" for scene_text in SceneTexts)
 
     _Logger.Log(
         f"Finished Scene-By-Scene Generation Pipeline for Chapter {_ChapterNum}/{_TotalChapters}",
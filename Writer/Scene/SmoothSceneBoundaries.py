@@ -0,0 +1,48 @@
+import Writer.Config
+from Writer.Parallel import map_ordered
+# import Writer.Prompts # Dihapus untuk pemuatan dinamis
+
+# Paragraphs of the earlier scene shown as context for a transition
+PREVIOUS_ENDING_PARAGRAPHS = 2
+
+
+def _Paragraphs(_Scene: str) -> list:
+    return [Paragraph for Paragraph in _Scene.strip().split("\n\n") if Paragraph.strip()]
+
+
+def SmoothSceneBoundaries(Interface, _Logger, _Scenes: list, _Workers: int = 1) -> list:
+    """
+    Rewrites the opening paragraph of every scene after the first so it follows
+    on from the end of the scene before it.
+
+    Scenes written concurrently never saw each other. Each boundary only needs
+    the original end of one scene and the original opening of the next, so all
+    boundaries are smoothed independently (on up to _Workers threads). A
+    rewrite that comes back empty or much longer than the paragraph it
+    replaces is discarded.
+    """
+    import Writer.Prompts as ActivePrompts
+
+    def smooth(SceneIndex: int) -> str:
+        PreviousParagraphs = _Paragraphs(_Scenes[SceneIndex - 1])
+        NextParagraphs = _Paragraphs(_Scenes[SceneIndex])
+        if not PreviousParagraphs or not NextParagraphs:
+            return _Scenes[SceneIndex]
+
+        Messages = [
+            Interface.BuildSystemQuery(ActivePrompts.SCENE_BOUNDARY_INTRO),
+            Interface.BuildUserQuery(ActivePrompts.SCENE_BOUNDARY_PROMPT.format(
+                _PreviousEnding="\n\n".join(PreviousParagraphs[-PREVIOUS_ENDING_PARAGRAPHS:]),
+                _NextOpening=NextParagraphs[0],
+            )),
+        ]
+        _, Response, _ = Interface.SafeGenerateJSON(_Logger, Messages, Writer.Config.CHAPTER_STAGE1_WRITER_MODEL)
+        Opening = str(Response.get("text", "") if isinstance(Response, dict) else "").strip()
+        if not Opening or len(Opening) > 3 * len(NextParagraphs[0]) + 200:
+            _Logger.Log(f"Scene boundary {SceneIndex}/{SceneIndex + 1}: rewrite rejected, keeping the original opening", 6)
+            return _Scenes[SceneIndex]
+        return "\n\n".join([Opening] + NextParagraphs[1:])
+
+    _Logger.Log(f"Smoothing {len(_Scenes) - 1} scene boundar{'y' if len(_Scenes) == 2 else 'ies'}", 5)
+    Smoothed = map_ordered(smooth, range(1, len(_Scenes)), _Workers, thread_name_prefix="SceneBoundary")
+    return _Scenes[:1] + Smoothed
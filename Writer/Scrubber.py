@@ -2,41 +2,57 @@
 import Writer.Config  # Add this
 import Writer.Statistics  # Add this import
 from Writer.Models import ChapterOutput
+from Writer.Parallel import map_ordered, resolve_workers
 
 
 def ScrubNovel(Interface, _Logger, _Chapters: list, _TotalChapters: int):
-    import Writer.Prompts as ActivePrompts  # Ditambahkan untuk pemuatan dinamis
-
     EditedChapters = _Chapters
 
-    for i in range(_TotalChapters):
-
-        # Get original word count before scrubbing
-        OriginalWordCount = Writer.Statistics.GetWordCount(EditedChapters[i])
-
-        Prompt: str = ActivePrompts.CHAPTER_SCRUB_PROMPT.format(
-            _Chapter=EditedChapters[i]
-        )
-        _Logger.Log(
-            f"Prompting LLM To Perform Chapter {i+1}/{_TotalChapters} Scrubbing Edit", 5
-        )
-        Messages = []
-        Messages.append(Interface.BuildUserQuery(Prompt))
-        Messages, Chapter_obj, _ = Interface.SafeGeneratePydantic(  # Use Pydantic model
-            _Logger,
-            Messages,
-            Writer.Config.SCRUB_MODEL,
-            ChapterOutput
-        )
-        _Logger.Log(f"Finished Chapter {i+1}/{_TotalChapters} Scrubbing Edit", 5)
-
-        # Extract text from validated ChapterOutput model
-        NewChapter = Chapter_obj.text
+    # Chapters are scrubbed independently, so they run concurrently
+    def scrub(i):
+        try:
+            return ScrubChapter(Interface, _Logger, EditedChapters[i], i, _TotalChapters)
+        except Exception as e:
+            _Logger.Log(f"Chapter {i+1} scrub failed ({e}); keeping the unscrubbed chapter", 7)
+            return EditedChapters[i]
+
+    Workers = resolve_workers(Writer.Config, "POST_PROCESSING_WORKERS")
+    for i, NewChapter in enumerate(map_ordered(scrub, range(_TotalChapters), Workers, thread_name_prefix="ScrubNovel")):
         EditedChapters[i] = NewChapter
-        NewWordCount = Writer.Statistics.GetWordCount(NewChapter)
-        _Logger.Log(
-            f"Word Count Change (Scrub): Chapter {i+1} {OriginalWordCount} -> {NewWordCount}",
-            3,
-        )
 
     return EditedChapters
+
+
+def ScrubChapter(Interface, _Logger, _Chapter: str, i: int, _TotalChapters: int):
+    """Scrubs one chapter; i is the 0-based chapter index"""
+    import Writer.Prompts as ActivePrompts  # Ditambahkan untuk pemuatan dinamis
+
+    # Get original word count before scrubbing
+    OriginalWordCount = Writer.Statistics.GetWordCount(_Chapter)
+
+    Prompt: str = ActivePrompts.CHAPTER_SCRUB_PROMPT.format(
+        _Chapter=_Chapter
+    )
+    _Logger.Log(
+        f"Prompting LLM To Perform Chapter {i+1}/{_TotalChapters} Scrubbing Edit", 5
+    )
+    Messages = []
+    Messages.append(Interface.BuildUserQuery(Prompt))
+    Messages, Chapter_obj, _ = Interface.SafeGeneratePydantic(  # Use Pydantic model
+        _Logger,
+        Messages,
+        Writer.Config.SCRUB_MODEL,
+        ChapterOutput,
+        _SeedOverride=Writer.Config.SEED + i + 1  # Per-chapter seed: same result whatever the scheduling
+    )
+    _Logger.Log(f"Finished Chapter {i+1}/{_TotalChapters} Scrubbing Edit", 5)
+
+    # Extract text from validated ChapterOutput model
+    NewChapter = Chapter_obj.text
+    NewWordCount = Writer.Statistics.GetWordCount(NewChapter)
+    _Logger.Log(
+        f"Word Count Change (Scrub): Chapter {i+1} {OriginalWordCount} -> {NewWordCount}",
+        3,
+    )
+
+    return NewChapter
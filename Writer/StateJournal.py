@@ -0,0 +1,309 @@
+"""
+StateJournal - Append-only journaled state backend
+
+With STATE_BACKEND = "journal", a save no longer rewrites the whole state file.
+Each save diffs the state against the last saved version and appends one JSON
+line holding only the changes to "<state file>.journal":
+
+    {"seq": 12, "ops": [["set", ["next_chapter_index"], 4],
+                        ["extend", ["completed_chapters_data"], [{...}]]]}
+
+Nested dicts are diffed key by key, and lists that only grew are recorded as
+"extend", so saving after a chapter costs about one chapter of text. Every
+STATE_JOURNAL_COMPACT_EVERY records, the full state is written to the state
+file itself, in the StateManager container format plus a "journal_seq" marker,
+and the journal is truncated.
+
+Loading reads that snapshot and replays the journal records newer than its
+journal_seq. A torn last line (crash mid-append) is dropped, because every
+record is a complete line. Top-level Pydantic objects are rebuilt through
+MODEL_REGISTRY only when they are first read (see LazyState).
+"""
+import copy
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Union
+
+from Writer.Models import get_model
+from Writer.StateManager import StateManager, serialize_for_json
+
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_SEQ_KEY = "journal_seq"
+
+
+def journal_path(filepath: Union[str, Path]) -> str:
+    """Path of the journal that belongs to a state file"""
+    return str(filepath) + JOURNAL_SUFFIX
+
+
+def has_journal(filepath: Union[str, Path]) -> bool:
+    """True if the state file has a journal that must be replayed on load"""
+    return os.path.exists(journal_path(filepath))
+
+
+def remove_journal(filepath: Union[str, Path]) -> None:
+    """Deletes a state file's journal (after a full JSON save made it stale)"""
+    try:
+        os.remove(journal_path(filepath))
+    except FileNotFoundError:
+        pass
+    with _journals_lock:
+        _journals.pop(os.path.abspath(filepath), None)
+
+
+class _PendingModel:
+    """A serialized Pydantic object that has not been rebuilt yet"""
+
+    __slots__ = ("encoded",)
+
+    def __init__(self, encoded: dict):
+        self.encoded = encoded
+
+    def build(self):
+        model_name = self.encoded[StateManager.MODEL_KEY]
+        model_data = self.encoded[StateManager.DATA_KEY]
+        try:
+            return get_model(model_name)(**model_data)
+        except Exception as e:
+            # Same fallback as StateManager.load_state: keep the data as a dict
+            import sys
+            print(f"Warning: Failed to reconstruct {model_name} as Pydantic: {e}", file=sys.stderr)
+            return model_data
+
+
+class LazyState(dict):
+    """
+    State dict whose Pydantic values are rebuilt on first access.
+
+    Values are materialized by item access, get(), pop(), items() and values().
+    __iter__ is overridden so that dict(state) and {**state} also go through
+    __getitem__ instead of copying the raw placeholders.
+    """
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, _PendingModel):
+            value = value.build()
+            super().__setitem__(key, value)
+        return value
+
+    def __iter__(self):
+        return super().__iter__()
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            super().pop(key)
+            return value
+        return super().pop(key, *default)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            super().__setitem__(key, default)
+        return self[key]
+
+    def items(self):
+        self._materialize()
+        return super().items()
+
+    def values(self):
+        self._materialize()
+        return super().values()
+
+    def copy(self):
+        self._materialize()
+        return LazyState(super().copy())
+
+    def _materialize(self):
+        for key, value in list(super().items()):
+            if isinstance(value, _PendingModel):
+                super().__setitem__(key, value.build())
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON-ready form of one top-level state value"""
+    if isinstance(value, _PendingModel):
+        return value.encoded
+    if StateManager._is_pydantic_model(value):
+        return {StateManager.MODEL_KEY: type(value).__name__, StateManager.DATA_KEY: serialize_for_json(value.model_dump())}
+    return serialize_for_json(value)
+
+
+def _is_encoded_model(value: Any) -> bool:
+    return isinstance(value, dict) and StateManager.MODEL_KEY in value and StateManager.DATA_KEY in value
+
+
+def _diff(path: list, old: Any, new: Any, ops: list) -> None:
+    """Appends the ops that turn old into new"""
+    if old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict) and not _is_encoded_model(old) and not _is_encoded_model(new):
+        for key in old:
+            if key not in new:
+                ops.append(["del", path + [key]])
+        for key, value in new.items():
+            if key in old:
+                _diff(path + [key], old[key], value, ops)
+            else:
+                ops.append(["set", path + [key], value])
+        return
+    if isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)) and len(new) > len(old) \
+            and list(new[:len(old)]) == list(old):
+        ops.append(["extend", path, list(new[len(old):])])
+        return
+    ops.append(["set", path, new])
+
+
+def _apply(tree: dict, op: list) -> None:
+    """Applies one journal op to a decoded state tree"""
+    kind, path = op[0], op[1]
+    parent = tree
+    for key in path[:-1]:
+        parent = parent.setdefault(key, {})
+    if kind == "set":
+        parent[path[-1]] = op[2]
+    elif kind == "del":
+        parent.pop(path[-1], None)
+    elif kind == "extend":
+        parent.setdefault(path[-1], []).extend(op[2])
+    else:
+        raise ValueError(f"Unknown state journal op '{kind}'")
+
+
+class StateJournal:
+    """Journaled save/load of one state file"""
+
+    def __init__(self, filepath: Union[str, Path], compact_every: int = 50):
+        self.filepath = str(filepath)
+        self.journal_filepath = journal_path(filepath)
+        self.compact_every = max(1, compact_every)
+        self._lock = threading.Lock()
+        self._saved = None  # Encoded top-level values as last written; None forces a full snapshot
+        self._seq = 0
+        self._records_since_compact = 0
+
+    def save(self, state_data: Dict[str, Any]) -> int:
+        """
+        Persists state_data and returns the number of bytes written.
+
+        Only changes since the previous save are appended; the first save of
+        this journal and every compact_every-th record write a full snapshot.
+        """
+        with self._lock:
+            encoded = {key: _encode_value(value) for key, value in dict.items(state_data)}
+            if self._saved is None or self._records_since_compact >= self.compact_every:
+                return self._compact(encoded)
+
+            ops = []
+            _diff([], self._saved, encoded, ops)
+            if not ops:
+                return 0
+            self._seq += 1
+            line = json.dumps({"seq": self._seq, "ops": ops}, ensure_ascii=False) + "\n"
+            with open(self.journal_filepath, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._saved = encoded
+            self._records_since_compact += 1
+            return len(line.encode("utf-8"))
+
+    def compact(self, state_data: Dict[str, Any]) -> int:
+        """Writes a full snapshot of state_data and empties the journal"""
+        with self._lock:
+            return self._compact({key: _encode_value(value) for key, value in dict.items(state_data)})
+
+    def _compact(self, encoded: Dict[str, Any]) -> int:
+        pydantic_objects = {key: value for key, value in encoded.items() if _is_encoded_model(value)}
+        other_data = {key: value for key, value in encoded.items() if key not in pydantic_objects}
+        snapshot = json.dumps({
+            StateManager.PYDANTIC_KEY: pydantic_objects,
+            StateManager.OTHER_KEY: other_data,
+            JOURNAL_SEQ_KEY: self._seq,
+        }, ensure_ascii=False)
+
+        Path(self.filepath).parent.mkdir(parents=True, exist_ok=True)
+        temp_filepath = self.filepath + ".tmp"
+        with open(temp_filepath, "w", encoding="utf-8") as f:
+            f.write(snapshot)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_filepath, self.filepath)
+        # A crash before this truncation is harmless: load skips records up to journal_seq
+        with open(self.journal_filepath, "w", encoding="utf-8"):
+            pass
+
+        self._saved = encoded
+        self._records_since_compact = 0
+        return len(snapshot.encode("utf-8"))
+
+    def load(self) -> LazyState:
+        """
+        Rebuilds the state from the snapshot and the journal.
+
+        Raises:
+            FileNotFoundError: If the state file doesn't exist
+            json.JSONDecodeError: If the snapshot contains invalid JSON
+        """
+        with self._lock:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            tree = dict(snapshot.get(StateManager.PYDANTIC_KEY, {}))
+            tree.update(snapshot.get(StateManager.OTHER_KEY, {}))
+            seq = snapshot.get(JOURNAL_SEQ_KEY, 0)
+
+            records = 0
+            if os.path.exists(self.journal_filepath):
+                valid_bytes = 0
+                with open(self.journal_filepath, "rb") as f:
+                    for raw_line in f:
+                        try:
+                            record = json.loads(raw_line)
+                        except ValueError:
+                            break  # Torn write from a crash; everything after it is discarded
+                        valid_bytes += len(raw_line)
+                        if record["seq"] <= seq:
+                            continue  # Already folded into the snapshot
+                        for op in record["ops"]:
+                            _apply(tree, op)
+                        seq = record["seq"]
+                        records += 1
+                # Drop the torn tail so the next append starts on a clean line
+                if valid_bytes != os.path.getsize(self.journal_filepath):
+                    with open(self.journal_filepath, "r+b") as f:
+                        f.truncate(valid_bytes)
+
+            # The caller mutates the returned containers in place, so the diff baseline gets its own copy
+            self._saved = copy.deepcopy(tree)
+            self._seq = seq
+            self._records_since_compact = records
+            return LazyState({
+                key: _PendingModel(value) if _is_encoded_model(value) else value
+                for key, value in tree.items()
+            })
+
+
+_journals = {}
+_journals_lock = threading.Lock()
+
+
+def get_state_journal(filepath: Union[str, Path], compact_every: int = None) -> StateJournal:  # type: ignore[assignment]
+    """Returns the shared StateJournal for a state file (one per path, so saves diff against the last one)"""
+    if compact_every is None:
+        import Writer.Config as Config
+        compact_every = getattr(Config, 'STATE_JOURNAL_COMPACT_EVERY', 50)
+    key = os.path.abspath(filepath)
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = StateJournal(filepath, compact_every)
+            _journals[key] = journal
+        return journal
+
+
+__all__ = ['StateJournal', 'LazyState', 'get_state_journal', 'journal_path', 'has_journal', 'remove_journal']
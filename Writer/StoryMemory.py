@@ -0,0 +1,120 @@
+"""
+StoryMemory - Rolling hierarchical memory of the chapters written so far
+
+StoryPipeline keeps the memory as a plain dict in current_state["story_memory"].
+Each finished chapter's continuity summary is added on the background summary
+thread; chapter N's context renders the memory through chapter N-2. Once
+more than STORY_MEMORY_ARC_SIZE chapter summaries are held, the oldest ones are
+rolled up into an arc summary; once more than STORY_MEMORY_ARC_SIZE arcs are held, the
+oldest arcs are folded into a single "story so far" summary. The memory
+therefore holds a bounded number of summaries however long the novel gets, and
+render() fits them into STORY_MEMORY_TOKEN_BUDGET tokens for the chapter context.
+
+Layout (JSON-serializable):
+    {"chapters": [{"number": 7, "summary": "..."}],
+     "arcs": [{"first": 1, "last": 4, "summary": "..."}],
+     "story_so_far": {"last": 0, "summary": ""}}
+"""
+import Writer.Config
+
+
+class StoryMemory:
+    """Chapter summaries rolled up into arc and story-so-far summaries"""
+
+    def __init__(self, data: dict = None):  # type: ignore[assignment]
+        self.data = data if isinstance(data, dict) else {}
+        self.data.setdefault("chapters", [])
+        self.data.setdefault("arcs", [])
+        self.data.setdefault("story_so_far", {"last": 0, "summary": ""})
+
+    def last_chapter(self) -> int:
+        """Number of the latest chapter in the memory (0 when empty)"""
+        Chapters, Arcs = self.data["chapters"], self.data["arcs"]
+        if Chapters:
+            return Chapters[-1]["number"]
+        if Arcs:
+            return Arcs[-1]["last"]
+        return self.data["story_so_far"]["last"]
+
+    def add_chapter(self, Interface, _Logger, ActivePrompts, _ChapterNum: int, _Summary: str) -> None:
+        """Adds a chapter summary and rolls up the oldest summaries when a level is full"""
+        ArcSize = max(2, getattr(Writer.Config, "STORY_MEMORY_ARC_SIZE", 4))
+        Chapters, Arcs = self.data["chapters"], self.data["arcs"]
+        Chapters.append({"number": _ChapterNum, "summary": _Summary})
+
+        if len(Chapters) > ArcSize:
+            Rolled = Chapters[:ArcSize]
+            _Logger.Log(f"Story memory: rolling Chapters {Rolled[0]['number']}-{Rolled[-1]['number']} into an arc summary", 5)
+            Arcs.append({
+                "first": Rolled[0]["number"],
+                "last": Rolled[-1]["number"],
+                "summary": _RollUp(Interface, _Logger, ActivePrompts, [Chapter["summary"] for Chapter in Rolled]),
+            })
+            del Chapters[:ArcSize]
+
+        if len(Arcs) > ArcSize:
+            Folded = Arcs[:-1]  # The newest arc stays detailed
+            Summaries = [Arc["summary"] for Arc in Folded]
+            if self.data["story_so_far"]["summary"]:
+                Summaries.insert(0, self.data["story_so_far"]["summary"])
+            _Logger.Log(f"Story memory: folding Chapters {Folded[0]['first']}-{Folded[-1]['last']} into the story so far", 5)
+            self.data["story_so_far"] = {
+                "last": Folded[-1]["last"],
+                "summary": _RollUp(Interface, _Logger, ActivePrompts, Summaries),
+            }
+            del Arcs[:-1]
+
+    def render(self, ActivePrompts, _TokenBudget: int, _CountTokens, _BeforeChapter: int = None) -> str:  # type: ignore[assignment]
+        """
+        Memory text for the chapter context, within _TokenBudget tokens (_CountTokens(text) -> int).
+
+        The newest chapter summary and the story so far are added first, then older
+        chapter summaries and arcs, newest first; the result reads in story order.
+        Only chapters before _BeforeChapter are included when it is given.
+        """
+        def Included(Number):
+            return _BeforeChapter is None or Number < _BeforeChapter
+
+        StorySoFar = self.data["story_so_far"]
+        Blocks = []  # (story position, priority, text)
+        if StorySoFar["summary"] and Included(StorySoFar["last"]):
+            Blocks.append((0, 1, ActivePrompts.STORY_MEMORY_STORY_SO_FAR_FORMAT.format(summary=StorySoFar["summary"])))
+        for Arc in self.data["arcs"]:
+            if Included(Arc["last"]):
+                Blocks.append((Arc["first"], 3, ActivePrompts.STORY_MEMORY_ARC_FORMAT.format(
+                    first_chapter=Arc["first"], last_chapter=Arc["last"], summary=Arc["summary"])))
+        Chapters = [Chapter for Chapter in self.data["chapters"] if Included(Chapter["number"])]
+        for Index, Chapter in enumerate(Chapters):
+            Blocks.append((Chapter["number"], 0 if Index == len(Chapters) - 1 else 2, ActivePrompts.STORY_MEMORY_CHAPTER_FORMAT.format(
+                chapter_num=Chapter["number"], summary=Chapter["summary"])))
+
+        Kept, Used = [], 0
+        for Position, _, Text in sorted(Blocks, key=lambda Block: (Block[1], -Block[0])):
+            Tokens = _CountTokens(Text)
+            if Used + Tokens <= _TokenBudget:
+                Kept.append((Position, Text))
+                Used += Tokens
+        return "\n\n".join(Text for _, Text in sorted(Kept, key=lambda Block: Block[0]))
+
+
+def _RollUp(Interface, _Logger, ActivePrompts, _Summaries: list) -> str:
+    """One summary of consecutive summaries; falls back to their truncated concatenation"""
+    TargetWords = getattr(Writer.Config, "STORY_MEMORY_SUMMARY_WORDS", 150)
+    Messages = [
+        Interface.BuildSystemQuery(ActivePrompts.STORY_MEMORY_ROLLUP_INTRO),
+        Interface.BuildUserQuery(ActivePrompts.STORY_MEMORY_ROLLUP_PROMPT.format(
+            _Summaries="\n\n".join(_Summaries), _Words=TargetWords
+        )),
+    ]
+    try:
+        _, Response, _ = Interface.SafeGenerateJSON(_Logger, Messages, Writer.Config.FAST_MODEL)
+        Summary = str(Response.get("summary", "") if isinstance(Response, dict) else "").strip()
+    except Exception as e:
+        _Logger.Log(f"Story memory: roll-up failed ({e}); keeping a truncated concatenation", 6)
+        Summary = ""
+    if not Summary:
+        Summary = " ".join(" ".join(_Summaries).split()[:TargetWords])
+    return Summary
+
+
+__all__ = ['StoryMemory']
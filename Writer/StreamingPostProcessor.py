@@ -0,0 +1,114 @@
+"""
+StreamingPostProcessor - Per-chapter edit -> scrub -> translate during chapter writing
+
+With STREAMING_POST_PROCESSING enabled, StoryPipeline hands every finished
+chapter to this processor instead of waiting for the whole book. Chapter i
+starts as soon as chapters i-1, i and i+1 exist, because EditChapter reads the
+original text of both neighbours. The chapter then runs through the enabled
+passes on a worker pool. When the chapter loop ends, only the last chapter or
+two are typically still in flight.
+
+Each pass keeps its input text when its call fails, as the batch passes do.
+_perform_post_processing_stage picks up the per-pass results and skips the
+matching batch passes.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from Writer.Parallel import resolve_workers
+
+STREAMED_PASSES = ("edited", "scrubbed", "translated")
+
+
+class StreamingPostProcessor:
+    """Schedules per-chapter post-processing as chapters and their neighbours are written"""
+
+    def __init__(self, Interface, _Logger, Config, NovelEditor, Scrubber, Translator, _Outline: str, _TotalChapters: int):
+        self.Interface = Interface
+        self.Logger = _Logger
+        self.NovelEditor = NovelEditor
+        self.Scrubber = Scrubber
+        self.Translator = Translator
+        self.Outline = _Outline
+        self.TotalChapters = _TotalChapters
+
+        self.NativeLanguage = Config.NATIVE_LANGUAGE
+        self.TargetLanguage = Config.TRANSLATE_LANGUAGE
+        self.Passes = []
+        if Config.ENABLE_FINAL_EDIT_PASS:
+            self.Passes.append("edited")
+        if not Config.SCRUB_NO_SCRUB:
+            self.Passes.append("scrubbed")
+        if self.TargetLanguage and self.TargetLanguage.lower() != self.NativeLanguage.lower():
+            self.Passes.append("translated")
+
+        self._lock = threading.Lock()
+        self._originals = {}
+        self._futures = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=resolve_workers(Config, "POST_PROCESSING_WORKERS"), thread_name_prefix="StreamingPost"
+        ) if self.Passes else None
+
+    def chapter_written(self, _ChapterNum: int, _Text: str) -> None:
+        """Records a finished chapter and starts every chapter whose neighbours now exist"""
+        if self._executor is None:
+            return
+        with self._lock:
+            self._originals[_ChapterNum] = _Text
+            for candidate in (_ChapterNum - 1, _ChapterNum, _ChapterNum + 1):
+                if self._is_ready(candidate):
+                    self.Logger.Log(f"Streaming post-processing: starting Chapter {candidate}/{self.TotalChapters}", 5)
+                    self._futures[candidate] = self._executor.submit(self._process, candidate)
+
+    def _is_ready(self, _ChapterNum: int) -> bool:
+        if not 1 <= _ChapterNum <= self.TotalChapters or _ChapterNum in self._futures:
+            return False
+        neighbours = range(max(1, _ChapterNum - 1), min(self.TotalChapters, _ChapterNum + 1) + 1)
+        return all(n in self._originals for n in neighbours)
+
+    def _process(self, _ChapterNum: int) -> dict:
+        i = _ChapterNum - 1
+        with self._lock:
+            text = self._originals[_ChapterNum]
+            # EditChapter indexes the full list but only reads the chapter and its neighbours
+            original_chapters = [self._originals.get(n, "") for n in range(1, self.TotalChapters + 1)]
+        outputs = {}
+        for pass_name in self.Passes:
+            try:
+                if pass_name == "edited":
+                    text = self.NovelEditor.EditChapter(self.Interface, self.Logger, original_chapters, self.Outline, self.TotalChapters, _ChapterNum)
+                elif pass_name == "scrubbed":
+                    text = self.Scrubber.ScrubChapter(self.Interface, self.Logger, text, i, self.TotalChapters)
+                else:
+                    text = self.Translator.TranslateChapter(self.Interface, self.Logger, text, i, self.TotalChapters, self.TargetLanguage, self.NativeLanguage)
+            except Exception as e:
+                self.Logger.Log(f"Streaming post-processing: Chapter {_ChapterNum} {pass_name} pass failed ({e}); keeping its input text", 7)
+            outputs[pass_name] = text
+        self.Logger.Log(f"Streaming post-processing: Chapter {_ChapterNum}/{self.TotalChapters} complete", 5)
+        return outputs
+
+    def results(self, _ChapterTexts: list):
+        """
+        Waits for every chapter and returns {pass name: [chapter texts]}.
+
+        Returns None when streaming did not cover exactly _ChapterTexts (e.g. a
+        chapter was rewritten or the run resumed), so the batch passes run instead.
+        """
+        if self._executor is None:
+            return None
+        with self._lock:
+            covered = len(_ChapterTexts) == self.TotalChapters and all(
+                self._originals.get(n) == text for n, text in enumerate(_ChapterTexts, start=1)
+            )
+            futures = dict(self._futures)
+        if not covered or len(futures) != self.TotalChapters:
+            self.close()
+            return None
+        per_chapter = [futures[n].result() for n in range(1, self.TotalChapters + 1)]
+        self.close()
+        return {pass_name: [outputs[pass_name] for outputs in per_chapter] for pass_name in self.Passes}
+
+    def close(self) -> None:
+        """Stops scheduling; chapters not yet started are cancelled"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -2,6 +2,7 @@ import Writer.Config
 # Writer.Prompts akan diimpor sebagai ActivePrompts di dalam fungsi
 import Writer.Statistics  # Add this import
 from Writer.Models import ChapterOutput
+from Writer.Parallel import map_ordered, resolve_workers
 
 
 def TranslatePrompt(Interface, _Logger, _Prompt: str, _SourceLanguage: str, TargetLang: str = "English"):  # Tambahkan TargetLang
@@ -30,36 +31,51 @@ def TranslatePrompt(Interface, _Logger, _Prompt: str, _SourceLanguage: str, Targ
 def TranslateNovel(
     Interface, _Logger, _Chapters: list, _TotalChapters: int, _TargetLanguage: str, _SourceLanguage: str = "English"  # Tambahkan _SourceLanguage
 ):
-    import Writer.Prompts as ActivePrompts  # Impor ulang untuk memastikan kita mendapatkan yang di-patch
-    translation_chapter_prompt_template = ActivePrompts.CHAPTER_TRANSLATE_PROMPT
-
     EditedChapters = _Chapters[:]  # Salin list
 
-    for i in range(_TotalChapters):
-
-        # Get original word count before translating
-        OriginalWordCount = Writer.Statistics.GetWordCount(EditedChapters[i])
-
-        PromptFormatted: str = translation_chapter_prompt_template.format(
-            _Chapter=EditedChapters[i], _Language=_TargetLanguage
-        )
-        _Logger.Log(
-            f"Prompting LLM To Perform Chapter {i+1}/{_TotalChapters} Translation from {_SourceLanguage} to {_TargetLanguage}", 5
-        )
-        Messages = []
-        Messages.append(Interface.BuildUserQuery(PromptFormatted))
-        Messages, Chapter_obj, _ = Interface.SafeGeneratePydantic(  # Use Pydantic model
-            _Logger, Messages, Writer.Config.TRANSLATOR_MODEL, ChapterOutput
-        )
-        _Logger.Log(f"Finished Chapter {i+1} Translation to {_TargetLanguage}", 5)
-
-        # Extract text from validated ChapterOutput model
-        NewChapter = Chapter_obj.text
+    # Chapters are translated independently, so they run concurrently
+    def translate(i):
+        try:
+            return TranslateChapter(Interface, _Logger, EditedChapters[i], i, _TotalChapters, _TargetLanguage, _SourceLanguage)
+        except Exception as e:
+            _Logger.Log(f"Chapter {i+1} translation failed ({e}); keeping the untranslated chapter", 7)
+            return EditedChapters[i]
+
+    Workers = resolve_workers(Writer.Config, "POST_PROCESSING_WORKERS")
+    for i, NewChapter in enumerate(map_ordered(translate, range(_TotalChapters), Workers, thread_name_prefix="TranslateNovel")):
         EditedChapters[i] = NewChapter
-        NewWordCount = Writer.Statistics.GetWordCount(NewChapter)
-        _Logger.Log(
-            f"Word Count Change (Translate): Chapter {i+1} {OriginalWordCount} -> {NewWordCount}",
-            3,
-        )
 
     return EditedChapters
+
+
+def TranslateChapter(Interface, _Logger, _Chapter: str, i: int, _TotalChapters: int, _TargetLanguage: str, _SourceLanguage: str):
+    """Translates one chapter; i is the 0-based chapter index"""
+    import Writer.Prompts as ActivePrompts  # Impor ulang untuk memastikan kita mendapatkan yang di-patch
+    translation_chapter_prompt_template = ActivePrompts.CHAPTER_TRANSLATE_PROMPT
+
+    # Get original word count before translating
+    OriginalWordCount = Writer.Statistics.GetWordCount(_Chapter)
+
+    PromptFormatted: str = translation_chapter_prompt_template.format(
+        _Chapter=_Chapter, _Language=_TargetLanguage
+    )
+    _Logger.Log(
+        f"Prompting LLM To Perform Chapter {i+1}/{_TotalChapters} Translation from {_SourceLanguage} to {_TargetLanguage}", 5
+    )
+    Messages = []
+    Messages.append(Interface.BuildUserQuery(PromptFormatted))
+    Messages, Chapter_obj, _ = Interface.SafeGeneratePydantic(  # Use Pydantic model
+        _Logger, Messages, Writer.Config.TRANSLATOR_MODEL, ChapterOutput,
+        _SeedOverride=Writer.Config.SEED + i + 1  # Per-chapter seed: same result whatever the scheduling
+    )
+    _Logger.Log(f"Finished Chapter {i+1} Translation to {_TargetLanguage}", 5)
+
+    # Extract text from validated ChapterOutput model
+    NewChapter = Chapter_obj.text
+    NewWordCount = Writer.Statistics.GetWordCount(NewChapter)
+    _Logger.Log(
+        f"Word Count Change (Translate): Chapter {i+1} {OriginalWordCount} -> {NewWordCount}",
+        3,
+    )
+
+    return NewChapter
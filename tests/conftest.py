@@ -92,6 +92,46 @@ def mock_logger():
     return _create_mock_logger
 
 
+@pytest.fixture
+def story_pipeline(monkeypatch):
+    """Factory for creating a StoryPipeline without running __init__
+
+    The pipeline reads the real Writer.Config. Background chapter-stage features
+    are switched off; keyword arguments set Writer.Config values for the test.
+    """
+    def _create_story_pipeline(chapter_generator=None, **config):
+        from unittest.mock import MagicMock
+        import Writer.Config
+        from Writer.Pipeline import StoryPipeline
+
+        settings = {
+            "CHAPTER_PREFETCH_DEPTH": 0,
+            "EXPAND_OUTLINE": False,
+            "SCENE_GENERATION_PIPELINE": True,
+            "PRECOMPUTE_CHAPTER_SUMMARIES": False,
+            "BACKGROUND_CHAPTER_TITLES": False,
+            "USE_HIERARCHICAL_MEMORY": False,
+            "CHAPTER_BLOB_STORE": False,
+            "STREAMING_POST_PROCESSING": False,
+        }
+        settings.update(config)
+        for name, value in settings.items():
+            monkeypatch.setattr(Writer.Config, name, value)
+
+        pipeline = StoryPipeline.__new__(StoryPipeline)
+        pipeline.Interface = MagicMock(name='mock_interface')
+        pipeline.SysLogger = MagicMock(name='mock_logger')
+        pipeline.Config = Writer.Config
+        pipeline.ActivePrompts = MagicMock(name='mock_prompts')
+        pipeline.Statistics = MagicMock(name='mock_statistics')
+        pipeline.Statistics.GetWordCount.return_value = 10
+        pipeline.ChapterGenerator = chapter_generator if chapter_generator is not None else MagicMock(name='mock_chapter_generator')
+        pipeline.lorebook = None
+        pipeline._save_state_wrapper = MagicMock()
+        return pipeline
+    return _create_story_pipeline
+
+
 @pytest.fixture
 def indonesian_language_config():
     """Set up Indonesian language configuration for tests"""
@@ -0,0 +1,140 @@
+"""
+Tests for the journaled state backend - London School Approach
+Saves append only the changed keys; loads replay the journal over the last snapshot.
+"""
+import json
+import os
+
+import pytest
+
+from Writer.Models import TitleOutput
+from Writer.StateJournal import LazyState, StateJournal, journal_path
+from Writer.StateManager import StateManager
+
+
+def _journal_lines(state_file):
+    with open(journal_path(state_file), encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    return str(tmp_path / "run.state.json")
+
+
+class TestStateJournalSave:
+    """Only changes since the previous save reach the disk"""
+
+    def test_first_save_writes_snapshot_readable_by_state_manager(self, state_file):
+        StateJournal(state_file).save({"status": "in_progress", "title": TitleOutput(title="Gua Harta")})
+
+        loaded = StateManager.load_state(state_file)
+        assert loaded["status"] == "in_progress"
+        assert loaded["title"] == TitleOutput(title="Gua Harta")
+        assert _journal_lines(state_file) == []
+
+    def test_new_chapter_is_appended_as_extend(self, state_file):
+        journal = StateJournal(state_file)
+        state = {"completed_chapters_data": [{"number": 1, "text": "long chapter " * 500}], "next_chapter_index": 2}
+        journal.save(state)
+
+        state["completed_chapters_data"].append({"number": 2, "text": "second"})
+        state["next_chapter_index"] = 3
+        written = journal.save(state)
+
+        assert written < 200
+        assert _journal_lines(state_file) == [{"seq": 1, "ops": [
+            ["extend", ["completed_chapters_data"], [{"number": 2, "text": "second"}]],
+            ["set", ["next_chapter_index"], 3],
+        ]}]
+
+    def test_unchanged_state_writes_nothing(self, state_file):
+        journal = StateJournal(state_file)
+        journal.save({"status": "in_progress"})
+        assert journal.save({"status": "in_progress"}) == 0
+
+    def test_compaction_folds_journal_into_snapshot(self, state_file):
+        journal = StateJournal(state_file, compact_every=2)
+        for index in range(4):
+            journal.save({"next_chapter_index": index})
+
+        # Saves 1 and 2 were journaled; save 3 compacted them into the snapshot
+        assert _journal_lines(state_file) == []
+        assert StateManager.load_state(state_file)["next_chapter_index"] == 3
+        journal.save({"next_chapter_index": 4})
+        assert _journal_lines(state_file) == [{"seq": 3, "ops": [["set", ["next_chapter_index"], 4]]}]
+
+
+class TestStateJournalLoad:
+    """Snapshot + journal replay, tolerating crashes"""
+
+    def test_round_trip_with_nested_changes(self, state_file):
+        journal = StateJournal(state_file)
+        state = {"chapter_checkpoints": {"1": {"stage1": "draft"}}, "config": {"SEED": 1}}
+        journal.save(state)
+        state["chapter_checkpoints"]["1"]["stage2"] = "developed"
+        del state["config"]
+        journal.save(state)
+
+        assert StateJournal(state_file).load() == {"chapter_checkpoints": {"1": {"stage1": "draft", "stage2": "developed"}}}
+
+    def test_pydantic_objects_are_rebuilt_on_first_access(self, state_file):
+        StateJournal(state_file).save({"title": TitleOutput(title="Gua Harta")})
+
+        loaded = StateJournal(state_file).load()
+        assert isinstance(loaded, LazyState)
+        assert not isinstance(dict.__getitem__(loaded, "title"), TitleOutput)
+        assert loaded["title"] == TitleOutput(title="Gua Harta")
+        assert dict(loaded)["title"] == TitleOutput(title="Gua Harta")
+
+    def test_torn_last_record_is_dropped(self, state_file):
+        journal = StateJournal(state_file)
+        journal.save({"next_chapter_index": 1})
+        journal.save({"next_chapter_index": 2})
+        with open(journal_path(state_file), "a", encoding="utf-8") as f:
+            f.write('{"seq": 2, "ops": [["set", ["next_chap')
+
+        resumed = StateJournal(state_file)
+        assert resumed.load() == {"next_chapter_index": 2}
+        resumed.save({"next_chapter_index": 3})
+        assert StateJournal(state_file).load() == {"next_chapter_index": 3}
+
+    def test_records_already_in_snapshot_are_not_replayed(self, state_file):
+        journal = StateJournal(state_file, compact_every=1)
+        journal.save({"items": [1]})
+        journal.save({"items": [1, 2]})
+        with open(journal_path(state_file), encoding="utf-8") as f:
+            stale_journal = f.read()
+        journal.save({"items": [1, 2, 3]})  # Compacts; simulate a crash before the journal was emptied
+        with open(journal_path(state_file), "w", encoding="utf-8") as f:
+            f.write(stale_journal)
+
+        assert StateJournal(state_file).load() == {"items": [1, 2, 3]}
+
+    def test_loaded_containers_are_diffed_after_in_place_changes(self, state_file):
+        StateJournal(state_file).save({"completed_chapters_data": []})
+        resumed = StateJournal(state_file)
+        state = resumed.load()
+        state["completed_chapters_data"].append({"number": 1})
+        resumed.save(state)
+
+        assert StateJournal(state_file).load() == {"completed_chapters_data": [{"number": 1}]}
+
+
+class TestWriteStateBackend:
+    """Write.save_state/load_state follow STATE_BACKEND"""
+
+    def test_journal_backend_round_trip_and_json_save_removes_journal(self, state_file, monkeypatch):
+        import Writer.Config
+        from Write import load_state, save_state
+
+        monkeypatch.setattr(Writer.Config, "STATE_BACKEND", "journal")
+        save_state({"status": "in_progress", "next_chapter_index": 1}, state_file)
+        save_state({"status": "in_progress", "next_chapter_index": 2}, state_file)
+        assert os.path.exists(journal_path(state_file))
+        assert load_state(state_file)["next_chapter_index"] == 2
+
+        monkeypatch.setattr(Writer.Config, "STATE_BACKEND", "json")
+        save_state({"status": "completed"}, state_file)
+        assert not os.path.exists(journal_path(state_file))
+        assert load_state(state_file) == {"status": "completed"}
@@ -109,3 +109,21 @@ def test_load_unexpected_error_during_specific_language_import_fallback(mocker:
     assert hasattr(result, '__name__')
     assert any("CRITICAL: Unexpected error loading prompt module for NATIVE_LANGUAGE 'errorlang'" in entry for entry in mock_log_entries if entry.startswith("ERROR:"))
     mock_import_module.assert_called_once_with("Writer.Prompts_errorlang")
+
+
+def test_all_models_keeps_embedding_model_for_real_providers(monkeypatch):
+    """-AllModels replaces chat models but not EMBEDDING_MODEL unless the provider is offline"""
+    import Writer.Config
+    from Write import apply_all_models
+
+    for model_var in [k for k in dir(Writer.Config) if k.endswith("_MODEL")]:
+        monkeypatch.setattr(Writer.Config, model_var, getattr(Writer.Config, model_var))  # Restored after the test
+    monkeypatch.setattr(Writer.Config, "FAST_MODEL", "ollama://fast")
+    monkeypatch.setattr(Writer.Config, "EMBEDDING_MODEL", "ollama://embed")
+
+    apply_all_models("openrouter://some/chat-model")
+    assert Writer.Config.FAST_MODEL == "openrouter://some/chat-model"
+    assert Writer.Config.EMBEDDING_MODEL == "ollama://embed"
+
+    apply_all_models("mock://bench")
+    assert Writer.Config.EMBEDDING_MODEL == "mock://bench"
@@ -0,0 +1,145 @@
+"""
+Tests for chapter sub-step checkpoints - London School Approach
+A crash mid-chapter resumes from the last finished scene, stage or revision.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from Writer.Chapter.ChapterCheckpoint import ChapterCheckpoint
+from Writer.Models import SceneOutline
+
+
+def _scene(num):
+    return SceneOutline(scene_number=num, setting=f"Setting {num}", characters_present=["Rian"],
+                        action=f"Action number {num} happens here", purpose="Purpose", estimated_word_count=150)
+
+
+class TestChapterCheckpoint:
+    """ChapterCheckpoint.run memoizes producers and saves after each step"""
+
+    def test_run_records_and_saves_once(self):
+        save = MagicMock()
+        checkpoint = ChapterCheckpoint(save=save)
+        producer = MagicMock(return_value="value")
+
+        assert checkpoint.run("step", producer) == "value"
+        assert checkpoint.run("step", producer) == "value"
+        producer.assert_called_once()
+        save.assert_called_once()
+        assert checkpoint.data == {"step": "value"}
+
+    def test_recorded_value_is_reused(self, mock_logger):
+        logger = mock_logger()
+        checkpoint = ChapterCheckpoint({"step": "old"})
+        producer = MagicMock()
+
+        assert checkpoint.run("step", producer, logger) == "old"
+        producer.assert_not_called()
+        logger.Log.assert_called_once()
+
+
+class TestFinishChapterResume:
+    """FinishChapter skips checkpointed stages and resumes the revision loop"""
+
+    def _draft(self):
+        return {
+            "chapter_num": 1, "total_chapters": 1, "message_history": [], "context_history_insert": "",
+            "chapter_outline": "outline 1", "last_chapter_summary": "", "outline_for_check": "outline 1",
+            "previous_chapter_pending": False, "stage1": "draft text",
+        }
+
+    def test_checkpointed_stage2_is_not_regenerated(self, mock_logger):
+        import Writer.Chapter.ChapterGenerator as ChapterGenerator
+
+        checkpoint = ChapterCheckpoint({"stage2": "saved stage 2"})
+        with patch.object(ChapterGenerator, '_generate_stage2_character_dev') as stage2, \
+                patch.object(ChapterGenerator, '_generate_stage3_dialogue', return_value="stage 3") as stage3, \
+                patch('Writer.Config.CHAPTER_NO_REVISIONS', True):
+            result = ChapterGenerator.FinishChapter(MagicMock(), mock_logger(), self._draft(), "outline", [], _Checkpoint=checkpoint)
+
+        assert result == "stage 3"
+        stage2.assert_not_called()
+        assert stage3.call_args.args[9] == "saved stage 2"
+        assert checkpoint.get("stage3") == "stage 3"
+
+    def test_revision_loop_resumes_after_last_checkpointed_iteration(self, mock_logger):
+        import Writer.Chapter.ChapterGenerator as ChapterGenerator
+
+        config = SimpleNamespace(CHAPTER_MIN_REVISIONS=1, CHAPTER_MAX_REVISIONS=3)
+        editor = MagicMock()
+        editor.GetFeedbackOnChapter.return_value = "feedback"
+        editor.GetChapterRating.return_value = False
+        revise = MagicMock(side_effect=lambda *args, **kwargs: (f"revision {kwargs['_Iteration']}", ["history"]))
+        checkpoint = ChapterCheckpoint({"revision": {"iteration": 2, "text": "revision 2", "history": []}})
+
+        result = ChapterGenerator._run_final_chapter_revision_loop(
+            MagicMock(), mock_logger(), MagicMock(), 1, 1, "stage 3", "outline", [], config, editor, revise, checkpoint
+        )
+
+        assert result == "revision 3"
+        revise.assert_called_once()
+        assert editor.GetFeedbackOnChapter.call_args_list[0].args[2] == "revision 2"
+        assert checkpoint.get("revision") == {"iteration": 3, "text": "revision 3", "history": ["history"]}
+
+
+class TestChapterBySceneResume:
+    """ChapterByScene reuses checkpointed scene outlines and scenes"""
+
+    def test_finished_scenes_and_outlines_are_reused(self, mock_interface, mock_logger):
+        from Writer.Scene.ChapterByScene import ChapterByScene
+
+        checkpoint = ChapterCheckpoint({
+            "scene_outlines": [_scene(1).model_dump(), _scene(2).model_dump()],
+            "scene_1": "Saved scene one",
+        })
+        with patch('Writer.Scene.ChapterByScene.Writer.Scene.ChapterOutlineToScenes.ChapterOutlineToScenes') as to_scenes, \
+                patch('Writer.Scene.ChapterByScene.Writer.Scene.SceneOutlineToScene.SceneOutlineToScene', return_value="New scene two") as write:
+            result = ChapterByScene(mock_interface(), mock_logger(), 1, 1, "chapter outline", "story outline", _Checkpoint=checkpoint)
+
+        to_scenes.assert_not_called()
+        write.assert_called_once()
+        assert write.call_args.args[2] == 2
+        assert "Saved scene one" in result and "New scene two" in result
+        assert checkpoint.get("scene_2") == "New scene two"
+
+    def test_generated_scene_outlines_are_checkpointed(self, mock_interface, mock_logger):
+        from Writer.Scene.ChapterByScene import ChapterByScene
+
+        checkpoint = ChapterCheckpoint()
+        with patch('Writer.Scene.ChapterByScene.Writer.Scene.ChapterOutlineToScenes.ChapterOutlineToScenes', return_value=[_scene(1)]), \
+                patch('Writer.Scene.ChapterByScene.Writer.Scene.SceneOutlineToScene.SceneOutlineToScene', return_value="Scene"):
+            ChapterByScene(mock_interface(), mock_logger(), 1, 1, "chapter outline", "story outline", _Checkpoint=checkpoint)
+
+        assert checkpoint.get("scene_outlines") == [_scene(1).model_dump()]
+        assert checkpoint.get("scene_1") == "Scene"
+
+
+class TestPipelineChapterCheckpoints:
+    """StoryPipeline keeps sub-steps in state until the chapter completes"""
+
+    def _run(self, pipeline, state):
+        with patch('Writer.Pipeline._get_current_context_for_chapter_gen_pipeline_version', return_value="context"), \
+                patch('Writer.Pipeline._get_outline_for_chapter_pipeline_version', return_value="outline"), \
+                patch('Writer.Pipeline._handle_chapter_title_generation_pipeline_version', return_value="Title"):
+            return pipeline._write_chapters_stage(state, "state.json", 1, "base")
+
+    def test_crash_keeps_sub_steps_and_resume_reuses_them(self, story_pipeline):
+        generator = MagicMock()
+
+        def crash(*args, **kwargs):
+            kwargs["_Checkpoint"].put("stage1", "draft")
+            raise RuntimeError("crash")
+
+        generator.GenerateChapter.side_effect = crash
+        state = {"completed_chapters_data": [], "next_chapter_index": 1}
+        try:
+            self._run(story_pipeline(generator), state)
+        except RuntimeError:
+            pass
+        assert state["chapter_checkpoints"] == {"1": {"stage1": "draft"}}
+
+        generator.GenerateChapter.side_effect = lambda *args, **kwargs: f"finished {kwargs['_Checkpoint'].get('stage1')}"
+        chapters = self._run(story_pipeline(generator), state)
+
+        assert chapters[0]["text"] == "finished draft"
+        assert state["chapter_checkpoints"] == {}
@@ -9,9 +9,19 @@ from unittest.mock import Mock
 import sys
 import os
 
+import pytest
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
 
+@pytest.fixture(autouse=True)
+def sequential_uncached_summaries(monkeypatch):
+    """Fresh summary cache per test; scripted responses need the work summary requested first"""
+    import Writer.Chapter.SummaryCache as SummaryCache
+    monkeypatch.setattr(SummaryCache, "_summary_cache", SummaryCache.SummaryCache())
+    monkeypatch.setattr("Writer.Config.SUMMARY_CHECK_WORKERS", 1)
+
+
 class TestLLMSummaryCheckLengthValidation:
     """Test length validation early return for < 100 words"""
 
@@ -666,6 +676,6 @@ class TestLLMSummaryCheckIntegration:
         assert any("Generating summary" in msg and "work" in msg.lower() for msg in log_messages)
         assert any("Finished generating summary" in msg and "work" in msg.lower() for msg in log_messages)
         assert any("Generating summary" in msg and "outline" in msg.lower() for msg in log_messages)
-        assert any("Finished generating and cached" in msg and "outline" in msg.lower() for msg in log_messages)
+        assert any("Finished generating summary" in msg and "outline" in msg.lower() for msg in log_messages)
         assert any("Comparing" in msg or "comparison" in msg.lower() for msg in log_messages)
         assert any("Finished comparing" in msg for msg in log_messages)
@@ -0,0 +1,153 @@
+"""
+Tests for chapter draft prefetching - London School Approach
+Later chapters run their outline-driven stages early; continuity stages wait.
+"""
+import threading
+from unittest.mock import MagicMock, patch
+
+
+def _context_for(_logger, _config, _stats, _prompts, state, chapter_num, _base, lorebook=None):
+    written = len(state.get("completed_chapters_data", []))
+    return f"context {chapter_num} after {written}"
+
+
+class TestChapterPrefetchScheduler:
+    """StoryPipeline._write_chapters_stage with CHAPTER_PREFETCH_DEPTH"""
+
+    def _run(self, pipeline, total_chapters):
+        state = {"completed_chapters_data": [], "next_chapter_index": 1}
+        with patch('Writer.Pipeline._get_current_context_for_chapter_gen_pipeline_version', side_effect=_context_for), \
+                patch('Writer.Pipeline._get_outline_for_chapter_pipeline_version', return_value="outline"), \
+                patch('Writer.Pipeline._handle_chapter_title_generation_pipeline_version', side_effect=lambda *a: f"Title {a[5]}"):
+            return pipeline._write_chapters_stage(state, "state.json", total_chapters, "base")
+
+    def test_depth_zero_generates_sequentially(self, story_pipeline):
+        generator = MagicMock()
+        generator.GenerateChapter.side_effect = lambda *args, **kwargs: f"text {args[2]}"
+        chapters = self._run(story_pipeline(generator), 3)
+
+        assert [c["text"] for c in chapters] == ["text 1", "text 2", "text 3"]
+        generator.DraftChapter.assert_not_called()
+        generator.FinishChapter.assert_not_called()
+
+    def test_later_chapters_are_drafted_without_previous_text(self, story_pipeline):
+        generator = MagicMock()
+        generator.GenerateChapter.side_effect = lambda *args, **kwargs: f"text {args[2]}"
+        generator.DraftChapter.side_effect = lambda *args, **kwargs: {"chapter_num": args[2], "outline": args[4], "pending": args[9]}
+        generator.FinishChapter.side_effect = lambda _iface, _log, draft, outline, chapters, _base, **kwargs: (
+            f"text {draft['chapter_num']} with {len(chapters)} before")
+        chapters = self._run(story_pipeline(generator, CHAPTER_PREFETCH_DEPTH=1), 3)
+
+        assert [c["text"] for c in chapters] == ["text 1", "text 2 with 1 before", "text 3 with 2 before"]
+        drafted = {call.args[2]: call.args for call in generator.DraftChapter.call_args_list}
+        assert set(drafted) == {2, 3}
+        # Chapter 2 was drafted while chapter 1 was still being written
+        assert drafted[2][4] == "context 2 after 0"
+        assert all(args[9] is True for args in drafted.values())
+        # Finishing uses the full context including the previous chapter
+        finish_outlines = [call.args[3] for call in generator.FinishChapter.call_args_list]
+        assert finish_outlines == ["context 2 after 1", "context 3 after 2"]
+
+    def test_draft_runs_while_current_chapter_is_written(self, story_pipeline):
+        draft_started = threading.Event()
+        generator = MagicMock()
+
+        def generate(*args, **kwargs):
+            # Chapter 1 only finishes once chapter 2's draft has started in the background
+            assert draft_started.wait(timeout=5)
+            return "text 1"
+
+        def draft(*args, **kwargs):
+            draft_started.set()
+            return {"chapter_num": args[2]}
+
+        generator.GenerateChapter.side_effect = generate
+        generator.DraftChapter.side_effect = draft
+        generator.FinishChapter.return_value = "text 2"
+        chapters = self._run(story_pipeline(generator, CHAPTER_PREFETCH_DEPTH=2), 2)
+
+        assert [c["text"] for c in chapters] == ["text 1", "text 2"]
+
+    def test_failed_draft_falls_back_to_sequential_generation(self, story_pipeline):
+        generator = MagicMock()
+        generator.GenerateChapter.side_effect = lambda *args, **kwargs: f"text {args[2]}"
+        generator.DraftChapter.side_effect = RuntimeError("model down")
+        chapters = self._run(story_pipeline(generator, CHAPTER_PREFETCH_DEPTH=1), 2)
+
+        assert [c["text"] for c in chapters] == ["text 1", "text 2"]
+        generator.FinishChapter.assert_not_called()
+
+
+class TestFinishChapterContinuity:
+    """FinishChapter adds the previous chapter summary to a prefetched draft"""
+
+    def test_pending_draft_gets_previous_chapter_summary(self, mock_logger):
+        import Writer.Chapter.ChapterGenerator as ChapterGenerator
+
+        draft = {
+            "chapter_num": 2, "total_chapters": 2, "message_history": [], "context_history_insert": "",
+            "chapter_outline": "outline 2", "last_chapter_summary": "", "outline_for_check": "outline 2",
+            "previous_chapter_pending": True, "stage1": "draft text",
+        }
+        with patch.object(ChapterGenerator, '_summarize_last_chapter', return_value="chapter 1 summary") as summarize, \
+                patch.object(ChapterGenerator, '_generate_stage2_character_dev', return_value="stage 2") as stage2, \
+                patch.object(ChapterGenerator, '_generate_stage3_dialogue', return_value="stage 3"), \
+                patch('Writer.Config.CHAPTER_NO_REVISIONS', True):
+            result = ChapterGenerator.FinishChapter(MagicMock(), mock_logger(), draft, "full context", [{"text": "chapter 1"}])
+
+        assert result == "stage 3"
+        summarize.assert_called_once()
+        stage2_args = stage2.call_args.args
+        assert stage2_args[8] == "chapter 1 summary"
+        assert stage2_args[9] == "draft text"
+        assert "chapter 1 summary" in stage2_args[11]
+
+
+class TestPrecomputedChapterSummaries:
+    """PRECOMPUTE_CHAPTER_SUMMARIES summarizes each finished chapter in the background"""
+
+    def _run(self, pipeline, total_chapters):
+        state = {"completed_chapters_data": [], "next_chapter_index": 1}
+        with patch('Writer.Pipeline._get_current_context_for_chapter_gen_pipeline_version', side_effect=_context_for), \
+                patch('Writer.Pipeline._get_outline_for_chapter_pipeline_version', return_value="outline"), \
+                patch('Writer.Pipeline._handle_chapter_title_generation_pipeline_version', side_effect=lambda *a: f"Title {a[5]}"):
+            return pipeline._write_chapters_stage(state, "state.json", total_chapters, "base")
+
+    def test_next_chapter_receives_summary_of_previous(self, story_pipeline):
+        seen_summaries = []
+        generator = MagicMock()
+
+        def generate(*args, **kwargs):
+            seen_summaries.append([chapter.get("summary") for chapter in args[5]])
+            return f"text {args[2]}"
+
+        generator.GenerateChapter.side_effect = generate
+        generator.SummarizeChapter.side_effect = lambda _iface, _log, outline, text, num, total: f"summary of {text}"
+        pipeline = story_pipeline(generator, PRECOMPUTE_CHAPTER_SUMMARIES=True)
+        chapters = self._run(pipeline, 3)
+
+        assert seen_summaries == [[], ["summary of text 1"], ["summary of text 1", "summary of text 2"]]
+        assert [c["summary"] for c in chapters] == ["summary of text 1", "summary of text 2", "summary of text 3"]
+        summarized = [call.args[2:5] for call in generator.SummarizeChapter.call_args_list]
+        assert summarized[0] == ("context 1 after 0", "text 1", 1)
+
+    def test_failed_summary_leaves_chapter_without_one(self, story_pipeline):
+        generator = MagicMock()
+        generator.GenerateChapter.side_effect = lambda *args, **kwargs: f"text {args[2]}"
+        generator.SummarizeChapter.side_effect = RuntimeError("model down")
+        pipeline = story_pipeline(generator, PRECOMPUTE_CHAPTER_SUMMARIES=True)
+        chapters = self._run(pipeline, 2)
+
+        assert [c["text"] for c in chapters] == ["text 1", "text 2"]
+        assert all("summary" not in c for c in chapters)
+
+    def test_stored_summary_skips_the_summary_call(self, mock_interface, mock_logger):
+        import Writer.Chapter.ChapterGenerator as ChapterGenerator
+
+        interface = mock_interface()
+        summary = ChapterGenerator._summarize_last_chapter(
+            interface, mock_logger(), MagicMock(), "context", [{"text": "chapter 1", "summary": "stored"}], 2, 3, MagicMock()
+        )
+
+        assert summary == "stored"
+        interface.SafeGenerateJSON.assert_not_called()
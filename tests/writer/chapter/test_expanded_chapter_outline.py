@@ -0,0 +1,70 @@
+"""
+Tests for rendering ThisChapterOutline from the expanded outline - London School Approach
+Stage 0 skips the extraction call when the expansion stage already wrote the chapter outline.
+"""
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from Writer.Chapter.ChapterGenerator import _prepare_initial_generation_context, _render_expanded_chapter_outline
+
+
+def _prompts():
+    prompts = Mock()
+    prompts.CHAPTER_GENERATION_INTRO = "Intro"
+    prompts.CHAPTER_GENERATION_PROMPT = "Prompt {_Outline} {_ChapterNum}"
+    prompts.CHAPTER_HISTORY_INSERT = "History insert {_Outline}"
+    return prompts
+
+
+class TestRenderExpandedChapterOutline:
+    """Deterministic rendering of stored per-chapter outlines"""
+
+    def test_stored_text_and_title(self):
+        rendered = _render_expanded_chapter_outline({"text": "Rian memasuki gua.", "title": "Gua Gelap"}, 3)
+
+        assert rendered == "Chapter 3: Gua Gelap\n\nRian memasuki gua."
+
+    def test_structured_scenes_when_there_is_no_text(self):
+        expanded = {
+            "chapter_title": "Gua Gelap",
+            "outline_summary": "Ringkasan bab",
+            "scenes": ["Rian tiba di mulut gua.", {"title": "Di dalam", "key_events": "Obor padam"}],
+        }
+
+        rendered = _render_expanded_chapter_outline(expanded, 2)
+
+        assert rendered == "Chapter 2: Gua Gelap\n\nRian tiba di mulut gua.\n\nScene: Di dalam\nKey Events: Obor padam"
+
+    def test_nothing_to_render(self):
+        assert _render_expanded_chapter_outline(None, 1) == ""
+        assert _render_expanded_chapter_outline({"title": "Only a title"}, 1) == ""
+
+
+class TestStageZeroFastPath:
+    """_prepare_initial_generation_context with an expanded chapter outline"""
+
+    def test_expanded_outline_skips_extraction_call(self, mock_interface, mock_logger):
+        interface = mock_interface()
+        config = SimpleNamespace(CHAPTER_STAGE1_WRITER_MODEL="model", MIN_WORDS_PER_CHAPTER_OUTLINE=3)
+
+        _, _, outline, _, outline_for_check = _prepare_initial_generation_context(
+            interface, mock_logger(), _prompts(), "full context", [], 1, 2, config,
+            _ExpandedChapterOutline={"text": "Rian memasuki gua yang gelap.", "title": "Gua"}
+        )
+
+        assert outline == "Chapter 1: Gua\n\nRian memasuki gua yang gelap."
+        assert outline_for_check == outline
+        interface.SafeGeneratePydantic.assert_not_called()
+
+    def test_short_expanded_outline_falls_back_to_extraction(self, mock_interface, mock_logger):
+        interface = mock_interface()
+        interface.SafeGeneratePydantic.return_value = ([], Mock(text="extracted outline"), {})
+        config = SimpleNamespace(CHAPTER_STAGE1_WRITER_MODEL="model", MIN_WORDS_PER_CHAPTER_OUTLINE=100)
+
+        _, _, outline, _, _ = _prepare_initial_generation_context(
+            interface, mock_logger(), _prompts(), "full context", [], 1, 2, config,
+            _ExpandedChapterOutline={"text": "Terlalu pendek.", "title": "Gua"}
+        )
+
+        assert outline == "extracted outline"
+        interface.SafeGeneratePydantic.assert_called_once()
@@ -0,0 +1,60 @@
+"""
+Tests for the persistent summary cache - London School Approach
+Summaries are keyed by a stable digest and survive a resume.
+"""
+from unittest.mock import Mock
+
+import pytest
+
+import Writer.Chapter.SummaryCache as SummaryCacheModule
+from Writer.Chapter.SummaryCache import SummaryCache, use_summary_cache_file
+
+
+@pytest.fixture(autouse=True)
+def isolated_summary_cache(monkeypatch):
+    monkeypatch.setattr(SummaryCacheModule, "_summary_cache", SummaryCache())
+
+
+class TestSummaryCache:
+    """Digest keys and the JSON file next to the run state"""
+
+    def test_key_depends_on_model_and_prompts_only(self):
+        key = SummaryCache.make_key("ollama://a", "intro", "prompt")
+
+        assert key == SummaryCache.make_key("ollama://a", "intro", "prompt")
+        assert key != SummaryCache.make_key("ollama://b", "intro", "prompt")
+        assert key != SummaryCache.make_key("ollama://a", "intro", "other prompt")
+
+    def test_entries_survive_reopening_the_file(self, tmp_path):
+        filepath = str(tmp_path / "summary_cache.json")
+        SummaryCache(filepath).put("k", "a summary")
+
+        assert SummaryCache(filepath).get("k") == "a summary"
+
+
+class TestLLMSummaryCheckWithCache:
+    """A resumed check of the same text only makes the comparison call"""
+
+    def test_resumed_check_reuses_both_summaries(self, tmp_path, mock_interface, mock_logger):
+        from Writer.Chapter.ChapterGenSummaryCheck import LLMSummaryCheck
+
+        comparison = Mock(Suggestions="", DidFollowOutline=True)
+        work_text = ' '.join(['kata'] * 150)
+
+        first = mock_interface()
+        first.SafeGenerateJSON.return_value = ([], {"summary": "ringkasan"}, {})
+        first.SafeGeneratePydantic.return_value = ([], comparison, {})
+        use_summary_cache_file(str(tmp_path / "summary_cache.json"))
+        LLMSummaryCheck(first, mock_logger(), "outline bab", work_text)
+        assert first.SafeGenerateJSON.call_count == 2
+
+        # New process: the shared cache is rebuilt from the file
+        SummaryCacheModule._summary_cache = SummaryCache()
+        use_summary_cache_file(str(tmp_path / "summary_cache.json"))
+        resumed = mock_interface()
+        resumed.SafeGeneratePydantic.return_value = ([], comparison, {})
+        result, _ = LLMSummaryCheck(resumed, mock_logger(), "outline bab", work_text)
+
+        assert result is True
+        resumed.SafeGenerateJSON.assert_not_called()
+        assert resumed.SafeGeneratePydantic.call_count == 1
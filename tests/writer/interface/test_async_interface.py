@@ -0,0 +1,82 @@
+"""
+Tests for AsyncInterface and the per-provider/per-host request slots - London School Approach
+"""
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import Writer.Config
+
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+def _make_slow_chat(tracker):
+    """Fake _ollama_chat that records the peak number of concurrent calls"""
+    def _slow_chat(_Logger, _Model_key, ProviderModel_name, _Messages_list, ModelOptions_dict, Seed_int, _FormatSchema_dict):
+        with tracker["lock"]:
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+        time.sleep(0.05)
+        with tracker["lock"]:
+            tracker["active"] -= 1
+        return _Messages_list + [{"role": "assistant", "content": f"seed {Seed_int}"}], None
+    return _slow_chat
+
+
+def _tracker():
+    return {"lock": threading.Lock(), "active": 0, "peak": 0}
+
+
+class TestAsyncInterface:
+    """Coroutines wrap the sync Interface and honor its concurrency limits"""
+
+    def test_chat_response_coroutines_overlap_up_to_provider_limit(self, mock_logger):
+        from Writer.Interface.Wrapper import Interface
+        from Writer.Interface.AsyncWrapper import AsyncInterface
+
+        tracker = _tracker()
+        with patch.object(Writer.Config, 'MAX_CONCURRENT_REQUESTS_PER_PROVIDER', {"ollama": 3}), \
+                patch.object(Writer.Config, 'MAX_CONCURRENT_REQUESTS_PER_HOST', 10):
+            interface = Interface(Models=[])
+            async_interface = AsyncInterface(interface, max_workers=8)
+            with patch.object(interface, '_ollama_chat', side_effect=_make_slow_chat(tracker)):
+                async def _run_all():
+                    return await asyncio.gather(*[
+                        async_interface.ChatResponse(mock_logger(), MESSAGES, "ollama://test", seed)
+                        for seed in range(6)
+                    ])
+                results = asyncio.run(_run_all())
+            async_interface.close()
+
+        assert [r[0][-1]["content"] for r in results] == [f"seed {i}" for i in range(6)]
+        assert 1 < tracker["peak"] <= 3
+
+    def test_host_limit_applies_across_providers_sharing_a_host(self, mock_logger):
+        from Writer.Interface.Wrapper import Interface
+        from Writer.Interface.AsyncWrapper import AsyncInterface
+
+        tracker = _tracker()
+        with patch.object(Writer.Config, 'MAX_CONCURRENT_REQUESTS_PER_PROVIDER', {"ollama": 8}), \
+                patch.object(Writer.Config, 'MAX_CONCURRENT_REQUESTS_PER_HOST', 1):
+            interface = Interface(Models=[])
+            async_interface = AsyncInterface(interface, max_workers=8)
+            with patch.object(interface, '_ollama_chat', side_effect=_make_slow_chat(tracker)):
+                async def _run_all():
+                    return await asyncio.gather(*[
+                        async_interface.ChatResponse(mock_logger(), MESSAGES, "ollama://test@10.0.0.1:11434", seed)
+                        for seed in range(3)
+                    ])
+                asyncio.run(_run_all())
+            async_interface.close()
+
+        assert tracker["peak"] == 1
+
+    def test_sync_helpers_are_delegated(self):
+        from Writer.Interface.Wrapper import Interface
+        from Writer.Interface.AsyncWrapper import AsyncInterface
+
+        async_interface = AsyncInterface(Interface(Models=[]), max_workers=1)
+        assert async_interface.BuildUserQuery("hi") == {"role": "user", "content": "hi"}
+        async_interface.close()
@@ -59,7 +59,7 @@ class TestGoogleCompliance:
 
         # Mock the embed_content response - using client.models.embed_content pattern
         mock_response = Mock()
-        mock_response.embedding = [0.1, 0.2, 0.3]
+        mock_response.embeddings = [Mock(values=[0.1, 0.2, 0.3])]
         mock_client.models.embed_content.return_value = mock_response
 
         # Act - This should call client.models.embed_content, not genai.embed_content
@@ -106,7 +106,7 @@ class TestGoogleCompliance:
 
         # Make first call fail, second succeed
         mock_response = Mock()
-        mock_response.embedding = [0.1, 0.2, 0.3]
+        mock_response.embeddings = [Mock(values=[0.1, 0.2, 0.3])]
         mock_client.models.embed_content.side_effect = [
             Exception("API Error"),  # First call fails
             mock_response            # Second call succeeds
@@ -140,7 +140,7 @@ class TestGoogleCompliance:
 
         # Mock response with object attributes (latest SDK pattern)
         mock_response = Mock()
-        mock_response.embedding = [0.1, 0.2, 0.3]
+        mock_response.embeddings = [Mock(values=[0.1, 0.2, 0.3])]
         mock_client.models.embed_content.return_value = mock_response
         interface.Clients["google_test"] = mock_client
 
@@ -0,0 +1,75 @@
+"""
+Tests for the shared keep-alive HTTP session pool - London School Approach
+"""
+import json
+from unittest.mock import Mock, patch
+
+from Writer.Interface.HTTPSession import HTTPSessionPool
+
+
+class TestHTTPSessionPool:
+    """Pool configuration and request plumbing"""
+
+    def test_requests_backend_mounts_sized_adapter(self):
+        pool = HTTPSessionPool(pool_connections=2, pool_maxsize=7, enable_http2=False)
+        adapter = pool._client.get_adapter("https://openrouter.ai")
+        assert adapter._pool_maxsize == 7
+        assert pool.http2 is False
+        pool.close()
+
+    def test_post_uses_connect_and_read_timeouts(self):
+        pool = HTTPSessionPool(connect_timeout=3, read_timeout=30, enable_http2=False)
+        with patch.object(pool._client, 'post') as mock_post:
+            pool.post("https://example.com", headers={"a": "b"}, json={"x": 1})
+        assert mock_post.call_args.kwargs["timeout"] == (3, 30)
+        pool.close()
+
+    def test_httpx_backend_sends_raw_body_as_content(self):
+        pool = HTTPSessionPool(enable_http2=False)
+        pool.close()
+        pool.http2 = True
+        pool._client = Mock()
+
+        pool.post("https://example.com", headers={"a": "b"}, data='{"x": 1}')
+
+        assert pool._client.post.call_args.kwargs["content"] == '{"x": 1}'
+        assert "data" not in pool._client.post.call_args.kwargs
+
+
+class TestOpenRouterUsesPool:
+    """OpenRouter chat and embeddings reuse the Interface-owned pool"""
+
+    def test_chat_posts_through_session_and_returns_choices(self):
+        from Writer.Interface.OpenRouter import OpenRouter
+
+        session = Mock()
+        session.post.return_value.json.return_value = {
+            "choices": [{"message": {"content": "hello"}}],
+            "usage": {"prompt_tokens": 4, "completion_tokens": 1},
+        }
+        client = OpenRouter(api_key="key", model="a/b", session=session)
+
+        response = client.chat(messages=[{"role": "user", "content": "hi"}], stream=False, temperature=0.0, max_tokens=50)
+
+        assert response.choices[0].message.content == "hello"
+        assert response.usage["completion_tokens"] == 1
+        sent_body = json.loads(session.post.call_args.kwargs["data"])
+        assert sent_body["max_tokens"] == 50
+        assert sent_body["temperature"] == 0.0
+
+    def test_interface_shares_one_pool_for_embeddings(self, mock_logger):
+        from Writer.Interface.Wrapper import Interface
+
+        interface = Interface(Models=[])
+        interface.Clients["openrouter://emb"] = Mock(api_key="key")
+        shared = interface._get_http_session()
+        with patch.object(shared, 'post') as mock_post:
+            mock_post.return_value.json.return_value = {
+                "data": [{"embedding": [0.1, 0.2], "index": 0}], "usage": {"prompt_tokens": 2}
+            }
+            embeddings, _ = interface._openrouter_embedding(mock_logger(), "openrouter://emb", "emb", ["a"])
+            interface._openrouter_embedding(mock_logger(), "openrouter://emb", "emb", ["b"])
+
+        assert embeddings == [[0.1, 0.2]]
+        assert mock_post.call_count == 2
+        assert interface._get_http_session() is shared
@@ -0,0 +1,64 @@
+"""
+Tests for tiered JSON parsing in SafeGenerateJSON - London School Approach
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from Writer.Interface.JSONParse import JSONParseStats, extract_balanced, parse_json_tiered
+
+
+class TestParseJsonTiered:
+    """Cheapest tier that can parse the response wins"""
+
+    def test_valid_json_uses_strict_tier(self):
+        assert parse_json_tiered('{"a": 1}') == ({"a": 1}, "strict")
+
+    def test_fenced_json_uses_strict_tier(self):
+        assert parse_json_tiered('```json\n{"a": [1, 2]}\n```') == ({"a": [1, 2]}, "strict")
+
+    def test_prose_around_json_uses_extract_tier(self):
+        text = 'Here you go: {"text": "a } inside \\" quotes {", "n": 2} Hope that helps!'
+        assert parse_json_tiered(text) == ({"text": 'a } inside " quotes {', "n": 2}, "extract")
+
+    def test_broken_json_falls_back_to_repair(self):
+        value, tier = parse_json_tiered('{"a": 1, "b": [1, 2,}')
+        assert tier == "repair"
+        assert value["a"] == 1
+
+    def test_multiple_objects_are_left_to_repair(self):
+        value, tier = parse_json_tiered('{"a": 1}\n{"b": 2}')
+        assert tier == "repair"
+        assert isinstance(value, list)
+
+    def test_empty_and_non_json_responses_raise(self):
+        with pytest.raises(ValueError):
+            parse_json_tiered("```\n```")
+        with pytest.raises(ValueError):
+            parse_json_tiered("no json here")
+
+    def test_unbalanced_text_is_not_extracted(self):
+        assert extract_balanced('{"a": [1, 2}', 0) is None
+
+
+class TestParseTierCounters:
+    """SafeGenerateJSON records the winning tier per model"""
+
+    def test_counts_are_recorded_per_model(self, mock_logger):
+        from Writer.Interface.Wrapper import Interface
+
+        interface = Interface(Models=[])
+        interface.Clients['ollama://test'] = Mock()
+        responses = ['{"ok": true}', 'Sure! {"ok": true}']
+        with patch.object(interface, '_ollama_chat', return_value=([{'role': 'assistant', 'content': ''}], None)), \
+                patch.object(interface, 'GetLastMessageText', side_effect=responses):
+            interface.SafeGenerateJSON(mock_logger(), [{'role': 'user', 'content': 'x'}], "ollama://test")
+            interface.SafeGenerateJSON(mock_logger(), [{'role': 'user', 'content': 'x'}], "ollama://test")
+
+        assert interface.JSONParseStats.snapshot() == {"ollama://test": {"strict": 1, "extract": 1, "repair": 0}}
+
+    def test_stats_snapshot_is_a_copy(self):
+        stats = JSONParseStats()
+        stats.record("m", "strict")
+        stats.snapshot()["m"]["strict"] = 99
+        assert stats.snapshot()["m"]["strict"] == 1
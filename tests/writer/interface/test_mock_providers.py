@@ -0,0 +1,114 @@
+"""
+Tests for the offline mock:// and replay:// providers - London School Approach
+"""
+import json
+import random
+
+import pytest
+
+from Writer.Interface.MockProviders import (
+    MockProvider, ReplayMissError, ReplayProvider, SchemaSynthesizer,
+    deterministic_embedding, messages_digest,
+)
+from Writer.Models import MODEL_REGISTRY, ChapterOutput, StoryElements
+
+
+def _write_transcript(directory, index, messages, response):
+    path = directory / f"{index}_Chat.json"
+    path.write_text(json.dumps(messages + [{"role": "assistant", "content": response}]), encoding="utf-8")
+
+
+class TestSchemaSynthesizer:
+    """Synthesized responses validate against the structured-output models"""
+
+    @pytest.mark.parametrize("model", list(MODEL_REGISTRY.values()), ids=lambda m: m.__name__)
+    def test_registry_models_validate(self, model):
+        synthesizer = SchemaSynthesizer(model.model_json_schema(), random.Random(1), {"words": 120, "chapters": 2, "rating": 90})
+        model.model_validate(synthesizer.build())
+
+    def test_story_elements_validate(self):
+        synthesizer = SchemaSynthesizer(StoryElements.model_json_schema(), random.Random(2), {"words": 50, "chapters": 3, "rating": 90})
+        assert isinstance(StoryElements.model_validate(synthesizer.build()), StoryElements)
+
+
+class TestMockProvider:
+    """Deterministic content with injectable latency"""
+
+    def test_same_request_and_seed_is_deterministic(self):
+        provider = MockProvider("bench", {"words": 40})
+        messages = [{"role": "user", "content": "Write chapter 1"}]
+        schema = ChapterOutput.model_json_schema()
+        assert provider.chat(messages, 7, schema)[0] == provider.chat(messages, 7, schema)[0]
+
+    def test_latency_uses_injected_sleep(self):
+        sleeps = []
+        provider = MockProvider("bench", {"latency": 0.5, "tps": 10}, sleep=sleeps.append)
+        _, usage = provider.chat([{"role": "user", "content": "hi"}])
+        assert sleeps == [pytest.approx(0.5 + usage["completion_tokens"] / 10)]
+
+    def test_no_schema_answers_with_common_keys(self):
+        content, _ = MockProvider("bench").chat([{"role": "user", "content": "summarize"}])
+        assert {"context", "summary", "text"} <= set(json.loads(content))
+
+    def test_embedding_is_deterministic_unit_vector(self):
+        vector = deterministic_embedding("lore", 16)
+        assert vector == deterministic_embedding("lore", 16)
+        assert sum(v * v for v in vector) == pytest.approx(1.0)
+
+
+class TestReplayProvider:
+    """Recorded transcripts are served by request digest"""
+
+    def test_matches_by_digest_then_last_user_message(self, tmp_path):
+        _write_transcript(tmp_path, 0, [{"role": "system", "content": "s"}, {"role": "user", "content": "a"}], "first")
+        _write_transcript(tmp_path, 1, [{"role": "user", "content": "b"}], "second")
+        provider = ReplayProvider(str(tmp_path))
+
+        assert provider.chat([{"role": "system", "content": "s"}, {"role": "user", "content": "a"}])[0] == "first"
+        assert provider.chat([{"role": "system", "content": "other"}, {"role": "user", "content": "b"}])[0] == "second"
+
+    def test_lorebook_metadata_order_and_timestamp_are_ignored(self, tmp_path):
+        recorded = "Lore: hero (source: story_elements | type: character | added_at: 2024-01-01 10:00:00.1)"
+        replayed = "Lore: hero (added_at: 2025-06-06 12:34:56.7 | type: character | source: story_elements)"
+        _write_transcript(tmp_path, 0, [{"role": "user", "content": recorded}], "lore answer")
+        provider = ReplayProvider(str(tmp_path))
+
+        assert messages_digest([{"role": "user", "content": recorded}]) == messages_digest([{"role": "user", "content": replayed}])
+        assert provider.chat([{"role": "user", "content": replayed}])[0] == "lore answer"
+
+    def test_strict_miss_raises(self, tmp_path):
+        _write_transcript(tmp_path, 0, [{"role": "user", "content": "a"}], "first")
+        with pytest.raises(ReplayMissError):
+            ReplayProvider(str(tmp_path)).chat([{"role": "user", "content": "unknown"}])
+
+    def test_non_strict_miss_falls_back_to_recording_order(self, tmp_path):
+        _write_transcript(tmp_path, 0, [{"role": "user", "content": "a"}], "first")
+        _write_transcript(tmp_path, 1, [{"role": "user", "content": "b"}], "second")
+        provider = ReplayProvider(str(tmp_path), strict=False)
+
+        assert provider.chat([{"role": "user", "content": "x"}])[0] == "first"
+        assert provider.chat([{"role": "user", "content": "y"}])[0] == "second"
+
+    def test_missing_source_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            ReplayProvider(str(tmp_path / "missing"))
+
+
+class TestInterfaceIntegration:
+    """mock:// and replay:// URLs are wired into Interface"""
+
+    def test_model_url_parsing(self):
+        from Writer.Interface.Wrapper import Interface
+
+        interface = Interface(Models=[])
+        assert interface.GetModelAndProvider("mock://bench?latency=0.2&dist=lognormal") == (
+            "mock", "bench", None, {"latency": 0.2, "dist": "lognormal"})
+        assert interface.GetModelAndProvider("replay:///tmp/run?strict=0") == ("replay", "/tmp/run", None, {"strict": 0.0})
+
+    def test_safe_generate_pydantic_with_mock(self, mock_logger):
+        from Writer.Interface.Wrapper import Interface
+
+        interface = Interface(Models=["mock://bench?words=80"])
+        _, result, _ = interface.SafeGeneratePydantic(
+            mock_logger(), [{"role": "user", "content": "Write chapter 1"}], "mock://bench?words=80", ChapterOutput)
+        assert isinstance(result, ChapterOutput)
@@ -28,7 +28,7 @@ class TestOpenRouterCompliance:
         from Writer.Interface.Wrapper import Interface
 
         # Arrange
-        with patch('Writer.Interface.OpenRouter.requests.post') as mock_post:
+        with patch('requests.post') as mock_post:
             mock_response = Mock()
             mock_response.json.return_value = {
                 "choices": [{"message": {"content": "test response"}}],
@@ -0,0 +1,138 @@
+"""
+Tests for the content-addressed LLM response cache - London School Approach
+"""
+import pytest  # type: ignore # Needed for pytest fixtures
+from unittest.mock import patch
+
+from Writer.Interface.ResponseCache import ResponseCache
+
+
+MESSAGES = [{"role": "user", "content": "Write a title"}]
+
+
+class TestResponseCacheKeys:
+    """Cache keys must be stable for identical requests and differ otherwise"""
+
+    def test_key_is_stable_for_identical_requests(self):
+        key1 = ResponseCache.make_key("ollama://m", MESSAGES, 12, {"type": "object"}, {"temperature": 0.5})
+        key2 = ResponseCache.make_key("ollama://m", [dict(MESSAGES[0])], 12, {"type": "object"}, {"temperature": 0.5})
+        assert key1 == key2
+
+    def test_key_changes_with_seed_and_options(self):
+        base = ResponseCache.make_key("ollama://m", MESSAGES, 12)
+        assert base != ResponseCache.make_key("ollama://m", MESSAGES, 13)
+        assert base != ResponseCache.make_key("ollama://m", MESSAGES, 12, options={"temperature": 0.1})
+        assert base != ResponseCache.make_key("ollama://other", MESSAGES, 12)
+
+
+class TestResponseCacheModes:
+    """read-write stores and serves, read-only serves only, bypass does nothing"""
+
+    def test_read_write_round_trip_counts_hits_and_misses(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path), mode="read-write")
+        key = ResponseCache.make_key("m", MESSAGES, 1)
+
+        assert cache.get(key) is None
+        cache.put(key, "m", "cached answer", {"prompt_tokens": 3, "completion_tokens": 2})
+
+        assert cache.get(key) == ("cached answer", {"prompt_tokens": 3, "completion_tokens": 2})
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_read_only_never_writes(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path), mode="read-only")
+        key = ResponseCache.make_key("m", MESSAGES, 1)
+        cache.put(key, "m", "answer")
+        assert cache.get(key) is None
+        assert cache.stats()["stores"] == 0
+
+    def test_bypass_does_not_touch_disk(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path / "cache"), mode="bypass")
+        cache.put("k", "m", "answer")
+        assert cache.get("k") is None
+        assert not (tmp_path / "cache").exists()
+
+    def test_invalid_mode_raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            ResponseCache(cache_dir=str(tmp_path), mode="sometimes")
+
+    def test_lru_eviction_keeps_recently_used_entries(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path), mode="read-write", max_mb=0)
+        cache.max_bytes = 25  # Room for two 10-byte entries
+        cache.put("a", "m", "a" * 10)
+        cache.put("b", "m", "b" * 10)
+        cache.get("a")  # "a" becomes most recently used
+        cache.put("c", "m", "c" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+
+class TestChatResponseCaching:
+    """Interface.ChatResponse serves repeated requests from the cache"""
+
+    def _interface(self, tmp_path):
+        from Writer.Interface.Wrapper import Interface
+
+        interface = Interface(Models=[])
+        interface.ResponseCache = ResponseCache(cache_dir=str(tmp_path), mode="read-write")
+        return interface
+
+    def test_second_identical_call_skips_provider(self, tmp_path, mock_logger):
+        interface = self._interface(tmp_path)
+
+        with patch.object(interface, '_ollama_chat') as mock_chat:
+            mock_chat.return_value = (
+                MESSAGES + [{"role": "assistant", "content": '{"title": "A Title"}'}],
+                {"prompt_tokens": 5, "completion_tokens": 2}
+            )
+            first = interface.SafeGenerateJSON(mock_logger(), MESSAGES, "ollama://test", 7)
+            second = interface.SafeGenerateJSON(mock_logger(), MESSAGES, "ollama://test", 7)
+
+        assert mock_chat.call_count == 1
+        assert second == first
+        assert interface.ResponseCache.stats()["hits"] == 1
+
+    def test_response_is_not_cached_until_accepted(self, tmp_path, mock_logger):
+        interface = self._interface(tmp_path)
+
+        with patch.object(interface, '_ollama_chat') as mock_chat:
+            mock_chat.return_value = (MESSAGES + [{"role": "assistant", "content": "A Title"}], None)
+            interface.ChatResponse(mock_logger(), MESSAGES, "ollama://test", 7)
+
+        assert interface.ResponseCache.stats()["stores"] == 0
+
+    def test_unparseable_json_is_not_cached(self, tmp_path, mock_logger):
+        interface = self._interface(tmp_path)
+
+        with patch.object(interface, '_ollama_chat') as mock_chat:
+            mock_chat.side_effect = [
+                (MESSAGES + [{"role": "assistant", "content": "no json here"}], None),
+                (MESSAGES + [{"role": "assistant", "content": '{"title": "A Title"}'}], None),
+            ]
+            _, response, _ = interface.SafeGenerateJSON(mock_logger(), MESSAGES, "ollama://test", 7)
+
+        assert response == {"title": "A Title"}
+        assert interface.ResponseCache.stats()["stores"] == 1
+
+    def test_cached_response_failing_validation_is_evicted(self, tmp_path, mock_logger):
+        from pydantic import BaseModel
+
+        class Title(BaseModel):
+            title: str
+
+        interface = self._interface(tmp_path)
+        wrong = MESSAGES + [{"role": "assistant", "content": '{"name": "A Title"}'}]
+        right = MESSAGES + [{"role": "assistant", "content": '{"title": "A Title"}'}]
+
+        with patch.object(interface, '_ollama_chat') as mock_chat, \
+                patch.object(interface, '_wait_before_retry'):
+            mock_chat.side_effect = [(wrong, None), (right, None)]
+            _, result, _ = interface.SafeGeneratePydantic(mock_logger(), MESSAGES, "ollama://test", Title)
+
+        assert result.title == "A Title"
+        assert interface.ResponseCache.stats()["stores"] == 2
+        cached = interface.ResponseCache._connect().execute("SELECT content FROM responses").fetchall()
+        assert cached == [('{"title": "A Title"}',)]
@@ -0,0 +1,166 @@
+"""
+Tests for the retry policy engine - London School Approach
+Error classification, backoff, circuit breaker and token bucket
+"""
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from Writer.Interface.RetryPolicy import (
+    CircuitBreaker, CircuitOpenError, ProviderError, ResponseParseError, RetryEngine, RetryPolicy, TokenBucket,
+    classify_error, retry_after_seconds,
+)
+from Writer.Interface.MockProviders import ReplayMissError
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestClassifyError:
+    """Errors are sorted into retry classes"""
+
+    @pytest.mark.parametrize("error, expected", [
+        (json.JSONDecodeError("bad", "{", 0), "validation"),
+        (TypeError("Expected single JSON object, got list"), "validation"),
+        (ProviderError("slow down", status_code=429), "rate_limit"),
+        (Exception("429 RESOURCE_EXHAUSTED"), "rate_limit"),
+        (ProviderError("boom", status_code=503), "overload"),
+        (Exception("server busy, please try again"), "overload"),
+        (ProviderError("bad key", status_code=401), "fatal"),
+        (ConnectionResetError("reset by peer"), "transport"),
+        (ResponseParseError("Failed to generate valid JSON after 3 retries"), "validation"),
+        (ProviderError("Response without error but missing choices: {}", error_class="transport"), "transport"),
+        (Exception("field missing from provider payload"), "transport"),
+        (Exception("502 from proxy: upstream page not found"), "transport"),
+        (ProviderError("model 'x' not found", status_code=404), "fatal"),
+        (ReplayMissError("Replay transcript not found for request in run"), "fatal"),
+    ])
+    def test_classification(self, error, expected):
+        assert classify_error(error) == expected
+
+    def test_retry_after_header_is_read(self):
+        error = Exception("rate limited")
+        error.response = Mock(headers={"Retry-After": "7"}, status_code=429)  # type: ignore[attr-defined]
+        assert retry_after_seconds(error) == 7.0
+
+    def test_google_retry_delay_is_read(self):
+        assert retry_after_seconds(Exception("429 ... 'retryDelay': '12s'")) == 12.0
+
+
+class TestRetryPolicy:
+    """Per-class backoff"""
+
+    def test_validation_errors_do_not_sleep(self):
+        assert RetryPolicy().delay("validation", 3) == 0.0
+
+    def test_backoff_grows_and_is_capped(self):
+        policy = RetryPolicy({"transport": {"base": 1.0, "factor": 2.0, "max": 4.0}})
+        assert 0.5 <= policy.delay("transport", 0) <= 1.0
+        assert 2.0 <= policy.delay("transport", 5) <= 4.0
+
+    def test_retry_after_takes_precedence(self):
+        assert RetryPolicy().delay("rate_limit", 0, retry_after=42) == 42
+
+
+class TestCircuitBreaker:
+    """Opens after consecutive failures, probes once after the reset timeout"""
+
+    def test_open_half_open_closed_cycle(self):
+        clock = _FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        clock.now = 10
+        assert breaker.allow()       # single probe
+        assert not breaker.allow()   # second caller waits for the probe
+        breaker.record_success()
+        assert breaker.allow()
+
+
+class TestTokenBucket:
+    """Requests beyond the rate wait for a refill"""
+
+    def test_acquire_waits_when_empty(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(60, burst=1, clock=clock, sleep=clock.sleep)
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(1.0)
+
+
+class TestRetryEngine:
+    """Classification drives whether and how long to retry"""
+
+    def test_transport_errors_are_retried(self):
+        sleeps = []
+        engine = RetryEngine(sleep=sleeps.append)
+        operation = Mock(side_effect=[ConnectionError("reset"), "ok"])
+        assert engine.call(operation, "ollama@h", max_attempts=3) == "ok"
+        assert operation.call_count == 2
+        assert len(sleeps) == 1
+
+    def test_validation_and_fatal_errors_are_not_retried(self):
+        engine = RetryEngine(sleep=Mock())
+        for error in (TypeError("list"), ProviderError("no credits", status_code=402)):
+            operation = Mock(side_effect=error)
+            with pytest.raises(type(error)):
+                engine.call(operation, "openrouter", max_attempts=5)
+            assert operation.call_count == 1
+
+    def test_open_circuit_stops_calls_to_host(self):
+        engine = RetryEngine(failure_threshold=2, reset_timeout=60, sleep=Mock())
+        failing = Mock(side_effect=ProviderError("down", status_code=503))
+        with pytest.raises(ProviderError):
+            engine.call(failing, "google", max_attempts=2)
+
+        untouched = Mock(return_value="ok")
+        with pytest.raises(CircuitOpenError):
+            engine.call(untouched, "google", max_attempts=1)
+        untouched.assert_not_called()
+
+
+class TestPydanticRetryDelay:
+    """SafeGeneratePydantic no longer sleeps on validation retries"""
+
+    def test_validation_retry_does_not_sleep(self, mock_logger):
+        from Writer.Interface.Wrapper import Interface
+        from Writer.Models import ChapterOutput
+
+        interface = Interface(Models=[])
+        valid_text = 'Valid long text with at least 100 characters here for testing purposes and validation. This text is sufficiently long now.'
+        with patch.object(interface, 'SafeGenerateJSON') as mock_json, \
+                patch('Writer.Interface.Wrapper.time.sleep') as mock_sleep:
+            mock_json.side_effect = [
+                ([], [{'text': 'data'}], None),
+                ([], {'text': valid_text, 'word_count': 20, 'chapter_number': 1}, None),
+            ]
+            interface.SafeGeneratePydantic(mock_logger(), [{'role': 'user', 'content': 'x'}], 'test', ChapterOutput, _max_retries_override=2)
+
+        mock_sleep.assert_not_called()
+
+    def test_json_parse_failure_does_not_sleep(self, mock_logger):
+        from Writer.Interface.Wrapper import Interface
+        from Writer.Models import ChapterOutput
+
+        interface = Interface(Models=[])
+        valid_text = 'Valid long text with at least 100 characters here for testing purposes and validation. This text is sufficiently long now.'
+        with patch.object(interface, 'SafeGenerateJSON') as mock_json, \
+                patch('Writer.Interface.Wrapper.time.sleep') as mock_sleep:
+            mock_json.side_effect = [
+                ResponseParseError("Failed to generate valid JSON after 3 retries"),
+                ([], {'text': valid_text, 'word_count': 20, 'chapter_number': 1}, None),
+            ]
+            interface.SafeGeneratePydantic(mock_logger(), [{'role': 'user', 'content': 'x'}], 'test', ChapterOutput, _max_retries_override=2)
+
+        mock_sleep.assert_not_called()
@@ -0,0 +1,51 @@
+"""
+Tests for memoized schemas and format instructions - London School Approach
+"""
+from unittest.mock import patch
+
+from Writer.Interface.SchemaRegistry import SchemaRegistry
+from Writer.Models import MODEL_REGISTRY, TitleOutput
+
+
+class TestSchemaRegistry:
+    """Schemas are computed once per model"""
+
+    def test_registry_precomputes_model_registry(self):
+        registry = SchemaRegistry()
+        assert all(model in registry for model in MODEL_REGISTRY.values())
+
+    def test_schema_is_computed_once(self):
+        registry = SchemaRegistry(models={})
+        with patch.object(TitleOutput, 'model_json_schema', wraps=TitleOutput.model_json_schema) as spy:
+            first = registry.schema(TitleOutput)
+            second = registry.schema(TitleOutput)
+        assert first is second
+        assert spy.call_count == 1
+
+
+class TestFormatInstructionCache:
+    """Format instructions are rendered once per model and language"""
+
+    def test_instruction_is_rendered_once_per_language(self):
+        from Writer.Interface.Wrapper import Interface
+
+        interface = Interface(Models=[])
+        with patch.object(interface, '_build_format_instruction', wraps=interface._build_format_instruction) as spy:
+            interface.language = 'en'
+            english = interface._get_format_instruction(TitleOutput)
+            assert interface._get_format_instruction(TitleOutput) is english
+            interface.language = 'id'
+            indonesian = interface._get_format_instruction(TitleOutput)
+        assert spy.call_count == 2
+        assert english != indonesian
+
+    def test_safe_generate_pydantic_reuses_cached_instruction(self, mock_logger):
+        from Writer.Interface.Wrapper import Interface
+
+        interface = Interface(Models=[])
+        with patch.object(interface, 'SafeGenerateJSON', return_value=([], {'title': 'Judul'}, None)), \
+                patch.object(interface, '_build_format_instruction', return_value="\nFORMAT") as spy:
+            for _ in range(3):
+                _, result, _ = interface.SafeGeneratePydantic(mock_logger(), [{'role': 'user', 'content': 'x'}], 'test', TitleOutput)
+        assert result.title == 'Judul'
+        assert spy.call_count == 1
@@ -0,0 +1,125 @@
+"""
+Tests for streaming generation with incremental JSON validation - London School Approach
+"""
+import json
+import pytest  # type: ignore # Needed for pytest fixtures
+from unittest.mock import Mock, patch
+
+import Writer.Config
+from Writer.Interface.StreamingJSON import IncrementalJSONValidator, StreamAbortedError
+from Writer.Models import ChapterOutput, TitleOutput
+
+
+def _feed_in_pieces(validator, text, size=5):
+    for i in range(0, len(text), size):
+        validator.feed(text[i:i + size])
+
+
+VALID_CHAPTER = json.dumps({
+    "text": "Kalimat pembuka bab. " * 20,
+    "word_count": 60,
+    "scenes": ["Adegan satu"],
+    "characters_present": ["Rina"],
+    "chapter_number": 1,
+    "chapter_title": "Awal",
+})
+
+
+class TestIncrementalJSONValidator:
+    """The validator accepts schema-valid streams and rejects broken ones early"""
+
+    def test_accepts_valid_response_fed_in_chunks(self):
+        validator = IncrementalJSONValidator(ChapterOutput.model_json_schema())
+        _feed_in_pieces(validator, "```json\n" + VALID_CHAPTER + "\n```")
+        assert validator.finished
+
+    @pytest.mark.parametrize("bad_prefix", [
+        "Berikut adalah JSON",                # prose instead of JSON
+        '[{"text": "a"}',                     # multiple objects as an array
+        '{"properties": {"text": ',           # schema echo
+        '{"text": 42',                        # wrong type for a string field
+        '{"chapter_number": "satu"',          # wrong type for an integer field
+        '{"text": "x"} {"text": "y"}',        # trailing second object
+    ])
+    def test_aborts_on_structural_errors(self, bad_prefix):
+        validator = IncrementalJSONValidator(ChapterOutput.model_json_schema())
+        with pytest.raises(StreamAbortedError):
+            _feed_in_pieces(validator, bad_prefix)
+
+    def test_aborts_when_string_exceeds_max_length(self):
+        schema = {"type": "object", "properties": {"title": {"type": "string", "maxLength": 10}}}
+        validator = IncrementalJSONValidator(schema)
+        with pytest.raises(StreamAbortedError, match="maxLength"):
+            validator.feed('{"title": "' + "a" * 11)
+
+    def test_escaped_characters_count_once(self):
+        schema = {"type": "object", "properties": {"title": {"type": "string", "maxLength": 3}}}
+        validator = IncrementalJSONValidator(schema)
+        validator.feed('{"title": "a\\"\\u00e9"}')
+        assert validator.finished
+
+    def test_nullable_and_nested_fields_are_resolved(self):
+        validator = IncrementalJSONValidator(TitleOutput.model_json_schema())
+        validator.feed('{"title": "Judul Bab"}')
+        assert validator.finished
+
+
+class TestOllamaStreamingAbort:
+    """_ollama_chat streams structured calls and SafeGenerateJSON retries aborted ones"""
+
+    def _chunks(self, text, done_counts=(10, 20)):
+        pieces = [{"message": {"content": text[i:i + 4]}, "done": False} for i in range(0, len(text), 4)]
+        pieces.append({"message": {"content": ""}, "done": True,
+                       "prompt_eval_count": done_counts[0], "eval_count": done_counts[1]})
+        return pieces
+
+    def test_streaming_collects_content_and_token_usage(self, mock_logger):
+        from Writer.Interface.Wrapper import Interface
+
+        interface = Interface(Models=[])
+        client = Mock()
+        client.chat.return_value = iter(self._chunks('{"title": "Judul"}'))
+        interface.Clients["ollama://test"] = client
+
+        with patch.object(Writer.Config, 'STREAMING_JSON_VALIDATION', True):
+            messages, usage = interface._ollama_chat(
+                mock_logger(), "ollama://test", "test", [{"role": "user", "content": "x"}],
+                None, 1, TitleOutput.model_json_schema()
+            )
+
+        assert client.chat.call_args.kwargs["stream"] is True
+        assert messages[-1]["content"] == '{"title": "Judul"}'
+        assert usage == {"prompt_tokens": 10, "completion_tokens": 20}
+
+    def test_aborted_stream_is_retried_with_new_seed(self, mock_logger):
+        from Writer.Interface.Wrapper import Interface
+
+        interface = Interface(Models=[])
+        client = Mock()
+        client.chat.side_effect = [
+            iter(self._chunks('Maaf, saya tidak bisa' + 'x' * 400)),
+            iter(self._chunks('{"title": "Judul"}')),
+        ]
+        interface.Clients["ollama://test"] = client
+
+        with patch.object(Writer.Config, 'STREAMING_JSON_VALIDATION', True):
+            _, parsed, _ = interface.SafeGenerateJSON(
+                mock_logger(), [{"role": "user", "content": "x"}], "ollama://test",
+                _FormatSchema=TitleOutput.model_json_schema()
+            )
+
+        assert parsed == {"title": "Judul"}
+        assert client.chat.call_count == 2
+
+    def test_streaming_disabled_by_default(self, mock_logger):
+        from Writer.Interface.Wrapper import Interface
+
+        interface = Interface(Models=[])
+        client = Mock()
+        client.chat.return_value = {"message": {"content": '{"title": "Judul"}'}}
+        interface.Clients["ollama://test"] = client
+
+        interface._ollama_chat(mock_logger(), "ollama://test", "test", [{"role": "user", "content": "x"}],
+                               None, 1, TitleOutput.model_json_schema())
+
+        assert client.chat.call_args.kwargs["stream"] is False
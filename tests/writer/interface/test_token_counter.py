@@ -0,0 +1,160 @@
+"""
+Tests for tokenizer-accurate token counting and context packing - London School Approach
+"""
+from unittest.mock import patch
+
+import Writer.Config
+from Writer.Interface.TokenCounter import TokenCounter, ContextPacker
+
+
+def _write_word_tokenizer(path):
+    """Minimal HuggingFace tokenizer.json: whitespace split, every word one token"""
+    from tokenizers import Tokenizer
+    from tokenizers.models import WordLevel
+    from tokenizers.pre_tokenizers import Whitespace
+    tokenizer = Tokenizer(WordLevel(vocab={"[UNK]": 0}, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = Whitespace()
+    tokenizer.save(str(path))
+
+
+class TestTokenCounter:
+    """Exact counts from local tokenizers, calibrated estimates otherwise"""
+
+    def test_uses_local_tokenizer_file_when_configured(self, tmp_path):
+        tokenizer_file = tmp_path / "tokenizer.json"
+        _write_word_tokenizer(tokenizer_file)
+        counter = TokenCounter()
+        with patch.object(Writer.Config, 'TOKENIZER_FILES', {"my-model": str(tokenizer_file)}):
+            assert counter.count("ollama://my-model@localhost:11434", "satu dua tiga empat") == 4
+            assert counter.is_exact("ollama://my-model@localhost:11434")
+
+    def test_fallback_ratio_is_calibrated_from_reported_usage(self):
+        counter = TokenCounter()
+        with patch.object(Writer.Config, 'CHARS_PER_TOKEN_ESTIMATE', 4.0):
+            assert counter.count("ollama://x", "a" * 400) == 100
+            counter.calibrate("ollama://x", 400, 200)  # Provider says 2 chars per token
+            assert counter.count("ollama://x", "a" * 400) == 200
+
+    def test_calibration_ignores_implausible_reports(self):
+        counter = TokenCounter()
+        counter.calibrate("ollama://x", 400, 1)
+        assert counter.chars_per_token("ollama://x") == Writer.Config.CHARS_PER_TOKEN_ESTIMATE
+
+
+class TestContextPacker:
+    """Lowest-priority context is dropped first; required context is kept"""
+
+    def setup_method(self):
+        self.counter = TokenCounter()
+        self.packer = ContextPacker(self.counter, "ollama://x")
+
+    def test_drops_lowest_priority_block_first(self):
+        with patch.object(Writer.Config, 'CHARS_PER_TOKEN_ESTIMATE', 1.0):
+            text, dropped = self.packer.pack_blocks(
+                [(3, "B" * 10), (1, "L" * 50), (2, "M" * 20), (3, "O" * 10)], budget=60, separator="|"
+            )
+        assert text == "|".join(["B" * 10, "M" * 20, "O" * 10])
+        assert dropped == [(1, "L" * 50)]
+
+    def test_never_drops_top_priority_blocks(self):
+        with patch.object(Writer.Config, 'CHARS_PER_TOKEN_ESTIMATE', 1.0):
+            text, dropped = self.packer.pack_blocks([(3, "A" * 100), (1, "B" * 10)], budget=5, separator="|")
+        assert text == "A" * 100
+        assert len(dropped) == 1
+
+    def test_pack_messages_keeps_system_and_last_message(self):
+        messages = [
+            {"role": "system", "content": "s" * 10},
+            {"role": "user", "content": "task" * 5},
+            {"role": "assistant", "content": "reply" * 20},
+            {"role": "user", "content": "now" * 5},
+        ]
+        with patch.object(Writer.Config, 'CHARS_PER_TOKEN_ESTIMATE', 1.0):
+            packed, changed = self.packer.pack_messages(messages, budget=80)
+        assert changed == 1
+        assert [m["role"] for m in packed] == ["system", "user", "assistant", "user"]
+        assert packed[2]["content"].endswith(" [...]") and len(packed[2]["content"]) < 100
+        assert packed[-1]["content"] == "now" * 5
+        assert messages[2]["content"] == "reply" * 20  # Input history is not modified
+
+    def test_retry_history_keeps_the_task_prompt(self):
+        messages = [
+            {"role": "system", "content": "s" * 10},
+            {"role": "user", "content": "T" * 100},
+            {"role": "assistant", "content": "{bad json 1" * 10},
+            {"role": "user", "content": "fix it 1" * 10},
+            {"role": "assistant", "content": "{bad json 2" * 10},
+            {"role": "user", "content": "fix it 2" * 10},
+        ]
+        with patch.object(Writer.Config, 'CHARS_PER_TOKEN_ESTIMATE', 1.0):
+            packed, changed = self.packer.pack_messages(messages, budget=350)
+        assert changed == 2
+        assert [m["content"][:5] for m in packed] == ["sssss", "TTTTT", "{bad ", "fix i"]
+        assert packed[2]["content"] == "{bad json 2" * 10
+        assert packed[1]["content"] == "T" * 100
+
+
+class TestChatResponsePacking:
+    """ChatResponse trims retry history that would overflow OLLAMA_CTX when PACK_CHAT_HISTORY is on"""
+
+    def _messages(self):
+        return [
+            {"role": "system", "content": "s" * 40},
+            {"role": "user", "content": "write the chapter"},
+            {"role": "assistant", "content": "y" * 4000},
+            {"role": "user", "content": "fix the JSON"},
+            {"role": "assistant", "content": "z" * 40},
+            {"role": "user", "content": "final question"},
+        ]
+
+    def _send(self, mock_logger, pack):
+        from Writer.Interface.Wrapper import Interface
+
+        interface = Interface(Models=[])
+        interface.TokenCounter = TokenCounter()
+        with patch.object(Writer.Config, 'OLLAMA_CTX', 1000), \
+                patch.object(Writer.Config, 'CONTEXT_RESPONSE_RESERVE_TOKENS', 200), \
+                patch.object(Writer.Config, 'CHARS_PER_TOKEN_ESTIMATE', 4.0), \
+                patch.object(Writer.Config, 'PACK_CHAT_HISTORY', pack), \
+                patch.object(interface, '_ollama_chat') as mock_chat:
+            mock_chat.side_effect = lambda *a: (a[3] + [{"role": "assistant", "content": "ok"}], None)
+            interface.ChatResponse(mock_logger(), self._messages(), "ollama://test", 1)
+        return mock_chat.call_args[0][3]
+
+    def test_failed_turns_are_dropped_before_sending(self, mock_logger):
+        sent_messages = self._send(mock_logger, True)
+
+        assert [m["role"] for m in sent_messages] == ["system", "user", "assistant", "user"]
+        assert sent_messages[1]["content"] == "write the chapter"
+        assert sent_messages[-1]["content"] == "final question"
+
+    def test_history_is_sent_unchanged_by_default(self, mock_logger):
+        assert self._send(mock_logger, False) == self._messages()
+
+
+class TestChapterContextBudget:
+    """_get_current_context_for_chapter_gen_pipeline_version with CHAPTER_CONTEXT_TOKEN_BUDGET"""
+
+    def test_dropped_blocks_are_logged_as_warnings(self):
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+
+        import Writer.Prompts as Prompts
+        from Writer.Pipeline import _get_current_context_for_chapter_gen_pipeline_version
+
+        config = SimpleNamespace(USE_HIERARCHICAL_MEMORY=False, CHAPTER_MEMORY_WORDS=500, CHAPTER_CONTEXT_TOKEN_BUDGET=50,
+                                 USE_LOREBOOK=False, EXPAND_OUTLINE=False, CHAPTER_STAGE1_WRITER_MODEL="model")
+        state = {
+            "completed_chapters_data": [{"number": 1, "title": "One", "text": "word " * 500}],
+            "total_chapters": 5,
+            "full_outline": "outline",
+        }
+        logger = MagicMock()
+
+        with patch.object(Writer.Config, 'CHARS_PER_TOKEN_ESTIMATE', 4.0):
+            context = _get_current_context_for_chapter_gen_pipeline_version(
+                logger, config, MagicMock(), Prompts, state, 2, "base context"
+            )
+
+        assert "word word" not in context
+        assert any("Dropped 1" in c.args[0] and c.args[1] == 7 for c in logger.Log.call_args_list)
@@ -56,7 +56,7 @@ class TestGenerateEmbedding:
         """Test Ollama embedding generation with mocked client - GREEN phase"""
         # Mock the ollama client
         mock_client = Mock()
-        mock_client.embeddings.return_value = {"embedding": [0.1, 0.2, 0.3]}
+        mock_client.embed.return_value = {"embeddings": [[0.1, 0.2, 0.3]]}
         self.interface.Clients["ollama://nomic-embed-text"] = mock_client
 
         # Test embedding generation
@@ -66,9 +66,9 @@ class TestGenerateEmbedding:
 
         assert embeddings == [[0.1, 0.2, 0.3]]
         assert usage["completion_tokens"] == 0  # Check that completion tokens is 0
-        mock_client.embeddings.assert_called_with(
+        mock_client.embed.assert_called_with(
             model="nomic-embed-text",
-            prompt="test text"
+            input=["test text"]
         )
 
     def test_generate_embedding_unsupported_provider(self):
@@ -104,3 +104,45 @@ class TestEmbeddingConfig:
         assert Config.EMBEDDING_DIMENSIONS == 768
         assert Config.EMBEDDING_CTX == 8192
         assert Config.EMBEDDING_FALLBACK_ENABLED is False
+
+
+class TestBatchedEmbedding:
+    """GenerateEmbedding sends texts in batches instead of one request per text"""
+
+    def setup_method(self):
+        self.interface = Interface(Models=[])
+        self.mock_logger = Mock()
+        self.mock_logger.Log = Mock()
+
+    def test_batches_respect_item_limit(self):
+        with patch('Writer.Config.EMBEDDING_BATCH_SIZE', 2):
+            batches = self.interface._batch_texts_for_embedding(["a", "b", "c", "d", "e"])
+        assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
+    def test_batches_respect_token_budget(self):
+        with patch('Writer.Config.EMBEDDING_BATCH_SIZE', 100), \
+                patch('Writer.Config.EMBEDDING_BATCH_MAX_TOKENS', 10), \
+                patch('Writer.Config.CHARS_PER_TOKEN_ESTIMATE', 1, create=True):
+            batches = self.interface._batch_texts_for_embedding(["x" * 6, "y" * 6, "z" * 30])
+        assert batches == [["x" * 6], ["y" * 6], ["z" * 30]]
+
+    def test_ollama_sends_one_request_per_batch(self):
+        mock_client = Mock()
+        mock_client.embed.side_effect = lambda model, input: {"embeddings": [[float(len(t))] for t in input]}
+        self.interface.Clients["ollama://nomic-embed-text"] = mock_client
+
+        with patch('Writer.Config.EMBEDDING_BATCH_SIZE', 3):
+            embeddings, _ = self.interface.GenerateEmbedding(
+                self.mock_logger, ["a", "bb", "ccc", "dddd", "eeeee"], "ollama://nomic-embed-text"
+            )
+
+        assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert mock_client.embed.call_count == 2
+
+    def test_mismatched_batch_size_raises(self):
+        mock_client = Mock()
+        mock_client.embed.return_value = {"embeddings": [[0.1]]}
+        self.interface.Clients["ollama://nomic-embed-text"] = mock_client
+
+        with pytest.raises(Exception):
+            self.interface.GenerateEmbedding(self.mock_logger, ["a", "b"], "ollama://nomic-embed-text")
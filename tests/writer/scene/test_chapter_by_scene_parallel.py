@@ -0,0 +1,80 @@
+"""
+Tests for concurrent scene writing - London School Approach
+Scenes are written on a worker pool and reassembled in outline order.
+"""
+import threading
+from unittest.mock import patch
+
+from Writer.Chapter.ChapterCheckpoint import ChapterCheckpoint
+from Writer.Models import SceneOutline
+from Writer.Scene.SmoothSceneBoundaries import SmoothSceneBoundaries
+
+
+def _scene(num):
+    return SceneOutline(scene_number=num, setting=f"Setting {num}", characters_present=["Rian"],
+                        action=f"Rian explores part {num}", purpose="Advance plot", estimated_word_count=200)
+
+
+class TestParallelSceneWriting:
+    """SCENE_WRITING_WORKERS scenes are in flight at once"""
+
+    def test_scenes_run_concurrently_and_keep_outline_order(self, mock_interface, mock_logger, monkeypatch):
+        from Writer.Scene.ChapterByScene import ChapterByScene
+
+        monkeypatch.setattr("Writer.Config.SCENE_WRITING_WORKERS", 3)
+        monkeypatch.setattr("Writer.Config.SCENE_BOUNDARY_SMOOTHING", False)
+        all_started = threading.Barrier(3, timeout=5)  # Only passes if the three scenes overlap
+        save_threads = []
+        checkpoint = ChapterCheckpoint({}, save=lambda: save_threads.append(threading.current_thread()))
+
+        def write(iface, logger, scene_num, total, scene_obj, outline, context=""):
+            all_started.wait()
+            return f"Scene {scene_num} text"
+
+        with patch('Writer.Scene.ChapterByScene.Writer.Scene.ChapterOutlineToScenes.ChapterOutlineToScenes',
+                   return_value=[_scene(1), _scene(2), _scene(3)]), \
+                patch('Writer.Scene.ChapterByScene.Writer.Scene.SceneOutlineToScene.SceneOutlineToScene', side_effect=write):
+            result = ChapterByScene(mock_interface(), mock_logger(), 1, 2, "chapter outline", "story outline",
+                                    _Checkpoint=checkpoint)
+
+        assert result == "Scene 1 text\n\nScene 2 text\n\nScene 3 text\n\n"
+        assert [checkpoint.get(f"scene_{n}") for n in (1, 2, 3)] == ["Scene 1 text", "Scene 2 text", "Scene 3 text"]
+        assert set(save_threads) == {threading.current_thread()}
+
+    def test_boundary_smoothing_is_checkpointed(self, mock_interface, mock_logger, monkeypatch):
+        from Writer.Scene.ChapterByScene import ChapterByScene
+
+        monkeypatch.setattr("Writer.Config.SCENE_BOUNDARY_SMOOTHING", True)
+        checkpoint = ChapterCheckpoint({"scene_outlines": [_scene(1).model_dump(), _scene(2).model_dump()],
+                                        "scene_1": "One.", "scene_2": "Two."})
+
+        with patch('Writer.Scene.ChapterByScene.Writer.Scene.SmoothSceneBoundaries.SmoothSceneBoundaries',
+                   return_value=["One.", "Then, two."]) as smooth:
+            result = ChapterByScene(mock_interface(), mock_logger(), 1, 2, "chapter outline", "story outline",
+                                    _Checkpoint=checkpoint)
+
+        assert result == "One.\n\nThen, two.\n\n"
+        assert smooth.call_args.args[2] == ["One.", "Two."]
+        assert checkpoint.get("scene_boundaries") == ["One.", "Then, two."]
+
+
+class TestSmoothSceneBoundaries:
+    """Only the opening paragraph of each later scene is rewritten"""
+
+    def test_opening_paragraph_is_replaced(self, mock_interface, mock_logger):
+        iface = mock_interface()
+        iface.SafeGenerateJSON.return_value = ([], {"text": "Keesokan paginya, Rian kembali."}, {})
+        scenes = ["Rian tidur.\n\nMalam sunyi.", "Rian kembali.\n\nGua itu gelap."]
+
+        result = SmoothSceneBoundaries(iface, mock_logger(), scenes)
+
+        assert result == ["Rian tidur.\n\nMalam sunyi.", "Keesokan paginya, Rian kembali.\n\nGua itu gelap."]
+        prompt = iface.BuildUserQuery.call_args.args[0]
+        assert "Malam sunyi." in prompt and "Gua itu gelap." not in prompt
+
+    def test_runaway_rewrite_is_rejected(self, mock_interface, mock_logger):
+        iface = mock_interface()
+        iface.SafeGenerateJSON.return_value = ([], {"text": "x" * 1000}, {})
+        scenes = ["Satu.", "Dua."]
+
+        assert SmoothSceneBoundaries(iface, mock_logger(), scenes) == scenes
@@ -8,12 +8,21 @@ with paragraph breaks (\n\n) to prevent wall-of-text issues.
 
 import sys
 from unittest.mock import patch, MagicMock
+
+import pytest
+
 from Writer.Models import SceneOutline
 
 # Mock termcolor before imports
 sys.modules['termcolor'] = MagicMock()
 
 
+@pytest.fixture(autouse=True)
+def sequential_scenes(monkeypatch):
+    """The scripted scene texts are handed out in call order"""
+    monkeypatch.setattr("Writer.Config.SCENE_WRITING_WORKERS", 1)
+
+
 class TestSceneParagraphBreaks:
     """Test suite for scene concatenation with proper paragraph breaks."""
 
@@ -14,6 +14,12 @@ from Writer.Models import SceneOutline
 sys.modules['termcolor'] = MagicMock()
 
 
+@pytest.fixture(autouse=True)
+def sequential_scenes(monkeypatch):
+    """Scene metadata is collected in call order"""
+    monkeypatch.setattr("Writer.Config.SCENE_WRITING_WORKERS", 1)
+
+
 class TestScenePipelineIntegration:
     """Integration tests for full scene generation pipeline"""
 
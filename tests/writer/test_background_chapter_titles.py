@@ -0,0 +1,62 @@
+"""
+Tests for background chapter titles - London School Approach
+Titles are generated off the chapter loop and merged before post-processing.
+"""
+import threading
+from unittest.mock import MagicMock, patch
+
+
+def _run(pipeline, state, total_chapters, title):
+    with patch('Writer.Pipeline._get_current_context_for_chapter_gen_pipeline_version', return_value="context"), \
+            patch('Writer.Pipeline._get_outline_for_chapter_pipeline_version', return_value="outline"), \
+            patch('Writer.Pipeline._handle_chapter_title_generation_pipeline_version', side_effect=title):
+        return pipeline._write_chapters_stage(state, "state.json", total_chapters, "base")
+
+
+class TestBackgroundChapterTitles:
+    """_write_chapters_stage with BACKGROUND_CHAPTER_TITLES"""
+
+    def test_next_chapter_does_not_wait_for_title(self, story_pipeline):
+        chapter_two_started = threading.Event()
+        generator = MagicMock()
+
+        def generate(*args, **kwargs):
+            if args[2] == 2:
+                chapter_two_started.set()
+            return f"text {args[2]}"
+
+        def title(*args):
+            # Chapter 1's title only finishes once chapter 2 is being written
+            if args[5] == 1:
+                assert chapter_two_started.wait(timeout=5)
+            return f"Title {args[5]}"
+
+        generator.GenerateChapter.side_effect = generate
+        state = {"completed_chapters_data": [], "next_chapter_index": 1}
+        chapters = _run(story_pipeline(generator, BACKGROUND_CHAPTER_TITLES=True), state, 2, title)
+
+        assert [c["title"] for c in chapters] == ["Title 1", "Title 2"]
+        assert all("title_pending" not in c for c in chapters)
+
+    def test_pending_titles_are_regenerated_on_resume(self, story_pipeline):
+        generator = MagicMock()
+        generator.GenerateChapter.side_effect = lambda *args, **kwargs: f"text {args[2]}"
+        state = {
+            "completed_chapters_data": [{"number": 1, "title": "Chapter 1", "text": "text 1", "title_pending": True}],
+            "next_chapter_index": 2,
+        }
+        chapters = _run(story_pipeline(generator, BACKGROUND_CHAPTER_TITLES=True), state, 2, lambda *args: f"Title {args[5]} of {args[4]}")
+
+        assert [c["title"] for c in chapters] == ["Title 1 of text 1", "Title 2 of text 2"]
+
+    def test_pending_titles_finish_when_no_chapters_are_left(self, story_pipeline):
+        generator = MagicMock()
+        state = {
+            "completed_chapters_data": [{"number": 1, "title": "Chapter 1", "text": "text 1", "title_pending": True}],
+            "next_chapter_index": 2,
+        }
+        chapters = _run(story_pipeline(generator, BACKGROUND_CHAPTER_TITLES=True), state, 1, lambda *args: "Resumed Title")
+
+        assert chapters[0]["title"] == "Resumed Title"
+        assert "title_pending" not in chapters[0]
+        generator.GenerateChapter.assert_not_called()
@@ -85,10 +85,11 @@ class TestBaseContextExtractionHelper:
 class TestBaseContextGeneration:
     """Test that GenerateOutline uses SafeGenerateJSON for base context."""
 
-    def test_uses_safe_generate_json(self, mock_interface, mock_logger):
+    def test_uses_safe_generate_json(self, mock_interface, mock_logger, monkeypatch):
         """Test that SafeGenerateJSON is called instead of SafeGeneratePydantic"""
         # Arrange
         mock_int = mock_interface()
+        monkeypatch.setattr('Writer.Config.REVIEW_WORKERS', 1)  # Scripted responses need a fixed call order
         mock_log = mock_logger()
 
         # Configure mocks for the complete flow
@@ -127,12 +128,6 @@ class TestBaseContextGeneration:
                 MagicMock(feedback="Good feedback"),
                 {'prompt_tokens': 50}
             ),
-            # OutlineCompleteSchema (iteration 1) - not ready yet
-            (
-                [{'role': 'assistant'}],
-                MagicMock(IsComplete=False),
-                {'prompt_tokens': 20}
-            ),
             # Revised outline (iteration 1)
             (
                 [{'role': 'assistant'}],
@@ -173,10 +168,11 @@ class TestBaseContextGeneration:
                 # Make sure BaseContext is NOT in the calls
                 assert 'BaseContext' not in str(args[3].__name__ if hasattr(args[3], '__name__') else args[3])
 
-    def test_extraction_from_json_response(self, mock_interface, mock_logger):
+    def test_extraction_from_json_response(self, mock_interface, mock_logger, monkeypatch):
         """Test that context is extracted from JSON response correctly"""
         # Arrange
         mock_int = mock_interface()
+        monkeypatch.setattr('Writer.Config.REVIEW_WORKERS', 1)  # Scripted responses need a fixed call order
         mock_log = mock_logger()
         context_text = "Expected context from JSON"
 
@@ -212,12 +208,6 @@ class TestBaseContextGeneration:
                 MagicMock(feedback="Good feedback"),
                 {'prompt_tokens': 50}
             ),
-            # OutlineCompleteSchema (iteration 1) - not ready yet
-            (
-                [{'role': 'assistant'}],
-                MagicMock(IsComplete=False),
-                {'prompt_tokens': 20}
-            ),
             # Revised outline (iteration 1)
             (
                 [{'role': 'assistant'}],
@@ -250,10 +240,11 @@ class TestBaseContextGeneration:
         # Assert
         assert context_text in base_context
 
-    def test_generates_log_messages(self, mock_interface, mock_logger):
+    def test_generates_log_messages(self, mock_interface, mock_logger, monkeypatch):
         """Test that appropriate log messages are generated"""
         # Arrange
         mock_int = mock_interface()
+        monkeypatch.setattr('Writer.Config.REVIEW_WORKERS', 1)  # Scripted responses need a fixed call order
         mock_log = mock_logger()
 
         mock_int.SafeGenerateJSON.side_effect = [
@@ -288,12 +279,6 @@ class TestBaseContextGeneration:
                 MagicMock(feedback="Good feedback"),
                 {'prompt_tokens': 50}
             ),
-            # OutlineCompleteSchema (iteration 1) - not ready yet
-            (
-                [{'role': 'assistant'}],
-                MagicMock(IsComplete=False),
-                {'prompt_tokens': 20}
-            ),
             # Revised outline (iteration 1)
             (
                 [{'role': 'assistant'}],
@@ -0,0 +1,81 @@
+"""
+Tests for the content-addressed chapter store - London School Approach
+State keeps chapter text hashes; texts are read from blobs on demand.
+"""
+import json
+import os
+from unittest.mock import patch
+
+from Writer.ChapterStore import ChapterStore, StoredChapter
+from Writer.StateManager import serialize_for_json
+
+
+class TestChapterStore:
+    """Blobs are written once per distinct text"""
+
+    def test_identical_texts_share_one_blob(self, tmp_path):
+        store = ChapterStore(str(tmp_path))
+        first = store.put("Rian memasuki gua.")
+        second = store.put("Rian memasuki gua.")
+
+        assert first == second
+        assert len(list(tmp_path.rglob("*.txt"))) == 1
+        assert ChapterStore(str(tmp_path)).get(first) == "Rian memasuki gua."
+
+    def test_inline_replaces_references_with_text(self, tmp_path):
+        store = ChapterStore(str(tmp_path))
+        info = {"EditedChaptersData": [{"number": 1, "text_ref": store.put("edited")}], "Title": "T"}
+
+        assert store.inline(info) == {"EditedChaptersData": [{"number": 1, "text": "edited"}], "Title": "T"}
+
+
+class TestStoredChapter:
+    """StoredChapter behaves like a chapter dict but serializes only the hash"""
+
+    def test_text_is_read_on_demand_and_serialized_as_reference(self, tmp_path):
+        store = ChapterStore(str(tmp_path), cache_size=0)
+        chapter = store.wrap({"number": 1, "title": "Awal", "text": "Isi bab."})
+
+        assert chapter["text"] == "Isi bab."
+        assert chapter.get("text", "") == "Isi bab."
+        assert "text" in chapter
+        serialized = json.loads(json.dumps(serialize_for_json({"completed_chapters_data": [chapter]})))
+        assert serialized == {"completed_chapters_data": [{"number": 1, "title": "Awal", "text_ref": store.put("Isi bab.")}]}
+
+    def test_copy_with_new_text_keeps_original_version(self, tmp_path):
+        store = ChapterStore(str(tmp_path))
+        original = store.wrap({"number": 1, "text": "raw"})
+
+        edited = original.copy()
+        edited["text"] = "edited"
+
+        assert isinstance(edited, StoredChapter)
+        assert original["text"] == "raw" and edited["text"] == "edited"
+        assert edited["number"] == 1
+
+    def test_attach_wraps_loaded_references(self, tmp_path):
+        store = ChapterStore(str(tmp_path))
+        loaded = [{"number": 1, "text_ref": store.put("from disk")}]
+
+        store.attach(loaded)
+        assert loaded[0]["text"] == "from disk"
+
+
+class TestPipelineChapterStore:
+    """_write_chapters_stage stores chapter texts as blobs when CHAPTER_BLOB_STORE is on"""
+
+    def test_written_chapters_are_stored_by_reference(self, tmp_path, story_pipeline):
+        pipeline = story_pipeline(CHAPTER_BLOB_STORE=True)
+        pipeline.ChapterGenerator.GenerateChapter.side_effect = lambda *args, **kwargs: f"text {args[2]}"
+
+        state = {"completed_chapters_data": [], "next_chapter_index": 1}
+        state_filepath = str(tmp_path / "run.state.json")
+        with patch('Writer.Pipeline._get_current_context_for_chapter_gen_pipeline_version', return_value="context"), \
+                patch('Writer.Pipeline._get_outline_for_chapter_pipeline_version', return_value="outline"), \
+                patch('Writer.Pipeline._handle_chapter_title_generation_pipeline_version', return_value="Title"):
+            chapters = pipeline._write_chapters_stage(state, state_filepath, 2, "base")
+
+        assert [c["text"] for c in chapters] == ["text 1", "text 2"]
+        serialized = serialize_for_json(state["completed_chapters_data"])
+        assert all("text" not in c and "text_ref" in c for c in serialized)
+        assert os.path.isdir(tmp_path / "chapters")
@@ -0,0 +1,74 @@
+"""
+Tests for the pre-run estimator - London School Approach
+Calibration from previous runs' logs and an offline walk of the pipeline.
+"""
+import os
+
+import pytest
+
+from Writer.Estimator import CostModel, EstimateRun, FormatEstimate
+
+
+def _write_log(log_root, run, lines):
+    run_dir = os.path.join(log_root, run)
+    os.makedirs(run_dir, exist_ok=True)
+    with open(os.path.join(run_dir, "Main.log"), "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _response_line(model, seconds, prompt_tokens, completion_tokens):
+    return (f"[ 4] [2025-01-01 10:00:00] Response for {model} in {seconds}s (12.0 tok/s). "
+            f"Tokens: {{'prompt_tokens': {prompt_tokens}, 'completion_tokens': {completion_tokens}}}")
+
+
+class TestCostModel:
+    """Latency fit per model from Wrapper response log lines"""
+
+    def test_parse_line_skips_offline_providers(self):
+        assert CostModel.parse_line(_response_line("ollama://qwen3:8b", 4.5, 100, 50)) == ("ollama://qwen3:8b", 100, 50, 4.5)
+        assert CostModel.parse_line(_response_line("mock://bench", 0.1, 100, 50)) is None
+        assert CostModel.parse_line("[ 5] Generating outline") is None
+
+    def test_fit_recovers_overhead_prefill_and_decode_rates(self, tmp_path):
+        samples = [(100, 50), (2000, 100), (500, 800), (4000, 400), (300, 1200), (1500, 600)]
+        _write_log(str(tmp_path), "Generation_1", [
+            _response_line("ollama://qwen3:8b", round(2 + p / 1000 + c / 20, 3), p, c) for p, c in samples
+        ])
+
+        model = CostModel.from_logs(str(tmp_path))
+
+        assert model.is_calibrated("ollama://qwen3:8b")
+        assert model.seconds("ollama://qwen3:8b", 1000, 200) == pytest.approx(2 + 1 + 10, rel=1e-3)
+        assert model.mean_completion_tokens("ollama://qwen3:8b") == pytest.approx(525)
+
+    def test_unseen_model_uses_pooled_history(self):
+        model = CostModel({"ollama://a": [(0, 100, 10.0)]})
+
+        assert not model.is_calibrated("ollama://b")
+        assert model.seconds("ollama://b", 0, 50) == pytest.approx(5.0)
+
+
+class TestEstimateRun:
+    """The pipeline is walked on mock models and attributed back to the configured ones"""
+
+    def test_worst_case_costs_more_and_config_is_restored(self, tmp_path, monkeypatch):
+        import Writer.Config
+        import Writer.Prompts
+
+        monkeypatch.setattr(Writer.Config, "USE_LOREBOOK", False)
+        for name in [n for n in dir(Writer.Config) if n.endswith("_MODEL") and n != "EMBEDDING_MODEL"]:
+            monkeypatch.setattr(Writer.Config, name, "ollama://writer")
+        monkeypatch.setattr(Writer.Config, "TRANSLATE_PROMPT_LANGUAGE", "")
+        _write_log(str(tmp_path), "Generation_1", [_response_line("ollama://writer", 10.0, 1000, 400)])
+
+        report = EstimateRun("A short story about a lighthouse keeper.", Writer.Prompts, Chapters=1, LogRoot=str(tmp_path))
+
+        expected, worst = report["expected"], report["worst_case"]
+        assert set(expected["models"]) == {"ollama://writer"}
+        assert report["calibrated_models"] == ["ollama://writer"]
+        assert {"outline", "write_chapters", "post_processing"} <= set(expected["stages"])
+        assert worst["total"]["calls"] > expected["total"]["calls"] > 0
+        assert expected["models"]["ollama://writer"]["completion_tokens"] == 400 * expected["total"]["calls"]
+        assert Writer.Config.INITIAL_OUTLINE_WRITER_MODEL == "ollama://writer"
+        assert Writer.Config.LOG_DIRECTORY == "Logs"
+        assert "Worst case" in FormatEstimate(report)
@@ -63,13 +63,14 @@ class TestInitialOutlinePromptFormat:
 class TestInitialOutlineGeneration:
     """Test that GenerateOutline uses SafeGeneratePydantic for OutlineOutput correctly."""
 
-    def test_initial_outline_uses_pydantic_model(self, mock_interface, mock_logger):
+    def test_initial_outline_uses_pydantic_model(self, mock_interface, mock_logger, monkeypatch):
         """Test that SafeGeneratePydantic is called with OutlineOutput model"""
         # Arrange
         from Writer.OutlineGenerator import GenerateOutline
         from Writer.Models import StoryElements, OutlineOutput
 
         mock_int = mock_interface()
+        monkeypatch.setattr('Writer.Config.REVIEW_WORKERS', 1)  # Scripted responses need a fixed call order
         mock_log = mock_logger()
 
         # Mock SafeGenerateJSON for base context
@@ -116,8 +117,6 @@ class TestInitialOutlineGeneration:
             ([{'role': 'assistant'}], outline_output, {'prompt_tokens': 200}),
             # Review feedback (iteration 1)
             ([{'role': 'assistant'}], MagicMock(feedback="Good"), {'prompt_tokens': 50}),
-            # Outline complete check (iteration 1) - not ready yet
-            ([{'role': 'assistant'}], MagicMock(IsComplete=False), {'prompt_tokens': 20}),
             # Revised outline (iteration 1)
             ([{'role': 'assistant'}], outline_output, {'prompt_tokens': 150}),
             # Review feedback (iteration 2)
@@ -0,0 +1,104 @@
+"""
+Tests for bounded ordered fan-out and concurrent outline expansion - London School Approach
+"""
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from Writer.Parallel import map_ordered, resolve_workers
+
+
+class TestMapOrdered:
+    """Results keep input order; callbacks run on the calling thread"""
+
+    def test_results_are_in_input_order(self):
+        def slow_first(item):
+            time.sleep(0.05 if item == 0 else 0)
+            return item * 10
+
+        assert map_ordered(slow_first, range(4), max_workers=4) == [0, 10, 20, 30]
+
+    def test_calls_overlap_up_to_max_workers(self):
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def track(_item):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+        map_ordered(track, range(6), max_workers=3)
+        assert peak[0] == 3
+
+    def test_on_result_runs_on_calling_thread(self):
+        caller = threading.current_thread()
+        seen = []
+        map_ordered(lambda item: item, range(3), max_workers=3,
+                    on_result=lambda index, result: seen.append((index, threading.current_thread() is caller)))
+        assert sorted(seen) == [(0, True), (1, True), (2, True)]
+
+    def test_single_worker_runs_inline_in_order(self):
+        order = []
+        map_ordered(order.append, ["a", "b", "c"], max_workers=1)
+        assert order == ["a", "b", "c"]
+
+    def test_first_error_is_raised(self):
+        def fail_on_two(item):
+            if item == 2:
+                raise ValueError("boom")
+            return item
+
+        with pytest.raises(ValueError, match="boom"):
+            map_ordered(fail_on_two, range(4), max_workers=2)
+
+    def test_resolve_workers_rejects_invalid_values(self):
+        assert resolve_workers(SimpleNamespace(W=3), "W") == 3
+        assert resolve_workers(SimpleNamespace(W=0), "W") == 1
+        assert resolve_workers(SimpleNamespace(W=MagicMock()), "W", 2) == 2
+        assert resolve_workers(SimpleNamespace(), "W") == 1
+
+
+class TestConcurrentOutlineExpansion:
+    """StoryPipeline._expand_chapter_outlines_stage fans out and checkpoints per chapter"""
+
+    def _pipeline(self, story_pipeline, workers, refinement=False):
+        pipeline = story_pipeline(ENABLE_GLOBAL_OUTLINE_REFINEMENT=refinement, OUTLINE_EXPANSION_WORKERS=workers)
+        pipeline.OutlineGenerator = MagicMock()
+        pipeline.OutlineGenerator.GeneratePerChapterOutline.side_effect = (
+            lambda _iface, _log, idx, _total, outline: (f"outline {idx} from {outline}", f"Title {idx}"))
+        pipeline.saved = []
+        pipeline._save_state_wrapper = lambda state, _path: pipeline.saved.append(list(state["expanded_chapter_outlines"]))
+        return pipeline
+
+    def test_outlines_are_ordered_and_checkpointed(self, story_pipeline):
+        pipeline = self._pipeline(story_pipeline, workers=3)
+        state = {"last_completed_step": "detect_chapters"}
+
+        outlines = pipeline._expand_chapter_outlines_stage(state, "global", 4, "state.json")
+
+        assert [o["title"] for o in outlines] == ["Title 1", "Title 2", "Title 3", "Title 4"]
+        assert state["last_completed_step"] == "expand_chapters"
+        # One checkpoint per chapter, then the stage completion save
+        assert len(pipeline.saved) == 5
+        assert [sum(1 for o in snapshot if o) for snapshot in pipeline.saved[:4]] == [1, 2, 3, 4]
+
+    def test_resume_skips_checkpointed_chapters_and_refinement(self, story_pipeline):
+        pipeline = self._pipeline(story_pipeline, workers=2, refinement=True)
+        state = {
+            "last_completed_step": "refine_global_outline",
+            "refined_global_outline": "refined",
+            "expanded_chapter_outlines": [{"text": "kept", "title": "Kept"}, None, None],
+        }
+
+        outlines = pipeline._expand_chapter_outlines_stage(state, "refined", 3, "state.json")
+
+        generated = [call.args[2] for call in pipeline.OutlineGenerator.GeneratePerChapterOutline.call_args_list]
+        assert sorted(generated) == [2, 3]
+        assert outlines[0]["title"] == "Kept"
+        assert outlines[2]["text"] == "outline 3 from refined"
+        pipeline.OutlineGenerator.ReviseOutline.assert_not_called()
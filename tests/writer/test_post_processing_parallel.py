@@ -0,0 +1,85 @@
+"""
+Tests for concurrent edit, scrub and translate passes - London School Approach
+"""
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+def _interface(fail_marker=None, barrier=None):
+    """Interface whose SafeGeneratePydantic echoes the first chapter marker found in the prompt"""
+    interface = MagicMock()
+    interface.BuildUserQuery.side_effect = lambda prompt: {"role": "user", "content": prompt}
+
+    def generate(_logger, messages, _model, _pydantic, _SeedOverride=-1):
+        prompt = messages[-1]["content"]
+        if barrier is not None:
+            barrier.wait(timeout=5)
+        marker = next(word for word in prompt.split() if word.startswith("CH") and word[2:].isdigit())
+        if fail_marker and fail_marker in prompt:
+            raise RuntimeError("model down")
+        return messages, SimpleNamespace(text=f"done {marker} seed {_SeedOverride}"), {}
+
+    interface.SafeGeneratePydantic.side_effect = generate
+    return interface
+
+
+CHAPTERS = ["CH1 text", "CH2 text", "CH3 text"]
+
+
+@pytest.fixture
+def config(monkeypatch):
+    import Writer.Config as Config
+    monkeypatch.setattr(Config, "POST_PROCESSING_WORKERS", 3)
+    monkeypatch.setattr(Config, "SEED", 100)
+    return Config
+
+
+class TestParallelScrubAndTranslate:
+    """Chapters run concurrently with per-chapter seeds and failure isolation"""
+
+    def test_scrub_runs_chapters_concurrently_in_order(self, config, mock_logger):
+        from Writer.Scrubber import ScrubNovel
+
+        # All three calls must be in flight at once to pass the barrier
+        result = ScrubNovel(_interface(barrier=threading.Barrier(3)), mock_logger(), list(CHAPTERS), 3)
+        assert result == ["done CH1 seed 101", "done CH2 seed 102", "done CH3 seed 103"]
+
+    def test_scrub_failure_keeps_input_chapter(self, config, mock_logger):
+        from Writer.Scrubber import ScrubNovel
+
+        result = ScrubNovel(_interface(fail_marker="CH2"), mock_logger(), list(CHAPTERS), 3)
+        assert result == ["done CH1 seed 101", "CH2 text", "done CH3 seed 103"]
+
+    def test_translate_failure_keeps_input_chapter(self, config, mock_logger):
+        from Writer.Translator import TranslateNovel
+
+        result = TranslateNovel(_interface(fail_marker="CH3"), mock_logger(), list(CHAPTERS), 3, "English", "Indonesian")
+        assert result == ["done CH1 seed 101", "done CH2 seed 102", "CH3 text"]
+
+    def test_seeds_do_not_depend_on_worker_count(self, config, mock_logger, monkeypatch):
+        from Writer.Translator import TranslateNovel
+
+        parallel = TranslateNovel(_interface(), mock_logger(), list(CHAPTERS), 3, "English")
+        monkeypatch.setattr(config, "POST_PROCESSING_WORKERS", 1)
+        sequential = TranslateNovel(_interface(), mock_logger(), list(CHAPTERS), 3, "English")
+        assert parallel == sequential
+
+
+class TestParallelEdit:
+    """EditNovel edits from the original chapters and isolates failures"""
+
+    def test_edit_uses_original_neighbours_and_isolates_failures(self, config, mock_logger):
+        from Writer import NovelEditor
+
+        interface = _interface(fail_marker='number="3"')
+        with patch.object(NovelEditor, "validate_chapter_editing", return_value=(True, {})):
+            result = NovelEditor.EditNovel(interface, mock_logger(), list(CHAPTERS), "outline", 3)
+
+        assert result[2] == "CH3 text"
+        prompts = [call.args[1][-1]["content"] for call in interface.SafeGeneratePydantic.call_args_list]
+        # Chapter 2 sees the original text of both neighbours
+        chapter2_prompt = next(p for p in prompts if 'number="2"' in p)
+        assert "CH1 text" in chapter2_prompt and "CH3 text" in chapter2_prompt
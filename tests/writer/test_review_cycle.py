@@ -0,0 +1,68 @@
+"""
+Tests for revision-loop review calls - London School Approach
+Only the evaluator calls an iteration can use are made.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from Writer.Chapter.ChapterGenerator import _run_final_chapter_revision_loop
+from Writer.ReviewCycle import ReviewChapter, ReviewOutline
+
+
+def _editor():
+    editor = MagicMock()
+    editor.GetFeedbackOnChapter.return_value = "feedback"
+    editor.GetChapterRating.return_value = False
+    editor.GetCombinedReviewOnChapter.return_value = ("combined feedback", True)
+    editor.GetFeedbackOnOutline.return_value = "outline feedback"
+    editor.GetOutlineRating.return_value = True
+    return editor
+
+
+class TestReviewCycle:
+    """Feedback and decision calls per iteration"""
+
+    def test_separate_calls_return_feedback_and_rating(self, mock_logger):
+        editor = _editor()
+        config = SimpleNamespace(COMBINED_REVIEW_MODE=False, REVIEW_WORKERS=2)
+
+        result = ReviewOutline(editor, MagicMock(), mock_logger(), "outline", _Config=config)
+
+        assert result == ("outline feedback", True)
+        editor.GetCombinedReviewOnOutline.assert_not_called()
+
+    def test_combined_mode_makes_one_call(self, mock_logger):
+        editor = _editor()
+        config = SimpleNamespace(COMBINED_REVIEW_MODE=True)
+
+        result = ReviewChapter(editor, MagicMock(), mock_logger(), "chapter", "outline", _Config=config)
+
+        assert result == ("combined feedback", True)
+        editor.GetFeedbackOnChapter.assert_not_called()
+        editor.GetChapterRating.assert_not_called()
+
+    def test_unneeded_calls_are_skipped(self, mock_logger):
+        editor = _editor()
+        config = SimpleNamespace(COMBINED_REVIEW_MODE=True)
+
+        assert ReviewChapter(editor, MagicMock(), mock_logger(), "c", "o", _NeedFeedback=False, _Config=config) == (None, False)
+        assert ReviewChapter(editor, MagicMock(), mock_logger(), "c", "o", _NeedRating=False, _Config=config) == ("feedback", None)
+        editor.GetCombinedReviewOnChapter.assert_not_called()
+
+
+class TestChapterRevisionLoopReviews:
+    """_run_final_chapter_revision_loop asks only for what each iteration uses"""
+
+    def test_no_feedback_at_revision_cap_and_no_rating_before_minimum(self, mock_logger):
+        editor = _editor()
+        config = SimpleNamespace(CHAPTER_MIN_REVISIONS=1, CHAPTER_MAX_REVISIONS=2, COMBINED_REVIEW_MODE=False, REVIEW_WORKERS=1)
+        revise = MagicMock(side_effect=lambda *args, **kwargs: (f"revision {kwargs['_Iteration']}", []))
+
+        result = _run_final_chapter_revision_loop(
+            MagicMock(), mock_logger(), MagicMock(), 1, 3, "draft", "outline", [], config, editor, revise
+        )
+
+        assert result == "revision 2"
+        assert revise.call_count == 2
+        assert editor.GetFeedbackOnChapter.call_count == 2  # Iterations 1 and 2; iteration 3 hits the cap
+        assert editor.GetChapterRating.call_count == 2  # Iterations 2 and 3; iteration 1 must revise anyway
@@ -0,0 +1,195 @@
+"""
+Tests for the rolling hierarchical story memory - London School Approach
+Chapter summaries roll up into arcs and the story so far; the rendered memory fits a token budget.
+"""
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import Writer.Prompts as Prompts
+from Writer.StoryMemory import StoryMemory
+
+
+@pytest.fixture(autouse=True)
+def small_arcs(monkeypatch):
+    monkeypatch.setattr("Writer.Config.STORY_MEMORY_ARC_SIZE", 2)
+    monkeypatch.setattr("Writer.Config.STORY_MEMORY_SUMMARY_WORDS", 5)
+
+
+def _interface(mock_interface):
+    interface = mock_interface()
+    interface.SafeGenerateJSON.side_effect = lambda _log, messages, _model: ([], {"summary": f"rolled {len(messages)}"}, {})
+    return interface
+
+
+def _count_words(text):
+    return len(text.split())
+
+
+class TestStoryMemoryRollUp:
+    """add_chapter keeps a bounded number of summaries"""
+
+    def test_oldest_chapters_roll_into_an_arc(self, mock_interface, mock_logger):
+        interface = _interface(mock_interface)
+        memory = StoryMemory()
+
+        for number in (1, 2, 3):
+            memory.add_chapter(interface, mock_logger(), Prompts, number, f"summary {number}")
+
+        assert memory.data["arcs"] == [{"first": 1, "last": 2, "summary": "rolled 2"}]
+        assert memory.data["chapters"] == [{"number": 3, "summary": "summary 3"}]
+        assert memory.last_chapter() == 3
+        prompt = interface.BuildUserQuery.call_args.args[0]
+        assert "summary 1" in prompt and "summary 2" in prompt and "summary 3" not in prompt
+
+    def test_old_arcs_fold_into_the_story_so_far(self, mock_interface, mock_logger):
+        interface = _interface(mock_interface)
+        data = {}
+        for number in range(1, 8):
+            StoryMemory(data).add_chapter(interface, mock_logger(), Prompts, number, f"summary {number}")
+
+        memory = StoryMemory(data)
+        assert memory.data["story_so_far"] == {"last": 4, "summary": "rolled 2"}
+        assert [(arc["first"], arc["last"]) for arc in memory.data["arcs"]] == [(5, 6)]
+        assert [chapter["number"] for chapter in memory.data["chapters"]] == [7]
+
+    def test_failed_roll_up_keeps_a_truncated_concatenation(self, mock_interface, mock_logger):
+        interface = mock_interface()
+        interface.SafeGenerateJSON.side_effect = RuntimeError("model down")
+        memory = StoryMemory()
+
+        for number in (1, 2, 3):
+            memory.add_chapter(interface, mock_logger(), Prompts, number, f"first summary number {number}")
+
+        assert memory.data["arcs"][0]["summary"] == "first summary number 1 first"
+
+
+class TestStoryMemoryRender:
+    """render() fits the memory into the token budget"""
+
+    def _memory(self):
+        return StoryMemory({
+            "chapters": [{"number": 5, "summary": "five " * 10}, {"number": 6, "summary": "six " * 10}],
+            "arcs": [{"first": 3, "last": 4, "summary": "arc " * 10}],
+            "story_so_far": {"last": 2, "summary": "start " * 10},
+        })
+
+    def test_everything_in_story_order_when_it_fits(self):
+        rendered = self._memory().render(Prompts, 1000, _count_words)
+
+        assert rendered.index("Story So Far") < rendered.index("Chapters 3-4") < rendered.index("Chapter 5") < rendered.index("Chapter 6")
+
+    def test_newest_chapter_and_story_so_far_survive_a_small_budget(self):
+        rendered = self._memory().render(Prompts, 30, _count_words)
+
+        assert "Chapter 6 Summary" in rendered and "Story So Far" in rendered
+        assert "Chapters 3-4" not in rendered and "Chapter 5 Summary" not in rendered
+        assert _count_words(rendered) <= 30
+
+    def test_later_chapters_are_left_out(self):
+        rendered = self._memory().render(Prompts, 1000, _count_words, _BeforeChapter=6)
+
+        assert "Chapter 5 Summary" in rendered and "Chapter 6 Summary" not in rendered
+
+
+class TestChapterContextWithStoryMemory:
+    """_get_current_context_for_chapter_gen_pipeline_version with USE_HIERARCHICAL_MEMORY"""
+
+    def test_memory_replaces_previous_chapter_tail(self):
+        from Writer.Pipeline import _get_current_context_for_chapter_gen_pipeline_version
+
+        config = SimpleNamespace(USE_HIERARCHICAL_MEMORY=True, STORY_MEMORY_TOKEN_BUDGET=1000, CHAPTER_MEMORY_WORDS=250,
+                                 CHAPTER_CONTEXT_TOKEN_BUDGET=0, USE_LOREBOOK=False, EXPAND_OUTLINE=False,
+                                 CHAPTER_STAGE1_WRITER_MODEL="model")
+        state = {
+            "completed_chapters_data": [{"number": 1, "title": "One", "text": "tail words of chapter one"}],
+            "story_memory": {"chapters": [{"number": 1, "summary": "Rian found the cave."}]},
+            "full_outline": "outline",
+        }
+        statistics = MagicMock()
+        statistics.GetWordCount.return_value = 100
+
+        context = _get_current_context_for_chapter_gen_pipeline_version(
+            MagicMock(), config, statistics, Prompts, state, 2, "base context"
+        )
+
+        assert "Rian found the cave." in context
+        assert "tail words of chapter one" not in context
+
+
+class TestPipelineStoryMemory:
+    """_write_chapters_stage updates the story memory on the summary thread"""
+
+    @pytest.fixture
+    def memory_pipeline(self, story_pipeline):
+        pipeline = story_pipeline(USE_HIERARCHICAL_MEMORY=True, PRECOMPUTE_CHAPTER_SUMMARIES=True, STORY_MEMORY_ARC_SIZE=4)
+        pipeline.ActivePrompts = Prompts
+        pipeline.ChapterGenerator.GenerateChapter.side_effect = lambda *args, **kwargs: f"text {args[2]}"
+        pipeline.ChapterGenerator.SummarizeChapter.side_effect = lambda _iface, _log, _outline, text, num, total: f"summary of {text}"
+        return pipeline
+
+    def _run(self, pipeline, state, total_chapters, context):
+        with patch('Writer.Pipeline._get_current_context_for_chapter_gen_pipeline_version', side_effect=context), \
+                patch('Writer.Pipeline._get_outline_for_chapter_pipeline_version', return_value="outline"), \
+                patch('Writer.Pipeline._handle_chapter_title_generation_pipeline_version', return_value="Title"):
+            pipeline._write_chapters_stage(state, "state.json", total_chapters, "base")
+
+    def test_context_waits_for_memory_through_two_chapters_back(self, memory_pipeline):
+        remembered = []
+        context_four_built = threading.Event()
+        add_chapter = StoryMemory.add_chapter
+
+        def slow_add_chapter(memory, interface, logger, prompts, number, summary):
+            # Chapter 3's memory update only finishes once chapter 4's context is built
+            if number == 3:
+                assert context_four_built.wait(timeout=5)
+            add_chapter(memory, interface, logger, prompts, number, summary)
+
+        def context(_logger, _config, _stats, _prompts, state, chapter_num, _base, lorebook=None):
+            remembered.append([chapter["number"] for chapter in state["story_memory"].get("chapters", [])])
+            if chapter_num == 4:
+                context_four_built.set()
+            return f"context {chapter_num}"
+
+        state = {"completed_chapters_data": [], "next_chapter_index": 1}
+        with patch.object(StoryMemory, 'add_chapter', slow_add_chapter):
+            self._run(memory_pipeline, state, 4, context)
+
+        assert remembered == [[], [], [1], [1, 2]]
+        assert [chapter["number"] for chapter in state["story_memory"]["chapters"]] == [1, 2, 3, 4]
+
+    def test_resume_adds_written_chapters_to_the_memory(self, memory_pipeline):
+        pipeline = memory_pipeline
+        state = {
+            "completed_chapters_data": [
+                {"number": 1, "title": "One", "text": "text 1", "summary": "stored summary 1"},
+                {"number": 2, "title": "Two", "text": "text 2"},
+            ],
+            "next_chapter_index": 3,
+        }
+
+        self._run(pipeline, state, 3, lambda *args, **kwargs: "context")
+
+        assert state["story_memory"]["chapters"] == [
+            {"number": 1, "summary": "stored summary 1"},
+            {"number": 2, "summary": "summary of text 2"},
+            {"number": 3, "summary": "summary of text 3"},
+        ]
+        summarized = [call.args[3] for call in pipeline.ChapterGenerator.SummarizeChapter.call_args_list]
+        assert "text 1" not in summarized
+
+    def test_later_updates_stay_pending_even_when_finished(self, memory_pipeline):
+        from concurrent.futures import Future
+
+        first, second = Future(), Future()
+        first.set_result({"chapters": [{"number": 1, "summary": "one"}]})
+        second.set_result({"chapters": [{"number": 1, "summary": "one"}, {"number": 2, "summary": "two"}]})
+        pending = [(1, first), (2, second)]
+        state = {"story_memory": {}}
+
+        memory_pipeline._collect_story_memory(pending, state, "state.json", 1)
+
+        assert state["story_memory"] == {"chapters": [{"number": 1, "summary": "one"}]}
+        assert pending == [(2, second)]
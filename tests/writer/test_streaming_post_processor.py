@@ -0,0 +1,66 @@
+"""
+Tests for streaming per-chapter post-processing - London School Approach
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from Writer.StreamingPostProcessor import StreamingPostProcessor
+
+
+def _config(**overrides):
+    values = dict(NATIVE_LANGUAGE="id", TRANSLATE_LANGUAGE="en", ENABLE_FINAL_EDIT_PASS=True,
+                  SCRUB_NO_SCRUB=False, POST_PROCESSING_WORKERS=2)
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _modules():
+    editor, scrubber, translator = MagicMock(), MagicMock(), MagicMock()
+    editor.EditChapter.side_effect = lambda _i, _l, originals, _o, _t, num: f"edit({originals[num - 1]})"
+    scrubber.ScrubChapter.side_effect = lambda _i, _l, text, _idx, _t: f"scrub({text})"
+    translator.TranslateChapter.side_effect = lambda _i, _l, text, _idx, _t, _target, _source: f"tr({text})"
+    return editor, scrubber, translator
+
+
+class TestStreamingPostProcessor:
+    """Chapters flow through edit -> scrub -> translate once their neighbours exist"""
+
+    def test_chapter_waits_for_next_chapter_before_editing(self, mock_logger):
+        editor, scrubber, translator = _modules()
+        processor = StreamingPostProcessor(MagicMock(), mock_logger(), _config(), editor, scrubber, translator, "outline", 3)
+
+        processor.chapter_written(1, "c1")
+        assert 1 not in processor._futures
+        processor.chapter_written(2, "c2")
+        assert set(processor._futures) == {1}
+        processor.chapter_written(3, "c3")
+        assert set(processor._futures) == {1, 2, 3}
+
+        results = processor.results(["c1", "c2", "c3"])
+        assert results["edited"] == ["edit(c1)", "edit(c2)", "edit(c3)"]
+        assert results["translated"] == ["tr(scrub(edit(c1)))", "tr(scrub(edit(c2)))", "tr(scrub(edit(c3)))"]
+
+    def test_failed_pass_keeps_its_input(self, mock_logger):
+        editor, scrubber, translator = _modules()
+        scrubber.ScrubChapter.side_effect = RuntimeError("model down")
+        processor = StreamingPostProcessor(MagicMock(), mock_logger(), _config(TRANSLATE_LANGUAGE=""), editor, scrubber, translator, "outline", 1)
+
+        processor.chapter_written(1, "c1")
+        assert processor.results(["c1"]) == {"edited": ["edit(c1)"], "scrubbed": ["edit(c1)"]}
+
+    def test_mismatched_chapters_fall_back_to_batch(self, mock_logger):
+        editor, scrubber, translator = _modules()
+        processor = StreamingPostProcessor(MagicMock(), mock_logger(), _config(), editor, scrubber, translator, "outline", 2)
+
+        processor.chapter_written(1, "c1")
+        processor.chapter_written(2, "c2")
+        assert processor.results(["c1", "rewritten"]) is None
+
+    def test_no_enabled_passes_schedules_nothing(self, mock_logger):
+        editor, scrubber, translator = _modules()
+        config = _config(ENABLE_FINAL_EDIT_PASS=False, SCRUB_NO_SCRUB=True, TRANSLATE_LANGUAGE="id")
+        processor = StreamingPostProcessor(MagicMock(), mock_logger(), config, editor, scrubber, translator, "outline", 1)
+
+        processor.chapter_written(1, "c1")
+        assert processor.Passes == []
+        assert processor.results(["c1"]) is None